@@ -14,23 +14,51 @@ __all__ = [
     "FaceCull",
     "FaceRasterization",
     "GBuffer",
+    "GBufferAccess",
     "GBufferFrequency",
+    "GBufferHeap",
+    "GBufferMap",
     "GBufferNature",
+    "GBufferReadFuture",
+    "GBufferRing",
     "GBufferView",
+    "GBufferViewFormat",
     "GBufferViewMap",
+    "GBufferViewMapCacheInfo",
     "IndexGBufferView",
     "Image",
     "ImageInvalidError",
+    "join_index_strips",
+    "memory_stats",
+    "MemoryKind",
+    "MemoryStats",
+    "MemoryUsage",
     "MipmapSelection",
+    "narrow_indices",
+    "optimize_overdraw",
+    "optimize_vertex_cache",
+    "optimize_vertex_fetch",
+    "pack_int_2_10_10_10_rev",
+    "pack_std140",
+    "PreparedComputeShader",
+    "PreparedShader",
     "PrimitiveMode",
+    "quantize_half_float",
+    "quantize_normalized",
     "read_color_from_render_target",
     "read_depth_from_render_target",
     "RenderTarget",
     "reset_state",
     "Shader",
     "ShaderAttribute",
+    "ShaderBinaryCache",
+    "ShaderCompileFuture",
+    "ShaderDefineValue",
+    "ShaderLibrary",
+    "ShaderLibraryCacheInfo",
     "ShaderStorageBlock",
     "ShaderUniform",
+    "ShaderUniformBlock",
     "Texture",
     "Texture2d",
     "TextureComponents",
@@ -47,13 +75,32 @@ __all__ = [
 from ._cache import clear_cache
 from ._g_buffer import EditGBuffer
 from ._g_buffer import GBuffer
+from ._g_buffer import GBufferAccess
 from ._g_buffer import GBufferFrequency
+from ._g_buffer import GBufferMap
 from ._g_buffer import GBufferNature
+from ._g_buffer import GBufferReadFuture
+from ._g_buffer_heap import GBufferHeap
+from ._g_buffer_ring import GBufferRing
 from ._g_buffer_view import GBufferView
+from ._g_buffer_view import GBufferViewFormat
 from ._g_buffer_view_map import GBufferViewMap
+from ._g_buffer_view_map import GBufferViewMapCacheInfo
 from ._g_buffer_view_map import IndexGBufferView
 from ._image import Image
 from ._image import ImageInvalidError
+from ._index_optimization import join_index_strips
+from ._index_optimization import narrow_indices
+from ._index_optimization import optimize_overdraw
+from ._index_optimization import optimize_vertex_cache
+from ._index_optimization import optimize_vertex_fetch
+from ._memory import MemoryKind
+from ._memory import MemoryStats
+from ._memory import MemoryUsage
+from ._memory import memory_stats
+from ._quantize import pack_int_2_10_10_10_rev
+from ._quantize import quantize_half_float
+from ._quantize import quantize_normalized
 from ._render_target import RenderTarget
 from ._render_target import TextureRenderTarget
 from ._render_target import WindowRenderTargetMixin
@@ -66,17 +113,26 @@ from ._shader import ComputeShader
 from ._shader import DepthTest
 from ._shader import FaceCull
 from ._shader import FaceRasterization
+from ._shader import PreparedComputeShader
+from ._shader import PreparedShader
 from ._shader import PrimitiveMode
 from ._shader import Shader
 from ._shader import ShaderAttribute
+from ._shader import ShaderCompileFuture
 from ._shader import ShaderInputMap
 from ._shader import ShaderStorageBlock
 from ._shader import ShaderUniform
+from ._shader import ShaderUniformBlock
 from ._shader import ShaderUniformValue
+from ._shader_binary_cache import ShaderBinaryCache
+from ._shader_library import ShaderDefineValue
+from ._shader_library import ShaderLibrary
+from ._shader_library import ShaderLibraryCacheInfo
 from ._state import ClipDepth
 from ._state import ClipOrigin
 from ._state import clip_space
 from ._state import reset_state
+from ._std140 import pack_std140
 from ._texture import MipmapSelection
 from ._texture import Texture
 from ._texture import TextureComponents
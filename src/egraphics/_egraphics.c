@@ -38,8 +38,17 @@
 
 typedef struct ModuleState
 {
+    bool is_gl_base_instance_supported;
+    bool is_gl_buffer_storage_supported;
+    bool is_gl_clear_buffer_supported;
     bool is_gl_clip_control_supported;
     bool is_gl_image_unit_supported;
+    bool is_gl_indirect_parameters_supported;
+    bool is_gl_multi_bind_supported;
+    bool is_gl_multi_draw_indirect_supported;
+    bool is_gl_parallel_shader_compile_supported;
+    bool is_gl_primitive_restart_fixed_index_supported;
+    bool is_gl_program_binary_supported;
     bool is_gl_shader_storage_buffer_supported;
 
     float clear_color[4];
@@ -67,6 +76,7 @@ typedef struct ModuleState
     GLenum polygon_rasterization_mode;
     float point_size;
     int clip_distances;
+    bool primitive_restart;
     GLenum clip_origin;
     GLenum clip_depth;
 } ModuleState;
@@ -78,8 +88,17 @@ reset_module_state(PyObject *module, PyObject *unused)
     CHECK_UNEXPECTED_PYTHON_ERROR();
     if (!state){ Py_RETURN_NONE; }
 
+    state->is_gl_base_instance_supported = false;
+    state->is_gl_buffer_storage_supported = false;
+    state->is_gl_clear_buffer_supported = false;
     state->is_gl_clip_control_supported = false;
     state->is_gl_image_unit_supported = false;
+    state->is_gl_indirect_parameters_supported = false;
+    state->is_gl_multi_bind_supported = false;
+    state->is_gl_multi_draw_indirect_supported = false;
+    state->is_gl_parallel_shader_compile_supported = false;
+    state->is_gl_primitive_restart_fixed_index_supported = false;
+    state->is_gl_program_binary_supported = false;
     state->is_gl_shader_storage_buffer_supported = false;
 
     state->clear_color[0] = -1;
@@ -115,6 +134,7 @@ reset_module_state(PyObject *module, PyObject *unused)
     state->polygon_rasterization_mode = GL_FILL;
     state->point_size = 1.0f;
     state->clip_distances = 0;
+    state->primitive_restart = false;
     state->clip_origin = GL_LOWER_LEFT;
     state->clip_depth = GL_NEGATIVE_ONE_TO_ONE;
 
@@ -334,25 +354,24 @@ write_gl_buffer_target_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
     Py_buffer buffer;
     buffer.obj = 0;
 
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
 
     GLenum target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
     if (PyObject_GetBuffer(args[1], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
 
-    GLintptr offset = PyLong_AsLong(args[2]);
+    GLintptr offset = PyLong_AsSsize_t(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint buffer_size;
-    glGetBufferParameteriv(target, GL_BUFFER_SIZE, &buffer_size);
-    CHECK_GL_ERROR();
+    Py_ssize_t buffer_size = PyLong_AsSsize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
     if (offset < 0 || offset + buffer.len > buffer_size)
     {
         PyErr_Format(
             PyExc_ValueError,
-            "write would overrun buffer (offset: %zi, size: %zi, buffer size: %i)",
+            "write would overrun buffer (offset: %zi, size: %zi, buffer size: %zi)",
             offset,
             buffer.len,
             buffer_size
@@ -366,13 +385,116 @@ write_gl_buffer_target_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 
     Py_RETURN_NONE;
 error:
-    if (buffer.buf != 0)
+    if (buffer.obj != 0)
     {
         PyBuffer_Release(&buffer);
     }
     return 0;
 }
 
+static PyObject *
+write_gl_buffer_data_many(
+    GLenum target,
+    GLuint gl_buffer,
+    PyObject *py_writes,
+    PyObject *py_buffer_size
+)
+{
+    PyObject *writes = 0;
+    Py_buffer *buffers = 0;
+    GLintptr *offsets = 0;
+    Py_ssize_t acquired_count = 0;
+
+    writes = PySequence_Fast(py_writes, "writes must be a sequence");
+    if (!writes){ goto error; }
+
+    Py_ssize_t buffer_size = PyLong_AsSsize_t(py_buffer_size);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t write_count = PySequence_Fast_GET_SIZE(writes);
+    if (write_count == 0)
+    {
+        Py_DECREF(writes);
+        Py_RETURN_NONE;
+    }
+
+    buffers = PyMem_Malloc(sizeof(Py_buffer) * write_count);
+    offsets = PyMem_Malloc(sizeof(GLintptr) * write_count);
+    if (!buffers || !offsets)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    for (Py_ssize_t i = 0; i < write_count; i++)
+    {
+        PyObject *data;
+        Py_ssize_t offset;
+        if (!PyArg_ParseTuple(PySequence_Fast_GET_ITEM(writes, i), "On", &data, &offset))
+        {
+            goto error;
+        }
+        if (PyObject_GetBuffer(data, &buffers[i], PyBUF_CONTIG_RO) == -1){ goto error; }
+        acquired_count += 1;
+        if (offset < 0 || offset + buffers[i].len > buffer_size)
+        {
+            PyErr_Format(
+                PyExc_ValueError,
+                "write would overrun buffer (offset: %zi, size: %zi, buffer size: %zi)",
+                offset,
+                buffers[i].len,
+                buffer_size
+            );
+            goto error;
+        }
+        offsets[i] = offset;
+    }
+
+    for (Py_ssize_t i = 0; i < write_count; i++)
+    {
+        if (gl_buffer)
+        {
+            glNamedBufferSubData(gl_buffer, offsets[i], buffers[i].len, buffers[i].buf);
+        }
+        else
+        {
+            glBufferSubData(target, offsets[i], buffers[i].len, buffers[i].buf);
+        }
+        PyBuffer_Release(&buffers[i]);
+    }
+    acquired_count = 0;
+    PyMem_Free(buffers);
+    buffers = 0;
+    PyMem_Free(offsets);
+    offsets = 0;
+    Py_CLEAR(writes);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    for (Py_ssize_t i = 0; i < acquired_count; i++)
+    {
+        PyBuffer_Release(&buffers[i]);
+    }
+    PyMem_Free(buffers);
+    PyMem_Free(offsets);
+    Py_XDECREF(writes);
+    return 0;
+}
+
+static PyObject *
+write_gl_buffer_target_data_many(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLenum target = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return write_gl_buffer_data_many(target, 0, args[1], args[2]);
+error:
+    return 0;
+}
+
 static PyObject *
 set_gl_buffer_target_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
@@ -419,511 +541,608 @@ error:
 }
 
 static PyObject *
-create_gl_buffer_memory_view(PyObject *module, PyObject **args, Py_ssize_t nargs)
+release_gl_buffer_memory_view(PyObject *module, PyObject *py_target)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
-
-    GLenum target = PyLong_AsLong(args[0]);
+    GLenum target = PyLong_AsLong(py_target);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    Py_ssize_t length = PyLong_AsSsize_t(args[1]);
+    glUnmapBuffer(target);
+    CHECK_GL_ERROR();
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_buffer_target_storage(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
     CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_buffer_storage_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "buffer storage not supported");
+        return 0;
+    }
 
-    void *memory = glMapBuffer(target, GL_READ_WRITE);
-    CHECK_GL_ERROR();
+    GLenum target = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *memory_view = PyMemoryView_FromMemory(memory, length, PyBUF_WRITE);
-    if (!memory_view)
+    GLsizeiptr length = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (length < 0)
     {
-        glUnmapBuffer(target);
-        CHECK_GL_ERROR();
+        PyErr_Format(PyExc_ValueError, "length must be 0 or more");
         goto error;
     }
 
-    return memory_view;
+    GLbitfield flags = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glBufferStorage(target, length, 0, flags);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
 error:
     return 0;
 }
 
 static PyObject *
-release_gl_buffer_memory_view(PyObject *module, PyObject *py_target)
+create_gl_buffer_range_memory_view(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLenum target = PyLong_AsLong(py_target);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLenum target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glUnmapBuffer(target);
+    GLintptr offset = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizeiptr length = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLbitfield access = PyLong_AsUnsignedLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    void *memory = glMapBufferRange(target, offset, length, access);
     CHECK_GL_ERROR();
-    Py_RETURN_NONE;
+
+    PyObject *memory_view = PyMemoryView_FromMemory(
+        memory,
+        length,
+        (access & GL_MAP_WRITE_BIT) ? PyBUF_WRITE : PyBUF_READ
+    );
+    if (!memory_view)
+    {
+        glUnmapBuffer(target);
+        CHECK_GL_ERROR();
+        goto error;
+    }
+
+    return memory_view;
 error:
     return 0;
 }
 
 static PyObject *
-configure_gl_vertex_array_location(PyObject *module, PyObject **args, Py_ssize_t nargs)
+copy_gl_buffer_target_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(6);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
 
-    GLuint location = PyLong_AsLong(args[0]);
+    GLenum read_target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint count = PyLong_AsLong(args[1]);
+    GLenum write_target = PyLong_AsLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLenum type = PyLong_AsLong(args[2]);
+    GLintptr read_offset = PyLong_AsSsize_t(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLsizei stride = PyLong_AsLong(args[3]);
+    GLintptr write_offset = PyLong_AsSsize_t(args[3]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    void *offset = (void *)PyLong_AsLong(args[4]);
+    GLsizeiptr size = PyLong_AsSsize_t(args[4]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *py_instancing_divisor = args[5];
+    glCopyBufferSubData(read_target, write_target, read_offset, write_offset, size);
+    CHECK_GL_ERROR();
 
-    switch (type)
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+copy_gl_buffer_data_many(
+    GLenum read_target,
+    GLenum write_target,
+    GLuint read_gl_buffer,
+    GLuint write_gl_buffer,
+    PyObject *py_ranges
+)
+{
+    PyObject *ranges = PySequence_Fast(py_ranges, "ranges must be a sequence");
+    if (!ranges){ goto error; }
+
+    Py_ssize_t range_count = PySequence_Fast_GET_SIZE(ranges);
+    for (Py_ssize_t i = 0; i < range_count; i++)
     {
-        case GL_BYTE:
-        case GL_UNSIGNED_BYTE:
-        case GL_SHORT:
-        case GL_UNSIGNED_SHORT:
-        case GL_INT:
-        case GL_UNSIGNED_INT:
+        Py_ssize_t read_offset;
+        Py_ssize_t write_offset;
+        Py_ssize_t size;
+        if (!PyArg_ParseTuple(
+            PySequence_Fast_GET_ITEM(ranges, i),
+            "nnn",
+            &read_offset,
+            &write_offset,
+            &size
+        )){ goto error; }
+        if (read_gl_buffer)
         {
-            glVertexAttribIPointer(location, count, type, stride, offset);
-            break;
+            glCopyNamedBufferSubData(
+                read_gl_buffer,
+                write_gl_buffer,
+                read_offset,
+                write_offset,
+                size
+            );
         }
-        default:
+        else
         {
-            glVertexAttribPointer(location, count, type, GL_FALSE, stride, offset);
-            break;
+            glCopyBufferSubData(read_target, write_target, read_offset, write_offset, size);
         }
-
     }
+    Py_CLEAR(ranges);
     CHECK_GL_ERROR();
 
-    glEnableVertexAttribArray(location);
-    CHECK_GL_ERROR();
-
-    if (py_instancing_divisor != Py_None)
-    {
-        GLuint instancing_divisor = PyLong_AsLong(py_instancing_divisor);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-        glVertexAttribDivisor(location, instancing_divisor);
-        CHECK_GL_ERROR();
-    }
-
     Py_RETURN_NONE;
 error:
+    Py_XDECREF(ranges);
     return 0;
 }
 
 static PyObject *
-set_draw_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+copy_gl_buffer_target_data_many(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
-
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    GLuint gl_framebuffer = PyLong_AsLong(args[0]);
+    GLenum read_target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *py_size = args[1];
+    GLenum write_target = PyLong_AsLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    emath_api = EMathApi_Get();
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    return copy_gl_buffer_data_many(read_target, write_target, 0, 0, args[2]);
+error:
+    return 0;
+}
 
-    const int *size = emath_api->IVector2_GetValuePointer(py_size);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+static PyObject *
+clear_gl_buffer_data(
+    ModuleState *state,
+    GLenum target,
+    GLuint gl_buffer,
+    PyObject *py_value,
+    PyObject *py_ranges
+)
+{
+    Py_buffer value;
+    value.obj = 0;
+    PyObject *ranges = 0;
+    char *pattern = 0;
 
-    EMathApi_Release();
-    emath_api = 0;
+    if (PyObject_GetBuffer(py_value, &value, PyBUF_CONTIG_RO) == -1){ goto error; }
 
-    glBindFramebuffer(GL_DRAW_FRAMEBUFFER, gl_framebuffer);
-    CHECK_GL_ERROR();
+    GLenum internal_format;
+    GLenum format;
+    GLenum type;
+    switch (value.len)
+    {
+        case 1:
+            internal_format = GL_R8UI;
+            format = GL_RED_INTEGER;
+            type = GL_UNSIGNED_BYTE;
+            break;
+        case 2:
+            internal_format = GL_R16UI;
+            format = GL_RED_INTEGER;
+            type = GL_UNSIGNED_SHORT;
+            break;
+        case 4:
+            internal_format = GL_R32UI;
+            format = GL_RED_INTEGER;
+            type = GL_UNSIGNED_INT;
+            break;
+        case 8:
+            internal_format = GL_RG32UI;
+            format = GL_RG_INTEGER;
+            type = GL_UNSIGNED_INT;
+            break;
+        case 12:
+            internal_format = GL_RGB32UI;
+            format = GL_RGB_INTEGER;
+            type = GL_UNSIGNED_INT;
+            break;
+        case 16:
+            internal_format = GL_RGBA32UI;
+            format = GL_RGBA_INTEGER;
+            type = GL_UNSIGNED_INT;
+            break;
+        default:
+            PyErr_SetString(PyExc_ValueError, "value size must be 1, 2, 4, 8, 12 or 16 bytes");
+            goto error;
+    }
 
-    glViewport(0, 0, size[0], size[1]);
+    ranges = PySequence_Fast(py_ranges, "ranges must be a sequence");
+    if (!ranges){ goto error; }
+
+    Py_ssize_t range_count = PySequence_Fast_GET_SIZE(ranges);
+    Py_ssize_t pattern_size = 0;
+    for (Py_ssize_t i = 0; i < range_count; i++)
+    {
+        Py_ssize_t offset;
+        Py_ssize_t size;
+        if (!PyArg_ParseTuple(
+            PySequence_Fast_GET_ITEM(ranges, i),
+            "nn",
+            &offset,
+            &size
+        )){ goto error; }
+        if (state->is_gl_clear_buffer_supported)
+        {
+            if (gl_buffer)
+            {
+                glClearNamedBufferSubData(
+                    gl_buffer,
+                    internal_format,
+                    offset,
+                    size,
+                    format,
+                    type,
+                    value.buf
+                );
+            }
+            else
+            {
+                glClearBufferSubData(
+                    target,
+                    internal_format,
+                    offset,
+                    size,
+                    format,
+                    type,
+                    value.buf
+                );
+            }
+            continue;
+        }
+        if (size > pattern_size)
+        {
+            char *new_pattern = realloc(pattern, size);
+            if (!new_pattern)
+            {
+                PyErr_NoMemory();
+                goto error;
+            }
+            for (Py_ssize_t j = pattern_size; j < size; j += value.len)
+            {
+                memcpy(new_pattern + j, value.buf, value.len);
+            }
+            pattern = new_pattern;
+            pattern_size = size;
+        }
+        if (gl_buffer)
+        {
+            glNamedBufferSubData(gl_buffer, offset, size, pattern);
+        }
+        else
+        {
+            glBufferSubData(target, offset, size, pattern);
+        }
+    }
+    free(pattern);
+    pattern = 0;
+    Py_CLEAR(ranges);
+    PyBuffer_Release(&value);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    PyErr_SetRaisedException(ex);
+    free(pattern);
+    Py_XDECREF(ranges);
+    if (value.obj)
+    {
+        PyBuffer_Release(&value);
+    }
     return 0;
 }
 
 static PyObject *
-set_read_framebuffer(PyObject *module, PyObject *py_gl_framebuffer)
+clear_gl_buffer_target_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLuint gl_framebuffer = PyLong_AsLong(py_gl_framebuffer);
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glBindFramebuffer(GL_READ_FRAMEBUFFER, gl_framebuffer);
-    CHECK_GL_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    Py_RETURN_NONE;
+    GLenum target = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return clear_gl_buffer_data(state, target, 0, args[1], args[2]);
 error:
     return 0;
 }
 
 static PyObject *
-read_color_from_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+flush_gl_buffer_target_range(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLint original_texture_0_name = -1;
-    PyObject *ex = 0;
-    float *data = 0;
-    struct EMathApi *emath_api = 0;
-
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    PyObject *py_rect = args[0];
-    long index = PyLong_AsLong(args[1]);
+    GLenum target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *py_position = PyObject_GetAttrString(py_rect, "position");
+    GLintptr offset = PyLong_AsSsize_t(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *py_size = PyObject_GetAttrString(py_rect, "size");
+    GLsizeiptr length = PyLong_AsSsize_t(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    emath_api = EMathApi_Get();
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    glFlushMappedBufferRange(target, offset, length);
+    CHECK_GL_ERROR();
 
-    const int *position = emath_api->IVector2_GetValuePointer(py_position);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
 
-    const int *size = emath_api->IVector2_GetValuePointer(py_size);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+static PyObject *
+create_gl_named_buffer(PyObject *module, PyObject *unused)
+{
+    GLuint gl_buffer = 0;
 
-    size_t count = (size_t)size[0] * (size_t)size[1];
-    data = malloc(sizeof(float) * 4 * count);
-    if (!data)
+    glCreateBuffers(1, &gl_buffer);
+    CHECK_GL_ERROR();
+
+    return PyLong_FromUnsignedLong(gl_buffer);
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_named_buffer_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    PyObject *data = args[1];
+
+    GLenum usage = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_buffer buffer;
+    if (PyLong_Check(data))
     {
-        PyErr_Format(PyExc_MemoryError, "out of memory");
-        goto error;
+        long length = PyLong_AsLong(data);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        if (length < 0)
+        {
+            PyErr_Format(PyExc_ValueError, "data must be 0 or more");
+            goto error;
+        }
+        buffer.len = length;
+        buffer.buf = 0;
     }
-
-    GLint texture_name;
-    if (index != 0)
+    else
     {
-        glGetFramebufferAttachmentParameteriv(
-            GL_READ_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0,
-            GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME,
-            &original_texture_0_name
-        );
-        CHECK_GL_ERROR();
-        glGetFramebufferAttachmentParameteriv(
-            GL_READ_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0 + index,
-            GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME,
-            &texture_name
-        );
-        CHECK_GL_ERROR();
-        glFramebufferTexture2D(
-            GL_READ_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0,
-            GL_TEXTURE_2D,
-            texture_name,
-            0
-        );
-        CHECK_GL_ERROR();
+        if (PyObject_GetBuffer(data, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
     }
 
-    glReadPixels(position[0], position[1], size[0], size[1], GL_RGBA, GL_FLOAT, data);
-    CHECK_GL_ERROR();
+    glNamedBufferData(gl_buffer, buffer.len, buffer.buf, usage);
 
-    if (index != 0)
+    if (buffer.buf != 0)
     {
-        glFramebufferTexture2D(
-            GL_READ_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0,
-            GL_TEXTURE_2D,
-            original_texture_0_name,
-            0
-        );
-        CHECK_GL_ERROR();
-        original_texture_0_name = -1;
+        PyBuffer_Release(&buffer);
     }
 
-    PyObject *array = emath_api->FVector4Array_Create(count, data);
-    free(data);
-    data = 0;
-    EMathApi_Release();
-    return array;
+    CHECK_GL_ERROR();
+
+    return PyLong_FromSsize_t(buffer.len);
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    if (original_texture_0_name != -1)
-    {
-        glFramebufferTexture2D(
-            GL_READ_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0,
-            GL_TEXTURE_2D,
-            original_texture_0_name,
-            0
-        );
-    }
-    if (data){ free(data); }
-    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-read_depth_from_framebuffer(PyObject *module, PyObject *rect)
+set_gl_named_buffer_storage(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
-    float *data = 0;
-
-    PyObject *py_position = PyObject_GetAttrString(rect, "position");
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    PyObject *py_size = PyObject_GetAttrString(rect, "size");
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    emath_api = EMathApi_Get();
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
     CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_buffer_storage_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "buffer storage not supported");
+        return 0;
+    }
 
-    const int *position = emath_api->IVector2_GetValuePointer(py_position);
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    const int *size = emath_api->IVector2_GetValuePointer(py_size);
+    GLsizeiptr length = PyLong_AsSsize_t(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    size_t count = (size_t)size[0] * (size_t)size[1];
-    data = malloc(sizeof(float) * count);
-    if (!data)
+    if (length < 0)
     {
-        PyErr_Format(PyExc_MemoryError, "out of memory");
+        PyErr_Format(PyExc_ValueError, "length must be 0 or more");
         goto error;
     }
 
-    glReadPixels(position[0], position[1], size[0], size[1], GL_DEPTH_COMPONENT, GL_FLOAT, data);
+    GLbitfield flags = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glNamedBufferStorage(gl_buffer, length, 0, flags);
     CHECK_GL_ERROR();
 
-    PyObject *array = emath_api->FArray_Create(count, data);
-    free(data);
-    data = 0;
-    EMathApi_Release();
-    return array;
+    Py_RETURN_NONE;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    if (!data){ free(data); }
-    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-clear_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+write_gl_named_buffer_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
+    Py_buffer buffer;
+    buffer.obj = 0;
 
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
 
-    PyObject *py_color = args[0];
-    PyObject *py_depth = args[1];
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLbitfield clear_mask = 0;
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
 
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    GLintptr offset = PyLong_AsSsize_t(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    if (py_color != Py_None)
-    {
-        emath_api = EMathApi_Get();
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        const float *color = emath_api->FVector4_GetValuePointer(py_color);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        EMathApi_Release();
-        emath_api = 0;
-
-        if (memcmp(state->clear_color, color, sizeof(float) * 4) != 0)
-        {
-            glClearColor(color[0], color[1], color[2], color[3]);
-            CHECK_GL_ERROR();
-            memcpy(state->clear_color, color, sizeof(float) * 4);
-        }
-        clear_mask |= GL_COLOR_BUFFER_BIT;
-        if (
-            state->color_mask_r != true ||
-            state->color_mask_g != true ||
-            state->color_mask_b != true ||
-            state->color_mask_a != true
-        )
-        {
-            glColorMask(true, true, true, true);
-            CHECK_GL_ERROR();
-            state->color_mask_r = true;
-            state->color_mask_g = true;
-            state->color_mask_b = true;
-            state->color_mask_a = true;
-        }
-    }
+    Py_ssize_t buffer_size = PyLong_AsSsize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    if (py_depth != Py_None)
+    if (offset < 0 || offset + buffer.len > buffer_size)
     {
-        float depth = PyFloat_AsDouble(py_depth);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-        if (depth != state->clear_depth)
-        {
-            glClearDepth(depth);
-            CHECK_GL_ERROR();
-        }
-        clear_mask |= GL_DEPTH_BUFFER_BIT;
-        if (state->depth_mask != GL_TRUE)
-        {
-            glDepthMask(GL_TRUE);
-            CHECK_GL_ERROR();
-            state->depth_mask = GL_TRUE;
-        }
+        PyErr_Format(
+            PyExc_ValueError,
+            "write would overrun buffer (offset: %zi, size: %zi, buffer size: %zi)",
+            offset,
+            buffer.len,
+            buffer_size
+        );
+        goto error;
     }
 
-    if (state->scissor_enabled)
-    {
-        glDisable(GL_SCISSOR_TEST);
-        CHECK_GL_ERROR();
-        state->scissor_enabled = false;
-    }
+    glNamedBufferSubData(gl_buffer, offset, buffer.len, buffer.buf);
+    PyBuffer_Release(&buffer);
+    CHECK_GL_ERROR();
 
-    if (clear_mask != 0)
-    {
-        glClear(clear_mask);
-        CHECK_GL_ERROR();
-    }
     Py_RETURN_NONE;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    PyErr_SetRaisedException(ex);
+    if (buffer.obj != 0)
+    {
+        PyBuffer_Release(&buffer);
+    }
     return 0;
 }
 
 static PyObject *
-attach_color_texture_to_gl_read_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+write_gl_named_buffer_data_many(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    GLuint gl_texture = PyLong_AsLong(args[0]);
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    long index = PyLong_AsLong(args[1]);
+    return write_gl_buffer_data_many(0, gl_buffer, args[1], args[2]);
+error:
+    return 0;
+}
+
+static PyObject *
+copy_gl_named_buffer_data_many(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLuint read_gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glFramebufferTexture2D(GL_READ_FRAMEBUFFER, GL_COLOR_ATTACHMENT0 + index, GL_TEXTURE_2D, gl_texture, 0);
-    CHECK_GL_ERROR();
+    GLuint write_gl_buffer = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    Py_RETURN_NONE;
+    return copy_gl_buffer_data_many(0, 0, read_gl_buffer, write_gl_buffer, args[2]);
 error:
     return 0;
 }
 
 static PyObject *
-attach_depth_texture_to_gl_read_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+clear_gl_named_buffer_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(1);
-
-    GLuint gl_texture = PyLong_AsLong(args[0]);
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glFramebufferTexture2D(GL_READ_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_TEXTURE_2D, gl_texture, 0);
-    CHECK_GL_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    Py_RETURN_NONE;
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return clear_gl_buffer_data(state, 0, gl_buffer, args[1], args[2]);
 error:
     return 0;
 }
 
 static PyObject *
-attach_depth_renderbuffer_to_gl_read_framebuffer(PyObject *module, PyObject *py_size)
+create_gl_named_buffer_memory_view(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
-    GLuint gl_render_buffer = 0;
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
 
-    emath_api = EMathApi_Get();
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    const int *size = emath_api->IVector2_GetValuePointer(py_size);
+    GLintptr offset = PyLong_AsSsize_t(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    EMathApi_Release();
-    emath_api = 0;
-
-    glGenRenderbuffers(1, &gl_render_buffer);
-    CHECK_GL_ERROR();
+    GLsizeiptr length = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glBindRenderbuffer(GL_RENDERBUFFER, gl_render_buffer);
-    CHECK_GL_ERROR();
+    GLbitfield access = PyLong_AsUnsignedLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, size[0], size[1]);
+    void *memory = glMapNamedBufferRange(gl_buffer, offset, length, access);
     CHECK_GL_ERROR();
 
-    glFramebufferRenderbuffer(
-        GL_READ_FRAMEBUFFER,
-        GL_DEPTH_ATTACHMENT,
-        GL_RENDERBUFFER,
-        gl_render_buffer
+    PyObject *memory_view = PyMemoryView_FromMemory(
+        memory,
+        length,
+        (access & GL_MAP_WRITE_BIT) ? PyBUF_WRITE : PyBUF_READ
     );
-    CHECK_GL_ERROR();
-
-    PyObject *py_gl_render_buffer = PyLong_FromUnsignedLong(gl_render_buffer);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!memory_view)
+    {
+        glUnmapNamedBuffer(gl_buffer);
+        CHECK_GL_ERROR();
+        goto error;
+    }
 
-    return py_gl_render_buffer;
+    return memory_view;
 error:
-    if (gl_render_buffer){ glDeleteRenderbuffers(1, &gl_render_buffer); }
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-set_texture_locations_on_gl_draw_framebuffer(PyObject *module, PyObject *py_texture_indices)
+release_gl_named_buffer_memory_view(PyObject *module, PyObject *py_gl_buffer)
 {
-    Py_ssize_t n_indices = PyList_GET_SIZE(py_texture_indices);
-
-    GLenum *gl_buffers = malloc(sizeof(GLenum) * n_indices);
-
-    for (Py_ssize_t i = 0; i < n_indices; i++)
-    {
-        PyObject *index = PyList_GET_ITEM(py_texture_indices, i);
-        if (index == Py_None)
-        {
-            gl_buffers[i] = GL_NONE;
-        }
-        else
-        {
-            gl_buffers[i] = GL_COLOR_ATTACHMENT0 + i;
-        }
-    }
+    GLuint gl_buffer = PyLong_AsUnsignedLong(py_gl_buffer);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glDrawBuffers(n_indices, gl_buffers);
-    free(gl_buffers);
-    gl_buffers = 0;
+    glUnmapNamedBuffer(gl_buffer);
     CHECK_GL_ERROR();
-
     Py_RETURN_NONE;
 error:
-    if (gl_buffers != 0){ free(gl_buffers); }
     return 0;
 }
 
 static PyObject *
-set_active_gl_texture_unit(PyObject *module, PyObject *py_unit)
+flush_gl_named_buffer_range(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLenum unit = PyLong_AsLong(py_unit);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glActiveTexture(GL_TEXTURE0 + unit);
+    GLintptr offset = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizeiptr length = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glFlushMappedNamedBufferRange(gl_buffer, offset, length);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -932,118 +1151,139 @@ error:
 }
 
 static PyObject *
-set_gl_texture_target(PyObject *module, PyObject **args, Py_ssize_t nargs)
+configure_gl_vertex_array_location(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
 
-    GLenum target = PyLong_AsLong(args[0]);
+    GLuint location = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLuint gl_texture = 0;
-    if (args[1] != Py_None)
+    GLint count = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum type = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLboolean normalized = (args[3] == Py_True) ? GL_TRUE : GL_FALSE;
+
+    GLenum pointer_type = PyLong_AsLong(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei stride = PyLong_AsLong(args[5]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    void *offset = (void *)PyLong_AsLong(args[6]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    PyObject *py_instancing_divisor = args[7];
+
+    switch (pointer_type)
     {
-        gl_texture = PyLong_AsUnsignedLong(args[1]);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+        case GL_INT:
+        case GL_UNSIGNED_INT:
+        {
+            glVertexAttribIPointer(location, count, type, stride, offset);
+            break;
+        }
+        case GL_DOUBLE:
+        {
+            glVertexAttribLPointer(location, count, type, stride, offset);
+            break;
+        }
+        default:
+        {
+            glVertexAttribPointer(location, count, type, normalized, stride, offset);
+            break;
+        }
+
     }
+    CHECK_GL_ERROR();
 
-    glBindTexture(target, gl_texture);
+    glEnableVertexAttribArray(location);
     CHECK_GL_ERROR();
 
+    if (py_instancing_divisor != Py_None)
+    {
+        GLuint instancing_divisor = PyLong_AsLong(py_instancing_divisor);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        glVertexAttribDivisor(location, instancing_divisor);
+        CHECK_GL_ERROR();
+    }
+
     Py_RETURN_NONE;
 error:
     return 0;
 }
 
 static PyObject *
-set_gl_texture_target_2d_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+configure_gl_vertex_array_format(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
-    void *data_ptr = 0;
-
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(6);
-
-    glPixelStorei(GL_UNPACK_ALIGNMENT, 1);
-    CHECK_GL_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(7);
 
-    GLenum target = PyLong_AsLong(args[0]);
+    GLuint location = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint internal_format = PyLong_AsLong(args[1]);
+    GLint count = PyLong_AsLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLsizei width = 0;
-    GLsizei height = 0;
-    {
-        PyObject *py_size = args[2];
-
-        emath_api = EMathApi_Get();
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        const unsigned int *size = emath_api->UVector2_GetValuePointer(py_size);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+    GLenum type = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-        EMathApi_Release();
-        emath_api = 0;
+    GLboolean normalized = (args[3] == Py_True) ? GL_TRUE : GL_FALSE;
 
-        width = size[0];
-        height = size[1];
-    }
+    GLenum pointer_type = PyLong_AsLong(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint format = PyLong_AsLong(args[3]);
+    GLuint relative_offset = PyLong_AsLong(args[5]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLenum type = PyLong_AsLong(args[4]);
+    GLuint binding_index = PyLong_AsLong(args[6]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    Py_buffer buffer;
+    switch (pointer_type)
     {
-        PyObject *py_data = args[5];
-        if (py_data != Py_None)
+        case GL_INT:
+        case GL_UNSIGNED_INT:
         {
-            if (PyObject_GetBuffer(py_data, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
-            data_ptr = buffer.buf;
+            glVertexAttribIFormat(location, count, type, relative_offset);
+            break;
+        }
+        case GL_DOUBLE:
+        {
+            glVertexAttribLFormat(location, count, type, relative_offset);
+            break;
+        }
+        default:
+        {
+            glVertexAttribFormat(location, count, type, normalized, relative_offset);
+            break;
         }
     }
+    CHECK_GL_ERROR();
 
-    glTexImage2D(
-        target,
-        0,
-        internal_format,
-        width,
-        height,
-        0,
-        format,
-        type,
-        data_ptr
-    );
-    if (data_ptr != 0)
-    {
-        PyBuffer_Release(&buffer);
-        data_ptr = 0;
-    }
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    glVertexAttribBinding(location, binding_index);
+    CHECK_GL_ERROR();
+
+    glEnableVertexAttribArray(location);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    if (data_ptr != 0)
-    {
-        PyBuffer_Release(&buffer);
-    }
-    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-generate_gl_texture_target_mipmaps(PyObject *module, PyObject *py_target)
+set_gl_vertex_array_binding_divisor(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLenum target = PyLong_AsLong(py_target);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLuint binding_index = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glGenerateMipmap(target);
+    GLuint divisor = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glVertexBindingDivisor(binding_index, divisor);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -1052,408 +1292,380 @@ error:
 }
 
 static PyObject *
-set_gl_texture_target_parameters(PyObject *module, PyObject **args, Py_ssize_t nargs)
+bind_gl_vertex_buffers(PyObject *module, PyObject *py_bindings)
 {
-    PyObject *ex = 0;
-    struct EMathApi *emath_api = 0;
+    PyObject *bindings = 0;
+    GLuint *gl_buffers = 0;
+    GLintptr *offsets = 0;
+    GLsizei *strides = 0;
 
     ModuleState *state = (ModuleState *)PyModule_GetState(module);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
-
-    GLenum target = PyLong_AsLong(args[0]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    GLenum min_filter = PyLong_AsLong(args[1]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    GLenum mag_filter = PyLong_AsLong(args[2]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    glTexParameteri(target, GL_TEXTURE_MIN_FILTER, min_filter);
-    CHECK_GL_ERROR();
-
-    glTexParameteri(target, GL_TEXTURE_MAG_FILTER, mag_filter);
-    CHECK_GL_ERROR();
-
-    for (size_t i = 0; i < 3; i++)
+    bindings = PySequence_Fast(py_bindings, "bindings must be a sequence");
+    if (!bindings){ goto error; }
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(bindings);
+    if (count == 0)
     {
-        static const GLenum wrap_target[] = {
-            GL_TEXTURE_WRAP_S,
-            GL_TEXTURE_WRAP_T,
-            GL_TEXTURE_WRAP_R
-        };
-        PyObject *py_wrap = args[3 + i];
-        if (i > 0 && py_wrap == Py_None){ break; }
-        GLenum wrap = PyLong_AsLong(py_wrap);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        glTexParameteri(target, wrap_target[i], wrap);
-        CHECK_GL_ERROR();
+        Py_DECREF(bindings);
+        Py_RETURN_NONE;
     }
 
+    gl_buffers = PyMem_Malloc(sizeof(GLuint) * count);
+    offsets = PyMem_Malloc(sizeof(GLintptr) * count);
+    strides = PyMem_Malloc(sizeof(GLsizei) * count);
+    if (!gl_buffers || !offsets || !strides)
     {
-        PyObject *py_wrap_color = args[6];
-
-        emath_api = EMathApi_Get();
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        const float *wrap_color = emath_api->FVector4_GetValuePointer(py_wrap_color);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        EMathApi_Release();
-        emath_api = 0;
+        PyErr_NoMemory();
+        goto error;
+    }
 
-        glTexParameterfv(target, GL_TEXTURE_BORDER_COLOR, wrap_color);
-        CHECK_GL_ERROR();
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        unsigned int gl_buffer;
+        Py_ssize_t offset;
+        int stride;
+        if (!PyArg_ParseTuple(
+            PySequence_Fast_GET_ITEM(bindings, i),
+            "Ini",
+            &gl_buffer,
+            &offset,
+            &stride
+        )){ goto error; }
+        gl_buffers[i] = gl_buffer;
+        offsets[i] = offset;
+        strides[i] = stride;
     }
 
-    GLfloat anisotropy = PyFloat_AsDouble(args[7]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-    if (anisotropy >= 1.0 && state->texture_filter_anisotropic_supported)
+    if (state->is_gl_multi_bind_supported)
     {
-        glTexParameterf(target, GL_TEXTURE_MAX_ANISOTROPY_EXT, anisotropy);
+        glBindVertexBuffers(0, count, gl_buffers, offsets, strides);
         CHECK_GL_ERROR();
     }
+    else
+    {
+        for (Py_ssize_t i = 0; i < count; i++)
+        {
+            glBindVertexBuffer(i, gl_buffers[i], offsets[i], strides[i]);
+            CHECK_GL_ERROR();
+        }
+    }
 
+    PyMem_Free(gl_buffers);
+    PyMem_Free(offsets);
+    PyMem_Free(strides);
+    Py_DECREF(bindings);
     Py_RETURN_NONE;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    PyErr_SetRaisedException(ex);
+    PyMem_Free(gl_buffers);
+    PyMem_Free(offsets);
+    PyMem_Free(strides);
+    Py_XDECREF(bindings);
     return 0;
 }
 
 static PyObject *
-get_gl_program_uniforms(PyObject *module, PyObject *py_gl_shader)
+set_draw_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *result = 0;
-    GLchar *name = 0;
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
 
-    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
 
-    GLint uniform_count = 0;
-    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORMS, &uniform_count);
-    CHECK_GL_ERROR();
+    GLuint gl_framebuffer = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint max_name_length = 0;
-    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORM_MAX_LENGTH, &max_name_length);
-    CHECK_GL_ERROR();
+    PyObject *py_size = args[1];
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    name = malloc(sizeof(GLchar) * max_name_length + 1);
-    if (!name)
-    {
-        PyErr_Format(PyExc_MemoryError, "out of memory");
-        goto error;
-    }
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    result = PyTuple_New(uniform_count);
+    const int *size = emath_api->IVector2_GetValuePointer(py_size);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    for (GLint i = 0; i < uniform_count; i++)
-    {
-        GLsizei name_length;
-        GLint size;
-        GLenum type;
+    EMathApi_Release();
+    emath_api = 0;
 
-        glGetActiveUniform(gl_shader, i, max_name_length, &name_length, &size, &type, name);
-        CHECK_GL_ERROR();
-        name[name_length] = 0;
+    glBindFramebuffer(GL_DRAW_FRAMEBUFFER, gl_framebuffer);
+    CHECK_GL_ERROR();
 
-        GLint location = glGetUniformLocation(gl_shader, name);
-        CHECK_GL_ERROR();
+    glViewport(0, 0, size[0], size[1]);
+    CHECK_GL_ERROR();
 
-        PyObject *uniform = Py_BuildValue("siii", name, size, type, location);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
 
-        PyTuple_SET_ITEM(result, i, uniform);
-    }
+static PyObject *
+set_read_framebuffer(PyObject *module, PyObject *py_gl_framebuffer)
+{
+    GLuint gl_framebuffer = PyLong_AsLong(py_gl_framebuffer);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    free(name);
+    glBindFramebuffer(GL_READ_FRAMEBUFFER, gl_framebuffer);
+    CHECK_GL_ERROR();
 
-    return result;
+    Py_RETURN_NONE;
 error:
-    Py_XDECREF(result);
-    if (name){ free(name); }
     return 0;
 }
 
-
 static PyObject *
-get_gl_program_storage_blocks(PyObject *module, PyObject *py_gl_shader)
+read_color_from_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    PyObject *result = 0;
-    GLchar *name = 0;
+    GLint original_texture_0_name = -1;
+    PyObject *ex = 0;
+    float *data = 0;
+    struct EMathApi *emath_api = 0;
 
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    PyObject *py_rect = args[0];
+    long index = PyLong_AsLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
-    if (!state->is_gl_shader_storage_buffer_supported)
-    {
-        result = PyTuple_New(0);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-        return result;
-    }
 
-    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    PyObject *py_position = PyObject_GetAttrString(py_rect, "position");
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint storage_block_count = 0;
-    glGetProgramInterfaceiv(gl_shader, GL_SHADER_STORAGE_BLOCK, GL_ACTIVE_RESOURCES, &storage_block_count);
-    CHECK_GL_ERROR();
+    PyObject *py_size = PyObject_GetAttrString(py_rect, "size");
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    if (storage_block_count == 0)
-    {
-        result = PyTuple_New(0);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-        return result;
-    }
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint max_name_length = 0;
-    glGetProgramInterfaceiv(gl_shader, GL_SHADER_STORAGE_BLOCK, GL_MAX_NAME_LENGTH, &max_name_length);
-    CHECK_GL_ERROR();
+    const int *position = emath_api->IVector2_GetValuePointer(py_position);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    name = malloc(sizeof(GLchar) * max_name_length + 1);
-    if (!name)
+    const int *size = emath_api->IVector2_GetValuePointer(py_size);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    size_t count = (size_t)size[0] * (size_t)size[1];
+    data = malloc(sizeof(float) * 4 * count);
+    if (!data)
     {
         PyErr_Format(PyExc_MemoryError, "out of memory");
         goto error;
     }
 
-    result = PyTuple_New(storage_block_count);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    for (GLint i = 0; i < storage_block_count; i++)
+    GLint texture_name;
+    if (index != 0)
     {
-        GLsizei name_length = 0;
-        glGetProgramResourceName(gl_shader, GL_SHADER_STORAGE_BLOCK, i, max_name_length + 1, &name_length, name);
+        glGetFramebufferAttachmentParameteriv(
+            GL_READ_FRAMEBUFFER,
+            GL_COLOR_ATTACHMENT0,
+            GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME,
+            &original_texture_0_name
+        );
         CHECK_GL_ERROR();
-        name[name_length] = 0;
+        glGetFramebufferAttachmentParameteriv(
+            GL_READ_FRAMEBUFFER,
+            GL_COLOR_ATTACHMENT0 + index,
+            GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME,
+            &texture_name
+        );
+        CHECK_GL_ERROR();
+        glFramebufferTexture2D(
+            GL_READ_FRAMEBUFFER,
+            GL_COLOR_ATTACHMENT0,
+            GL_TEXTURE_2D,
+            texture_name,
+            0
+        );
+        CHECK_GL_ERROR();
+    }
 
-        PyObject *storage_block_name = PyUnicode_FromString(name);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+    glReadPixels(position[0], position[1], size[0], size[1], GL_RGBA, GL_FLOAT, data);
+    CHECK_GL_ERROR();
 
-        PyTuple_SET_ITEM(result, i, storage_block_name);
+    if (index != 0)
+    {
+        glFramebufferTexture2D(
+            GL_READ_FRAMEBUFFER,
+            GL_COLOR_ATTACHMENT0,
+            GL_TEXTURE_2D,
+            original_texture_0_name,
+            0
+        );
+        CHECK_GL_ERROR();
+        original_texture_0_name = -1;
     }
 
-    free(name);
-
-    return result;
+    PyObject *array = emath_api->FVector4Array_Create(count, data);
+    free(data);
+    data = 0;
+    EMathApi_Release();
+    return array;
 error:
-    Py_XDECREF(result);
-    if (name){ free(name); }
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    if (original_texture_0_name != -1)
+    {
+        glFramebufferTexture2D(
+            GL_READ_FRAMEBUFFER,
+            GL_COLOR_ATTACHMENT0,
+            GL_TEXTURE_2D,
+            original_texture_0_name,
+            0
+        );
+    }
+    if (data){ free(data); }
+    PyErr_SetRaisedException(ex);
     return 0;
 }
 
-
 static PyObject *
-get_gl_program_attributes(PyObject *module, PyObject *py_gl_shader)
+read_depth_from_framebuffer(PyObject *module, PyObject *rect)
 {
-    PyObject *result = 0;
-    GLchar *name = 0;
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    float *data = 0;
 
-    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    PyObject *py_position = PyObject_GetAttrString(rect, "position");
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint attr_count = 0;
-    glGetProgramiv(gl_shader, GL_ACTIVE_ATTRIBUTES, &attr_count);
-    CHECK_GL_ERROR();
+    PyObject *py_size = PyObject_GetAttrString(rect, "size");
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLint max_name_length = 0;
-    glGetProgramiv(gl_shader, GL_ACTIVE_ATTRIBUTE_MAX_LENGTH, &max_name_length);
-    CHECK_GL_ERROR();
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    name = malloc(sizeof(GLchar) * max_name_length + 1);
-    if (!name)
-    {
-        PyErr_Format(PyExc_MemoryError, "out of memory");
-        goto error;
-    }
-    GLsizei name_length;
-    GLint size;
-    GLenum type;
+    const int *position = emath_api->IVector2_GetValuePointer(py_position);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    result = PyTuple_New(attr_count);
+    const int *size = emath_api->IVector2_GetValuePointer(py_size);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    for (GLint i = 0; i < attr_count; i++)
+    size_t count = (size_t)size[0] * (size_t)size[1];
+    data = malloc(sizeof(float) * count);
+    if (!data)
     {
-        glGetActiveAttrib(gl_shader, i, max_name_length, &name_length, &size, &type, name);
-        CHECK_GL_ERROR();
-        name[name_length] = 0;
-
-        GLint location = glGetAttribLocation(gl_shader, name);
-        CHECK_GL_ERROR();
-
-        PyObject *attr = Py_BuildValue("siii", name, size, type, location);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-
-        PyTuple_SET_ITEM(result, i, attr);
+        PyErr_Format(PyExc_MemoryError, "out of memory");
+        goto error;
     }
 
-    free(name);
+    glReadPixels(position[0], position[1], size[0], size[1], GL_DEPTH_COMPONENT, GL_FLOAT, data);
+    CHECK_GL_ERROR();
 
-    return result;
+    PyObject *array = emath_api->FArray_Create(count, data);
+    free(data);
+    data = 0;
+    EMathApi_Release();
+    return array;
 error:
-    Py_XDECREF(result);
-    if (name){ free(name); }
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    if (!data){ free(data); }
+    PyErr_SetRaisedException(ex);
     return 0;
 }
 
-
 static PyObject *
-create_gl_program(PyObject *module, PyObject **args, Py_ssize_t nargs)
+clear_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    static const char * SHADER_STAGE_NAME[] = {
-        "vertex",
-        "geometry",
-        "fragment",
-        "compute"
-    };
-    static const GLenum SHADER_STAGES[] = {
-        GL_VERTEX_SHADER,
-        GL_GEOMETRY_SHADER,
-        GL_FRAGMENT_SHADER,
-        GL_COMPUTE_SHADER
-    };
-    static const size_t SHADER_STAGES_LENGTH = sizeof(SHADER_STAGES) / sizeof(SHADER_STAGES[0]);
-    GLuint shaders[] = {0, 0, 0, 0};
-    GLchar *log = 0;
-    GLuint gl_program = 0;
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
 
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
 
-    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    PyObject *py_color = args[0];
+    PyObject *py_depth = args[1];
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLbitfield clear_mask = 0;
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (py_color != Py_None)
     {
-        PyObject *shader_code = args[i];
-        if (shader_code == Py_None){ continue; }
+        emath_api = EMathApi_Get();
+        CHECK_UNEXPECTED_PYTHON_ERROR();
 
-        GLuint shader = glCreateShader(SHADER_STAGES[i]);
-        shaders[i] = shader;
-        CHECK_GL_ERROR();
+        const float *color = emath_api->FVector4_GetValuePointer(py_color);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        EMathApi_Release();
+        emath_api = 0;
 
+        if (memcmp(state->clear_color, color, sizeof(float) * 4) != 0)
         {
-            Py_buffer buffer;
-            if (PyObject_GetBuffer(shader_code, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
-            GLint length = buffer.len;
-            glShaderSource(shader, 1, (const GLchar *const *)&buffer.buf, &length);
-            PyBuffer_Release(&buffer);
+            glClearColor(color[0], color[1], color[2], color[3]);
             CHECK_GL_ERROR();
+            memcpy(state->clear_color, color, sizeof(float) * 4);
         }
-
-        glCompileShader(shader);
-        CHECK_GL_ERROR();
-
+        clear_mask |= GL_COLOR_BUFFER_BIT;
+        if (
+            state->color_mask_r != true ||
+            state->color_mask_g != true ||
+            state->color_mask_b != true ||
+            state->color_mask_a != true
+        )
         {
-            GLint compile_status;
-            glGetShaderiv(shader, GL_COMPILE_STATUS, &compile_status);
+            glColorMask(true, true, true, true);
             CHECK_GL_ERROR();
-            if (compile_status == GL_FALSE)
-            {
-                GLint log_length;
-                glGetShaderiv(shader, GL_INFO_LOG_LENGTH, &log_length);
-                CHECK_GL_ERROR();
-
-                log = malloc(sizeof(GLchar *) * log_length);
-                if (!log)
-                {
-                    PyErr_Format(PyExc_MemoryError, "out of memory");
-                    goto error;
-                }
-
-                glGetShaderInfoLog(shader, log_length, 0, log);
-                CHECK_GL_ERROR();
-
-                PyErr_Format(
-                    PyExc_RuntimeError,
-                    "%s stage failed to compile:\n%s",
-                    SHADER_STAGE_NAME[i],
-                    log
-                );
-                free(log);
-                log = 0;
-
-                goto error;
-            }
+            state->color_mask_r = true;
+            state->color_mask_g = true;
+            state->color_mask_b = true;
+            state->color_mask_a = true;
         }
     }
 
-    gl_program = glCreateProgram();
-    CHECK_GL_ERROR();
-
-    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
-    {
-        GLuint shader = shaders[i];
-        if (shader == 0){ continue; }
-        glAttachShader(gl_program, shader);
-        CHECK_GL_ERROR();
-    }
-
-    glLinkProgram(gl_program);
-    CHECK_GL_ERROR();
+    if (py_depth != Py_None)
     {
-        GLint link_status;
-        glGetProgramiv(gl_program, GL_LINK_STATUS, &link_status);
-        CHECK_GL_ERROR();
-
-        if (link_status == GL_FALSE)
+        float depth = PyFloat_AsDouble(py_depth);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        if (depth != state->clear_depth)
         {
-            GLint log_length;
-            glGetProgramiv(gl_program, GL_INFO_LOG_LENGTH, &log_length);
+            glClearDepth(depth);
             CHECK_GL_ERROR();
-
-            log = malloc(sizeof(GLchar *) * log_length);
-            if (!log)
-            {
-                PyErr_Format(PyExc_MemoryError, "out of memory");
-                goto error;
-            }
-
-            glGetProgramInfoLog(gl_program, log_length, 0, log);
+        }
+        clear_mask |= GL_DEPTH_BUFFER_BIT;
+        if (state->depth_mask != GL_TRUE)
+        {
+            glDepthMask(GL_TRUE);
             CHECK_GL_ERROR();
-
-            PyErr_Format(
-                PyExc_RuntimeError,
-                "failed to link:\n%s",
-                log
-            );
-            free(log);
-            log = 0;
-
-            goto error;
+            state->depth_mask = GL_TRUE;
         }
     }
 
-    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    if (state->scissor_enabled)
     {
-        GLuint shader = shaders[i];
-        if (shader == 0){ continue; }
-        glDeleteShader(shader);
+        glDisable(GL_SCISSOR_TEST);
         CHECK_GL_ERROR();
+        state->scissor_enabled = false;
     }
 
-    return PyLong_FromUnsignedLong(gl_program);
-error:
-    if (log){ free(log); }
-    if (gl_program != 0){ glDeleteProgram(gl_program); }
-    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    if (clear_mask != 0)
     {
-        GLuint shader = shaders[i];
-        if (shader == 0){ continue; }
-        glDeleteShader(shader);
+        glClear(clear_mask);
         CHECK_GL_ERROR();
     }
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-delete_gl_program(PyObject *module, PyObject *py_gl_program)
+attach_color_texture_to_gl_read_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLuint gl_program = PyLong_AsUnsignedLong(py_gl_program);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLuint gl_texture = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glDeleteProgram(gl_program);
+    long index = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glFramebufferTexture2D(GL_READ_FRAMEBUFFER, GL_COLOR_ATTACHMENT0 + index, GL_TEXTURE_2D, gl_texture, 0);
+    CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
 error:
@@ -1461,17 +1673,14 @@ error:
 }
 
 static PyObject *
-use_gl_program(PyObject *module, PyObject *py_gl_program)
+attach_depth_texture_to_gl_read_framebuffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    GLuint gl_program = 0;
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(1);
 
-    if (py_gl_program != Py_None)
-    {
-        gl_program = PyLong_AsUnsignedLong(py_gl_program);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-    }
+    GLuint gl_texture = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glUseProgram(gl_program);
+    glFramebufferTexture2D(GL_READ_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_TEXTURE_2D, gl_texture, 0);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -1479,172 +1688,114 @@ error:
     return 0;
 }
 
-#define SET_ACTIVE_GL_PROGRAM_UNIFORM(name, gl_type, uniform_name)\
-    static PyObject *\
-    set_active_gl_program_uniform_##name(PyObject *module, PyObject **args, Py_ssize_t nargs)\
-    {\
-        CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);\
-        \
-        GLint location = PyLong_AsLong(args[0]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        GLsizei count = (GLsizei)PyLong_AsSize_t(args[1]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        gl_type *value = (gl_type *)PyLong_AsVoidPtr(args[2]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        glUniform##uniform_name##v(location, count, value);\
-        CHECK_GL_ERROR();\
-        \
-        Py_RETURN_NONE;\
-    error:\
-        return 0;\
-    }
-
-#define SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(name, gl_type, uniform_name)\
-    static PyObject *\
-    set_active_gl_program_uniform_##name(PyObject *module, PyObject **args, Py_ssize_t nargs)\
-    {\
-        CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);\
-        \
-        GLint location = PyLong_AsLong(args[0]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        GLsizei count = (GLsizei)PyLong_AsSize_t(args[1]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        gl_type *value = (gl_type *)PyLong_AsVoidPtr(args[2]);\
-        CHECK_UNEXPECTED_PYTHON_ERROR();\
-        \
-        glUniform##uniform_name##v(location, count, GL_FALSE, value);\
-        CHECK_GL_ERROR();\
-        \
-        Py_RETURN_NONE;\
-    error:\
-        return 0;\
-    }
-
-SET_ACTIVE_GL_PROGRAM_UNIFORM(float, GLfloat, 1f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(float_2, GLfloat, 2f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(float_3, GLfloat, 3f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(float_4, GLfloat, 4f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x2, GLfloat, Matrix2f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x3, GLfloat, Matrix2x3f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x4, GLfloat, Matrix2x4f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x2, GLfloat, Matrix3x2f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x3, GLfloat, Matrix3f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x4, GLfloat, Matrix3x4f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x2, GLfloat, Matrix4x2f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x3, GLfloat, Matrix4x3f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x4, GLfloat, Matrix4f);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(double, GLdouble, 1d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(double_2, GLdouble, 2d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(double_3, GLdouble, 3d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(double_4, GLdouble, 4d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x2, GLdouble, Matrix2d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x3, GLdouble, Matrix2x3d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x4, GLdouble, Matrix2x4d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x2, GLdouble, Matrix3x2d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x3, GLdouble, Matrix3d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x4, GLdouble, Matrix3x4d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x2, GLdouble, Matrix4x2d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x3, GLdouble, Matrix4x3d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x4, GLdouble, Matrix4d);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(int, GLint, 1i);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(int_2, GLint, 2i);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(int_3, GLint, 3i);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(int_4, GLint, 4i);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int, GLuint, 1ui);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_2, GLuint, 2ui);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_3, GLuint, 3ui);
-SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_4, GLuint, 4ui);
-
-
 static PyObject *
-execute_gl_program_index_buffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+attach_depth_renderbuffer_to_gl_read_framebuffer(PyObject *module, PyObject *py_size)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    GLuint gl_render_buffer = 0;
 
-    GLenum mode = PyLong_AsLong(args[0]);
+    emath_api = EMathApi_Get();
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLsizei count = PyLong_AsSize_t(args[1]);
+    const int *size = emath_api->IVector2_GetValuePointer(py_size);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLsizei offset = PyLong_AsSize_t(args[2]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    EMathApi_Release();
+    emath_api = 0;
 
-    GLenum type = PyLong_AsLong(args[3]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    glGenRenderbuffers(1, &gl_render_buffer);
+    CHECK_GL_ERROR();
 
-    GLsizei instances = PyLong_AsSize_t(args[4]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    glBindRenderbuffer(GL_RENDERBUFFER, gl_render_buffer);
+    CHECK_GL_ERROR();
 
-    if (instances > 1)
-    {
-        glDrawElementsInstanced(mode, count, type, (void *)offset, instances);
-        CHECK_GL_ERROR();
-    }
-    else
-    {
-        glDrawElements(mode, count, type, (void *)offset);
-        CHECK_GL_ERROR();
-    }
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, size[0], size[1]);
+    CHECK_GL_ERROR();
 
-    Py_RETURN_NONE;
+    glFramebufferRenderbuffer(
+        GL_READ_FRAMEBUFFER,
+        GL_DEPTH_ATTACHMENT,
+        GL_RENDERBUFFER,
+        gl_render_buffer
+    );
+    CHECK_GL_ERROR();
+
+    PyObject *py_gl_render_buffer = PyLong_FromUnsignedLong(gl_render_buffer);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return py_gl_render_buffer;
 error:
+    if (gl_render_buffer){ glDeleteRenderbuffers(1, &gl_render_buffer); }
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-execute_gl_program_indices(PyObject *module, PyObject **args, Py_ssize_t nargs)
+set_texture_locations_on_gl_draw_framebuffer(PyObject *module, PyObject *py_texture_indices)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
-
-    GLenum mode = PyLong_AsLong(args[0]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    GLint first = PyLong_AsLong(args[1]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-
-    GLenum count = PyLong_AsLong(args[2]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    Py_ssize_t n_indices = PyList_GET_SIZE(py_texture_indices);
 
-    GLsizei instances = PyLong_AsSize_t(args[3]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    GLenum *gl_buffers = malloc(sizeof(GLenum) * n_indices);
 
-    if (instances > 1)
-    {
-        glDrawArraysInstanced(mode, first, count, instances);
-        CHECK_GL_ERROR();
-    }
-    else
+    for (Py_ssize_t i = 0; i < n_indices; i++)
     {
-        glDrawArrays(mode, first, count);
-        CHECK_GL_ERROR();
+        PyObject *index = PyList_GET_ITEM(py_texture_indices, i);
+        if (index == Py_None)
+        {
+            gl_buffers[i] = GL_NONE;
+        }
+        else
+        {
+            gl_buffers[i] = GL_COLOR_ATTACHMENT0 + i;
+        }
     }
 
+    glDrawBuffers(n_indices, gl_buffers);
+    free(gl_buffers);
+    gl_buffers = 0;
+    CHECK_GL_ERROR();
+
     Py_RETURN_NONE;
 error:
+    if (gl_buffers != 0){ free(gl_buffers); }
     return 0;
 }
 
 static PyObject *
-execute_gl_program_compute(PyObject *module, PyObject **args, Py_ssize_t nargs)
+create_gl_named_framebuffer(PyObject *module, PyObject *unused)
+{
+    GLuint gl_framebuffer = 0;
+
+    glCreateFramebuffers(1, &gl_framebuffer);
+    CHECK_GL_ERROR();
+
+    return PyLong_FromUnsignedLong(gl_framebuffer);
+error:
+    return 0;
+}
+
+static PyObject *
+attach_color_texture_to_gl_named_framebuffer(
+    PyObject *module,
+    PyObject **args,
+    Py_ssize_t nargs
+)
 {
     CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
 
-    GLuint num_groups_x = PyLong_AsUnsignedLong(args[0]);
+    GLuint gl_framebuffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLuint num_groups_y = PyLong_AsUnsignedLong(args[1]);
+    GLuint gl_texture = PyLong_AsUnsignedLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLuint num_groups_z = PyLong_AsUnsignedLong(args[2]);
+    long index = PyLong_AsLong(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glDispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+    glNamedFramebufferTexture(gl_framebuffer, GL_COLOR_ATTACHMENT0 + index, gl_texture, 0);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -1653,12 +1804,21 @@ error:
 }
 
 static PyObject *
-set_gl_memory_barrier(PyObject *module, PyObject *py_barriers)
+attach_depth_texture_to_gl_named_framebuffer(
+    PyObject *module,
+    PyObject **args,
+    Py_ssize_t nargs
+)
 {
-    GLbitfield barriers = PyLong_AsUnsignedLong(py_barriers);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLuint gl_framebuffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glMemoryBarrier(barriers);
+    GLuint gl_texture = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glNamedFramebufferTexture(gl_framebuffer, GL_DEPTH_ATTACHMENT, gl_texture, 0);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -1667,90 +1827,129 @@ error:
 }
 
 static PyObject *
-set_image_unit(PyObject *module, PyObject **args, Py_ssize_t nargs)
+attach_depth_renderbuffer_to_gl_named_framebuffer(
+    PyObject *module,
+    PyObject **args,
+    Py_ssize_t nargs
+)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    GLuint gl_render_buffer = 0;
 
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
-    if (!state->is_gl_image_unit_supported)
-    {
-        PyErr_SetString(PyExc_RuntimeError, "image units not supported");
-        return 0;
-    }
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
 
-    GLuint unit = PyLong_AsUnsignedLong(args[0]);
+    GLuint gl_framebuffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLuint texture = PyLong_AsUnsignedLong(args[1]);
+    emath_api = EMathApi_Get();
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLenum format = PyLong_AsLong(args[2]);
+    const int *size = emath_api->IVector2_GetValuePointer(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glBindImageTexture(unit, texture, 0, GL_FALSE, 0, GL_READ_WRITE, format);
+    EMathApi_Release();
+    emath_api = 0;
+
+    glCreateRenderbuffers(1, &gl_render_buffer);
     CHECK_GL_ERROR();
 
-    Py_RETURN_NONE;
+    glNamedRenderbufferStorage(gl_render_buffer, GL_DEPTH_COMPONENT24, size[0], size[1]);
+    CHECK_GL_ERROR();
+
+    glNamedFramebufferRenderbuffer(
+        gl_framebuffer,
+        GL_DEPTH_ATTACHMENT,
+        GL_RENDERBUFFER,
+        gl_render_buffer
+    );
+    CHECK_GL_ERROR();
+
+    PyObject *py_gl_render_buffer = PyLong_FromUnsignedLong(gl_render_buffer);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return py_gl_render_buffer;
 error:
+    if (gl_render_buffer){ glDeleteRenderbuffers(1, &gl_render_buffer); }
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
     return 0;
 }
 
 static PyObject *
-set_shader_storage_buffer_unit(PyObject *module, PyObject **args, Py_ssize_t nargs)
+set_texture_locations_on_gl_named_framebuffer(
+    PyObject *module,
+    PyObject **args,
+    Py_ssize_t nargs
+)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+    GLenum *gl_buffers = 0;
 
-    GLuint index = PyLong_AsUnsignedLong(args[0]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
 
-    GLuint gl_buffer = PyLong_AsUnsignedLong(args[1]);
+    GLuint gl_framebuffer = PyLong_AsUnsignedLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLintptr offset = PyLong_AsLong(args[2]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    PyObject *py_texture_indices = args[1];
+    Py_ssize_t n_indices = PyList_GET_SIZE(py_texture_indices);
 
-    GLsizeiptr size = PyLong_AsLong(args[3]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    gl_buffers = malloc(sizeof(GLenum) * n_indices);
 
-    if (size == 0)
-    {
-        glBindBufferBase(GL_SHADER_STORAGE_BUFFER, index, 0);
-    }
-    else
+    for (Py_ssize_t i = 0; i < n_indices; i++)
     {
-        glBindBufferRange(GL_SHADER_STORAGE_BUFFER, index, gl_buffer, offset, size);
+        PyObject *index = PyList_GET_ITEM(py_texture_indices, i);
+        if (index == Py_None)
+        {
+            gl_buffers[i] = GL_NONE;
+        }
+        else
+        {
+            gl_buffers[i] = GL_COLOR_ATTACHMENT0 + i;
+        }
     }
+
+    glNamedFramebufferDrawBuffers(gl_framebuffer, n_indices, gl_buffers);
+    free(gl_buffers);
+    gl_buffers = 0;
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
 error:
+    if (gl_buffers != 0){ free(gl_buffers); }
     return 0;
 }
 
 static PyObject *
-set_program_shader_storage_block_binding(PyObject *module, PyObject **args, Py_ssize_t nargs)
+set_active_gl_texture_unit(PyObject *module, PyObject *py_unit)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
-
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    GLenum unit = PyLong_AsLong(py_unit);
     CHECK_UNEXPECTED_PYTHON_ERROR();
-    if (!state->is_gl_shader_storage_buffer_supported)
-    {
-        PyErr_SetString(PyExc_RuntimeError, "shader storage buffers not supported");
-        return 0;
-    }
 
-    GLuint gl_program = PyLong_AsUnsignedLong(args[0]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    glActiveTexture(GL_TEXTURE0 + unit);
+    CHECK_GL_ERROR();
 
-    GLuint storage_block_index = PyLong_AsUnsignedLong(args[1]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
 
-    GLuint storage_block_binding = PyLong_AsUnsignedLong(args[2]);
+static PyObject *
+set_gl_texture_target(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLenum target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    glShaderStorageBlockBinding(gl_program, storage_block_index, storage_block_binding);
+    GLuint gl_texture = 0;
+    if (args[1] != Py_None)
+    {
+        gl_texture = PyLong_AsUnsignedLong(args[1]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    glBindTexture(target, gl_texture);
     CHECK_GL_ERROR();
 
     Py_RETURN_NONE;
@@ -1759,371 +1958,3433 @@ error:
 }
 
 static PyObject *
-set_gl_execution_state(PyObject *module, PyObject **args, Py_ssize_t nargs)
+set_gl_texture_target_2d_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
     PyObject *ex = 0;
     struct EMathApi *emath_api = 0;
+    void *data_ptr = 0;
 
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(19);
-
-    bool depth_write = (args[0] == Py_True);
-
-    GLenum depth_func = PyLong_AsLong(args[1]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(6);
 
-    GLboolean color_mask_r = (args[2] == Py_True);
-    GLboolean color_mask_g = (args[3] == Py_True);
-    GLboolean color_mask_b = (args[4] == Py_True);
-    GLboolean color_mask_a = (args[5] == Py_True);
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1);
+    CHECK_GL_ERROR();
 
-    GLenum blend_source = PyLong_AsLong(args[6]);
+    GLenum target = PyLong_AsLong(args[0]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLenum blend_destination = PyLong_AsLong(args[7]);
+    GLint internal_format = PyLong_AsLong(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    GLenum blend_source_alpha = blend_source;
-    if (args[8] != Py_None)
+    GLsizei width = 0;
+    GLsizei height = 0;
     {
-        blend_source_alpha = PyLong_AsLong(args[8]);
+        PyObject *py_size = args[2];
+
+        emath_api = EMathApi_Get();
         CHECK_UNEXPECTED_PYTHON_ERROR();
-    }
 
-    GLenum blend_destination_alpha = blend_destination;
-    if (args[9] != Py_None)
-    {
-        blend_destination_alpha = PyLong_AsLong(args[9]);
+        const unsigned int *size = emath_api->UVector2_GetValuePointer(py_size);
         CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        EMathApi_Release();
+        emath_api = 0;
+
+        width = size[0];
+        height = size[1];
     }
 
-    GLenum blend_function = PyLong_AsLong(args[10]);
+    GLint format = PyLong_AsLong(args[3]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    PyObject *py_blend_color = args[11];
+    GLenum type = PyLong_AsLong(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_buffer buffer;
+    {
+        PyObject *py_data = args[5];
+        if (py_data != Py_None)
+        {
+            if (PyObject_GetBuffer(py_data, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+            data_ptr = buffer.buf;
+        }
+    }
+
+    glTexImage2D(
+        target,
+        0,
+        internal_format,
+        width,
+        height,
+        0,
+        format,
+        type,
+        data_ptr
+    );
+    if (data_ptr != 0)
+    {
+        PyBuffer_Release(&buffer);
+        data_ptr = 0;
+    }
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    if (data_ptr != 0)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+generate_gl_texture_target_mipmaps(PyObject *module, PyObject *py_target)
+{
+    GLenum target = PyLong_AsLong(py_target);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glGenerateMipmap(target);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_texture_target_parameters(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
+
+    GLenum target = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum min_filter = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum mag_filter = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glTexParameteri(target, GL_TEXTURE_MIN_FILTER, min_filter);
+    CHECK_GL_ERROR();
+
+    glTexParameteri(target, GL_TEXTURE_MAG_FILTER, mag_filter);
+    CHECK_GL_ERROR();
+
+    for (size_t i = 0; i < 3; i++)
+    {
+        static const GLenum wrap_target[] = {
+            GL_TEXTURE_WRAP_S,
+            GL_TEXTURE_WRAP_T,
+            GL_TEXTURE_WRAP_R
+        };
+        PyObject *py_wrap = args[3 + i];
+        if (i > 0 && py_wrap == Py_None){ break; }
+        GLenum wrap = PyLong_AsLong(py_wrap);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        glTexParameteri(target, wrap_target[i], wrap);
+        CHECK_GL_ERROR();
+    }
+
+    {
+        PyObject *py_wrap_color = args[6];
+
+        emath_api = EMathApi_Get();
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        const float *wrap_color = emath_api->FVector4_GetValuePointer(py_wrap_color);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        EMathApi_Release();
+        emath_api = 0;
+
+        glTexParameterfv(target, GL_TEXTURE_BORDER_COLOR, wrap_color);
+        CHECK_GL_ERROR();
+    }
+
+    GLfloat anisotropy = PyFloat_AsDouble(args[7]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (anisotropy >= 1.0 && state->texture_filter_anisotropic_supported)
+    {
+        glTexParameterf(target, GL_TEXTURE_MAX_ANISOTROPY_EXT, anisotropy);
+        CHECK_GL_ERROR();
+    }
+
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+create_gl_named_texture(PyObject *module, PyObject *py_target)
+{
+    GLuint gl_texture = 0;
+
+    GLenum target = PyLong_AsLong(py_target);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glCreateTextures(target, 1, &gl_texture);
+    CHECK_GL_ERROR();
+
+    return PyLong_FromUnsignedLong(gl_texture);
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_named_texture_2d_storage(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLuint gl_texture = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei levels = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum internal_format = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    const unsigned int *size = emath_api->UVector2_GetValuePointer(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    EMathApi_Release();
+    emath_api = 0;
+
+    glTextureStorage2D(gl_texture, levels, internal_format, size[0], size[1]);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+write_gl_named_texture_2d_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+    Py_buffer buffer;
+    buffer.obj = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
+
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1);
+    CHECK_GL_ERROR();
+
+    GLuint gl_texture = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    emath_api = EMathApi_Get();
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    const unsigned int *size = emath_api->UVector2_GetValuePointer(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei width = size[0];
+    GLsizei height = size[1];
+
+    EMathApi_Release();
+    emath_api = 0;
+
+    GLenum format = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum type = PyLong_AsLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (PyObject_GetBuffer(args[4], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+
+    glTextureSubImage2D(gl_texture, 0, 0, 0, width, height, format, type, buffer.buf);
+    PyBuffer_Release(&buffer);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    if (buffer.obj != 0)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+generate_gl_named_texture_mipmaps(PyObject *module, PyObject *py_gl_texture)
+{
+    GLuint gl_texture = PyLong_AsUnsignedLong(py_gl_texture);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glGenerateTextureMipmap(gl_texture);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_named_texture_parameters(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
+
+    GLuint gl_texture = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum min_filter = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum mag_filter = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glTextureParameteri(gl_texture, GL_TEXTURE_MIN_FILTER, min_filter);
+    CHECK_GL_ERROR();
+
+    glTextureParameteri(gl_texture, GL_TEXTURE_MAG_FILTER, mag_filter);
+    CHECK_GL_ERROR();
+
+    for (size_t i = 0; i < 3; i++)
+    {
+        static const GLenum wrap_target[] = {
+            GL_TEXTURE_WRAP_S,
+            GL_TEXTURE_WRAP_T,
+            GL_TEXTURE_WRAP_R
+        };
+        PyObject *py_wrap = args[3 + i];
+        if (i > 0 && py_wrap == Py_None){ break; }
+        GLenum wrap = PyLong_AsLong(py_wrap);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        glTextureParameteri(gl_texture, wrap_target[i], wrap);
+        CHECK_GL_ERROR();
+    }
+
+    {
+        PyObject *py_wrap_color = args[6];
+
+        emath_api = EMathApi_Get();
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        const float *wrap_color = emath_api->FVector4_GetValuePointer(py_wrap_color);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        EMathApi_Release();
+        emath_api = 0;
+
+        glTextureParameterfv(gl_texture, GL_TEXTURE_BORDER_COLOR, wrap_color);
+        CHECK_GL_ERROR();
+    }
+
+    GLfloat anisotropy = PyFloat_AsDouble(args[7]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (anisotropy >= 1.0 && state->texture_filter_anisotropic_supported)
+    {
+        glTextureParameterf(gl_texture, GL_TEXTURE_MAX_ANISOTROPY_EXT, anisotropy);
+        CHECK_GL_ERROR();
+    }
+
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+get_gl_program_uniforms(PyObject *module, PyObject *py_gl_shader)
+{
+    PyObject *result = 0;
+    GLchar *name = 0;
+
+    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint uniform_count = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORMS, &uniform_count);
+    CHECK_GL_ERROR();
+
+    GLint max_name_length = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORM_MAX_LENGTH, &max_name_length);
+    CHECK_GL_ERROR();
+
+    name = malloc(sizeof(GLchar) * max_name_length + 1);
+    if (!name)
+    {
+        PyErr_Format(PyExc_MemoryError, "out of memory");
+        goto error;
+    }
+
+    result = PyTuple_New(uniform_count);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    for (GLint i = 0; i < uniform_count; i++)
+    {
+        GLsizei name_length;
+        GLint size;
+        GLenum type;
+
+        glGetActiveUniform(gl_shader, i, max_name_length, &name_length, &size, &type, name);
+        CHECK_GL_ERROR();
+        name[name_length] = 0;
+
+        GLint location = glGetUniformLocation(gl_shader, name);
+        CHECK_GL_ERROR();
+
+        PyObject *uniform = Py_BuildValue("siii", name, size, type, location);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        PyTuple_SET_ITEM(result, i, uniform);
+    }
+
+    free(name);
+
+    return result;
+error:
+    Py_XDECREF(result);
+    if (name){ free(name); }
+    return 0;
+}
+
+
+static PyObject *
+get_gl_program_uniform_blocks(PyObject *module, PyObject *py_gl_shader)
+{
+    PyObject *result = 0;
+    GLchar *name = 0;
+
+    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint uniform_block_count = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORM_BLOCKS, &uniform_block_count);
+    CHECK_GL_ERROR();
+
+    GLint max_name_length = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH, &max_name_length);
+    CHECK_GL_ERROR();
+
+    name = malloc(sizeof(GLchar) * max_name_length + 1);
+    if (!name)
+    {
+        PyErr_Format(PyExc_MemoryError, "out of memory");
+        goto error;
+    }
+
+    result = PyTuple_New(uniform_block_count);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    for (GLint i = 0; i < uniform_block_count; i++)
+    {
+        GLsizei name_length = 0;
+        glGetActiveUniformBlockName(gl_shader, i, max_name_length + 1, &name_length, name);
+        CHECK_GL_ERROR();
+        name[name_length] = 0;
+
+        GLint data_size = 0;
+        glGetActiveUniformBlockiv(gl_shader, i, GL_UNIFORM_BLOCK_DATA_SIZE, &data_size);
+        CHECK_GL_ERROR();
+
+        PyObject *uniform_block = Py_BuildValue("si", name, data_size);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        PyTuple_SET_ITEM(result, i, uniform_block);
+    }
+
+    free(name);
+
+    return result;
+error:
+    Py_XDECREF(result);
+    if (name){ free(name); }
+    return 0;
+}
+
+static PyObject *
+get_gl_program_binary_length(PyObject *module, PyObject *py_gl_program)
+{
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_program_binary_supported)
+    {
+        return PyLong_FromLong(0);
+    }
+
+    GLuint gl_program = PyLong_AsUnsignedLong(py_gl_program);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint length = 0;
+    glGetProgramiv(gl_program, GL_PROGRAM_BINARY_LENGTH, &length);
+    CHECK_GL_ERROR();
+
+    return PyLong_FromLong(length);
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_program_storage_blocks(PyObject *module, PyObject *py_gl_shader)
+{
+    PyObject *result = 0;
+    GLchar *name = 0;
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_shader_storage_buffer_supported)
+    {
+        result = PyTuple_New(0);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        return result;
+    }
+
+    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint storage_block_count = 0;
+    glGetProgramInterfaceiv(gl_shader, GL_SHADER_STORAGE_BLOCK, GL_ACTIVE_RESOURCES, &storage_block_count);
+    CHECK_GL_ERROR();
+
+    if (storage_block_count == 0)
+    {
+        result = PyTuple_New(0);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        return result;
+    }
+
+    GLint max_name_length = 0;
+    glGetProgramInterfaceiv(gl_shader, GL_SHADER_STORAGE_BLOCK, GL_MAX_NAME_LENGTH, &max_name_length);
+    CHECK_GL_ERROR();
+
+    name = malloc(sizeof(GLchar) * max_name_length + 1);
+    if (!name)
+    {
+        PyErr_Format(PyExc_MemoryError, "out of memory");
+        goto error;
+    }
+
+    result = PyTuple_New(storage_block_count);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    for (GLint i = 0; i < storage_block_count; i++)
+    {
+        GLsizei name_length = 0;
+        glGetProgramResourceName(gl_shader, GL_SHADER_STORAGE_BLOCK, i, max_name_length + 1, &name_length, name);
+        CHECK_GL_ERROR();
+        name[name_length] = 0;
+
+        PyObject *storage_block_name = PyUnicode_FromString(name);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        PyTuple_SET_ITEM(result, i, storage_block_name);
+    }
+
+    free(name);
+
+    return result;
+error:
+    Py_XDECREF(result);
+    if (name){ free(name); }
+    return 0;
+}
+
+
+static PyObject *
+get_gl_program_attributes(PyObject *module, PyObject *py_gl_shader)
+{
+    PyObject *result = 0;
+    GLchar *name = 0;
+
+    GLuint gl_shader = PyLong_AsUnsignedLong(py_gl_shader);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint attr_count = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_ATTRIBUTES, &attr_count);
+    CHECK_GL_ERROR();
+
+    GLint max_name_length = 0;
+    glGetProgramiv(gl_shader, GL_ACTIVE_ATTRIBUTE_MAX_LENGTH, &max_name_length);
+    CHECK_GL_ERROR();
+
+    name = malloc(sizeof(GLchar) * max_name_length + 1);
+    if (!name)
+    {
+        PyErr_Format(PyExc_MemoryError, "out of memory");
+        goto error;
+    }
+    GLsizei name_length;
+    GLint size;
+    GLenum type;
+
+    result = PyTuple_New(attr_count);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    for (GLint i = 0; i < attr_count; i++)
+    {
+        glGetActiveAttrib(gl_shader, i, max_name_length, &name_length, &size, &type, name);
+        CHECK_GL_ERROR();
+        name[name_length] = 0;
+
+        GLint location = glGetAttribLocation(gl_shader, name);
+        CHECK_GL_ERROR();
+
+        PyObject *attr = Py_BuildValue("siii", name, size, type, location);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        PyTuple_SET_ITEM(result, i, attr);
+    }
+
+    free(name);
+
+    return result;
+error:
+    Py_XDECREF(result);
+    if (name){ free(name); }
+    return 0;
+}
+
+
+static const char * SHADER_STAGE_NAME[] = {
+    "vertex",
+    "geometry",
+    "fragment",
+    "compute"
+};
+static const GLenum SHADER_STAGES[] = {
+    GL_VERTEX_SHADER,
+    GL_GEOMETRY_SHADER,
+    GL_FRAGMENT_SHADER,
+    GL_COMPUTE_SHADER
+};
+#define SHADER_STAGES_LENGTH (sizeof(SHADER_STAGES) / sizeof(SHADER_STAGES[0]))
+
+static void
+delete_gl_shaders(GLuint *shaders)
+{
+    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    {
+        GLuint shader = shaders[i];
+        if (shader == 0){ continue; }
+        glDeleteShader(shader);
+        shaders[i] = 0;
+    }
+}
+
+static GLuint
+start_gl_program_impl(PyObject *module, PyObject **args, GLuint *shaders)
+{
+    GLuint gl_program = 0;
+
+    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    {
+        PyObject *shader_code = args[i];
+        if (shader_code == Py_None){ continue; }
+
+        GLuint shader = glCreateShader(SHADER_STAGES[i]);
+        shaders[i] = shader;
+        CHECK_GL_ERROR();
+
+        {
+            Py_buffer buffer;
+            if (PyObject_GetBuffer(shader_code, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+            GLint length = buffer.len;
+            glShaderSource(shader, 1, (const GLchar *const *)&buffer.buf, &length);
+            PyBuffer_Release(&buffer);
+            CHECK_GL_ERROR();
+        }
+
+        glCompileShader(shader);
+        CHECK_GL_ERROR();
+    }
+
+    gl_program = glCreateProgram();
+    CHECK_GL_ERROR();
+
+    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    {
+        GLuint shader = shaders[i];
+        if (shader == 0){ continue; }
+        glAttachShader(gl_program, shader);
+        CHECK_GL_ERROR();
+    }
+
+    {
+        ModuleState *state = (ModuleState *)PyModule_GetState(module);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        if (state->is_gl_program_binary_supported)
+        {
+            glProgramParameteri(gl_program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE);
+            CHECK_GL_ERROR();
+        }
+    }
+
+    glLinkProgram(gl_program);
+    CHECK_GL_ERROR();
+
+    return gl_program;
+error:
+    if (gl_program != 0){ glDeleteProgram(gl_program); }
+    delete_gl_shaders(shaders);
+    return 0;
+}
+
+static int
+finish_gl_program_impl(GLuint gl_program, GLuint *shaders)
+{
+    GLchar *log = 0;
+
+    for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+    {
+        GLuint shader = shaders[i];
+        if (shader == 0){ continue; }
+
+        GLint compile_status;
+        glGetShaderiv(shader, GL_COMPILE_STATUS, &compile_status);
+        CHECK_GL_ERROR();
+        if (compile_status == GL_FALSE)
+        {
+            GLint log_length;
+            glGetShaderiv(shader, GL_INFO_LOG_LENGTH, &log_length);
+            CHECK_GL_ERROR();
+
+            log = malloc(sizeof(GLchar *) * log_length);
+            if (!log)
+            {
+                PyErr_Format(PyExc_MemoryError, "out of memory");
+                goto error;
+            }
+
+            glGetShaderInfoLog(shader, log_length, 0, log);
+            CHECK_GL_ERROR();
+
+            PyErr_Format(
+                PyExc_RuntimeError,
+                "%s stage failed to compile:\n%s",
+                SHADER_STAGE_NAME[i],
+                log
+            );
+            free(log);
+            log = 0;
+
+            goto error;
+        }
+    }
+
+    {
+        GLint link_status;
+        glGetProgramiv(gl_program, GL_LINK_STATUS, &link_status);
+        CHECK_GL_ERROR();
+
+        if (link_status == GL_FALSE)
+        {
+            GLint log_length;
+            glGetProgramiv(gl_program, GL_INFO_LOG_LENGTH, &log_length);
+            CHECK_GL_ERROR();
+
+            log = malloc(sizeof(GLchar *) * log_length);
+            if (!log)
+            {
+                PyErr_Format(PyExc_MemoryError, "out of memory");
+                goto error;
+            }
+
+            glGetProgramInfoLog(gl_program, log_length, 0, log);
+            CHECK_GL_ERROR();
+
+            PyErr_Format(
+                PyExc_RuntimeError,
+                "failed to link:\n%s",
+                log
+            );
+            free(log);
+            log = 0;
+
+            goto error;
+        }
+    }
+
+    delete_gl_shaders(shaders);
+    CHECK_GL_ERROR();
+
+    return 0;
+error:
+    if (log){ free(log); }
+    glDeleteProgram(gl_program);
+    delete_gl_shaders(shaders);
+    return -1;
+}
+
+static PyObject *
+create_gl_program(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    GLuint shaders[SHADER_STAGES_LENGTH] = {0, 0, 0, 0};
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLuint gl_program = start_gl_program_impl(module, args, shaders);
+    if (gl_program == 0){ goto error; }
+
+    if (finish_gl_program_impl(gl_program, shaders) == -1){ goto error; }
+
+    return PyLong_FromUnsignedLong(gl_program);
+error:
+    return 0;
+}
+
+static PyObject *
+start_gl_program(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    GLuint shaders[SHADER_STAGES_LENGTH] = {0, 0, 0, 0};
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLuint gl_program = start_gl_program_impl(module, args, shaders);
+    if (gl_program == 0){ goto error; }
+
+    return Py_BuildValue(
+        "(k(kkkk))",
+        (unsigned long)gl_program,
+        (unsigned long)shaders[0],
+        (unsigned long)shaders[1],
+        (unsigned long)shaders[2],
+        (unsigned long)shaders[3]
+    );
+error:
+    return 0;
+}
+
+static PyObject *
+is_gl_program_complete(PyObject *module, PyObject *py_gl_program)
+{
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_parallel_shader_compile_supported)
+    {
+        Py_RETURN_TRUE;
+    }
+
+    GLuint gl_program = PyLong_AsUnsignedLong(py_gl_program);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint completion_status = GL_FALSE;
+    glGetProgramiv(gl_program, GL_COMPLETION_STATUS_KHR, &completion_status);
+    CHECK_GL_ERROR();
+
+    if (completion_status == GL_FALSE)
+    {
+        Py_RETURN_FALSE;
+    }
+    Py_RETURN_TRUE;
+error:
+    return 0;
+}
+
+static PyObject *
+finish_gl_program(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    GLuint shaders[SHADER_STAGES_LENGTH] = {0, 0, 0, 0};
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLuint gl_program = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    {
+        unsigned long py_shaders[SHADER_STAGES_LENGTH];
+        if (!PyArg_ParseTuple(
+            args[1],
+            "kkkk",
+            &py_shaders[0],
+            &py_shaders[1],
+            &py_shaders[2],
+            &py_shaders[3]
+        )){ goto error; }
+        for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+        {
+            shaders[i] = (GLuint)py_shaders[i];
+        }
+    }
+
+    if (finish_gl_program_impl(gl_program, shaders) == -1){ goto error; }
+
+    return PyLong_FromUnsignedLong(gl_program);
+error:
+    return 0;
+}
+
+static PyObject *
+cancel_gl_program(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    GLuint shaders[SHADER_STAGES_LENGTH] = {0, 0, 0, 0};
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLuint gl_program = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    {
+        unsigned long py_shaders[SHADER_STAGES_LENGTH];
+        if (!PyArg_ParseTuple(
+            args[1],
+            "kkkk",
+            &py_shaders[0],
+            &py_shaders[1],
+            &py_shaders[2],
+            &py_shaders[3]
+        )){ goto error; }
+        for(size_t i = 0; i < SHADER_STAGES_LENGTH; i++)
+        {
+            shaders[i] = (GLuint)py_shaders[i];
+        }
+    }
+
+    delete_gl_shaders(shaders);
+    glDeleteProgram(gl_program);
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_program_binary(PyObject *module, PyObject *py_gl_program)
+{
+    PyObject *py_binary = 0;
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_program_binary_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "program binary not supported");
+        goto error;
+    }
+
+    GLuint gl_program = PyLong_AsUnsignedLong(py_gl_program);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint length = 0;
+    glGetProgramiv(gl_program, GL_PROGRAM_BINARY_LENGTH, &length);
+    CHECK_GL_ERROR();
+
+    py_binary = PyBytes_FromStringAndSize(0, length);
+    if (!py_binary){ goto error; }
+
+    GLenum format = 0;
+    GLsizei written = 0;
+    glGetProgramBinary(gl_program, length, &written, &format, PyBytes_AS_STRING(py_binary));
+    CHECK_GL_ERROR();
+    if (written != length)
+    {
+        if (_PyBytes_Resize(&py_binary, written) == -1){ goto error; }
+    }
+
+    return Py_BuildValue("(kN)", (unsigned long)format, py_binary);
+error:
+    Py_XDECREF(py_binary);
+    return 0;
+}
+
+static PyObject *
+create_gl_program_from_binary(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
+    GLuint gl_program = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_program_binary_supported)
+    {
+        Py_RETURN_NONE;
+    }
+
+    GLenum format = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (PyObject_GetBuffer(args[1], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+
+    gl_program = glCreateProgram();
+    CHECK_GL_ERROR();
+
+    glProgramBinary(gl_program, format, buffer.buf, buffer.len);
+    PyBuffer_Release(&buffer);
+    buffer.obj = 0;
+    GLenum gl_error = glGetError();
+    GLint link_status = GL_FALSE;
+    if (gl_error == GL_NO_ERROR)
+    {
+        glGetProgramiv(gl_program, GL_LINK_STATUS, &link_status);
+        CHECK_GL_ERROR();
+    }
+    if (link_status == GL_FALSE)
+    {
+        glDeleteProgram(gl_program);
+        CHECK_GL_ERROR();
+        Py_RETURN_NONE;
+    }
+
+    return PyLong_FromUnsignedLong(gl_program);
+error:
+    if (buffer.obj)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    if (gl_program != 0){ glDeleteProgram(gl_program); }
+    return 0;
+}
+
+static PyObject *
+delete_gl_program(PyObject *module, PyObject *py_gl_program)
+{
+    GLuint gl_program = PyLong_AsUnsignedLong(py_gl_program);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glDeleteProgram(gl_program);
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+use_gl_program(PyObject *module, PyObject *py_gl_program)
+{
+    GLuint gl_program = 0;
+
+    if (py_gl_program != Py_None)
+    {
+        gl_program = PyLong_AsUnsignedLong(py_gl_program);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    glUseProgram(gl_program);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+#define SET_ACTIVE_GL_PROGRAM_UNIFORM(name, gl_type, uniform_name)\
+    static PyObject *\
+    set_active_gl_program_uniform_##name(PyObject *module, PyObject **args, Py_ssize_t nargs)\
+    {\
+        CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);\
+        \
+        GLint location = PyLong_AsLong(args[0]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        GLsizei count = (GLsizei)PyLong_AsSize_t(args[1]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        gl_type *value = (gl_type *)PyLong_AsVoidPtr(args[2]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        glUniform##uniform_name##v(location, count, value);\
+        CHECK_GL_ERROR();\
+        \
+        Py_RETURN_NONE;\
+    error:\
+        return 0;\
+    }
+
+#define SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(name, gl_type, uniform_name)\
+    static PyObject *\
+    set_active_gl_program_uniform_##name(PyObject *module, PyObject **args, Py_ssize_t nargs)\
+    {\
+        CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);\
+        \
+        GLint location = PyLong_AsLong(args[0]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        GLsizei count = (GLsizei)PyLong_AsSize_t(args[1]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        gl_type *value = (gl_type *)PyLong_AsVoidPtr(args[2]);\
+        CHECK_UNEXPECTED_PYTHON_ERROR();\
+        \
+        glUniform##uniform_name##v(location, count, GL_FALSE, value);\
+        CHECK_GL_ERROR();\
+        \
+        Py_RETURN_NONE;\
+    error:\
+        return 0;\
+    }
+
+SET_ACTIVE_GL_PROGRAM_UNIFORM(float, GLfloat, 1f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(float_2, GLfloat, 2f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(float_3, GLfloat, 3f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(float_4, GLfloat, 4f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x2, GLfloat, Matrix2f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x3, GLfloat, Matrix2x3f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_2x4, GLfloat, Matrix2x4f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x2, GLfloat, Matrix3x2f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x3, GLfloat, Matrix3f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_3x4, GLfloat, Matrix3x4f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x2, GLfloat, Matrix4x2f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x3, GLfloat, Matrix4x3f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(float_4x4, GLfloat, Matrix4f);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(double, GLdouble, 1d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(double_2, GLdouble, 2d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(double_3, GLdouble, 3d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(double_4, GLdouble, 4d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x2, GLdouble, Matrix2d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x3, GLdouble, Matrix2x3d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_2x4, GLdouble, Matrix2x4d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x2, GLdouble, Matrix3x2d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x3, GLdouble, Matrix3d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_3x4, GLdouble, Matrix3x4d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x2, GLdouble, Matrix4x2d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x3, GLdouble, Matrix4x3d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM_MATRIX(double_4x4, GLdouble, Matrix4d);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(int, GLint, 1i);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(int_2, GLint, 2i);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(int_3, GLint, 3i);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(int_4, GLint, 4i);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int, GLuint, 1ui);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_2, GLuint, 2ui);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_3, GLuint, 3ui);
+SET_ACTIVE_GL_PROGRAM_UNIFORM(unsigned_int_4, GLuint, 4ui);
+
+
+static PyObject *
+execute_gl_program_index_buffer(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
+
+    GLenum mode = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei count = PyLong_AsSize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei offset = PyLong_AsSize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum type = PyLong_AsLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei instances = PyLong_AsSize_t(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (instances > 1)
+    {
+        glDrawElementsInstanced(mode, count, type, (void *)offset, instances);
+        CHECK_GL_ERROR();
+    }
+    else
+    {
+        glDrawElements(mode, count, type, (void *)offset);
+        CHECK_GL_ERROR();
+    }
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+execute_gl_program_indices(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLenum mode = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLint first = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum count = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei instances = PyLong_AsSize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (instances > 1)
+    {
+        glDrawArraysInstanced(mode, first, count, instances);
+        CHECK_GL_ERROR();
+    }
+    else
+    {
+        glDrawArrays(mode, first, count);
+        CHECK_GL_ERROR();
+    }
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+execute_gl_program_ranges(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
+    GLint *firsts = 0;
+    GLsizei *counts = 0;
+    GLint *base_vertices = 0;
+    void **indices = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(7);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum mode = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    bool indexed = args[1] != Py_None;
+    GLenum type = 0;
+    if (indexed)
+    {
+        type = PyLong_AsLong(args[1]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    Py_ssize_t index_size = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t index_offset = PyLong_AsSsize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t index_count = PyLong_AsSsize_t(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (PyObject_GetBuffer(args[5], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+    if (buffer.len % (sizeof(int32_t) * 4) != 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "ranges must contain 4 values per range");
+        goto error;
+    }
+    Py_ssize_t range_count = buffer.len / (sizeof(int32_t) * 4);
+    const int32_t *ranges = buffer.buf;
+
+    GLsizei instances = PyLong_AsSize_t(args[6]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    bool simple = instances == 1;
+    for (Py_ssize_t i = 0; i < range_count; i++)
+    {
+        const int32_t *range = &ranges[i * 4];
+        if (range[0] < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "range first must be 0 or more");
+            goto error;
+        }
+        if (range[1] < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "range count must be 0 or more");
+            goto error;
+        }
+        if (range[3] < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "range base instance must be 0 or more");
+            goto error;
+        }
+        if (indexed)
+        {
+            if ((Py_ssize_t)range[0] + range[1] > index_count)
+            {
+                PyErr_SetString(PyExc_ValueError, "range goes beyond indices");
+                goto error;
+            }
+        }
+        else if ((Py_ssize_t)range[0] + range[2] < 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "range first plus base vertex must be 0 or more");
+            goto error;
+        }
+        if (range[3] != 0)
+        {
+            if (!state->is_gl_base_instance_supported)
+            {
+                PyErr_SetString(PyExc_RuntimeError, "base instance not supported");
+                goto error;
+            }
+            simple = false;
+        }
+    }
+
+    if (range_count == 0)
+    {
+        PyBuffer_Release(&buffer);
+        Py_RETURN_NONE;
+    }
+
+    if (simple)
+    {
+        counts = PyMem_Malloc(sizeof(GLsizei) * range_count);
+        if (indexed)
+        {
+            base_vertices = PyMem_Malloc(sizeof(GLint) * range_count);
+            indices = PyMem_Malloc(sizeof(void *) * range_count);
+            if (!counts || !base_vertices || !indices)
+            {
+                PyErr_NoMemory();
+                goto error;
+            }
+        }
+        else
+        {
+            firsts = PyMem_Malloc(sizeof(GLint) * range_count);
+            if (!counts || !firsts)
+            {
+                PyErr_NoMemory();
+                goto error;
+            }
+        }
+
+        for (Py_ssize_t i = 0; i < range_count; i++)
+        {
+            const int32_t *range = &ranges[i * 4];
+            counts[i] = range[1];
+            if (indexed)
+            {
+                indices[i] = (void *)(index_offset + range[0] * index_size);
+                base_vertices[i] = range[2];
+            }
+            else
+            {
+                firsts[i] = range[0] + range[2];
+            }
+        }
+
+        if (indexed)
+        {
+            glMultiDrawElementsBaseVertex(
+                mode,
+                counts,
+                type,
+                (const void *const *)indices,
+                range_count,
+                base_vertices
+            );
+        }
+        else
+        {
+            glMultiDrawArrays(mode, firsts, counts, range_count);
+        }
+        CHECK_GL_ERROR();
+    }
+    else
+    {
+        for (Py_ssize_t i = 0; i < range_count; i++)
+        {
+            const int32_t *range = &ranges[i * 4];
+            if (indexed)
+            {
+                void *offset = (void *)(index_offset + range[0] * index_size);
+                if (state->is_gl_base_instance_supported)
+                {
+                    glDrawElementsInstancedBaseVertexBaseInstance(
+                        mode,
+                        range[1],
+                        type,
+                        offset,
+                        instances,
+                        range[2],
+                        range[3]
+                    );
+                }
+                else
+                {
+                    glDrawElementsInstancedBaseVertex(
+                        mode,
+                        range[1],
+                        type,
+                        offset,
+                        instances,
+                        range[2]
+                    );
+                }
+            }
+            else
+            {
+                if (state->is_gl_base_instance_supported)
+                {
+                    glDrawArraysInstancedBaseInstance(
+                        mode,
+                        range[0] + range[2],
+                        range[1],
+                        instances,
+                        range[3]
+                    );
+                }
+                else
+                {
+                    glDrawArraysInstanced(mode, range[0] + range[2], range[1], instances);
+                }
+            }
+            CHECK_GL_ERROR();
+        }
+    }
+
+    PyMem_Free(firsts);
+    PyMem_Free(counts);
+    PyMem_Free(base_vertices);
+    PyMem_Free(indices);
+    PyBuffer_Release(&buffer);
+    Py_RETURN_NONE;
+error:
+    PyMem_Free(firsts);
+    PyMem_Free(counts);
+    PyMem_Free(base_vertices);
+    PyMem_Free(indices);
+    if (buffer.obj)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    return 0;
+}
+
+static PyObject *
+execute_gl_program_indirect(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(8);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_multi_draw_indirect_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "multi draw indirect not supported");
+        goto error;
+    }
+
+    GLenum mode = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    bool indexed = args[1] != Py_None;
+    GLenum type = 0;
+    if (indexed)
+    {
+        type = PyLong_AsLong(args[1]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t offset = PyLong_AsSsize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei draw_count = PyLong_AsLong(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizei stride = PyLong_AsLong(args[5]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glBindBuffer(GL_DRAW_INDIRECT_BUFFER, gl_buffer);
+    CHECK_GL_ERROR();
+
+    if (args[6] == Py_None)
+    {
+        if (indexed)
+        {
+            glMultiDrawElementsIndirect(mode, type, (void *)offset, draw_count, stride);
+        }
+        else
+        {
+            glMultiDrawArraysIndirect(mode, (void *)offset, draw_count, stride);
+        }
+        CHECK_GL_ERROR();
+    }
+    else
+    {
+        if (!state->is_gl_indirect_parameters_supported)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "indirect parameters not supported");
+            goto error;
+        }
+
+        GLuint count_gl_buffer = PyLong_AsUnsignedLong(args[6]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        Py_ssize_t count_offset = PyLong_AsSsize_t(args[7]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        glBindBuffer(GL_PARAMETER_BUFFER, count_gl_buffer);
+        CHECK_GL_ERROR();
+
+        if (GLEW_VERSION_4_6)
+        {
+            if (indexed)
+            {
+                glMultiDrawElementsIndirectCount(
+                    mode,
+                    type,
+                    (void *)offset,
+                    count_offset,
+                    draw_count,
+                    stride
+                );
+            }
+            else
+            {
+                glMultiDrawArraysIndirectCount(
+                    mode,
+                    (void *)offset,
+                    count_offset,
+                    draw_count,
+                    stride
+                );
+            }
+        }
+        else
+        {
+            if (indexed)
+            {
+                glMultiDrawElementsIndirectCountARB(
+                    mode,
+                    type,
+                    (void *)offset,
+                    count_offset,
+                    draw_count,
+                    stride
+                );
+            }
+            else
+            {
+                glMultiDrawArraysIndirectCountARB(
+                    mode,
+                    (void *)offset,
+                    count_offset,
+                    draw_count,
+                    stride
+                );
+            }
+        }
+        CHECK_GL_ERROR();
+
+        glBindBuffer(GL_PARAMETER_BUFFER, 0);
+        CHECK_GL_ERROR();
+    }
+
+    glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+execute_gl_program_compute(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLuint num_groups_x = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint num_groups_y = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint num_groups_z = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glDispatchCompute(num_groups_x, num_groups_y, num_groups_z);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_memory_barrier(PyObject *module, PyObject *py_barriers)
+{
+    GLbitfield barriers = PyLong_AsUnsignedLong(py_barriers);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glMemoryBarrier(barriers);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_image_unit(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_image_unit_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "image units not supported");
+        return 0;
+    }
+
+    GLuint unit = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint texture = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum format = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glBindImageTexture(unit, texture, 0, GL_FALSE, 0, GL_READ_WRITE, format);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_shader_storage_buffer_unit(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLuint index = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLintptr offset = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizeiptr size = PyLong_AsLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (size == 0)
+    {
+        glBindBufferBase(GL_SHADER_STORAGE_BUFFER, index, 0);
+    }
+    else
+    {
+        glBindBufferRange(GL_SHADER_STORAGE_BUFFER, index, gl_buffer, offset, size);
+    }
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_uniform_buffer_unit(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    GLuint index = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint gl_buffer = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLintptr offset = PyLong_AsLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLsizeiptr size = PyLong_AsLong(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (size == 0)
+    {
+        glBindBufferBase(GL_UNIFORM_BUFFER, index, 0);
+    }
+    else
+    {
+        glBindBufferRange(GL_UNIFORM_BUFFER, index, gl_buffer, offset, size);
+    }
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_program_uniform_block_binding(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    GLuint gl_program = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint uniform_block_index = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint uniform_block_binding = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glUniformBlockBinding(gl_program, uniform_block_index, uniform_block_binding);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_program_shader_storage_block_binding(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (!state->is_gl_shader_storage_buffer_supported)
+    {
+        PyErr_SetString(PyExc_RuntimeError, "shader storage buffers not supported");
+        return 0;
+    }
+
+    GLuint gl_program = PyLong_AsUnsignedLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint storage_block_index = PyLong_AsUnsignedLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint storage_block_binding = PyLong_AsUnsignedLong(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glShaderStorageBlockBinding(gl_program, storage_block_index, storage_block_binding);
+    CHECK_GL_ERROR();
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_execution_state(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *ex = 0;
+    struct EMathApi *emath_api = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(20);
+
+    bool depth_write = (args[0] == Py_True);
+
+    GLenum depth_func = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLboolean color_mask_r = (args[2] == Py_True);
+    GLboolean color_mask_g = (args[3] == Py_True);
+    GLboolean color_mask_b = (args[4] == Py_True);
+    GLboolean color_mask_a = (args[5] == Py_True);
+
+    GLenum blend_source = PyLong_AsLong(args[6]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum blend_destination = PyLong_AsLong(args[7]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum blend_source_alpha = blend_source;
+    if (args[8] != Py_None)
+    {
+        blend_source_alpha = PyLong_AsLong(args[8]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    GLenum blend_destination_alpha = blend_destination;
+    if (args[9] != Py_None)
+    {
+        blend_destination_alpha = PyLong_AsLong(args[9]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    GLenum blend_function = PyLong_AsLong(args[10]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    PyObject *py_blend_color = args[11];
 
     PyObject *py_cull_face = args[12];
 
-    PyObject *py_scissor_position = args[13];
-    PyObject *py_scissor_size = args[14];
+    PyObject *py_scissor_position = args[13];
+    PyObject *py_scissor_size = args[14];
+
+    bool depth_clamp = (args[15] == Py_True);
+
+    GLenum polygon_rasterization_mode = PyLong_AsLong(args[16]);
+
+    float point_size = PyFloat_AsDouble(args[17]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    float clip_distances = PyLong_AsLong(args[18]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    bool primitive_restart = (args[19] == Py_True);
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (!depth_write && depth_func == GL_ALWAYS)
+    {
+        if (state->depth_test)
+        {
+            glDisable(GL_DEPTH_TEST);
+            CHECK_GL_ERROR();
+            state->depth_test = false;
+        }
+    }
+    else
+    {
+        if (!state->depth_test)
+        {
+            glEnable(GL_DEPTH_TEST);
+            CHECK_GL_ERROR();
+            state->depth_test = true;
+        }
+        if (state->depth_mask != depth_write)
+        {
+            glDepthMask(depth_write);
+            CHECK_GL_ERROR();
+            state->depth_mask = depth_write;
+        }
+        if (state->depth_func != depth_func)
+        {
+            glDepthFunc(depth_func);
+            CHECK_GL_ERROR();
+            state->depth_func = depth_func;
+        }
+    }
+
+    if (state->depth_clamp != depth_clamp)
+    {
+        if (depth_clamp)
+        {
+            glEnable(GL_DEPTH_CLAMP);
+        }
+        else
+        {
+            glDisable(GL_DEPTH_CLAMP);
+        }
+        CHECK_GL_ERROR();
+        state->depth_clamp = depth_clamp;
+    }
+
+    if (
+        state->color_mask_r != color_mask_r ||
+        state->color_mask_g != color_mask_g ||
+        state->color_mask_b != color_mask_b ||
+        state->color_mask_a != color_mask_a
+    )
+    {
+        glColorMask(color_mask_r, color_mask_g, color_mask_b, color_mask_a);
+        CHECK_GL_ERROR();
+        state->color_mask_r = color_mask_r;
+        state->color_mask_g = color_mask_g;
+        state->color_mask_b = color_mask_b;
+        state->color_mask_a = color_mask_a;
+    }
+
+    if (
+        blend_source == GL_ONE &&
+        blend_source_alpha == GL_ONE &&
+        blend_destination == GL_ZERO &&
+        blend_destination_alpha == GL_ZERO
+    )
+    {
+        if (state->blend)
+        {
+            glDisable(GL_BLEND);
+            CHECK_GL_ERROR();
+            state->blend = false;
+        }
+    }
+    else
+    {
+        if (!state->blend)
+        {
+            glEnable(GL_BLEND);
+            CHECK_GL_ERROR();
+            state->blend = true;
+        }
+        if (
+            state->blend_source != blend_source ||
+            state->blend_destination != blend_destination ||
+            state->blend_source_alpha != blend_source_alpha ||
+            state->blend_destination_alpha != blend_destination_alpha
+        )
+        {
+            glBlendFuncSeparate(
+                blend_source,
+                blend_destination,
+                blend_source_alpha,
+                blend_destination_alpha
+            );
+            CHECK_GL_ERROR();
+            state->blend_source = blend_source;
+            state->blend_destination = blend_destination;
+            state->blend_source_alpha = blend_source_alpha;
+            state->blend_destination_alpha = blend_destination_alpha;
+        }
+        if (state->blend_equation != blend_function)
+        {
+            glBlendEquation(blend_function);
+            CHECK_GL_ERROR();
+            state->blend_equation = blend_function;
+        }
+
+        static const float default_blend_color[] = {1, 1, 1, 1};
+        const float *blend_color = default_blend_color;
+        if (py_blend_color != Py_None)
+        {
+            if (!emath_api)
+            {
+                emath_api = EMathApi_Get();
+                CHECK_UNEXPECTED_PYTHON_ERROR();
+            }
+            blend_color = emath_api->FVector4_GetValuePointer(py_blend_color);
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+        }
+        if (memcmp(state->blend_color, blend_color, sizeof(float) * 4) != 0)
+        {
+            glBlendColor(blend_color[0], blend_color[1], blend_color[2], blend_color[3]);
+            CHECK_GL_ERROR();
+            memcpy(state->blend_color, blend_color, sizeof(float) * 4);
+        }
+    }
+
+    if (py_cull_face == Py_None)
+    {
+        if (state->cull_face_enabled)
+        {
+            glDisable(GL_CULL_FACE);
+            CHECK_GL_ERROR();
+            state->cull_face_enabled = false;
+        }
+    }
+    else
+    {
+        if (!state->cull_face_enabled)
+        {
+            glEnable(GL_CULL_FACE);
+            CHECK_GL_ERROR();
+            state->cull_face_enabled = true;
+        }
+
+        GLenum cull_face = PyLong_AsLong(args[12]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        if (state->cull_face != cull_face)
+        {
+            glCullFace(cull_face);
+            CHECK_GL_ERROR();
+            state->cull_face = cull_face;
+        }
+    }
+
+    if (py_scissor_position == Py_None || py_scissor_size == Py_None)
+    {
+        if (state->scissor_enabled)
+        {
+            glDisable(GL_SCISSOR_TEST);
+            CHECK_GL_ERROR();
+            state->scissor_enabled = false;
+        }
+    }
+    else
+    {
+        if (!state->scissor_enabled)
+        {
+            glEnable(GL_SCISSOR_TEST);
+            CHECK_GL_ERROR();
+            state->scissor_enabled = true;
+        }
+
+        if (!emath_api)
+        {
+            emath_api = EMathApi_Get();
+            CHECK_UNEXPECTED_PYTHON_ERROR();
+        }
+
+        const int* scissor_position = emath_api->IVector2_GetValuePointer(py_scissor_position);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+        const int* scissor_size = emath_api->IVector2_GetValuePointer(py_scissor_size);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+
+        if (
+            scissor_position[0] != state->scissor[0] ||
+            scissor_position[1] != state->scissor[1] ||
+            scissor_size[0] != state->scissor[2] ||
+            scissor_size[1] != state->scissor[3]
+        )
+        {
+            glScissor(scissor_position[0], scissor_position[1], scissor_size[0], scissor_size[1]);
+            CHECK_GL_ERROR();
+            state->scissor[0] = scissor_position[0];
+            state->scissor[1] = scissor_position[1];
+            state->scissor[2] = scissor_size[2];
+            state->scissor[3] = scissor_size[3];
+        }
+    }
+
+    if (state->polygon_rasterization_mode != polygon_rasterization_mode)
+    {
+        glPolygonMode(GL_FRONT_AND_BACK, polygon_rasterization_mode);
+        CHECK_GL_ERROR();
+        state->polygon_rasterization_mode = polygon_rasterization_mode;
+    }
+
+    if (state->point_size != point_size)
+    {
+        glPointSize(point_size);
+        CHECK_GL_ERROR();
+        state->point_size = point_size;
+    }
+
+    if (state->clip_distances != clip_distances)
+    {
+        if (state->clip_distances < clip_distances)
+        {
+            for (int i = state->clip_distances; i < clip_distances; i++)
+            {
+                glEnable(GL_CLIP_DISTANCE0 + i);
+                CHECK_GL_ERROR();
+            }
+        }
+        else
+        {
+            for (int i = clip_distances; i < state->clip_distances; i++)
+            {
+                glDisable(GL_CLIP_DISTANCE0 + i);
+                CHECK_GL_ERROR();
+            }
+        }
+        state->clip_distances = clip_distances;
+    }
+
+    if (state->primitive_restart != primitive_restart)
+    {
+        if (primitive_restart)
+        {
+            if (!state->is_gl_primitive_restart_fixed_index_supported)
+            {
+                PyErr_SetString(PyExc_RuntimeError, "primitive restart not supported");
+                goto error;
+            }
+            glEnable(GL_PRIMITIVE_RESTART_FIXED_INDEX);
+        }
+        else
+        {
+            glDisable(GL_PRIMITIVE_RESTART_FIXED_INDEX);
+        }
+        CHECK_GL_ERROR();
+        state->primitive_restart = primitive_restart;
+    }
+
+    if (emath_api){ EMathApi_Release(); }
+    Py_RETURN_NONE;
+error:
+    ex = PyErr_GetRaisedException();
+    if (emath_api){ EMathApi_Release(); }
+    PyErr_SetRaisedException(ex);
+    return 0;
+}
+
+static PyObject *
+create_gl_fence_sync(PyObject *module, PyObject *unused)
+{
+    GLsync sync = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0);
+    CHECK_GL_ERROR();
+
+    return PyLong_FromVoidPtr(sync);
+error:
+    return 0;
+}
+
+static PyObject *
+delete_gl_fence_sync(PyObject *module, PyObject *py_sync)
+{
+    GLsync sync = (GLsync)PyLong_AsVoidPtr(py_sync);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    glDeleteSync(sync);
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+wait_gl_fence_sync(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLsync sync = (GLsync)PyLong_AsVoidPtr(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLuint64 timeout = PyLong_AsUnsignedLongLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum result = glClientWaitSync(sync, GL_SYNC_FLUSH_COMMANDS_BIT, timeout);
+    CHECK_GL_ERROR();
+
+    switch (result)
+    {
+        case GL_ALREADY_SIGNALED:
+        case GL_CONDITION_SATISFIED:
+        {
+            Py_RETURN_TRUE;
+        }
+        case GL_TIMEOUT_EXPIRED:
+        {
+            Py_RETURN_FALSE;
+        }
+    }
+
+    PyErr_SetString(PyExc_RuntimeError, "failed to wait for fence sync");
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_version(PyObject *module, PyObject *unused)
+{
+    const GLubyte *gl_version = glGetString(GL_VERSION);
+    CHECK_GL_ERROR();
+
+    return PyUnicode_FromString(gl_version);
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_vendor(PyObject *module, PyObject *unused)
+{
+    const GLubyte *gl_vendor = glGetString(GL_VENDOR);
+    CHECK_GL_ERROR();
+
+    return PyUnicode_FromString(gl_vendor);
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_renderer(PyObject *module, PyObject *unused)
+{
+    const GLubyte *gl_renderer = glGetString(GL_RENDERER);
+    CHECK_GL_ERROR();
+
+    return PyUnicode_FromString(gl_renderer);
+error:
+    return 0;
+}
+
+static PyObject *
+set_gl_clip(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLenum origin = PyLong_AsLong(args[0]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    GLenum depth = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (
+        !state->is_gl_clip_control_supported &&
+        (
+            origin != GL_LOWER_LEFT ||
+            depth != GL_NEGATIVE_ONE_TO_ONE
+        )
+    )
+    {
+        PyErr_SetString(PyExc_RuntimeError, "glClipControl not supported");
+        goto error;
+    }
+
+    if (state->clip_origin != origin || state->clip_depth != depth)
+    {
+        glClipControl(origin, depth);
+        CHECK_GL_ERROR();
+
+        state->clip_origin = origin;
+        state->clip_depth = depth;
+    }
+
+    Py_RETURN_NONE;
+error:
+    return 0;
+}
+
+static PyObject *
+get_gl_clip(PyObject *module, PyObject* unused)
+{
+    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    return Py_BuildValue("(ii)", state->clip_origin, state->clip_depth);
+error:
+    return 0;
+}
+
+static PyObject *
+gather_strided_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
 
-    bool depth_clamp = (args[15] == Py_True);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
 
-    GLenum polygon_rasterization_mode = PyLong_AsLong(args[16]);
+    if (PyObject_GetBuffer(args[0], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
 
-    float point_size = PyFloat_AsDouble(args[17]);
+    Py_ssize_t element_size = PyLong_AsSsize_t(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    float clip_distances = PyLong_AsLong(args[18]);
+    Py_ssize_t stride = PyLong_AsSsize_t(args[2]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
+    Py_ssize_t count = PyLong_AsSsize_t(args[3]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    if (!depth_write && depth_func == GL_ALWAYS)
+    if (element_size < 1 || stride < 1 || count < 0)
     {
-        if (state->depth_test)
+        PyErr_Format(
+            PyExc_ValueError,
+            "invalid gather (element size: %zi, stride: %zi, count: %zi)",
+            element_size,
+            stride,
+            count
+        );
+        goto error;
+    }
+    if (count > 0 && (count - 1) * stride + element_size > buffer.len)
+    {
+        PyErr_Format(
+            PyExc_ValueError,
+            "gather would overrun buffer (stride: %zi, count: %zi, buffer size: %zi)",
+            stride,
+            count,
+            buffer.len
+        );
+        goto error;
+    }
+
+    PyObject *result = PyBytes_FromStringAndSize(0, element_size * count);
+    if (!result){ goto error; }
+    char *dst = PyBytes_AS_STRING(result);
+    const char *src = buffer.buf;
+    if (stride == element_size)
+    {
+        memcpy(dst, src, element_size * count);
+    }
+    else
+    {
+        for (Py_ssize_t i = 0; i < count; i++)
         {
-            glDisable(GL_DEPTH_TEST);
-            CHECK_GL_ERROR();
-            state->depth_test = false;
+            memcpy(dst + (i * element_size), src + (i * stride), element_size);
         }
     }
-    else
+
+    PyBuffer_Release(&buffer);
+    return result;
+error:
+    if (buffer.obj != 0)
     {
-        if (!state->depth_test)
+        PyBuffer_Release(&buffer);
+    }
+    return 0;
+}
+
+static PyObject *
+interleave_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    PyObject *sources = 0;
+    PyObject *result = 0;
+    Py_buffer buffer;
+    buffer.obj = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    Py_ssize_t stride = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t count = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (stride < 1 || count < 0)
+    {
+        PyErr_Format(
+            PyExc_ValueError,
+            "invalid interleave (stride: %zi, count: %zi)",
+            stride,
+            count
+        );
+        goto error;
+    }
+
+    sources = PySequence_Fast(args[0], "sources must be a sequence");
+    if (!sources){ goto error; }
+
+    result = PyBytes_FromStringAndSize(0, stride * count);
+    if (!result){ goto error; }
+    char *dst = PyBytes_AS_STRING(result);
+    memset(dst, 0, stride * count);
+
+    Py_ssize_t source_count = PySequence_Fast_GET_SIZE(sources);
+    for (Py_ssize_t i = 0; i < source_count; i++)
+    {
+        PyObject *py_data;
+        Py_ssize_t element_size;
+        Py_ssize_t offset;
+        if (!PyArg_ParseTuple(
+            PySequence_Fast_GET_ITEM(sources, i),
+            "Onn",
+            &py_data,
+            &element_size,
+            &offset
+        )){ goto error; }
+
+        if (element_size < 1 || offset < 0 || offset + element_size > stride)
         {
-            glEnable(GL_DEPTH_TEST);
-            CHECK_GL_ERROR();
-            state->depth_test = true;
+            PyErr_Format(
+                PyExc_ValueError,
+                "source would overrun stride (offset: %zi, size: %zi, stride: %zi)",
+                offset,
+                element_size,
+                stride
+            );
+            goto error;
         }
-        if (state->depth_mask != depth_write)
+
+        if (PyObject_GetBuffer(py_data, &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+        if (buffer.len < element_size * count)
         {
-            glDepthMask(depth_write);
-            CHECK_GL_ERROR();
-            state->depth_mask = depth_write;
+            PyErr_Format(
+                PyExc_ValueError,
+                "source is too small (size: %zi, expected size: %zi)",
+                buffer.len,
+                element_size * count
+            );
+            goto error;
         }
-        if (state->depth_func != depth_func)
+
+        const char *src = buffer.buf;
+        for (Py_ssize_t j = 0; j < count; j++)
         {
-            glDepthFunc(depth_func);
-            CHECK_GL_ERROR();
-            state->depth_func = depth_func;
+            memcpy(dst + (j * stride) + offset, src + (j * element_size), element_size);
         }
+        PyBuffer_Release(&buffer);
+        buffer.obj = 0;
     }
 
-    if (state->depth_clamp != depth_clamp)
+    Py_DECREF(sources);
+    return result;
+error:
+    if (buffer.obj != 0)
     {
-        if (depth_clamp)
+        PyBuffer_Release(&buffer);
+    }
+    Py_XDECREF(sources);
+    Py_XDECREF(result);
+    return 0;
+}
+
+static int
+get_float_data(PyObject *py_data, Py_buffer *buffer, Py_ssize_t *count)
+{
+    if (PyObject_GetBuffer(py_data, buffer, PyBUF_CONTIG_RO) == -1){ return -1; }
+    if (buffer->len % sizeof(float) != 0)
+    {
+        PyErr_Format(
+            PyExc_ValueError,
+            "float data size must be a multiple of %zi (size: %zi)",
+            (Py_ssize_t)sizeof(float),
+            buffer->len
+        );
+        return -1;
+    }
+    *count = buffer->len / sizeof(float);
+    return 0;
+}
+
+static float
+clamp_float(float value, float min, float max)
+{
+    if (!(value >= min)){ return min; }
+    if (value > max){ return max; }
+    return value;
+}
+
+static PyObject *
+quantize_normalized_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    GLenum type = PyLong_AsLong(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t count;
+    if (get_float_data(args[0], &buffer, &count) == -1){ goto error; }
+    const float *src = buffer.buf;
+
+    PyObject *result = 0;
+    switch (type)
+    {
+        case GL_BYTE:
         {
-            glEnable(GL_DEPTH_CLAMP);
+            result = PyBytes_FromStringAndSize(0, count * sizeof(int8_t));
+            if (!result){ goto error; }
+            int8_t *dst = (int8_t *)PyBytes_AS_STRING(result);
+            for (Py_ssize_t i = 0; i < count; i++)
+            {
+                dst[i] = (int8_t)lroundf(clamp_float(src[i], -1.0f, 1.0f) * INT8_MAX);
+            }
+            break;
         }
-        else
+        case GL_UNSIGNED_BYTE:
         {
-            glDisable(GL_DEPTH_CLAMP);
+            result = PyBytes_FromStringAndSize(0, count * sizeof(uint8_t));
+            if (!result){ goto error; }
+            uint8_t *dst = (uint8_t *)PyBytes_AS_STRING(result);
+            for (Py_ssize_t i = 0; i < count; i++)
+            {
+                dst[i] = (uint8_t)lroundf(clamp_float(src[i], 0.0f, 1.0f) * UINT8_MAX);
+            }
+            break;
+        }
+        case GL_SHORT:
+        {
+            result = PyBytes_FromStringAndSize(0, count * sizeof(int16_t));
+            if (!result){ goto error; }
+            int16_t *dst = (int16_t *)PyBytes_AS_STRING(result);
+            for (Py_ssize_t i = 0; i < count; i++)
+            {
+                dst[i] = (int16_t)lroundf(clamp_float(src[i], -1.0f, 1.0f) * INT16_MAX);
+            }
+            break;
+        }
+        case GL_UNSIGNED_SHORT:
+        {
+            result = PyBytes_FromStringAndSize(0, count * sizeof(uint16_t));
+            if (!result){ goto error; }
+            uint16_t *dst = (uint16_t *)PyBytes_AS_STRING(result);
+            for (Py_ssize_t i = 0; i < count; i++)
+            {
+                dst[i] = (uint16_t)lroundf(clamp_float(src[i], 0.0f, 1.0f) * UINT16_MAX);
+            }
+            break;
+        }
+        default:
+        {
+            PyErr_Format(PyExc_ValueError, "unexpected normalized type: %i", type);
+            goto error;
         }
-        CHECK_GL_ERROR();
-        state->depth_clamp = depth_clamp;
     }
 
-    if (
-        state->color_mask_r != color_mask_r ||
-        state->color_mask_g != color_mask_g ||
-        state->color_mask_b != color_mask_b ||
-        state->color_mask_a != color_mask_a
-    )
+    PyBuffer_Release(&buffer);
+    return result;
+error:
+    if (buffer.obj != 0)
     {
-        glColorMask(color_mask_r, color_mask_g, color_mask_b, color_mask_a);
-        CHECK_GL_ERROR();
-        state->color_mask_r = color_mask_r;
-        state->color_mask_g = color_mask_g;
-        state->color_mask_b = color_mask_b;
-        state->color_mask_a = color_mask_a;
+        PyBuffer_Release(&buffer);
     }
+    return 0;
+}
 
-    if (
-        blend_source == GL_ONE &&
-        blend_source_alpha == GL_ONE &&
-        blend_destination == GL_ZERO &&
-        blend_destination_alpha == GL_ZERO
-    )
+static uint16_t
+float_to_half_float(float value)
+{
+    uint32_t bits;
+    memcpy(&bits, &value, sizeof(bits));
+    uint16_t sign = (bits >> 16) & 0x8000;
+    uint32_t exponent = (bits >> 23) & 0xFF;
+    uint32_t mantissa = bits & 0x7FFFFF;
+
+    if (exponent == 0xFF)
     {
-        if (state->blend)
-        {
-            glDisable(GL_BLEND);
-            CHECK_GL_ERROR();
-            state->blend = false;
-        }
+        return sign | 0x7C00 | (mantissa ? 0x200 : 0);
     }
-    else
+
+    int32_t half_exponent = (int32_t)exponent - 127 + 15;
+    if (half_exponent >= 0x1F)
     {
-        if (!state->blend)
+        return sign | 0x7C00;
+    }
+    if (half_exponent <= 0)
+    {
+        if (half_exponent < -10)
         {
-            glEnable(GL_BLEND);
-            CHECK_GL_ERROR();
-            state->blend = true;
+            return sign;
         }
-        if (
-            state->blend_source != blend_source ||
-            state->blend_destination != blend_destination ||
-            state->blend_source_alpha != blend_source_alpha ||
-            state->blend_destination_alpha != blend_destination_alpha
-        )
+        mantissa |= 0x800000;
+        uint32_t shift = 14 - half_exponent;
+        uint32_t half_mantissa = mantissa >> shift;
+        uint32_t remainder = mantissa & ((1u << shift) - 1);
+        uint32_t halfway = 1u << (shift - 1);
+        if (remainder > halfway || (remainder == halfway && (half_mantissa & 1)))
         {
-            glBlendFuncSeparate(
-                blend_source,
-                blend_destination,
-                blend_source_alpha,
-                blend_destination_alpha
-            );
-            CHECK_GL_ERROR();
-            state->blend_source = blend_source;
-            state->blend_destination = blend_destination;
-            state->blend_source_alpha = blend_source_alpha;
-            state->blend_destination_alpha = blend_destination_alpha;
+            half_mantissa += 1;
         }
-        if (state->blend_equation != blend_function)
-        {
-            glBlendEquation(blend_function);
-            CHECK_GL_ERROR();
-            state->blend_equation = blend_function;
+        return sign | half_mantissa;
+    }
+
+    uint32_t half = ((uint32_t)half_exponent << 10) | (mantissa >> 13);
+    uint32_t remainder = mantissa & 0x1FFF;
+    if (remainder > 0x1000 || (remainder == 0x1000 && (half & 1)))
+    {
+        half += 1;
+    }
+    return sign | half;
+}
+
+static PyObject *
+quantize_half_float_data(PyObject *module, PyObject *py_data)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
+
+    Py_ssize_t count;
+    if (get_float_data(py_data, &buffer, &count) == -1){ goto error; }
+    const float *src = buffer.buf;
+
+    PyObject *result = PyBytes_FromStringAndSize(0, count * sizeof(uint16_t));
+    if (!result){ goto error; }
+    uint16_t *dst = (uint16_t *)PyBytes_AS_STRING(result);
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        dst[i] = float_to_half_float(src[i]);
+    }
+
+    PyBuffer_Release(&buffer);
+    return result;
+error:
+    if (buffer.obj != 0)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    return 0;
+}
+
+static PyObject *
+pack_int_2_10_10_10_rev_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer buffer;
+    buffer.obj = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    Py_ssize_t components = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+    if (components != 3 && components != 4)
+    {
+        PyErr_Format(PyExc_ValueError, "unexpected component count: %zi", components);
+        goto error;
+    }
+
+    Py_ssize_t float_count;
+    if (get_float_data(args[0], &buffer, &float_count) == -1){ goto error; }
+    if (float_count % components != 0)
+    {
+        PyErr_Format(
+            PyExc_ValueError,
+            "float data is not a multiple of %zi components (count: %zi)",
+            components,
+            float_count
+        );
+        goto error;
+    }
+    Py_ssize_t count = float_count / components;
+    const float *src = buffer.buf;
+
+    PyObject *result = PyBytes_FromStringAndSize(0, count * sizeof(uint32_t));
+    if (!result){ goto error; }
+    uint32_t *dst = (uint32_t *)PyBytes_AS_STRING(result);
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        const float *vector = src + (i * components);
+        uint32_t x = (uint32_t)lroundf(clamp_float(vector[0], -1.0f, 1.0f) * 511.0f);
+        uint32_t y = (uint32_t)lroundf(clamp_float(vector[1], -1.0f, 1.0f) * 511.0f);
+        uint32_t z = (uint32_t)lroundf(clamp_float(vector[2], -1.0f, 1.0f) * 511.0f);
+        uint32_t w = 0;
+        if (components == 4)
+        {
+            w = (uint32_t)lroundf(clamp_float(vector[3], -1.0f, 1.0f));
         }
+        dst[i] = (x & 0x3FF) | ((y & 0x3FF) << 10) | ((z & 0x3FF) << 20) | ((w & 0x3) << 30);
+    }
 
-        static const float default_blend_color[] = {1, 1, 1, 1};
-        const float *blend_color = default_blend_color;
-        if (py_blend_color != Py_None)
+    PyBuffer_Release(&buffer);
+    return result;
+error:
+    if (buffer.obj != 0)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    return 0;
+}
+
+// restart indices are read as UINT32_MAX and do not count towards the vertex count
+static uint32_t *
+read_index_data(
+    PyObject *py_data,
+    Py_ssize_t index_size,
+    bool allow_restart,
+    Py_ssize_t *count,
+    uint64_t *vertex_count
+)
+{
+    Py_buffer buffer;
+    if (PyObject_GetBuffer(py_data, &buffer, PyBUF_CONTIG_RO) == -1){ return 0; }
+    if (index_size != 1 && index_size != 2 && index_size != 4)
+    {
+        PyBuffer_Release(&buffer);
+        PyErr_SetString(PyExc_ValueError, "index size must be 1, 2 or 4");
+        return 0;
+    }
+
+    *count = buffer.len / index_size;
+    uint32_t *indices = PyMem_Malloc(sizeof(uint32_t) * (*count + 1));
+    if (!indices)
+    {
+        PyBuffer_Release(&buffer);
+        PyErr_NoMemory();
+        return 0;
+    }
+
+    uint32_t restart_index = (uint32_t)(((uint64_t)1 << (index_size * 8)) - 1);
+    *vertex_count = 0;
+    for (Py_ssize_t i = 0; i < *count; i++)
+    {
+        switch (index_size)
         {
-            if (!emath_api)
+            case 1:
+                indices[i] = ((const uint8_t *)buffer.buf)[i];
+                break;
+            case 2:
+                indices[i] = ((const uint16_t *)buffer.buf)[i];
+                break;
+            default:
+                indices[i] = ((const uint32_t *)buffer.buf)[i];
+                break;
+        }
+        if (indices[i] == restart_index)
+        {
+            if (!allow_restart)
             {
-                emath_api = EMathApi_Get();
-                CHECK_UNEXPECTED_PYTHON_ERROR();
+                PyMem_Free(indices);
+                PyBuffer_Release(&buffer);
+                PyErr_SetString(PyExc_ValueError, "indices must not contain the restart index");
+                return 0;
             }
-            blend_color = emath_api->FVector4_GetValuePointer(py_blend_color);
-            CHECK_UNEXPECTED_PYTHON_ERROR();
+            indices[i] = UINT32_MAX;
         }
-        if (memcmp(state->blend_color, blend_color, sizeof(float) * 4) != 0)
+        else if ((uint64_t)indices[i] + 1 > *vertex_count)
         {
-            glBlendColor(blend_color[0], blend_color[1], blend_color[2], blend_color[3]);
-            CHECK_GL_ERROR();
-            memcpy(state->blend_color, blend_color, sizeof(float) * 4);
+            *vertex_count = (uint64_t)indices[i] + 1;
         }
     }
 
-    if (py_cull_face == Py_None)
+    PyBuffer_Release(&buffer);
+    return indices;
+}
+
+static PyObject *
+write_index_data(const uint32_t *indices, Py_ssize_t count, Py_ssize_t index_size)
+{
+    PyObject *result = PyBytes_FromStringAndSize(0, count * index_size);
+    if (!result){ return 0; }
+    char *dst = PyBytes_AS_STRING(result);
+    for (Py_ssize_t i = 0; i < count; i++)
     {
-        if (state->cull_face_enabled)
+        if (indices[i] == UINT32_MAX)
         {
-            glDisable(GL_CULL_FACE);
-            CHECK_GL_ERROR();
-            state->cull_face_enabled = false;
+            memset(dst + i * index_size, 0xFF, index_size);
+            continue;
         }
-    }
-    else
-    {
-        if (!state->cull_face_enabled)
+        switch (index_size)
         {
-            glEnable(GL_CULL_FACE);
-            CHECK_GL_ERROR();
-            state->cull_face_enabled = true;
+            case 1:
+                ((uint8_t *)dst)[i] = (uint8_t)indices[i];
+                break;
+            case 2:
+                ((uint16_t *)dst)[i] = (uint16_t)indices[i];
+                break;
+            default:
+                ((uint32_t *)dst)[i] = indices[i];
+                break;
         }
+    }
+    return result;
+}
 
-        GLenum cull_face = PyLong_AsLong(args[12]);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+static int
+compare_uint32(const void *a, const void *b)
+{
+    uint32_t value_a = *(const uint32_t *)a;
+    uint32_t value_b = *(const uint32_t *)b;
+    return (value_a > value_b) - (value_a < value_b);
+}
 
-        if (state->cull_face != cull_face)
+// maps indices onto the sorted unique vertices they reference so that per vertex
+// allocations are bounded by the index count rather than by the largest index
+static int
+compact_index_data(
+    uint32_t *indices,
+    Py_ssize_t count,
+    uint32_t **unique,
+    uint32_t *unique_count
+)
+{
+    *unique = PyMem_Malloc(sizeof(uint32_t) * (count + 1));
+    if (!*unique)
+    {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (count > 0)
+    {
+        memcpy(*unique, indices, sizeof(uint32_t) * count);
+    }
+    qsort(*unique, count, sizeof(uint32_t), compare_uint32);
+    *unique_count = 0;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        if (*unique_count == 0 || (*unique)[*unique_count - 1] != (*unique)[i])
         {
-            glCullFace(cull_face);
-            CHECK_GL_ERROR();
-            state->cull_face = cull_face;
+            (*unique)[(*unique_count)++] = (*unique)[i];
         }
     }
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        const uint32_t *found = bsearch(
+            &indices[i],
+            *unique,
+            *unique_count,
+            sizeof(uint32_t),
+            compare_uint32
+        );
+        assert(found);
+        indices[i] = (uint32_t)(found - *unique);
+    }
+    return 0;
+}
+
+static int
+order_triangles_for_vertex_cache(
+    const uint32_t *indices,
+    Py_ssize_t triangle_count,
+    uint32_t vertex_count,
+    Py_ssize_t cache_size,
+    uint32_t *output,
+    Py_ssize_t *cluster_starts,
+    Py_ssize_t *cluster_count
+)
+{
+    int result = -1;
+    Py_ssize_t corner_count = triangle_count * 3;
+    Py_ssize_t *adjacency_offsets = PyMem_Calloc(vertex_count + 1, sizeof(Py_ssize_t));
+    Py_ssize_t *adjacency = PyMem_Malloc(sizeof(Py_ssize_t) * (corner_count + 1));
+    Py_ssize_t *live = PyMem_Calloc(vertex_count + 1, sizeof(Py_ssize_t));
+    Py_ssize_t *cache_time = PyMem_Calloc(vertex_count + 1, sizeof(Py_ssize_t));
+    bool *emitted = PyMem_Calloc(triangle_count + 1, sizeof(bool));
+    uint32_t *dead_end = PyMem_Malloc(sizeof(uint32_t) * (corner_count + 1));
+    uint32_t *candidates = PyMem_Malloc(sizeof(uint32_t) * (corner_count + 1));
+    if (
+        !adjacency_offsets ||
+        !adjacency ||
+        !live ||
+        !cache_time ||
+        !emitted ||
+        !dead_end ||
+        !candidates
+    )
+    {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
 
-    if (py_scissor_position == Py_None || py_scissor_size == Py_None)
+    for (Py_ssize_t i = 0; i < corner_count; i++)
     {
-        if (state->scissor_enabled)
-        {
-            glDisable(GL_SCISSOR_TEST);
-            CHECK_GL_ERROR();
-            state->scissor_enabled = false;
-        }
+        live[indices[i]] += 1;
     }
-    else
+    for (uint32_t v = 0; v < vertex_count; v++)
     {
-        if (!state->scissor_enabled)
+        adjacency_offsets[v + 1] = adjacency_offsets[v] + live[v];
+        cache_time[v] = adjacency_offsets[v];
+    }
+    for (Py_ssize_t i = 0; i < corner_count; i++)
+    {
+        adjacency[cache_time[indices[i]]++] = i / 3;
+    }
+    memset(cache_time, 0, sizeof(Py_ssize_t) * (vertex_count + 1));
+
+    Py_ssize_t output_count = 0;
+    Py_ssize_t dead_end_count = 0;
+    Py_ssize_t timestamp = cache_size + 1;
+    uint32_t cursor = 0;
+    int64_t fan = triangle_count > 0 ? (int64_t)indices[0] : -1;
+    bool new_cluster = true;
+    if (cluster_count)
+    {
+        *cluster_count = 0;
+    }
+    while (fan >= 0)
+    {
+        if (new_cluster && cluster_starts)
         {
-            glEnable(GL_SCISSOR_TEST);
-            CHECK_GL_ERROR();
-            state->scissor_enabled = true;
+            cluster_starts[(*cluster_count)++] = output_count / 3;
         }
+        new_cluster = false;
 
-        if (!emath_api)
+        Py_ssize_t candidate_count = 0;
+        for (Py_ssize_t a = adjacency_offsets[fan]; a < adjacency_offsets[fan + 1]; a++)
         {
-            emath_api = EMathApi_Get();
-            CHECK_UNEXPECTED_PYTHON_ERROR();
+            Py_ssize_t triangle = adjacency[a];
+            if (emitted[triangle])
+            {
+                continue;
+            }
+            for (Py_ssize_t c = 0; c < 3; c++)
+            {
+                uint32_t v = indices[triangle * 3 + c];
+                output[output_count++] = v;
+                dead_end[dead_end_count++] = v;
+                candidates[candidate_count++] = v;
+                live[v] -= 1;
+                if (timestamp - cache_time[v] > cache_size)
+                {
+                    cache_time[v] = timestamp++;
+                }
+            }
+            emitted[triangle] = true;
         }
 
-        const int* scissor_position = emath_api->IVector2_GetValuePointer(py_scissor_position);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
-        const int* scissor_size = emath_api->IVector2_GetValuePointer(py_scissor_size);
-        CHECK_UNEXPECTED_PYTHON_ERROR();
+        int64_t next = -1;
+        Py_ssize_t best_priority = -1;
+        for (Py_ssize_t i = 0; i < candidate_count; i++)
+        {
+            uint32_t v = candidates[i];
+            if (live[v] <= 0)
+            {
+                continue;
+            }
+            Py_ssize_t priority = 0;
+            if (timestamp - cache_time[v] + 2 * live[v] <= cache_size)
+            {
+                priority = timestamp - cache_time[v];
+            }
+            if (priority > best_priority)
+            {
+                best_priority = priority;
+                next = v;
+            }
+        }
 
-        if (
-            scissor_position[0] != state->scissor[0] ||
-            scissor_position[1] != state->scissor[1] ||
-            scissor_size[0] != state->scissor[2] ||
-            scissor_size[1] != state->scissor[3]
-        )
+        if (next == -1)
         {
-            glScissor(scissor_position[0], scissor_position[1], scissor_size[0], scissor_size[1]);
-            CHECK_GL_ERROR();
-            state->scissor[0] = scissor_position[0];
-            state->scissor[1] = scissor_position[1];
-            state->scissor[2] = scissor_size[2];
-            state->scissor[3] = scissor_size[3];
+            new_cluster = true;
+            while (dead_end_count > 0)
+            {
+                uint32_t v = dead_end[--dead_end_count];
+                if (live[v] > 0)
+                {
+                    next = v;
+                    break;
+                }
+            }
+            while (next == -1 && cursor < vertex_count)
+            {
+                if (live[cursor] > 0)
+                {
+                    next = cursor;
+                }
+                else
+                {
+                    cursor++;
+                }
+            }
         }
+        fan = next;
     }
+    assert(output_count == corner_count);
+
+    result = 0;
+cleanup:
+    PyMem_Free(adjacency_offsets);
+    PyMem_Free(adjacency);
+    PyMem_Free(live);
+    PyMem_Free(cache_time);
+    PyMem_Free(emitted);
+    PyMem_Free(dead_end);
+    PyMem_Free(candidates);
+    return result;
+}
 
-    if (state->polygon_rasterization_mode != polygon_rasterization_mode)
+static PyObject *
+optimize_index_data_vertex_cache(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    uint32_t *indices = 0;
+    uint32_t *unique = 0;
+    uint32_t *output = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(3);
+
+    Py_ssize_t index_size = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t cache_size = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t count;
+    uint64_t vertex_count;
+    indices = read_index_data(args[0], index_size, false, &count, &vertex_count);
+    if (!indices){ goto error; }
+
+    uint32_t unique_count;
+    if (compact_index_data(indices, count, &unique, &unique_count) == -1){ goto error; }
+
+    output = PyMem_Malloc(sizeof(uint32_t) * (count + 1));
+    if (!output)
     {
-        glPolygonMode(GL_FRONT_AND_BACK, polygon_rasterization_mode);
-        CHECK_GL_ERROR();
-        state->polygon_rasterization_mode = polygon_rasterization_mode;
+        PyErr_NoMemory();
+        goto error;
+    }
+    if (order_triangles_for_vertex_cache(
+        indices,
+        count / 3,
+        unique_count,
+        cache_size,
+        output,
+        0,
+        0
+    ) == -1){ goto error; }
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        output[i] = unique[output[i]];
     }
 
-    if (state->point_size != point_size)
+    PyObject *result = write_index_data(output, count, index_size);
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(output);
+    return result;
+error:
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(output);
+    return 0;
+}
+
+typedef struct
+{
+    float key;
+    Py_ssize_t cluster;
+} ClusterSortKey;
+
+static int
+compare_cluster_sort_keys(const void *a, const void *b)
+{
+    const ClusterSortKey *key_a = a;
+    const ClusterSortKey *key_b = b;
+    if (key_a->key > key_b->key){ return -1; }
+    if (key_a->key < key_b->key){ return 1; }
+    if (key_a->cluster < key_b->cluster){ return -1; }
+    if (key_a->cluster > key_b->cluster){ return 1; }
+    return 0;
+}
+
+static PyObject *
+optimize_index_data_overdraw(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    Py_buffer positions_buffer;
+    positions_buffer.obj = 0;
+    uint32_t *indices = 0;
+    uint32_t *unique = 0;
+    uint32_t *ordered = 0;
+    uint32_t *output = 0;
+    Py_ssize_t *cluster_starts = 0;
+    float *cluster_data = 0;
+    ClusterSortKey *sort_keys = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(5);
+
+    Py_ssize_t index_size = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t position_stride = PyLong_AsSsize_t(args[3]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t cache_size = PyLong_AsSsize_t(args[4]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t count;
+    uint64_t vertex_count;
+    indices = read_index_data(args[0], index_size, false, &count, &vertex_count);
+    if (!indices){ goto error; }
+    Py_ssize_t triangle_count = count / 3;
+
+    if (PyObject_GetBuffer(args[2], &positions_buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+    if (
+        vertex_count > 0 &&
+        (Py_ssize_t)(vertex_count - 1) * position_stride + (Py_ssize_t)sizeof(float) * 3 >
+        positions_buffer.len
+    )
     {
-        glPointSize(point_size);
-        CHECK_GL_ERROR();
-        state->point_size = point_size;
+        PyErr_SetString(PyExc_ValueError, "indices reference vertices beyond positions");
+        goto error;
     }
+    const char *positions = positions_buffer.buf;
 
-    if (state->clip_distances != clip_distances)
+    uint32_t unique_count;
+    if (compact_index_data(indices, count, &unique, &unique_count) == -1){ goto error; }
+
+    ordered = PyMem_Malloc(sizeof(uint32_t) * (count + 1));
+    output = PyMem_Malloc(sizeof(uint32_t) * (count + 1));
+    cluster_starts = PyMem_Malloc(sizeof(Py_ssize_t) * (triangle_count + 1));
+    if (!ordered || !output || !cluster_starts)
     {
-        if (state->clip_distances < clip_distances)
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    Py_ssize_t cluster_count = 0;
+    if (order_triangles_for_vertex_cache(
+        indices,
+        triangle_count,
+        unique_count,
+        cache_size,
+        ordered,
+        cluster_starts,
+        &cluster_count
+    ) == -1){ goto error; }
+    cluster_starts[cluster_count] = triangle_count;
+    for (Py_ssize_t i = 0; i < triangle_count * 3; i++)
+    {
+        ordered[i] = unique[ordered[i]];
+    }
+
+    cluster_data = PyMem_Calloc(cluster_count + 1, sizeof(float) * 6);
+    sort_keys = PyMem_Malloc(sizeof(ClusterSortKey) * (cluster_count + 1));
+    if (!cluster_data || !sort_keys)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    float mesh_centroid[3] = {0, 0, 0};
+    float mesh_area = 0;
+    for (Py_ssize_t c = 0; c < cluster_count; c++)
+    {
+        float *centroid = &cluster_data[c * 6];
+        float *normal = &cluster_data[c * 6 + 3];
+        float cluster_area = 0;
+        for (Py_ssize_t t = cluster_starts[c]; t < cluster_starts[c + 1]; t++)
         {
-            for (int i = state->clip_distances; i < clip_distances; i++)
+            const float *p0 = (const float *)(positions + ordered[t * 3] * position_stride);
+            const float *p1 = (const float *)(positions + ordered[t * 3 + 1] * position_stride);
+            const float *p2 = (const float *)(positions + ordered[t * 3 + 2] * position_stride);
+            float e1[3] = {p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2]};
+            float e2[3] = {p2[0] - p0[0], p2[1] - p0[1], p2[2] - p0[2]};
+            float n[3] = {
+                e1[1] * e2[2] - e1[2] * e2[1],
+                e1[2] * e2[0] - e1[0] * e2[2],
+                e1[0] * e2[1] - e1[1] * e2[0],
+            };
+            float area = sqrtf(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]);
+            for (int i = 0; i < 3; i++)
             {
-                glEnable(GL_CLIP_DISTANCE0 + i);
-                CHECK_GL_ERROR();
+                centroid[i] += (p0[i] + p1[i] + p2[i]) / 3.0f * area;
+                normal[i] += n[i];
             }
+            cluster_area += area;
         }
-        else
+        for (int i = 0; i < 3; i++)
         {
-            for (int i = clip_distances; i < state->clip_distances; i++)
+            mesh_centroid[i] += centroid[i];
+            if (cluster_area > 0)
             {
-                glDisable(GL_CLIP_DISTANCE0 + i);
-                CHECK_GL_ERROR();
+                centroid[i] /= cluster_area;
+            }
+        }
+        mesh_area += cluster_area;
+    }
+    if (mesh_area > 0)
+    {
+        for (int i = 0; i < 3; i++)
+        {
+            mesh_centroid[i] /= mesh_area;
+        }
+    }
+
+    for (Py_ssize_t c = 0; c < cluster_count; c++)
+    {
+        const float *centroid = &cluster_data[c * 6];
+        const float *normal = &cluster_data[c * 6 + 3];
+        float length = sqrtf(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]);
+        float key = 0;
+        if (length > 0)
+        {
+            for (int i = 0; i < 3; i++)
+            {
+                key += (centroid[i] - mesh_centroid[i]) * normal[i] / length;
             }
         }
-        state->clip_distances = clip_distances;
+        sort_keys[c].key = key;
+        sort_keys[c].cluster = c;
+    }
+    qsort(sort_keys, cluster_count, sizeof(ClusterSortKey), compare_cluster_sort_keys);
+
+    Py_ssize_t output_count = 0;
+    for (Py_ssize_t i = 0; i < cluster_count; i++)
+    {
+        Py_ssize_t c = sort_keys[i].cluster;
+        Py_ssize_t start = cluster_starts[c] * 3;
+        Py_ssize_t end = cluster_starts[c + 1] * 3;
+        memcpy(&output[output_count], &ordered[start], sizeof(uint32_t) * (end - start));
+        output_count += end - start;
+    }
+
+    PyObject *result = write_index_data(output, count, index_size);
+    PyBuffer_Release(&positions_buffer);
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(ordered);
+    PyMem_Free(output);
+    PyMem_Free(cluster_starts);
+    PyMem_Free(cluster_data);
+    PyMem_Free(sort_keys);
+    return result;
+error:
+    if (positions_buffer.obj)
+    {
+        PyBuffer_Release(&positions_buffer);
+    }
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(ordered);
+    PyMem_Free(output);
+    PyMem_Free(cluster_starts);
+    PyMem_Free(cluster_data);
+    PyMem_Free(sort_keys);
+    return 0;
+}
+
+static PyObject *
+optimize_index_data_vertex_fetch(PyObject *module, PyObject **args, Py_ssize_t nargs)
+{
+    uint32_t *indices = 0;
+    uint32_t *unique = 0;
+    uint32_t *remap = 0;
+    PyObject *py_indices = 0;
+    PyObject *py_order = 0;
+
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    Py_ssize_t index_size = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t count;
+    uint64_t vertex_count;
+    indices = read_index_data(args[0], index_size, false, &count, &vertex_count);
+    if (!indices){ goto error; }
+
+    uint32_t unique_count;
+    if (compact_index_data(indices, count, &unique, &unique_count) == -1){ goto error; }
+
+    remap = PyMem_Malloc(sizeof(uint32_t) * (unique_count + 1));
+    if (!remap)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+    memset(remap, 0xFF, sizeof(uint32_t) * (unique_count + 1));
+
+    py_order = PyBytes_FromStringAndSize(0, sizeof(uint32_t) * unique_count);
+    if (!py_order){ goto error; }
+    uint32_t *order = (uint32_t *)PyBytes_AS_STRING(py_order);
+
+    uint32_t order_count = 0;
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        uint32_t v = indices[i];
+        if (remap[v] == UINT32_MAX)
+        {
+            remap[v] = order_count;
+            order[order_count++] = unique[v];
+        }
+        indices[i] = remap[v];
     }
+    assert(order_count == unique_count);
 
-    if (emath_api){ EMathApi_Release(); }
-    Py_RETURN_NONE;
+    py_indices = write_index_data(indices, count, index_size);
+    if (!py_indices){ goto error; }
+
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(remap);
+    PyObject *result = PyTuple_Pack(2, py_indices, py_order);
+    Py_DECREF(py_indices);
+    Py_DECREF(py_order);
+    return result;
 error:
-    ex = PyErr_GetRaisedException();
-    if (emath_api){ EMathApi_Release(); }
-    PyErr_SetRaisedException(ex);
+    PyMem_Free(indices);
+    PyMem_Free(unique);
+    PyMem_Free(remap);
+    Py_XDECREF(py_indices);
+    Py_XDECREF(py_order);
     return 0;
 }
 
 static PyObject *
-get_gl_version(PyObject *module, PyObject *unused)
+remap_vertex_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    const GLubyte *gl_version = glGetString(GL_VERSION);
-    CHECK_GL_ERROR();
+    Py_buffer buffer;
+    buffer.obj = 0;
+    Py_buffer order_buffer;
+    order_buffer.obj = 0;
 
-    return PyUnicode_FromString(gl_version);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(4);
+
+    Py_ssize_t stride = PyLong_AsSsize_t(args[1]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    Py_ssize_t record_size = PyLong_AsSsize_t(args[2]);
+    CHECK_UNEXPECTED_PYTHON_ERROR();
+
+    if (PyObject_GetBuffer(args[0], &buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+    if (PyObject_GetBuffer(args[3], &order_buffer, PyBUF_CONTIG_RO) == -1){ goto error; }
+    const char *src = buffer.buf;
+    const uint32_t *order = order_buffer.buf;
+    Py_ssize_t count = order_buffer.len / sizeof(uint32_t);
+
+    PyObject *result = PyBytes_FromStringAndSize(0, count * stride);
+    if (!result){ goto error; }
+    char *dst = PyBytes_AS_STRING(result);
+    memset(dst, 0, count * stride);
+    for (Py_ssize_t i = 0; i < count; i++)
+    {
+        Py_ssize_t src_offset = (Py_ssize_t)order[i] * stride;
+        if (src_offset + record_size > buffer.len)
+        {
+            Py_DECREF(result);
+            PyErr_SetString(PyExc_ValueError, "indices reference vertices beyond attribute data");
+            goto error;
+        }
+        memcpy(dst + i * stride, src + src_offset, record_size);
+    }
+
+    PyBuffer_Release(&buffer);
+    PyBuffer_Release(&order_buffer);
+    return result;
 error:
+    if (buffer.obj)
+    {
+        PyBuffer_Release(&buffer);
+    }
+    if (order_buffer.obj)
+    {
+        PyBuffer_Release(&order_buffer);
+    }
     return 0;
 }
 
 static PyObject *
-set_gl_clip(PyObject *module, PyObject **args, Py_ssize_t nargs)
+narrow_index_data(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+    uint32_t *indices = 0;
+    PyObject *py_indices = 0;
 
-    GLenum origin = PyLong_AsLong(args[0]);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
 
-    GLenum depth = PyLong_AsLong(args[1]);
+    Py_ssize_t index_size = PyLong_AsSsize_t(args[1]);
     CHECK_UNEXPECTED_PYTHON_ERROR();
 
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    Py_ssize_t count;
+    uint64_t vertex_count;
+    indices = read_index_data(args[0], index_size, true, &count, &vertex_count);
+    if (!indices){ goto error; }
 
-    if (
-        !state->is_gl_clip_control_supported &&
-        (
-            origin != GL_LOWER_LEFT ||
-            depth != GL_NEGATIVE_ONE_TO_ONE
-        )
-    )
+    Py_ssize_t narrow_index_size = 4;
+    if (vertex_count <= UINT8_MAX)
     {
-        PyErr_SetString(PyExc_RuntimeError, "glClipControl not supported");
-        goto error;
+        narrow_index_size = 1;
     }
-
-    if (state->clip_origin != origin || state->clip_depth != depth)
+    else if (vertex_count <= UINT16_MAX)
     {
-        glClipControl(origin, depth);
-        CHECK_GL_ERROR();
-
-        state->clip_origin = origin;
-        state->clip_depth = depth;
+        narrow_index_size = 2;
     }
 
-    Py_RETURN_NONE;
+    py_indices = write_index_data(indices, count, narrow_index_size);
+    if (!py_indices){ goto error; }
+
+    PyMem_Free(indices);
+    PyObject *result = Py_BuildValue("(Nn)", py_indices, narrow_index_size);
+    return result;
 error:
+    PyMem_Free(indices);
+    Py_XDECREF(py_indices);
     return 0;
 }
 
 static PyObject *
-get_gl_clip(PyObject *module, PyObject* unused)
+join_index_data_strips(PyObject *module, PyObject **args, Py_ssize_t nargs)
 {
-    ModuleState *state = (ModuleState *)PyModule_GetState(module);
-    CHECK_UNEXPECTED_PYTHON_ERROR();
+    PyObject *strips = 0;
+    uint32_t **strip_indices = 0;
+    Py_ssize_t *strip_counts = 0;
+    Py_ssize_t strip_count = 0;
+    PyObject *py_indices = 0;
 
-    return Py_BuildValue("(ii)", state->clip_origin, state->clip_depth);
+    CHECK_UNEXPECTED_ARG_COUNT_ERROR(2);
+
+    Py_ssize_t index_size = 0;
+    if (args[1] != Py_None)
+    {
+        index_size = PyLong_AsSsize_t(args[1]);
+        CHECK_UNEXPECTED_PYTHON_ERROR();
+    }
+
+    strips = PySequence_Fast(args[0], "strips must be a sequence");
+    if (!strips){ goto error; }
+    strip_count = PySequence_Fast_GET_SIZE(strips);
+
+    strip_indices = PyMem_Calloc(strip_count + 1, sizeof(uint32_t *));
+    strip_counts = PyMem_Calloc(strip_count + 1, sizeof(Py_ssize_t));
+    if (!strip_indices || !strip_counts)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    Py_ssize_t total_count = 0;
+    uint64_t vertex_count = 0;
+    for (Py_ssize_t i = 0; i < strip_count; i++)
+    {
+        PyObject *py_data;
+        Py_ssize_t strip_index_size;
+        if (!PyArg_ParseTuple(
+            PySequence_Fast_GET_ITEM(strips, i),
+            "On",
+            &py_data,
+            &strip_index_size
+        )){ goto error; }
+        uint64_t strip_vertex_count;
+        strip_indices[i] = read_index_data(
+            py_data,
+            strip_index_size,
+            true,
+            &strip_counts[i],
+            &strip_vertex_count
+        );
+        if (!strip_indices[i]){ goto error; }
+        if (strip_vertex_count > vertex_count)
+        {
+            vertex_count = strip_vertex_count;
+        }
+        total_count += strip_counts[i] + (i > 0 ? 1 : 0);
+    }
+
+    if (index_size == 0)
+    {
+        index_size = 4;
+        if (vertex_count <= UINT8_MAX)
+        {
+            index_size = 1;
+        }
+        else if (vertex_count <= UINT16_MAX)
+        {
+            index_size = 2;
+        }
+    }
+    uint32_t restart_index = (uint32_t)(((uint64_t)1 << (index_size * 8)) - 1);
+    if (vertex_count > restart_index)
+    {
+        PyErr_SetString(PyExc_ValueError, "indices do not fit below the restart index");
+        goto error;
+    }
+
+    py_indices = PyBytes_FromStringAndSize(0, total_count * index_size);
+    if (!py_indices){ goto error; }
+    char *dst = PyBytes_AS_STRING(py_indices);
+    Py_ssize_t offset = 0;
+    for (Py_ssize_t i = 0; i < strip_count; i++)
+    {
+        if (i > 0)
+        {
+            memset(dst + offset * index_size, 0xFF, index_size);
+            offset += 1;
+        }
+        for (Py_ssize_t j = 0; j < strip_counts[i]; j++)
+        {
+            uint32_t index = strip_indices[i][j];
+            if (index == UINT32_MAX)
+            {
+                memset(dst + offset * index_size, 0xFF, index_size);
+                offset += 1;
+                continue;
+            }
+            switch (index_size)
+            {
+                case 1:
+                    ((uint8_t *)dst)[offset] = (uint8_t)index;
+                    break;
+                case 2:
+                    ((uint16_t *)dst)[offset] = (uint16_t)index;
+                    break;
+                default:
+                    ((uint32_t *)dst)[offset] = index;
+                    break;
+            }
+            offset += 1;
+        }
+    }
+    assert(offset == total_count);
+
+    for (Py_ssize_t i = 0; i < strip_count; i++)
+    {
+        PyMem_Free(strip_indices[i]);
+    }
+    PyMem_Free(strip_indices);
+    PyMem_Free(strip_counts);
+    Py_DECREF(strips);
+    return Py_BuildValue("(Nn)", py_indices, index_size);
 error:
+    if (strip_indices)
+    {
+        for (Py_ssize_t i = 0; i < strip_count; i++)
+        {
+            PyMem_Free(strip_indices[i]);
+        }
+    }
+    PyMem_Free(strip_indices);
+    PyMem_Free(strip_counts);
+    Py_XDECREF(strips);
+    Py_XDECREF(py_indices);
     return 0;
 }
 
@@ -2143,9 +5404,38 @@ static PyMethodDef module_PyMethodDef[] = {
     {"set_gl_buffer_target", (PyCFunction)set_gl_buffer_target, METH_FASTCALL, 0},
     {"set_gl_buffer_target_data", (PyCFunction)set_gl_buffer_target_data, METH_FASTCALL, 0},
     {"write_gl_buffer_target_data", (PyCFunction)write_gl_buffer_target_data, METH_FASTCALL, 0},
-    {"create_gl_buffer_memory_view", (PyCFunction)create_gl_buffer_memory_view, METH_FASTCALL, 0},
+    {"write_gl_buffer_target_data_many", (PyCFunction)write_gl_buffer_target_data_many, METH_FASTCALL, 0},
     {"release_gl_buffer_memory_view", release_gl_buffer_memory_view, METH_O, 0},
+    {"set_gl_buffer_target_storage", (PyCFunction)set_gl_buffer_target_storage, METH_FASTCALL, 0},
+    {"create_gl_buffer_range_memory_view", (PyCFunction)create_gl_buffer_range_memory_view, METH_FASTCALL, 0},
+    {"copy_gl_buffer_target_data", (PyCFunction)copy_gl_buffer_target_data, METH_FASTCALL, 0},
+    {"copy_gl_buffer_target_data_many", (PyCFunction)copy_gl_buffer_target_data_many, METH_FASTCALL, 0},
+    {"clear_gl_buffer_target_data", (PyCFunction)clear_gl_buffer_target_data, METH_FASTCALL, 0},
+    {"flush_gl_buffer_target_range", (PyCFunction)flush_gl_buffer_target_range, METH_FASTCALL, 0},
+    {"create_gl_named_buffer", create_gl_named_buffer, METH_NOARGS, 0},
+    {"set_gl_named_buffer_data", (PyCFunction)set_gl_named_buffer_data, METH_FASTCALL, 0},
+    {"set_gl_named_buffer_storage", (PyCFunction)set_gl_named_buffer_storage, METH_FASTCALL, 0},
+    {"write_gl_named_buffer_data", (PyCFunction)write_gl_named_buffer_data, METH_FASTCALL, 0},
+    {"write_gl_named_buffer_data_many", (PyCFunction)write_gl_named_buffer_data_many, METH_FASTCALL, 0},
+    {"copy_gl_named_buffer_data_many", (PyCFunction)copy_gl_named_buffer_data_many, METH_FASTCALL, 0},
+    {"clear_gl_named_buffer_data", (PyCFunction)clear_gl_named_buffer_data, METH_FASTCALL, 0},
+    {"create_gl_named_buffer_memory_view", (PyCFunction)create_gl_named_buffer_memory_view, METH_FASTCALL, 0},
+    {"release_gl_named_buffer_memory_view", release_gl_named_buffer_memory_view, METH_O, 0},
+    {"flush_gl_named_buffer_range", (PyCFunction)flush_gl_named_buffer_range, METH_FASTCALL, 0},
+    {"create_gl_named_texture", create_gl_named_texture, METH_O, 0},
+    {"set_gl_named_texture_2d_storage", (PyCFunction)set_gl_named_texture_2d_storage, METH_FASTCALL, 0},
+    {"write_gl_named_texture_2d_data", (PyCFunction)write_gl_named_texture_2d_data, METH_FASTCALL, 0},
+    {"generate_gl_named_texture_mipmaps", generate_gl_named_texture_mipmaps, METH_O, 0},
+    {"set_gl_named_texture_parameters", (PyCFunction)set_gl_named_texture_parameters, METH_FASTCALL, 0},
+    {"create_gl_named_framebuffer", create_gl_named_framebuffer, METH_NOARGS, 0},
+    {"attach_color_texture_to_gl_named_framebuffer", (PyCFunction)attach_color_texture_to_gl_named_framebuffer, METH_FASTCALL, 0},
+    {"attach_depth_texture_to_gl_named_framebuffer", (PyCFunction)attach_depth_texture_to_gl_named_framebuffer, METH_FASTCALL, 0},
+    {"attach_depth_renderbuffer_to_gl_named_framebuffer", (PyCFunction)attach_depth_renderbuffer_to_gl_named_framebuffer, METH_FASTCALL, 0},
+    {"set_texture_locations_on_gl_named_framebuffer", (PyCFunction)set_texture_locations_on_gl_named_framebuffer, METH_FASTCALL, 0},
     {"configure_gl_vertex_array_location", (PyCFunction)configure_gl_vertex_array_location, METH_FASTCALL, 0},
+    {"configure_gl_vertex_array_format", (PyCFunction)configure_gl_vertex_array_format, METH_FASTCALL, 0},
+    {"set_gl_vertex_array_binding_divisor", (PyCFunction)set_gl_vertex_array_binding_divisor, METH_FASTCALL, 0},
+    {"bind_gl_vertex_buffers", bind_gl_vertex_buffers, METH_O, 0},
     {"set_draw_framebuffer", (PyCFunction)set_draw_framebuffer, METH_FASTCALL, 0},
     {"set_read_framebuffer", set_read_framebuffer, METH_O, 0},
     {"read_color_from_framebuffer", (PyCFunction)read_color_from_framebuffer, METH_FASTCALL, 0},
@@ -2163,7 +5453,15 @@ static PyMethodDef module_PyMethodDef[] = {
     {"get_gl_program_uniforms", get_gl_program_uniforms, METH_O, 0},
     {"get_gl_program_attributes", get_gl_program_attributes, METH_O, 0},
     {"get_gl_program_storage_blocks", get_gl_program_storage_blocks, METH_O, 0},
+    {"get_gl_program_uniform_blocks", get_gl_program_uniform_blocks, METH_O, 0},
+    {"get_gl_program_binary_length", get_gl_program_binary_length, METH_O, 0},
+    {"get_gl_program_binary", get_gl_program_binary, METH_O, 0},
+    {"create_gl_program_from_binary", (PyCFunction)create_gl_program_from_binary, METH_FASTCALL, 0},
     {"create_gl_program", (PyCFunction)create_gl_program, METH_FASTCALL, 0},
+    {"start_gl_program", (PyCFunction)start_gl_program, METH_FASTCALL, 0},
+    {"is_gl_program_complete", is_gl_program_complete, METH_O, 0},
+    {"finish_gl_program", (PyCFunction)finish_gl_program, METH_FASTCALL, 0},
+    {"cancel_gl_program", (PyCFunction)cancel_gl_program, METH_FASTCALL, 0},
     {"delete_gl_program", delete_gl_program, METH_O, 0},
     {"use_gl_program", use_gl_program, METH_O, 0},
     {"set_active_gl_program_uniform_float", (PyCFunction)set_active_gl_program_uniform_float, METH_FASTCALL, 0},
@@ -2202,15 +5500,35 @@ static PyMethodDef module_PyMethodDef[] = {
     {"set_active_gl_program_uniform_double_4x4", (PyCFunction)set_active_gl_program_uniform_double_4x4, METH_FASTCALL, 0},
     {"execute_gl_program_index_buffer", (PyCFunction)execute_gl_program_index_buffer, METH_FASTCALL, 0},
     {"execute_gl_program_indices", (PyCFunction)execute_gl_program_indices, METH_FASTCALL, 0},
+    {"execute_gl_program_indirect", (PyCFunction)execute_gl_program_indirect, METH_FASTCALL, 0},
+    {"execute_gl_program_ranges", (PyCFunction)execute_gl_program_ranges, METH_FASTCALL, 0},
     {"execute_gl_program_compute", (PyCFunction)execute_gl_program_compute, METH_FASTCALL, 0},
     {"set_gl_memory_barrier", set_gl_memory_barrier, METH_O, 0},
     {"set_image_unit", (PyCFunction)set_image_unit, METH_FASTCALL, 0},
     {"set_shader_storage_buffer_unit", (PyCFunction)set_shader_storage_buffer_unit, METH_FASTCALL, 0},
     {"set_program_shader_storage_block_binding", (PyCFunction)set_program_shader_storage_block_binding, METH_FASTCALL, 0},
+    {"set_uniform_buffer_unit", (PyCFunction)set_uniform_buffer_unit, METH_FASTCALL, 0},
+    {"set_program_uniform_block_binding", (PyCFunction)set_program_uniform_block_binding, METH_FASTCALL, 0},
     {"set_gl_execution_state", (PyCFunction)set_gl_execution_state, METH_FASTCALL, 0},
+    {"create_gl_fence_sync", create_gl_fence_sync, METH_NOARGS, 0},
+    {"delete_gl_fence_sync", delete_gl_fence_sync, METH_O, 0},
+    {"wait_gl_fence_sync", (PyCFunction)wait_gl_fence_sync, METH_FASTCALL, 0},
     {"get_gl_version", (PyCFunction)get_gl_version, METH_NOARGS, 0},
+    {"get_gl_vendor", (PyCFunction)get_gl_vendor, METH_NOARGS, 0},
+    {"get_gl_renderer", (PyCFunction)get_gl_renderer, METH_NOARGS, 0},
     {"set_gl_clip", (PyCFunction)set_gl_clip, METH_FASTCALL, 0},
     {"get_gl_clip", (PyCFunction)get_gl_clip, METH_NOARGS, 0},
+    {"gather_strided_data", (PyCFunction)gather_strided_data, METH_FASTCALL, 0},
+    {"interleave_data", (PyCFunction)interleave_data, METH_FASTCALL, 0},
+    {"quantize_normalized_data", (PyCFunction)quantize_normalized_data, METH_FASTCALL, 0},
+    {"quantize_half_float_data", quantize_half_float_data, METH_O, 0},
+    {"pack_int_2_10_10_10_rev_data", (PyCFunction)pack_int_2_10_10_10_rev_data, METH_FASTCALL, 0},
+    {"optimize_index_data_vertex_cache", (PyCFunction)optimize_index_data_vertex_cache, METH_FASTCALL, 0},
+    {"optimize_index_data_overdraw", (PyCFunction)optimize_index_data_overdraw, METH_FASTCALL, 0},
+    {"optimize_index_data_vertex_fetch", (PyCFunction)optimize_index_data_vertex_fetch, METH_FASTCALL, 0},
+    {"remap_vertex_data", (PyCFunction)remap_vertex_data, METH_FASTCALL, 0},
+    {"narrow_index_data", (PyCFunction)narrow_index_data, METH_FASTCALL, 0},
+    {"join_index_data_strips", (PyCFunction)join_index_data_strips, METH_FASTCALL, 0},
     {0},
 };
 
@@ -2229,9 +5547,22 @@ PyInit__egraphics()
     GLint GL_MAX_CLIP_DISTANCES_VALUE = 0;
     GLint GL_MAX_IMAGE_UNITS_VALUE = 0;
     GLint GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE = 0;
+    GLint GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE = 0;
+    GLint GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE = 0;
+    bool is_gl_base_instance_supported = false;
+    bool is_gl_buffer_storage_supported = false;
+    bool is_gl_clear_buffer_supported = false;
     bool is_gl_clip_control_supported = false;
+    bool is_gl_direct_state_access_supported = false;
     bool is_gl_shader_storage_buffer_supported = false;
     bool is_gl_image_unit_supported = false;
+    bool is_gl_indirect_parameters_supported = false;
+    bool is_gl_multi_bind_supported = false;
+    bool is_gl_multi_draw_indirect_supported = false;
+    bool is_gl_parallel_shader_compile_supported = false;
+    bool is_gl_primitive_restart_fixed_index_supported = false;
+    bool is_gl_program_binary_supported = false;
+    bool is_gl_vertex_attrib_binding_supported = false;
     {
         PyObject *eplatform = PyImport_ImportModule("eplatform");
         if (!eplatform){ return 0; }
@@ -2290,6 +5621,207 @@ PyInit__egraphics()
             return 0;
         }
 
+        char *gl_base_instance_env = getenv("EGRAPHICS_GL_BASE_INSTANCE");
+        if (gl_base_instance_env && strcmp(gl_base_instance_env, "disabled") == 0)
+        {
+            assert(is_gl_base_instance_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_2 || GLEW_ARB_base_instance)
+            {
+                is_gl_base_instance_supported = true;
+            }
+            else
+            {
+                assert(is_gl_base_instance_supported == false);
+            }
+        }
+
+        char *gl_buffer_storage_env = getenv("EGRAPHICS_GL_BUFFER_STORAGE");
+        if (gl_buffer_storage_env && strcmp(gl_buffer_storage_env, "disabled") == 0)
+        {
+            assert(is_gl_buffer_storage_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_4 || GLEW_ARB_buffer_storage)
+            {
+                is_gl_buffer_storage_supported = true;
+            }
+            else
+            {
+                assert(is_gl_buffer_storage_supported == false);
+            }
+        }
+
+        char *gl_clear_buffer_env = getenv("EGRAPHICS_GL_CLEAR_BUFFER");
+        if (gl_clear_buffer_env && strcmp(gl_clear_buffer_env, "disabled") == 0)
+        {
+            assert(is_gl_clear_buffer_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_3 || GLEW_ARB_clear_buffer_object)
+            {
+                is_gl_clear_buffer_supported = true;
+            }
+            else
+            {
+                assert(is_gl_clear_buffer_supported == false);
+            }
+        }
+
+        char *gl_dsa_env = getenv("EGRAPHICS_GL_DIRECT_STATE_ACCESS");
+        if (gl_dsa_env && strcmp(gl_dsa_env, "disabled") == 0)
+        {
+            assert(is_gl_direct_state_access_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_5 || GLEW_ARB_direct_state_access)
+            {
+                is_gl_direct_state_access_supported = true;
+            }
+            else
+            {
+                assert(is_gl_direct_state_access_supported == false);
+            }
+        }
+
+        char *gl_vertex_attrib_binding_env = getenv("EGRAPHICS_GL_VERTEX_ATTRIB_BINDING");
+        if (gl_vertex_attrib_binding_env && strcmp(gl_vertex_attrib_binding_env, "disabled") == 0)
+        {
+            assert(is_gl_vertex_attrib_binding_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_3 || GLEW_ARB_vertex_attrib_binding)
+            {
+                is_gl_vertex_attrib_binding_supported = true;
+            }
+            else
+            {
+                assert(is_gl_vertex_attrib_binding_supported == false);
+            }
+        }
+
+        char *gl_multi_bind_env = getenv("EGRAPHICS_GL_MULTI_BIND");
+        if (gl_multi_bind_env && strcmp(gl_multi_bind_env, "disabled") == 0)
+        {
+            assert(is_gl_multi_bind_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_4 || GLEW_ARB_multi_bind)
+            {
+                is_gl_multi_bind_supported = true;
+            }
+            else
+            {
+                assert(is_gl_multi_bind_supported == false);
+            }
+        }
+
+        char *gl_multi_draw_indirect_env = getenv("EGRAPHICS_GL_MULTI_DRAW_INDIRECT");
+        if (gl_multi_draw_indirect_env && strcmp(gl_multi_draw_indirect_env, "disabled") == 0)
+        {
+            assert(is_gl_multi_draw_indirect_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_3 || GLEW_ARB_multi_draw_indirect)
+            {
+                is_gl_multi_draw_indirect_supported = true;
+            }
+            else
+            {
+                assert(is_gl_multi_draw_indirect_supported == false);
+            }
+        }
+
+        char *gl_indirect_parameters_env = getenv("EGRAPHICS_GL_INDIRECT_PARAMETERS");
+        if (gl_indirect_parameters_env && strcmp(gl_indirect_parameters_env, "disabled") == 0)
+        {
+            assert(is_gl_indirect_parameters_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_6 || GLEW_ARB_indirect_parameters)
+            {
+                is_gl_indirect_parameters_supported = true;
+            }
+            else
+            {
+                assert(is_gl_indirect_parameters_supported == false);
+            }
+        }
+
+        char *gl_primitive_restart_fixed_index_env = getenv(
+            "EGRAPHICS_GL_PRIMITIVE_RESTART_FIXED_INDEX"
+        );
+        if (
+            gl_primitive_restart_fixed_index_env &&
+            strcmp(gl_primitive_restart_fixed_index_env, "disabled") == 0
+        )
+        {
+            assert(is_gl_primitive_restart_fixed_index_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_3 || GLEW_ARB_ES3_compatibility)
+            {
+                is_gl_primitive_restart_fixed_index_supported = true;
+            }
+            else
+            {
+                assert(is_gl_primitive_restart_fixed_index_supported == false);
+            }
+        }
+
+        char *gl_parallel_shader_compile_env = getenv("EGRAPHICS_GL_PARALLEL_SHADER_COMPILE");
+        if (
+            gl_parallel_shader_compile_env &&
+            strcmp(gl_parallel_shader_compile_env, "disabled") == 0
+        )
+        {
+            assert(is_gl_parallel_shader_compile_supported == false);
+        }
+        else
+        {
+            if (GLEW_KHR_parallel_shader_compile)
+            {
+                is_gl_parallel_shader_compile_supported = true;
+                glMaxShaderCompilerThreadsKHR(0xFFFFFFFF);
+            }
+            else if (GLEW_ARB_parallel_shader_compile)
+            {
+                is_gl_parallel_shader_compile_supported = true;
+                glMaxShaderCompilerThreadsARB(0xFFFFFFFF);
+            }
+            else
+            {
+                assert(is_gl_parallel_shader_compile_supported == false);
+            }
+        }
+
+        char *gl_program_binary_env = getenv("EGRAPHICS_GL_PROGRAM_BINARY");
+        if (gl_program_binary_env && strcmp(gl_program_binary_env, "disabled") == 0)
+        {
+            assert(is_gl_program_binary_supported == false);
+        }
+        else
+        {
+            if (GLEW_VERSION_4_1 || GLEW_ARB_get_program_binary)
+            {
+                is_gl_program_binary_supported = true;
+            }
+            else
+            {
+                assert(is_gl_program_binary_supported == false);
+            }
+        }
+
         char *gl_clip_control_env = getenv("EGRAPHICS_GL_CLIP_CONTROL");
         if (gl_clip_control_env && strcmp(gl_clip_control_env, "disabled") == 0)
         {
@@ -2317,6 +5849,16 @@ PyInit__egraphics()
             &GL_MAX_CLIP_DISTANCES_VALUE
         );
 
+        glGetIntegerv(
+            GL_MAX_UNIFORM_BUFFER_BINDINGS,
+            &GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE
+        );
+
+        glGetIntegerv(
+            GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT,
+            &GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE
+        );
+
         char *gl_image_unit_env = getenv("EGRAPHICS_GL_IMAGE_UNIT");
         if (gl_image_unit_env && strcmp(gl_image_unit_env, "disabled") == 0)
         {
@@ -2398,8 +5940,19 @@ PyInit__egraphics()
             Py_DECREF(module);
             return 0;
         }
+        state->is_gl_base_instance_supported = is_gl_base_instance_supported;
+        state->is_gl_buffer_storage_supported = is_gl_buffer_storage_supported;
+        state->is_gl_clear_buffer_supported = is_gl_clear_buffer_supported;
         state->is_gl_clip_control_supported = is_gl_clip_control_supported;
         state->is_gl_image_unit_supported = is_gl_image_unit_supported;
+        state->is_gl_indirect_parameters_supported = is_gl_indirect_parameters_supported;
+        state->is_gl_multi_bind_supported = is_gl_multi_bind_supported;
+        state->is_gl_multi_draw_indirect_supported = is_gl_multi_draw_indirect_supported;
+        state->is_gl_parallel_shader_compile_supported = is_gl_parallel_shader_compile_supported;
+        state->is_gl_primitive_restart_fixed_index_supported = (
+            is_gl_primitive_restart_fixed_index_supported
+        );
+        state->is_gl_program_binary_supported = is_gl_program_binary_supported;
         state->is_gl_shader_storage_buffer_supported = is_gl_shader_storage_buffer_supported;
     }
 
@@ -2414,6 +5967,7 @@ PyInit__egraphics()
     ADD_ALIAS("GlBlendFactor", PyLong_Type);
     ADD_ALIAS("GlBlendFunction", PyLong_Type);
     ADD_ALIAS("GlBuffer", PyLong_Type);
+    ADD_ALIAS("GlBufferAccess", PyLong_Type);
     ADD_ALIAS("GlBufferTarget", PyLong_Type);
     ADD_ALIAS("GlBufferUsage", PyLong_Type);
     ADD_ALIAS("GlCull", PyLong_Type);
@@ -2424,6 +5978,7 @@ PyInit__egraphics()
     ADD_ALIAS("GlPrimitive", PyLong_Type);
     ADD_ALIAS("GlProgram", PyLong_Type);
     ADD_ALIAS("GlRenderbuffer", PyLong_Type);
+    ADD_ALIAS("GlSync", PyLong_Type);
     ADD_ALIAS("GlType", PyLong_Type);
     ADD_ALIAS("GlTexture", PyLong_Type);
     ADD_ALIAS("GlTextureComponents", PyLong_Type);
@@ -2445,6 +6000,7 @@ PyInit__egraphics()
 
     ADD_CONSTANT(GL_ARRAY_BUFFER);
     ADD_CONSTANT(GL_COPY_READ_BUFFER);
+    ADD_CONSTANT(GL_COPY_WRITE_BUFFER);
     ADD_CONSTANT(GL_ELEMENT_ARRAY_BUFFER);
     ADD_CONSTANT(GL_SHADER_STORAGE_BUFFER);
 
@@ -2458,6 +6014,15 @@ PyInit__egraphics()
     ADD_CONSTANT(GL_DYNAMIC_READ);
     ADD_CONSTANT(GL_DYNAMIC_COPY);
 
+    ADD_CONSTANT(GL_MAP_READ_BIT);
+    ADD_CONSTANT(GL_MAP_WRITE_BIT);
+    ADD_CONSTANT(GL_MAP_PERSISTENT_BIT);
+    ADD_CONSTANT(GL_MAP_COHERENT_BIT);
+    ADD_CONSTANT(GL_MAP_INVALIDATE_RANGE_BIT);
+    ADD_CONSTANT(GL_MAP_INVALIDATE_BUFFER_BIT);
+    ADD_CONSTANT(GL_MAP_FLUSH_EXPLICIT_BIT);
+    ADD_CONSTANT(GL_MAP_UNSYNCHRONIZED_BIT);
+
     ADD_CONSTANT(GL_FLOAT);
     ADD_CONSTANT(GL_DOUBLE);
     ADD_CONSTANT(GL_BYTE);
@@ -2466,6 +6031,9 @@ PyInit__egraphics()
     ADD_CONSTANT(GL_UNSIGNED_SHORT);
     ADD_CONSTANT(GL_INT);
     ADD_CONSTANT(GL_UNSIGNED_INT);
+    ADD_CONSTANT(GL_HALF_FLOAT);
+    ADD_CONSTANT(GL_INT_2_10_10_10_REV);
+    ADD_CONSTANT(GL_UNSIGNED_INT_2_10_10_10_REV);
     ADD_CONSTANT(GL_BOOL);
     ADD_CONSTANT(GL_FLOAT_VEC2);
     ADD_CONSTANT(GL_FLOAT_VEC3);
@@ -2617,6 +6185,26 @@ PyInit__egraphics()
     ADD_CONSTANT(GL_MAX_CLIP_DISTANCES_VALUE);
     ADD_CONSTANT(GL_MAX_IMAGE_UNITS_VALUE);
     ADD_CONSTANT(GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE);
+    ADD_CONSTANT(GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE);
+    ADD_CONSTANT(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE);
+
+    if (PyModule_AddObjectRef(
+        module,
+        "GL_DIRECT_STATE_ACCESS_SUPPORTED",
+        is_gl_direct_state_access_supported ? Py_True : Py_False
+    ) != 0)
+    {
+        return 0;
+    }
+
+    if (PyModule_AddObjectRef(
+        module,
+        "GL_VERTEX_ATTRIB_BINDING_SUPPORTED",
+        is_gl_vertex_attrib_binding_supported ? Py_True : Py_False
+    ) != 0)
+    {
+        return 0;
+    }
 
     ADD_CONSTANT(GL_NEVER);
     ADD_CONSTANT(GL_ALWAYS);
@@ -3,6 +3,7 @@ __all__ = [
     "GlBlendFactor",
     "GlBlendFunction",
     "GlBuffer",
+    "GlBufferAccess",
     "GlBufferTarget",
     "GlBufferUsage",
     "GlCull",
@@ -13,6 +14,7 @@ __all__ = [
     "GlPrimitive",
     "GlProgram",
     "GlRenderbuffer",
+    "GlSync",
     "GlType",
     "GlTexture",
     "GlTextureComponents",
@@ -22,6 +24,7 @@ __all__ = [
     "GlVertexArray",
     "GL_ARRAY_BUFFER",
     "GL_COPY_READ_BUFFER",
+    "GL_COPY_WRITE_BUFFER",
     "GL_ELEMENT_ARRAY_BUFFER",
     "GL_SHADER_STORAGE_BUFFER",
     "GL_STREAM_DRAW",
@@ -33,6 +36,14 @@ __all__ = [
     "GL_DYNAMIC_DRAW",
     "GL_DYNAMIC_READ",
     "GL_DYNAMIC_COPY",
+    "GL_MAP_READ_BIT",
+    "GL_MAP_WRITE_BIT",
+    "GL_MAP_PERSISTENT_BIT",
+    "GL_MAP_COHERENT_BIT",
+    "GL_MAP_INVALIDATE_RANGE_BIT",
+    "GL_MAP_INVALIDATE_BUFFER_BIT",
+    "GL_MAP_FLUSH_EXPLICIT_BIT",
+    "GL_MAP_UNSYNCHRONIZED_BIT",
     "GL_RED",
     "GL_RG",
     "GL_RGB",
@@ -104,6 +115,10 @@ __all__ = [
     "GL_MAX_CLIP_DISTANCES_VALUE",
     "GL_MAX_IMAGE_UNITS_VALUE",
     "GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE",
+    "GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE",
+    "GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE",
+    "GL_DIRECT_STATE_ACCESS_SUPPORTED",
+    "GL_VERTEX_ATTRIB_BINDING_SUPPORTED",
     "GL_NEVER",
     "GL_ALWAYS",
     "GL_LESS",
@@ -235,9 +250,38 @@ __all__ = [
     "delete_gl_renderbuffer",
     "set_gl_buffer_target_data",
     "write_gl_buffer_target_data",
-    "create_gl_buffer_memory_view",
+    "write_gl_buffer_target_data_many",
     "release_gl_buffer_memory_view",
+    "set_gl_buffer_target_storage",
+    "create_gl_buffer_range_memory_view",
+    "copy_gl_buffer_target_data",
+    "copy_gl_buffer_target_data_many",
+    "clear_gl_buffer_target_data",
+    "flush_gl_buffer_target_range",
+    "create_gl_named_buffer",
+    "set_gl_named_buffer_data",
+    "set_gl_named_buffer_storage",
+    "write_gl_named_buffer_data",
+    "write_gl_named_buffer_data_many",
+    "copy_gl_named_buffer_data_many",
+    "clear_gl_named_buffer_data",
+    "create_gl_named_buffer_memory_view",
+    "release_gl_named_buffer_memory_view",
+    "flush_gl_named_buffer_range",
+    "create_gl_named_texture",
+    "set_gl_named_texture_2d_storage",
+    "write_gl_named_texture_2d_data",
+    "generate_gl_named_texture_mipmaps",
+    "set_gl_named_texture_parameters",
+    "create_gl_named_framebuffer",
+    "attach_color_texture_to_gl_named_framebuffer",
+    "attach_depth_texture_to_gl_named_framebuffer",
+    "attach_depth_renderbuffer_to_gl_named_framebuffer",
+    "set_texture_locations_on_gl_named_framebuffer",
     "configure_gl_vertex_array_location",
+    "configure_gl_vertex_array_format",
+    "set_gl_vertex_array_binding_divisor",
+    "bind_gl_vertex_buffers",
     "set_draw_framebuffer",
     "set_read_framebuffer",
     "read_color_from_framebuffer",
@@ -254,7 +298,15 @@ __all__ = [
     "get_gl_program_uniforms",
     "get_gl_program_attributes",
     "get_gl_program_storage_blocks",
+    "get_gl_program_uniform_blocks",
+    "get_gl_program_binary_length",
+    "get_gl_program_binary",
+    "create_gl_program_from_binary",
     "create_gl_program",
+    "start_gl_program",
+    "is_gl_program_complete",
+    "finish_gl_program",
+    "cancel_gl_program",
     "delete_gl_program",
     "use_gl_program",
     "set_active_gl_program_uniform_float",
@@ -293,18 +345,39 @@ __all__ = [
     "set_active_gl_program_uniform_double_4x4",
     "execute_gl_program_index_buffer",
     "execute_gl_program_indices",
+    "execute_gl_program_indirect",
+    "execute_gl_program_ranges",
     "execute_gl_program_compute",
     "set_gl_memory_barrier",
     "set_image_unit",
     "set_shader_storage_buffer_unit",
     "set_program_shader_storage_block_binding",
+    "set_uniform_buffer_unit",
+    "set_program_uniform_block_binding",
     "set_gl_execution_state",
+    "create_gl_fence_sync",
+    "delete_gl_fence_sync",
+    "wait_gl_fence_sync",
     "get_gl_version",
+    "get_gl_vendor",
+    "get_gl_renderer",
     "set_gl_clip",
     "get_gl_clip",
+    "gather_strided_data",
+    "interleave_data",
+    "quantize_normalized_data",
+    "quantize_half_float_data",
+    "pack_int_2_10_10_10_rev_data",
+    "optimize_index_data_vertex_cache",
+    "optimize_index_data_overdraw",
+    "optimize_index_data_vertex_fetch",
+    "remap_vertex_data",
+    "narrow_index_data",
+    "join_index_data_strips",
 ]
 
 from collections.abc import Buffer
+from collections.abc import Sequence
 from typing import Callable
 from typing import NewType
 
@@ -319,6 +392,7 @@ GlBarrier = NewType("GlBarrier", int)
 GlBlendFactor = NewType("GlBlendFactor", int)
 GlBlendFunction = NewType("GlBlendFunction", int)
 GlBuffer = NewType("GlBuffer", int)
+GlBufferAccess = NewType("GlBufferAccess", int)
 GlBufferTarget = NewType("GlBufferTarget", int)
 GlBufferUsage = NewType("GlBufferUsage", int)
 GlCull = NewType("GlCull", int)
@@ -330,6 +404,7 @@ GlPolygonRasterizationMode = NewType("GlPolygonRasterizationMode", int)
 GlPrimitive = NewType("GlPrimitive", int)
 GlProgram = NewType("GlProgram", int)
 GlRenderbuffer = NewType("GlRenderbuffer", int)
+GlSync = NewType("GlSync", int)
 GlType = NewType("GlType", int)
 GlTexture = NewType("GlTexture", int)
 GlTextureComponents = NewType("GlTextureComponents", int)
@@ -340,6 +415,7 @@ GlVertexArray = NewType("GlVertexArray", int)
 
 GL_ARRAY_BUFFER: GlBufferTarget
 GL_COPY_READ_BUFFER: GlBufferTarget
+GL_COPY_WRITE_BUFFER: GlBufferTarget
 GL_ELEMENT_ARRAY_BUFFER: GlBufferTarget
 GL_SHADER_STORAGE_BUFFER: GlBufferTarget
 
@@ -353,6 +429,15 @@ GL_DYNAMIC_DRAW: GlBufferUsage
 GL_DYNAMIC_READ: GlBufferUsage
 GL_DYNAMIC_COPY: GlBufferUsage
 
+GL_MAP_READ_BIT: GlBufferAccess
+GL_MAP_WRITE_BIT: GlBufferAccess
+GL_MAP_PERSISTENT_BIT: GlBufferAccess
+GL_MAP_COHERENT_BIT: GlBufferAccess
+GL_MAP_INVALIDATE_RANGE_BIT: GlBufferAccess
+GL_MAP_INVALIDATE_BUFFER_BIT: GlBufferAccess
+GL_MAP_FLUSH_EXPLICIT_BIT: GlBufferAccess
+GL_MAP_UNSYNCHRONIZED_BIT: GlBufferAccess
+
 GL_FLOAT: GlType
 GL_DOUBLE: GlType
 GL_BYTE: GlType
@@ -361,6 +446,9 @@ GL_SHORT: GlType
 GL_UNSIGNED_SHORT: GlType
 GL_INT: GlType
 GL_UNSIGNED_INT: GlType
+GL_HALF_FLOAT: GlType
+GL_INT_2_10_10_10_REV: GlType
+GL_UNSIGNED_INT_2_10_10_10_REV: GlType
 GL_BOOL: GlType
 GL_FLOAT_VEC2: GlType
 GL_FLOAT_VEC3: GlType
@@ -512,6 +600,11 @@ GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS_VALUE: int
 GL_MAX_CLIP_DISTANCES_VALUE: int
 GL_MAX_IMAGE_UNITS_VALUE: int
 GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE: int
+GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE: int
+GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE: int
+
+GL_DIRECT_STATE_ACCESS_SUPPORTED: bool
+GL_VERTEX_ATTRIB_BINDING_SUPPORTED: bool
 
 GL_NEVER: GlFunc
 GL_ALWAYS: GlFunc
@@ -583,18 +676,82 @@ def delete_gl_renderbuffer(gl_renderbuffer: GlRenderbuffer, /) -> None: ...
 def set_gl_buffer_target_data(
     target: GlBufferTarget, data: Buffer | int, usage: int, /
 ) -> int: ...
-def write_gl_buffer_target_data(target: GlBufferTarget, data: Buffer, offset: int, /) -> None: ...
-def create_gl_buffer_memory_view(target: GlBufferTarget, length: int, /) -> memoryview: ...
+def write_gl_buffer_target_data(
+    target: GlBufferTarget, data: Buffer, offset: int, buffer_size: int, /
+) -> None: ...
+def write_gl_buffer_target_data_many(
+    target: GlBufferTarget, writes: Sequence[tuple[Buffer, int]], buffer_size: int, /
+) -> None: ...
 def release_gl_buffer_memory_view(target: GlBufferTarget, /) -> None: ...
+def set_gl_buffer_target_storage(
+    target: GlBufferTarget, length: int, flags: GlBufferAccess, /
+) -> None: ...
+def create_gl_buffer_range_memory_view(
+    target: GlBufferTarget, offset: int, length: int, access: GlBufferAccess, /
+) -> memoryview: ...
+def copy_gl_buffer_target_data(
+    read_target: GlBufferTarget,
+    write_target: GlBufferTarget,
+    read_offset: int,
+    write_offset: int,
+    size: int,
+    /,
+) -> None: ...
+def copy_gl_buffer_target_data_many(
+    read_target: GlBufferTarget,
+    write_target: GlBufferTarget,
+    ranges: Sequence[tuple[int, int, int]],
+    /,
+) -> None: ...
+def clear_gl_buffer_target_data(
+    target: GlBufferTarget, value: Buffer, ranges: Sequence[tuple[int, int]], /
+) -> None: ...
+def flush_gl_buffer_target_range(target: GlBufferTarget, offset: int, length: int, /) -> None: ...
+def create_gl_named_buffer() -> GlBuffer: ...
+def set_gl_named_buffer_data(gl_buffer: GlBuffer, data: Buffer | int, usage: int, /) -> int: ...
+def set_gl_named_buffer_storage(
+    gl_buffer: GlBuffer, length: int, flags: GlBufferAccess, /
+) -> None: ...
+def write_gl_named_buffer_data(
+    gl_buffer: GlBuffer, data: Buffer, offset: int, buffer_size: int, /
+) -> None: ...
+def write_gl_named_buffer_data_many(
+    gl_buffer: GlBuffer, writes: Sequence[tuple[Buffer, int]], buffer_size: int, /
+) -> None: ...
+def copy_gl_named_buffer_data_many(
+    read_gl_buffer: GlBuffer, write_gl_buffer: GlBuffer, ranges: Sequence[tuple[int, int, int]], /
+) -> None: ...
+def clear_gl_named_buffer_data(
+    gl_buffer: GlBuffer, value: Buffer, ranges: Sequence[tuple[int, int]], /
+) -> None: ...
+def create_gl_named_buffer_memory_view(
+    gl_buffer: GlBuffer, offset: int, length: int, access: GlBufferAccess, /
+) -> memoryview: ...
+def release_gl_named_buffer_memory_view(gl_buffer: GlBuffer, /) -> None: ...
+def flush_gl_named_buffer_range(gl_buffer: GlBuffer, offset: int, length: int, /) -> None: ...
 def configure_gl_vertex_array_location(
     location: int,
     size: int,
     type: GlType,
+    normalized: bool,
+    attribute_type: GlType,
     stride: int,
     offset: int,
     instancing_divistor: int | None,
     /,
 ) -> None: ...
+def configure_gl_vertex_array_format(
+    location: int,
+    size: int,
+    type: GlType,
+    normalized: bool,
+    attribute_type: GlType,
+    relative_offset: int,
+    binding_index: int,
+    /,
+) -> None: ...
+def set_gl_vertex_array_binding_divisor(binding_index: int, divisor: int, /) -> None: ...
+def bind_gl_vertex_buffers(bindings: Sequence[tuple[GlBuffer, int, int]], /) -> None: ...
 def set_draw_framebuffer(gl_framebuffer: GlFramebuffer, size: IVector2) -> None: ...
 def set_read_framebuffer(gl_framebuffer: GlFramebuffer) -> None: ...
 def read_color_from_framebuffer(rect: IRectangle, index: int, /) -> FVector4Array: ...
@@ -604,6 +761,19 @@ def attach_color_texture_to_gl_read_framebuffer(gl_texture: GlTexture, index: in
 def attach_depth_texture_to_gl_read_framebuffer(gl_texture: GlTexture, /) -> None: ...
 def attach_depth_renderbuffer_to_gl_read_framebuffer(size: IVector2, /) -> GlRenderbuffer: ...
 def set_texture_locations_on_gl_draw_framebuffer(texture_indices: list[None | int], /) -> None: ...
+def create_gl_named_framebuffer() -> GlFramebuffer: ...
+def attach_color_texture_to_gl_named_framebuffer(
+    gl_framebuffer: GlFramebuffer, gl_texture: GlTexture, index: int, /
+) -> None: ...
+def attach_depth_texture_to_gl_named_framebuffer(
+    gl_framebuffer: GlFramebuffer, gl_texture: GlTexture, /
+) -> None: ...
+def attach_depth_renderbuffer_to_gl_named_framebuffer(
+    gl_framebuffer: GlFramebuffer, size: IVector2, /
+) -> GlRenderbuffer: ...
+def set_texture_locations_on_gl_named_framebuffer(
+    gl_framebuffer: GlFramebuffer, texture_indices: list[None | int], /
+) -> None: ...
 def set_active_gl_texture_unit(unit: int, /) -> None: ...
 def set_gl_texture_target(target: GlTextureTarget, gl_texture: GlTexture | None, /) -> None: ...
 def set_gl_texture_target_2d_data(
@@ -627,11 +797,39 @@ def set_gl_texture_target_parameters(
     anisotropy: float,
     /,
 ) -> None: ...
+def create_gl_named_texture(target: GlTextureTarget, /) -> GlTexture: ...
+def set_gl_named_texture_2d_storage(
+    gl_texture: GlTexture, levels: int, internal_format: GlTextureComponents, size: UVector2, /
+) -> None: ...
+def write_gl_named_texture_2d_data(
+    gl_texture: GlTexture,
+    size: UVector2,
+    format: GlTextureComponents,
+    type: GlType,
+    data: Buffer,
+    /,
+) -> None: ...
+def generate_gl_named_texture_mipmaps(gl_texture: GlTexture, /) -> None: ...
+def set_gl_named_texture_parameters(
+    gl_texture: GlTexture,
+    min_filter: GlTextureFilter,
+    mag_filter: GlTextureFilter,
+    wrap_s: GlTextureWrap,
+    wrap_t: GlTextureWrap | None,
+    wrap_r: GlTextureWrap | None,
+    wrap_color: FVector4,
+    anisotropy: float,
+    /,
+) -> None: ...
 def get_gl_program_uniforms(program: GlProgram, /) -> tuple[tuple[str, int, GlType, int], ...]: ...
 def get_gl_program_attributes(
     program: GlProgram, /
 ) -> tuple[tuple[str, int, GlType, int], ...]: ...
 def get_gl_program_storage_blocks(program: GlProgram, /) -> tuple[str]: ...
+def get_gl_program_uniform_blocks(program: GlProgram, /) -> tuple[tuple[str, int], ...]: ...
+def get_gl_program_binary_length(program: GlProgram, /) -> int: ...
+def get_gl_program_binary(program: GlProgram, /) -> tuple[int, bytes]: ...
+def create_gl_program_from_binary(format: int, binary: Buffer, /) -> GlProgram | None: ...
 def create_gl_program(
     vertex: Buffer | None,
     geometry: Buffer | None,
@@ -639,6 +837,18 @@ def create_gl_program(
     compute: Buffer | None,
     /,
 ) -> GlProgram: ...
+def start_gl_program(
+    vertex: Buffer | None,
+    geometry: Buffer | None,
+    fragment: Buffer | None,
+    compute: Buffer | None,
+    /,
+) -> tuple[GlProgram, tuple[int, int, int, int]]: ...
+def is_gl_program_complete(gl_program: GlProgram, /) -> bool: ...
+def finish_gl_program(
+    gl_program: GlProgram, shaders: tuple[int, int, int, int], /
+) -> GlProgram: ...
+def cancel_gl_program(gl_program: GlProgram, shaders: tuple[int, int, int, int], /) -> None: ...
 def delete_gl_program(gl_program: GlProgram, /) -> None: ...
 def use_gl_program(gl_program: GlProgram | None, /) -> None: ...
 def set_active_gl_program_uniform_float(location: int, count: int, value_ptr: int) -> None: ...
@@ -707,6 +917,27 @@ def execute_gl_program_index_buffer(
 def execute_gl_program_indices(
     mode: GlPrimitive, first: int, count: int, instances: int
 ) -> None: ...
+def execute_gl_program_indirect(
+    mode: GlPrimitive,
+    type: GlType | None,
+    gl_buffer: GlBuffer,
+    offset: int,
+    draw_count: int,
+    stride: int,
+    count_gl_buffer: GlBuffer | None,
+    count_offset: int,
+    /,
+) -> None: ...
+def execute_gl_program_ranges(
+    mode: GlPrimitive,
+    type: GlType | None,
+    index_size: int,
+    index_offset: int,
+    index_count: int,
+    ranges: Buffer,
+    instances: int,
+    /,
+) -> None: ...
 def execute_gl_program_compute(
     num_groups_x: int, num_groups_y: int, num_groups_z: int
 ) -> None: ...
@@ -718,6 +949,10 @@ def set_shader_storage_buffer_unit(
 def set_program_shader_storage_block_binding(
     program: GlProgram, storage_block_index: int, storage_block_binding: int, /
 ) -> None: ...
+def set_uniform_buffer_unit(index: int, buffer: GlBuffer, offset: int, size: int, /) -> None: ...
+def set_program_uniform_block_binding(
+    program: GlProgram, uniform_block_index: int, uniform_block_binding: int, /
+) -> None: ...
 def set_gl_execution_state(
     depth_write: bool,
     depth_func: GlFunc,
@@ -738,8 +973,33 @@ def set_gl_execution_state(
     polygon_rasterization_mode: GlPolygonRasterizationMode,
     point_size: float,
     clip_distances: int,
+    primitive_restart: bool,
     /,
 ) -> None: ...
+def create_gl_fence_sync() -> GlSync: ...
+def delete_gl_fence_sync(sync: GlSync, /) -> None: ...
+def wait_gl_fence_sync(sync: GlSync, timeout: int, /) -> bool: ...
 def get_gl_version() -> str: ...
+def get_gl_vendor() -> str: ...
+def get_gl_renderer() -> str: ...
 def set_gl_clip(origin: GlOrigin, depth: GlDepthMode) -> None: ...
 def get_gl_clip() -> tuple[GlOrigin, GlDepthMode]: ...
+def gather_strided_data(data: Buffer, element_size: int, stride: int, count: int, /) -> bytes: ...
+def interleave_data(
+    sources: Sequence[tuple[Buffer, int, int]], stride: int, count: int, /
+) -> bytes: ...
+def quantize_normalized_data(data: Buffer, type: GlType, /) -> bytes: ...
+def quantize_half_float_data(data: Buffer, /) -> bytes: ...
+def pack_int_2_10_10_10_rev_data(data: Buffer, components: int, /) -> bytes: ...
+def optimize_index_data_vertex_cache(
+    data: Buffer, index_size: int, cache_size: int, /
+) -> bytes: ...
+def optimize_index_data_overdraw(
+    data: Buffer, index_size: int, positions: Buffer, position_stride: int, cache_size: int, /
+) -> bytes: ...
+def optimize_index_data_vertex_fetch(data: Buffer, index_size: int, /) -> tuple[bytes, bytes]: ...
+def remap_vertex_data(data: Buffer, stride: int, record_size: int, order: Buffer, /) -> bytes: ...
+def narrow_index_data(data: Buffer, index_size: int, /) -> tuple[bytes, int]: ...
+def join_index_data_strips(
+    strips: Sequence[tuple[Buffer, int]], index_size: int | None, /
+) -> tuple[bytes, int]: ...
@@ -3,14 +3,21 @@ from __future__ import annotations
 __all__ = [
     "EditGBuffer",
     "GBuffer",
+    "GBufferAccess",
+    "GBufferMap",
+    "GBufferReadFuture",
     "GBufferTarget",
     "GBufferFrequency",
     "GBufferNature",
     "get_g_buffer_gl_buffer",
 ]
 
+from asyncio import sleep
 from collections.abc import Buffer
+from collections.abc import Generator
+from collections.abc import Iterable
 from enum import Enum
+from enum import Flag
 from itertools import islice
 from typing import Any
 from typing import ClassVar
@@ -22,9 +29,17 @@ from weakref import ref
 
 from ._egraphics import GL_ARRAY_BUFFER
 from ._egraphics import GL_COPY_READ_BUFFER
+from ._egraphics import GL_COPY_WRITE_BUFFER
+from ._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
 from ._egraphics import GL_DYNAMIC_COPY
 from ._egraphics import GL_DYNAMIC_DRAW
 from ._egraphics import GL_DYNAMIC_READ
+from ._egraphics import GL_MAP_FLUSH_EXPLICIT_BIT
+from ._egraphics import GL_MAP_INVALIDATE_BUFFER_BIT
+from ._egraphics import GL_MAP_INVALIDATE_RANGE_BIT
+from ._egraphics import GL_MAP_READ_BIT
+from ._egraphics import GL_MAP_UNSYNCHRONIZED_BIT
+from ._egraphics import GL_MAP_WRITE_BIT
 from ._egraphics import GL_SHADER_STORAGE_BUFFER
 from ._egraphics import GL_STATIC_COPY
 from ._egraphics import GL_STATIC_DRAW
@@ -33,13 +48,35 @@ from ._egraphics import GL_STREAM_COPY
 from ._egraphics import GL_STREAM_DRAW
 from ._egraphics import GL_STREAM_READ
 from ._egraphics import GlBuffer
+from ._egraphics import GlSync
+from ._egraphics import clear_gl_buffer_target_data
+from ._egraphics import clear_gl_named_buffer_data
+from ._egraphics import copy_gl_buffer_target_data
+from ._egraphics import copy_gl_buffer_target_data_many
+from ._egraphics import copy_gl_named_buffer_data_many
 from ._egraphics import create_gl_buffer
-from ._egraphics import create_gl_buffer_memory_view
+from ._egraphics import create_gl_buffer_range_memory_view
+from ._egraphics import create_gl_fence_sync
+from ._egraphics import create_gl_named_buffer
+from ._egraphics import create_gl_named_buffer_memory_view
 from ._egraphics import delete_gl_buffer
+from ._egraphics import delete_gl_fence_sync
+from ._egraphics import flush_gl_buffer_target_range
+from ._egraphics import flush_gl_named_buffer_range
 from ._egraphics import release_gl_buffer_memory_view
+from ._egraphics import release_gl_named_buffer_memory_view
 from ._egraphics import set_gl_buffer_target
 from ._egraphics import set_gl_buffer_target_data
+from ._egraphics import set_gl_named_buffer_data
+from ._egraphics import wait_gl_fence_sync
 from ._egraphics import write_gl_buffer_target_data
+from ._egraphics import write_gl_buffer_target_data_many
+from ._egraphics import write_gl_named_buffer_data
+from ._egraphics import write_gl_named_buffer_data_many
+from ._memory import MemoryKind
+from ._memory import register_memory
+from ._memory import resize_memory
+from ._memory import unregister_memory
 from ._state import register_reset_state_callback
 
 
@@ -55,6 +92,24 @@ class GBufferNature(Enum):
     COPY = 2
 
 
+class GBufferAccess(Flag):
+    READ = GL_MAP_READ_BIT
+    WRITE = GL_MAP_WRITE_BIT
+    INVALIDATE_RANGE = GL_MAP_INVALIDATE_RANGE_BIT
+    INVALIDATE_BUFFER = GL_MAP_INVALIDATE_BUFFER_BIT
+    UNSYNCHRONIZED = GL_MAP_UNSYNCHRONIZED_BIT
+    FLUSH_EXPLICIT = GL_MAP_FLUSH_EXPLICIT_BIT
+
+
+_READ_INCOMPATIBLE_ACCESS: Final = (
+    GBufferAccess.INVALIDATE_RANGE | GBufferAccess.INVALIDATE_BUFFER | GBufferAccess.UNSYNCHRONIZED
+)
+
+
+_FILL_VALUE_SIZES: Final = frozenset((1, 2, 4, 8, 12, 16))
+_FENCE_WAIT_TIMEOUT: Final = 1_000_000_000
+
+
 _FREQUENCY_NATURE_TO_GL_USAGE: Final = {
     (GBufferFrequency.STREAM, GBufferNature.DRAW): GL_STREAM_DRAW,
     (GBufferFrequency.STREAM, GBufferNature.READ): GL_STREAM_READ,
@@ -73,6 +128,7 @@ class GBufferTarget:
 
     ARRAY: ClassVar[Self]
     COPY_READ: ClassVar[Self]
+    COPY_WRITE: ClassVar[Self]
     SHADER_STORAGE: ClassVar[Self]
 
     def __init__(self, gl_target: Any):
@@ -100,6 +156,7 @@ class GBufferTarget:
 
 GBufferTarget.ARRAY = GBufferTarget(GL_ARRAY_BUFFER)
 GBufferTarget.COPY_READ = GBufferTarget(GL_COPY_READ_BUFFER)
+GBufferTarget.COPY_WRITE = GBufferTarget(GL_COPY_WRITE_BUFFER)
 GBufferTarget.SHADER_STORAGE = GBufferTarget(GL_SHADER_STORAGE_BUFFER)
 
 
@@ -112,7 +169,10 @@ def _reset_g_buffer_target_state() -> None:
 class GBuffer:
     _buffer: memoryview | None = None
     _buffer_refs: int = 0
+    _map: GBufferMap | None = None
+    _size_generation: ClassVar[int] = 0
 
+    Access: TypeAlias = GBufferAccess
     Nature: TypeAlias = GBufferNature
     Frequency: TypeAlias = GBufferFrequency
     Target: TypeAlias = GBufferTarget
@@ -128,11 +188,17 @@ class GBuffer:
         self._frequency = frequency
         self._nature = nature
 
-        self._gl_buffer = create_gl_buffer()
-        GBufferTarget.ARRAY.g_buffer = self
-        self._length = set_gl_buffer_target_data(GL_ARRAY_BUFFER, data, self._gl_usage)
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._gl_buffer = create_gl_named_buffer()
+            self._length = set_gl_named_buffer_data(self._gl_buffer, data, self._gl_usage)
+        else:
+            self._gl_buffer = create_gl_buffer()
+            GBufferTarget.ARRAY.g_buffer = self
+            self._length = set_gl_buffer_target_data(GL_ARRAY_BUFFER, data, self._gl_usage)
+        register_memory(self, MemoryKind.G_BUFFER, self._length, (frequency, nature))
 
     def __del__(self) -> None:
+        unregister_memory(self)
         if not hasattr(self, "_gl_buffer"):
             return
         delete_gl_buffer(self._gl_buffer)
@@ -150,13 +216,23 @@ class GBuffer:
         assert self._buffer is None
         assert self._buffer_refs == 0
 
+        if self._map is not None:
+            raise RuntimeError("g buffer is already mapped")
+
         if self._length == 0:
             self._buffer = memoryview(b"").cast("B")
             self._buffer_refs += 1
             return self._buffer
 
-        GBufferTarget.COPY_READ.g_buffer = self
-        self._buffer = create_gl_buffer_memory_view(GL_COPY_READ_BUFFER, self._length)
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._buffer = create_gl_named_buffer_memory_view(
+                self._gl_buffer, 0, self._length, GL_MAP_READ_BIT | GL_MAP_WRITE_BIT
+            )
+        else:
+            GBufferTarget.COPY_READ.g_buffer = self
+            self._buffer = create_gl_buffer_range_memory_view(
+                GL_COPY_READ_BUFFER, 0, self._length, GL_MAP_READ_BIT | GL_MAP_WRITE_BIT
+            )
         self._buffer_refs += 1
         return self._buffer
 
@@ -167,14 +243,190 @@ class GBuffer:
             return
 
         if self._length != 0:
-            GBufferTarget.COPY_READ.g_buffer = self
-            release_gl_buffer_memory_view(GL_COPY_READ_BUFFER)
+            if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+                release_gl_named_buffer_memory_view(self._gl_buffer)
+            else:
+                GBufferTarget.COPY_READ.g_buffer = self
+                release_gl_buffer_memory_view(GL_COPY_READ_BUFFER)
 
         self._buffer = None
 
     def write(self, data: Buffer, *, offset: int = 0) -> None:
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            write_gl_named_buffer_data(self._gl_buffer, data, offset, self._length)
+            return
         GBufferTarget.ARRAY.g_buffer = self
-        write_gl_buffer_target_data(GL_ARRAY_BUFFER, data, offset)
+        write_gl_buffer_target_data(GL_ARRAY_BUFFER, data, offset, self._length)
+
+    def write_many(self, writes: Iterable[tuple[Buffer, int]]) -> None:
+        writes = tuple((d, o) for d, o in writes)
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            write_gl_named_buffer_data_many(self._gl_buffer, writes, self._length)
+            return
+        GBufferTarget.ARRAY.g_buffer = self
+        write_gl_buffer_target_data_many(GL_ARRAY_BUFFER, writes, self._length)
+
+    def replace(self, data: Buffer | int) -> None:
+        self._check_not_mapped()
+        previous_length = self._length
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._length = set_gl_named_buffer_data(self._gl_buffer, data, self._gl_usage)
+        else:
+            GBufferTarget.ARRAY.g_buffer = self
+            self._length = set_gl_buffer_target_data(GL_ARRAY_BUFFER, data, self._gl_usage)
+        if self._length != previous_length:
+            GBuffer._size_generation += 1
+        resize_memory(self, self._length)
+
+    def resize(self, length: int) -> None:
+        if length < 0:
+            raise ValueError("length must be 0 or more")
+        self._check_not_mapped()
+        if length == self._length:
+            return
+
+        preserve_length = min(length, self._length)
+        if preserve_length == 0:
+            self.replace(length)
+            return
+
+        temp = GBuffer(
+            preserve_length, frequency=GBufferFrequency.STREAM, nature=GBufferNature.COPY
+        )
+        self.copy_to(temp, size=preserve_length)
+        self.replace(length)
+        temp.copy_to(self)
+
+    def copy_to(
+        self, dst: GBuffer, *, src_offset: int = 0, dst_offset: int = 0, size: int | None = None
+    ) -> None:
+        if size is None:
+            size = min(self._length - src_offset, len(dst) - dst_offset)
+        self._validate_copy_range(dst, src_offset, dst_offset, size)
+        if size == 0:
+            return
+        self._check_not_mapped()
+        dst._check_not_mapped()
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            copy_gl_named_buffer_data_many(
+                self._gl_buffer, dst._gl_buffer, ((src_offset, dst_offset, size),)
+            )
+            return
+        GBufferTarget.COPY_READ.g_buffer = self
+        GBufferTarget.COPY_WRITE.g_buffer = dst
+        copy_gl_buffer_target_data(
+            GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, src_offset, dst_offset, size
+        )
+
+    def copy_to_many(self, dst: GBuffer, ranges: Iterable[tuple[int, int, int]]) -> None:
+        ranges = [(s, d, n) for s, d, n in ranges]
+        for src_offset, dst_offset, size in ranges:
+            self._validate_copy_range(dst, src_offset, dst_offset, size)
+        ranges = [r for r in ranges if r[2] != 0]
+        if not ranges:
+            return
+        self._check_not_mapped()
+        dst._check_not_mapped()
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            copy_gl_named_buffer_data_many(self._gl_buffer, dst._gl_buffer, ranges)
+            return
+        GBufferTarget.COPY_READ.g_buffer = self
+        GBufferTarget.COPY_WRITE.g_buffer = dst
+        copy_gl_buffer_target_data_many(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, ranges)
+
+    def _validate_copy_range(
+        self, dst: GBuffer, src_offset: int, dst_offset: int, size: int
+    ) -> None:
+        if src_offset < 0 or size < 0 or src_offset + size > self._length:
+            raise ValueError(
+                f"copy would overrun source buffer "
+                f"(offset: {src_offset}, size: {size}, buffer size: {self._length})"
+            )
+        if dst_offset < 0 or dst_offset + size > len(dst):
+            raise ValueError(
+                f"copy would overrun destination buffer "
+                f"(offset: {dst_offset}, size: {size}, buffer size: {len(dst)})"
+            )
+        if (
+            dst is self
+            and size
+            and src_offset < dst_offset + size
+            and dst_offset < src_offset + size
+        ):
+            raise ValueError("copy source and destination overlap")
+
+    def read_async(self, *, offset: int = 0, size: int | None = None) -> GBufferReadFuture:
+        if size is None:
+            size = self._length - offset
+        if offset < 0 or size < 0 or offset + size > self._length:
+            raise ValueError(
+                f"read would overrun buffer "
+                f"(offset: {offset}, size: {size}, buffer size: {self._length})"
+            )
+        staging = GBuffer(size, frequency=GBufferFrequency.STREAM, nature=GBufferNature.READ)
+        self.copy_to(staging, src_offset=offset, size=size)
+        return GBufferReadFuture(staging)
+
+    def fill(self, value: Buffer, *, offset: int = 0, size: int | None = None) -> None:
+        if size is None:
+            size = self._length - offset
+        self.fill_many(value, ((offset, size),))
+
+    def fill_many(self, value: Buffer, ranges: Iterable[tuple[int, int]]) -> None:
+        value = memoryview(value).cast("B")
+        value_size = len(value)
+        if value_size not in _FILL_VALUE_SIZES:
+            raise ValueError("value size must be 1, 2, 4, 8, 12 or 16 bytes")
+        ranges = [(o, n) for o, n in ranges]
+        for offset, size in ranges:
+            if offset < 0 or size < 0 or offset + size > self._length:
+                raise ValueError(
+                    f"fill would overrun buffer "
+                    f"(offset: {offset}, size: {size}, buffer size: {self._length})"
+                )
+            if offset % value_size or size % value_size:
+                raise ValueError("fill offset and size must be multiples of the value size")
+        ranges = [r for r in ranges if r[1] != 0]
+        if not ranges:
+            return
+        self._check_not_mapped()
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            clear_gl_named_buffer_data(self._gl_buffer, value, ranges)
+            return
+        GBufferTarget.COPY_WRITE.g_buffer = self
+        clear_gl_buffer_target_data(GL_COPY_WRITE_BUFFER, value, ranges)
+
+    def _map_read(self, offset: int, length: int) -> GBufferMap:
+        return self.map(offset=offset, length=length, access=GBufferAccess.READ)
+
+    def _check_not_mapped(self) -> None:
+        if self._map is not None or self._buffer_refs:
+            raise RuntimeError("g buffer is mapped")
+
+    def map(
+        self,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        access: GBufferAccess = GBufferAccess.READ | GBufferAccess.WRITE,
+    ) -> GBufferMap:
+        if length is None:
+            length = self._length - offset
+        if offset < 0 or length < 0 or offset + length > self._length:
+            raise ValueError(
+                f"map would overrun buffer "
+                f"(offset: {offset}, size: {length}, buffer size: {self._length})"
+            )
+        if not access & (GBufferAccess.READ | GBufferAccess.WRITE):
+            raise ValueError("access must include READ or WRITE")
+        if access & GBufferAccess.READ and access & _READ_INCOMPATIBLE_ACCESS:
+            raise ValueError(
+                "READ access cannot be combined with "
+                "INVALIDATE_RANGE, INVALIDATE_BUFFER or UNSYNCHRONIZED"
+            )
+        if access & GBufferAccess.FLUSH_EXPLICIT and not access & GBufferAccess.WRITE:
+            raise ValueError("FLUSH_EXPLICIT access requires WRITE")
+        return GBufferMap(self, offset, length, access)
 
     @property
     def frequency(self) -> GBufferFrequency:
@@ -185,6 +437,118 @@ class GBuffer:
         return self._nature
 
 
+class GBufferMap:
+    def __init__(self, g_buffer: GBuffer, offset: int, length: int, access: GBufferAccess):
+        self._g_buffer = g_buffer
+        self._offset = offset
+        self._length = length
+        self._access = access
+        self._memory: memoryview | None = None
+
+    def __enter__(self) -> memoryview:
+        g_buffer = self._g_buffer
+        if g_buffer._map is not None or g_buffer._buffer_refs:
+            raise RuntimeError("g buffer is already mapped")
+
+        if self._length == 0:
+            self._memory = memoryview(b"").cast("B")
+        elif GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._memory = create_gl_named_buffer_memory_view(
+                g_buffer._gl_buffer, self._offset, self._length, self._access.value
+            )
+        else:
+            GBufferTarget.COPY_READ.g_buffer = g_buffer
+            self._memory = create_gl_buffer_range_memory_view(
+                GL_COPY_READ_BUFFER, self._offset, self._length, self._access.value
+            )
+        g_buffer._map = self
+        return self._memory
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        assert self._memory is not None
+        self._memory.release()
+        self._memory = None
+        self._g_buffer._map = None
+        if self._length == 0:
+            return
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            release_gl_named_buffer_memory_view(self._g_buffer._gl_buffer)
+        else:
+            GBufferTarget.COPY_READ.g_buffer = self._g_buffer
+            release_gl_buffer_memory_view(GL_COPY_READ_BUFFER)
+
+    def flush(self, *, offset: int = 0, length: int | None = None) -> None:
+        if self._memory is None:
+            raise RuntimeError("g buffer map is not active")
+        if not self._access & GBufferAccess.FLUSH_EXPLICIT:
+            raise RuntimeError("g buffer map was not created with FLUSH_EXPLICIT access")
+        if length is None:
+            length = self._length - offset
+        if offset < 0 or length < 0 or offset + length > self._length:
+            raise ValueError(
+                f"flush would overrun map "
+                f"(offset: {offset}, size: {length}, map size: {self._length})"
+            )
+        if length == 0:
+            return
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            flush_gl_named_buffer_range(self._g_buffer._gl_buffer, offset, length)
+            return
+        GBufferTarget.COPY_READ.g_buffer = self._g_buffer
+        flush_gl_buffer_target_range(GL_COPY_READ_BUFFER, offset, length)
+
+    @property
+    def g_buffer(self) -> GBuffer:
+        return self._g_buffer
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def access(self) -> GBufferAccess:
+        return self._access
+
+
+class GBufferReadFuture:
+    _fence: GlSync | None = None
+
+    def __init__(self, staging: GBuffer):
+        self._staging = staging
+        self._fence = create_gl_fence_sync()
+
+    def __del__(self) -> None:
+        if self._fence is not None:
+            delete_gl_fence_sync(self._fence)
+            self._fence = None
+
+    def __await__(self) -> Generator[Any, None, GBuffer]:
+        while not self.done():
+            yield from sleep(0.001).__await__()
+        return self._staging
+
+    def _wait(self, timeout: int) -> bool:
+        if self._fence is None:
+            return True
+        if not wait_gl_fence_sync(self._fence, timeout):
+            return False
+        delete_gl_fence_sync(self._fence)
+        self._fence = None
+        return True
+
+    def done(self) -> bool:
+        return self._wait(0)
+
+    def result(self) -> GBuffer:
+        while not self._wait(_FENCE_WAIT_TIMEOUT):
+            pass
+        return self._staging
+
+
 def get_g_buffer_gl_buffer(g_buffer: GBuffer) -> GlBuffer:
     return g_buffer._gl_buffer
 
@@ -195,9 +559,13 @@ class _WriteGBuffer(NamedTuple):
 
 
 class EditGBuffer:
-    def __init__(self, g_buffer: GBuffer):
+    def __init__(self, g_buffer: GBuffer, *, mapped: bool = False, unsynchronized: bool = False):
+        if unsynchronized and not mapped:
+            raise ValueError("unsynchronized requires mapped")
         self._g_buffer = g_buffer
         self._write_buffer: list[_WriteGBuffer] = []
+        self._mapped = mapped
+        self._unsynchronized = unsynchronized
 
     def write(self, data: Buffer, *, offset: int = 0) -> None:
         self._write_buffer.append(_WriteGBuffer(data, offset))
@@ -206,19 +574,69 @@ class EditGBuffer:
         if not self._write_buffer:
             return
 
-        GBufferTarget.ARRAY.g_buffer = self._g_buffer
+        if self._mapped:
+            self._flush_mapped()
+            return
+
+        buffer_length = len(self._g_buffer)
 
         self._write_buffer.sort(key=lambda w: w.offset)
         data = bytearray(self._write_buffer[0].data)
         offset = self._write_buffer[0].offset
+        runs: list[tuple[bytearray, int]] = []
         for write in islice(self._write_buffer, 1, None):
             if write.offset == offset + len(data):
                 data += write.data
             else:
-                write_gl_buffer_target_data(GL_ARRAY_BUFFER, data, offset)
+                runs.append((data, offset))
                 data = bytearray(write.data)
                 offset = write.offset
-        write_gl_buffer_target_data(GL_ARRAY_BUFFER, data, offset)
+        runs.append((data, offset))
+
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            gl_buffer = self._g_buffer._gl_buffer
+            for data, offset in runs:
+                write_gl_named_buffer_data(gl_buffer, data, offset, buffer_length)
+        else:
+            GBufferTarget.ARRAY.g_buffer = self._g_buffer
+            for data, offset in runs:
+                write_gl_buffer_target_data(GL_ARRAY_BUFFER, data, offset, buffer_length)
+        self._write_buffer.clear()
+
+    def _flush_mapped(self) -> None:
+        buffer_length = len(self._g_buffer)
+        writes = [(memoryview(w.data).cast("B"), w.offset) for w in self._write_buffer]
+        for data, offset in writes:
+            if offset < 0 or offset + len(data) > buffer_length:
+                raise ValueError(
+                    f"write would overrun buffer "
+                    f"(offset: {offset}, size: {len(data)}, buffer size: {buffer_length})"
+                )
+        writes = [(data, offset) for data, offset in writes if len(data)]
+        if not writes:
+            self._write_buffer.clear()
+            return
+
+        runs: list[list[int]] = []
+        for start, end in sorted((offset, offset + len(data)) for data, offset in writes):
+            if runs and start <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], end)
+            else:
+                runs.append([start, end])
+        map_offset = runs[0][0]
+
+        # the mapping waits for pending draws that use the buffer unless unsynchronized
+        access = GBufferAccess.WRITE | GBufferAccess.FLUSH_EXPLICIT
+        if self._unsynchronized:
+            access |= GBufferAccess.UNSYNCHRONIZED
+        g_buffer_map = self._g_buffer.map(
+            offset=map_offset, length=runs[-1][1] - map_offset, access=access
+        )
+        with g_buffer_map as memory:
+            for data, offset in writes:
+                memory[offset - map_offset : offset - map_offset + len(data)] = data
+            for start, end in runs:
+                g_buffer_map.flush(offset=start - map_offset, length=end - start)
         self._write_buffer.clear()
 
     def clear(self) -> None:
@@ -227,3 +645,11 @@ class EditGBuffer:
     @property
     def g_buffer(self) -> GBuffer:
         return self._g_buffer
+
+    @property
+    def mapped(self) -> bool:
+        return self._mapped
+
+    @property
+    def unsynchronized(self) -> bool:
+        return self._unsynchronized
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+__all__ = ["GBufferHeap"]
+
+from collections.abc import Buffer
+from typing import NamedTuple
+
+from ._g_buffer import GBuffer
+from ._g_buffer import GBufferFrequency
+from ._g_buffer import GBufferNature
+from ._g_buffer_view import _BVT
+from ._g_buffer_view import GBufferView
+from ._g_buffer_view import GBufferViewFormat
+
+
+class _GBufferHeapPage:
+    def __init__(self, size: int, frequency: GBufferFrequency, nature: GBufferNature):
+        self.g_buffer = GBuffer(size, frequency=frequency, nature=nature)
+        self.free: list[list[int]] = [[0, size]]
+        self.used = 0
+
+    def allocate(self, size: int, alignment: int) -> int | None:
+        for i, (free_offset, free_size) in enumerate(self.free):
+            offset = -(-free_offset // alignment) * alignment
+            padding = offset - free_offset
+            if padding + size > free_size:
+                continue
+            remaining = free_size - padding - size
+            replacement = []
+            if padding:
+                replacement.append([free_offset, padding])
+            if remaining:
+                replacement.append([offset + size, remaining])
+            self.free[i : i + 1] = replacement
+            self.used += size
+            return offset
+        return None
+
+    def free_range(self, offset: int, size: int) -> None:
+        self.used -= size
+        if size == 0:
+            return
+        i = 0
+        while i < len(self.free) and self.free[i][0] < offset:
+            i += 1
+        self.free.insert(i, [offset, size])
+        if i + 1 < len(self.free) and offset + size == self.free[i + 1][0]:
+            self.free[i][1] += self.free[i + 1][1]
+            del self.free[i + 1]
+        if i > 0 and self.free[i - 1][0] + self.free[i - 1][1] == offset:
+            self.free[i - 1][1] += self.free[i][1]
+            del self.free[i]
+
+
+class _GBufferHeapAllocation(NamedTuple):
+    page: _GBufferHeapPage
+    offset: int
+    size: int
+
+
+class GBufferHeap:
+    def __init__(
+        self,
+        page_size: int,
+        *,
+        alignment: int = 4,
+        frequency: GBufferFrequency = GBufferFrequency.STATIC,
+        nature: GBufferNature = GBufferNature.DRAW,
+    ):
+        if page_size < 1:
+            raise ValueError("page size must be greater than 0")
+        if alignment < 1:
+            raise ValueError("alignment must be greater than 0")
+        self._page_size = page_size
+        self._alignment = alignment
+        self._frequency = frequency
+        self._nature = nature
+        self._pages: list[_GBufferHeapPage] = []
+        self._allocations: dict[GBufferView, _GBufferHeapAllocation] = {}
+
+    def allocate(
+        self,
+        data_type: type[_BVT],
+        length: int,
+        *,
+        stride: int | None = None,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
+    ) -> GBufferView[_BVT]:
+        if length < 0:
+            raise ValueError("length must be 0 or greater")
+        for page in self._pages:
+            offset = page.allocate(length, self._alignment)
+            if offset is not None:
+                break
+        else:
+            page = _GBufferHeapPage(max(self._page_size, length), self._frequency, self._nature)
+            self._pages.append(page)
+            offset = page.allocate(length, self._alignment)
+            assert offset is not None
+        g_buffer_view = GBufferView(
+            page.g_buffer,
+            data_type,
+            length=length,
+            stride=stride,
+            offset=offset,
+            instancing_divisor=instancing_divisor,
+            format=format,
+        )
+        self._allocations[g_buffer_view] = _GBufferHeapAllocation(page, offset, length)
+        return g_buffer_view
+
+    def write(
+        self,
+        data: Buffer,
+        data_type: type[_BVT],
+        *,
+        stride: int | None = None,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
+    ) -> GBufferView[_BVT]:
+        data = memoryview(data).cast("B")
+        g_buffer_view = self.allocate(
+            data_type,
+            len(data),
+            stride=stride,
+            instancing_divisor=instancing_divisor,
+            format=format,
+        )
+        g_buffer_view.g_buffer.write(data, offset=g_buffer_view.offset)
+        return g_buffer_view
+
+    def free(self, g_buffer_view: GBufferView) -> None:
+        try:
+            allocation = self._allocations.pop(g_buffer_view)
+        except KeyError:
+            raise ValueError("g buffer view was not allocated by this heap")
+        allocation.page.free_range(allocation.offset, allocation.size)
+        if allocation.page.used == 0 and not any(
+            a.page is allocation.page for a in self._allocations.values()
+        ):
+            self._pages.remove(allocation.page)
+
+    def defragment(self) -> dict[GBufferView, GBufferView]:
+        moved: dict[GBufferView, GBufferView] = {}
+        for page in self._pages:
+            page_allocations = sorted(
+                ((v, a) for v, a in self._allocations.items() if a.page is page),
+                key=lambda item: item[1].offset,
+            )
+            page_size = len(page.g_buffer)
+            page.free = [[0, page_size]]
+            page.used = 0
+            ranges: list[tuple[int, int, int]] = []
+            for g_buffer_view, allocation in page_allocations:
+                offset = page.allocate(allocation.size, self._alignment)
+                assert offset is not None and offset <= allocation.offset
+                if offset == allocation.offset:
+                    continue
+                ranges.append((allocation.offset, offset, allocation.size))
+                new_g_buffer_view = GBufferView(
+                    page.g_buffer,
+                    g_buffer_view.data_type,
+                    length=g_buffer_view.length,
+                    stride=g_buffer_view.stride,
+                    offset=offset,
+                    instancing_divisor=g_buffer_view.instancing_divisor,
+                    format=g_buffer_view.format,
+                )
+                del self._allocations[g_buffer_view]
+                self._allocations[new_g_buffer_view] = _GBufferHeapAllocation(
+                    page, offset, allocation.size
+                )
+                moved[g_buffer_view] = new_g_buffer_view
+            if not ranges:
+                continue
+            copy_size = max(src_offset + size for src_offset, _, size in ranges)
+            temp = GBuffer(copy_size, frequency=GBufferFrequency.STREAM, nature=GBufferNature.COPY)
+            page.g_buffer.copy_to(temp, size=copy_size)
+            temp.copy_to_many(page.g_buffer, ranges)
+        return moved
+
+    @property
+    def page_size(self) -> int:
+        return self._page_size
+
+    @property
+    def alignment(self) -> int:
+        return self._alignment
+
+    @property
+    def frequency(self) -> GBufferFrequency:
+        return self._frequency
+
+    @property
+    def nature(self) -> GBufferNature:
+        return self._nature
+
+    @property
+    def g_buffers(self) -> tuple[GBuffer, ...]:
+        return tuple(page.g_buffer for page in self._pages)
+
+    @property
+    def size(self) -> int:
+        return sum(len(page.g_buffer) for page in self._pages)
+
+    @property
+    def used(self) -> int:
+        return sum(page.used for page in self._pages)
+
+    @property
+    def available(self) -> int:
+        return self.size - self.used
+
+    @property
+    def largest_available(self) -> int:
+        return max((size for page in self._pages for _, size in page.free), default=0)
+
+    @property
+    def fragmentation(self) -> float:
+        available = self.available
+        if available == 0:
+            return 0.0
+        return 1.0 - (self.largest_available / available)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+__all__ = ["GBufferRing"]
+
+from collections.abc import Buffer
+from collections.abc import Iterable
+from typing import Final
+
+from ._egraphics import GL_ARRAY_BUFFER
+from ._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
+from ._egraphics import GL_MAP_COHERENT_BIT
+from ._egraphics import GL_MAP_PERSISTENT_BIT
+from ._egraphics import GL_MAP_READ_BIT
+from ._egraphics import GL_MAP_WRITE_BIT
+from ._egraphics import GlSync
+from ._egraphics import create_gl_buffer
+from ._egraphics import create_gl_buffer_range_memory_view
+from ._egraphics import create_gl_fence_sync
+from ._egraphics import create_gl_named_buffer
+from ._egraphics import create_gl_named_buffer_memory_view
+from ._egraphics import delete_gl_fence_sync
+from ._egraphics import set_gl_buffer_target_storage
+from ._egraphics import set_gl_named_buffer_storage
+from ._egraphics import wait_gl_fence_sync
+from ._g_buffer import _FENCE_WAIT_TIMEOUT
+from ._g_buffer import _FREQUENCY_NATURE_TO_GL_USAGE
+from ._g_buffer import GBuffer
+from ._g_buffer import GBufferAccess
+from ._g_buffer import GBufferFrequency
+from ._g_buffer import GBufferMap
+from ._g_buffer import GBufferNature
+from ._g_buffer import GBufferTarget
+from ._g_buffer_view import _BVT
+from ._g_buffer_view import GBufferView
+from ._g_buffer_view import GBufferViewFormat
+from ._memory import MemoryKind
+from ._memory import register_memory
+
+_PERSISTENT_ACCESS: Final = (
+    GL_MAP_READ_BIT | GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+)
+
+
+class _PersistentGBuffer(GBuffer):
+    def __init__(self, length: int):
+        self._frequency = GBufferFrequency.STREAM
+        self._nature = GBufferNature.DRAW
+        self._gl_usage = _FREQUENCY_NATURE_TO_GL_USAGE[(self._frequency, self._nature)]
+
+        self._length = length
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._gl_buffer = create_gl_named_buffer()
+            set_gl_named_buffer_storage(self._gl_buffer, length, _PERSISTENT_ACCESS)
+            self._memory = create_gl_named_buffer_memory_view(
+                self._gl_buffer, 0, length, _PERSISTENT_ACCESS
+            )
+        else:
+            self._gl_buffer = create_gl_buffer()
+            GBufferTarget.ARRAY.g_buffer = self
+            set_gl_buffer_target_storage(GL_ARRAY_BUFFER, length, _PERSISTENT_ACCESS)
+            self._memory = create_gl_buffer_range_memory_view(
+                GL_ARRAY_BUFFER, 0, length, _PERSISTENT_ACCESS
+            )
+        register_memory(self, MemoryKind.G_BUFFER, length, (self._frequency, self._nature))
+
+    def __del__(self) -> None:
+        if hasattr(self, "_memory"):
+            del self._memory
+        super().__del__()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self._memory
+
+    def __release_buffer__(self, view: memoryview) -> None:
+        pass
+
+    def replace(self, data: Buffer | int) -> None:
+        raise RuntimeError("g buffer storage is immutable")
+
+    def resize(self, length: int) -> None:
+        raise RuntimeError("g buffer storage is immutable")
+
+    def map(
+        self,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        access: GBufferAccess = GBufferAccess.READ | GBufferAccess.WRITE,
+    ) -> GBufferMap:
+        raise RuntimeError("g buffer is persistently mapped")
+
+    def _map_read(self, offset: int, length: int) -> GBufferMap:
+        # the persistent mapping is uncached, so bulk reads go through a staging copy
+        staging = self.read_async(offset=offset, size=length).result()
+        return staging.map(access=GBufferAccess.READ)
+
+    def write(self, data: Buffer, *, offset: int = 0) -> None:
+        data = memoryview(data).cast("B")
+        if offset < 0 or offset + len(data) > self._length:
+            raise ValueError(
+                f"write would overrun buffer "
+                f"(offset: {offset}, size: {len(data)}, buffer size: {self._length})"
+            )
+        self._memory[offset : offset + len(data)] = data
+
+    def write_many(self, writes: Iterable[tuple[Buffer, int]]) -> None:
+        writes = [(memoryview(data).cast("B"), offset) for data, offset in writes]
+        for data, offset in writes:
+            if offset < 0 or offset + len(data) > self._length:
+                raise ValueError(
+                    f"write would overrun buffer "
+                    f"(offset: {offset}, size: {len(data)}, buffer size: {self._length})"
+                )
+        for data, offset in writes:
+            self._memory[offset : offset + len(data)] = data
+
+
+class GBufferRing:
+    def __init__(self, frame_size: int, *, frames: int = 3, alignment: int = 4):
+        if frame_size < 1:
+            raise ValueError("frame size must be greater than 0")
+        if frames < 1:
+            raise ValueError("frames must be greater than 0")
+        if alignment < 1:
+            raise ValueError("alignment must be greater than 0")
+        self._frame_size = frame_size
+        self._frames = frames
+        self._alignment = alignment
+
+        self._g_buffer = _PersistentGBuffer(frame_size * frames)
+        self._fences: list[GlSync | None] = [None] * frames
+        self._frame = 0
+        self._cursor = 0
+
+    def __del__(self) -> None:
+        if not hasattr(self, "_fences"):
+            return
+        for fence in self._fences:
+            if fence is not None:
+                delete_gl_fence_sync(fence)
+        self._fences.clear()
+
+    def allocate(
+        self,
+        data_type: type[_BVT],
+        length: int,
+        *,
+        stride: int | None = None,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
+    ) -> GBufferView[_BVT]:
+        if length < 0:
+            raise ValueError("length must be 0 or greater")
+        start = -(-self._cursor // self._alignment) * self._alignment
+        if start + length > self._frame_size:
+            raise RuntimeError("not enough space left in frame")
+        self._cursor = start + length
+        return GBufferView(
+            self._g_buffer,
+            data_type,
+            length=length,
+            stride=stride,
+            offset=(self._frame * self._frame_size) + start,
+            instancing_divisor=instancing_divisor,
+            format=format,
+        )
+
+    def write(
+        self,
+        data: Buffer,
+        data_type: type[_BVT],
+        *,
+        stride: int | None = None,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
+    ) -> GBufferView[_BVT]:
+        data = memoryview(data).cast("B")
+        g_buffer_view = self.allocate(
+            data_type,
+            len(data),
+            stride=stride,
+            instancing_divisor=instancing_divisor,
+            format=format,
+        )
+        self._g_buffer.write(data, offset=g_buffer_view.offset)
+        return g_buffer_view
+
+    def advance(self) -> None:
+        assert self._fences[self._frame] is None
+        self._fences[self._frame] = create_gl_fence_sync()
+
+        self._frame = (self._frame + 1) % self._frames
+        self._cursor = 0
+
+        fence = self._fences[self._frame]
+        if fence is None:
+            return
+        while not wait_gl_fence_sync(fence, _FENCE_WAIT_TIMEOUT):
+            pass
+        delete_gl_fence_sync(fence)
+        self._fences[self._frame] = None
+
+    @property
+    def g_buffer(self) -> GBuffer:
+        return self._g_buffer
+
+    @property
+    def frame_size(self) -> int:
+        return self._frame_size
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def alignment(self) -> int:
+        return self._alignment
+
+    @property
+    def available(self) -> int:
+        return self._frame_size - self._cursor
@@ -1,23 +1,38 @@
 from __future__ import annotations
 
-__all__ = ["GBufferView", "bind_g_buffer_view_shader_storage_buffer_unit"]
+__all__ = [
+    "GBufferView",
+    "GBufferViewFormat",
+    "bind_g_buffer_view_shader_storage_buffer_unit",
+    "bind_g_buffer_view_uniform_buffer_unit",
+]
 
 import ctypes
+from collections.abc import Set
 from ctypes import sizeof as c_sizeof
+from enum import Enum
 from struct import unpack as c_unpack
 from typing import Any
 from typing import ClassVar
 from typing import Final
 from typing import Generator
 from typing import Generic
+from typing import Mapping
+from typing import TypeAlias
 from typing import TypeVar
 from typing import overload
 
 import emath
 
 from ._egraphics import GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE
+from ._egraphics import GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE
+from ._egraphics import gather_strided_data
+from ._egraphics import interleave_data
 from ._egraphics import set_shader_storage_buffer_unit
+from ._egraphics import set_uniform_buffer_unit
 from ._g_buffer import GBuffer
+from ._g_buffer import GBufferFrequency
+from ._g_buffer import GBufferNature
 from ._g_buffer import get_g_buffer_gl_buffer
 from ._state import register_reset_state_callback
 from ._weak_fifo_set import WeakFifoSet
@@ -147,6 +162,97 @@ _ARRAY_TO_BUFFER_VIEW_TYPE: Final = {
     emath.U32Array: ctypes.c_uint32,
 }
 
+_Array: TypeAlias = (
+    emath.FVector2Array
+    | emath.DVector2Array
+    | emath.I8Vector2Array
+    | emath.U8Vector2Array
+    | emath.I16Vector2Array
+    | emath.U16Vector2Array
+    | emath.I32Vector2Array
+    | emath.U32Vector2Array
+    | emath.FVector3Array
+    | emath.DVector3Array
+    | emath.I8Vector3Array
+    | emath.U8Vector3Array
+    | emath.I16Vector3Array
+    | emath.U16Vector3Array
+    | emath.I32Vector3Array
+    | emath.U32Vector3Array
+    | emath.FVector4Array
+    | emath.DVector4Array
+    | emath.I8Vector4Array
+    | emath.U8Vector4Array
+    | emath.I16Vector4Array
+    | emath.U16Vector4Array
+    | emath.I32Vector4Array
+    | emath.U32Vector4Array
+    | emath.FMatrix2x2Array
+    | emath.DMatrix2x2Array
+    | emath.FMatrix2x3Array
+    | emath.DMatrix2x3Array
+    | emath.FMatrix2x4Array
+    | emath.DMatrix2x4Array
+    | emath.FMatrix3x2Array
+    | emath.DMatrix3x2Array
+    | emath.FMatrix3x3Array
+    | emath.DMatrix3x3Array
+    | emath.FMatrix3x4Array
+    | emath.DMatrix3x4Array
+    | emath.FMatrix4x2Array
+    | emath.DMatrix4x2Array
+    | emath.FMatrix4x3Array
+    | emath.DMatrix4x3Array
+    | emath.FMatrix4x4Array
+    | emath.DMatrix4x4Array
+    | emath.FArray
+    | emath.DArray
+    | emath.I8Array
+    | emath.U8Array
+    | emath.I16Array
+    | emath.U16Array
+    | emath.I32Array
+    | emath.U32Array
+)
+
+_BUFFER_VIEW_TYPE_TO_ARRAY: Final = {v: k for k, v in _ARRAY_TO_BUFFER_VIEW_TYPE.items()}
+
+_HALF_FLOAT_DATA_TYPES: Final[Set] = {
+    ctypes.c_uint16,
+    emath.U16Vector2,
+    emath.U16Vector3,
+    emath.U16Vector4,
+}
+
+_NORMALIZED_DATA_TYPES: Final[Set] = {
+    ctypes.c_int8,
+    ctypes.c_uint8,
+    ctypes.c_int16,
+    ctypes.c_uint16,
+    ctypes.c_int32,
+    ctypes.c_uint32,
+    emath.I8Vector2,
+    emath.U8Vector2,
+    emath.I16Vector2,
+    emath.U16Vector2,
+    emath.I32Vector2,
+    emath.U32Vector2,
+    emath.I8Vector3,
+    emath.U8Vector3,
+    emath.I16Vector3,
+    emath.U16Vector3,
+    emath.I32Vector3,
+    emath.U32Vector3,
+    emath.I8Vector4,
+    emath.U8Vector4,
+    emath.I16Vector4,
+    emath.U16Vector4,
+    emath.I32Vector4,
+    emath.U32Vector4,
+}
+
+_INT_2_10_10_10_REV_DATA_TYPES: Final[Set] = {ctypes.c_int32, ctypes.c_uint32}
+
 
 def _get_size_of_bvt(t: type[_BVT]) -> int:
     try:
@@ -159,14 +265,43 @@ def _get_size_of_bvt(t: type[_BVT]) -> int:
 def _reset_g_buffer_view_shader_storage_buffer_state() -> None:
     GBufferView._max_shader_storage_buffer_unit = None
     GBufferView._next_shader_storage_buffer_unit = 0
+    GBufferView._open_shader_storage_buffer_units.clear()
     GBufferView._unbound_shader_storage_buffer_units.clear()
 
 
+@register_reset_state_callback
+def _reset_g_buffer_view_uniform_buffer_state() -> None:
+    GBufferView._next_uniform_buffer_unit = 0
+    GBufferView._open_uniform_buffer_units.clear()
+    GBufferView._unbound_uniform_buffer_units.clear()
+
+
+class GBufferViewFormat(Enum):
+    DEFAULT = 0
+    NORMALIZED = 1
+    HALF_FLOAT = 2
+    NORMALIZED_INT_2_10_10_10_REV = 3
+
+
+_FORMAT_DATA_TYPES: Final[Mapping[GBufferViewFormat, Set]] = {
+    GBufferViewFormat.NORMALIZED: _NORMALIZED_DATA_TYPES,
+    GBufferViewFormat.HALF_FLOAT: _HALF_FLOAT_DATA_TYPES,
+    GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV: _INT_2_10_10_10_REV_DATA_TYPES,
+}
+
+
 class GBufferView(Generic[_BVT]):
+    Format: TypeAlias = GBufferViewFormat
+
     _max_shader_storage_buffer_unit: ClassVar[int | None] = None
     _next_shader_storage_buffer_unit: ClassVar[int] = 0
     _unbound_shader_storage_buffer_units: ClassVar[WeakFifoSet[GBufferView]] = WeakFifoSet()
     _open_shader_storage_buffer_units: ClassVar[set[int]] = set()
+    _shader_storage_buffer_unit: int | None = None
+    _next_uniform_buffer_unit: ClassVar[int] = 0
+    _unbound_uniform_buffer_units: ClassVar[WeakFifoSet[GBufferView]] = WeakFifoSet()
+    _open_uniform_buffer_units: ClassVar[set[int]] = set()
+    _uniform_buffer_unit: int | None = None
 
     def __init__(
         self,
@@ -177,6 +312,7 @@ class GBufferView(Generic[_BVT]):
         stride: int | None = None,
         offset: int = 0,
         instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> None:
         self._g_buffer = g_buffer
         self._data_type: type[_BVT] = data_type
@@ -191,11 +327,11 @@ class GBufferView(Generic[_BVT]):
             raise ValueError("offset must be 0 or greater")
         self._offset = offset
 
+        self._length = length
         if length is None:
             length = len(g_buffer) - self._offset
         if length < 0:
             raise ValueError("length must be 0 or greater")
-        self._length = length
 
         if self._offset + length > len(g_buffer):
             raise ValueError("length/offset goes beyond buffer size")
@@ -204,27 +340,246 @@ class GBufferView(Generic[_BVT]):
             if instancing_divisor < 1:
                 raise ValueError("instancing divisor must be greater than 0")
         self._instancing_divisor = instancing_divisor
-        self._shader_storage_buffer_unit: int | None = None
+
+        if format != GBufferViewFormat.DEFAULT and data_type not in _FORMAT_DATA_TYPES[format]:
+            raise ValueError(f"{format} cannot be used with {data_type!r}")
+        self._format = format
+
+    def __del__(self) -> None:
+        if self._shader_storage_buffer_unit is not None:
+            self._release_shader_storage_buffer_unit()
+        if self._uniform_buffer_unit is not None:
+            self._release_uniform_buffer_unit()
 
     def __len__(self) -> int:
         stride_diff = self._stride - _get_size_of_bvt(self._data_type)
-        return (self._length + stride_diff) // self._stride
+        return (self.length + stride_diff) // self._stride
+
+    @overload
+    def __getitem__(self, index: int) -> _BVT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> GBufferView[_BVT]: ...
+
+    def __getitem__(self, index: int | slice) -> _BVT | GBufferView[_BVT]:
+        if isinstance(index, slice):
+            return self._slice(index)
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("g buffer view index out of range")
+        data_type_size = _get_size_of_bvt(self._data_type)
+        with self._g_buffer._map_read(
+            self._offset + (self._stride * index), data_type_size
+        ) as memory:
+            chunk = bytes(memory)
+        struct_name = _CTYPES_TO_STRUCT_NAME.get(self._data_type)
+        if struct_name is None:
+            return self._data_type.from_buffer(chunk)  # type: ignore
+        return c_unpack(struct_name, chunk)[0]
+
+    def _slice(self, index: slice) -> GBufferView[_BVT]:
+        start, stop, step = index.indices(len(self))
+        if step < 1:
+            raise ValueError("slice step must be greater than 0")
+        count = len(range(start, stop, step))
+        if count == 0:
+            offset = self._offset
+            length = 0
+        else:
+            offset = self._offset + (self._stride * start)
+            length = (self._stride * step * (count - 1)) + _get_size_of_bvt(self._data_type)
+        return GBufferView(
+            self._g_buffer,
+            self._data_type,
+            length=length,
+            stride=self._stride * step,
+            offset=offset,
+            instancing_divisor=self._instancing_divisor,
+            format=self._format,
+        )
 
     def __iter__(self) -> Generator[_BVT, None, None]:
-        if len(self._g_buffer) == 0:
+        count = len(self)
+        if count <= 0:
             return
         buffer = memoryview(self._g_buffer)
-        for i in range(len(self)):
+        data_type_size = _get_size_of_bvt(self._data_type)
+        struct_name = _CTYPES_TO_STRUCT_NAME.get(self._data_type)
+        for i in range(count):
             start_index = self._offset + (self._stride * i)
-            end_index = start_index + _get_size_of_bvt(self._data_type)
-            chunk = buffer[start_index:end_index]
-            try:
-                struct_name = _CTYPES_TO_STRUCT_NAME[self._data_type]
-                data = c_unpack(struct_name, chunk)[0]
-            except KeyError:
+            chunk = buffer[start_index : start_index + data_type_size]
+            if struct_name is None:
                 data = self._data_type.from_buffer(chunk)
+            else:
+                data = c_unpack(struct_name, chunk)[0]
             yield data  # type: ignore
 
+    @overload
+    def to_array(self: GBufferView[emath.FVector2]) -> emath.FVector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DVector2]) -> emath.DVector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I8Vector2]) -> emath.I8Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U8Vector2]) -> emath.U8Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I16Vector2]) -> emath.I16Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U16Vector2]) -> emath.U16Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I32Vector2]) -> emath.I32Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U32Vector2]) -> emath.U32Vector2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FVector3]) -> emath.FVector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DVector3]) -> emath.DVector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I8Vector3]) -> emath.I8Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U8Vector3]) -> emath.U8Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I16Vector3]) -> emath.I16Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U16Vector3]) -> emath.U16Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I32Vector3]) -> emath.I32Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U32Vector3]) -> emath.U32Vector3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FVector4]) -> emath.FVector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DVector4]) -> emath.DVector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I8Vector4]) -> emath.I8Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U8Vector4]) -> emath.U8Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I16Vector4]) -> emath.I16Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U16Vector4]) -> emath.U16Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.I32Vector4]) -> emath.I32Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.U32Vector4]) -> emath.U32Vector4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix2x2]) -> emath.FMatrix2x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix2x2]) -> emath.DMatrix2x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix2x3]) -> emath.FMatrix2x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix2x3]) -> emath.DMatrix2x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix2x4]) -> emath.FMatrix2x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix2x4]) -> emath.DMatrix2x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix3x2]) -> emath.FMatrix3x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix3x2]) -> emath.DMatrix3x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix3x3]) -> emath.FMatrix3x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix3x3]) -> emath.DMatrix3x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix3x4]) -> emath.FMatrix3x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix3x4]) -> emath.DMatrix3x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix4x2]) -> emath.FMatrix4x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix4x2]) -> emath.DMatrix4x2Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix4x3]) -> emath.FMatrix4x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix4x3]) -> emath.DMatrix4x3Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.FMatrix4x4]) -> emath.FMatrix4x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[emath.DMatrix4x4]) -> emath.DMatrix4x4Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_float]) -> emath.FArray: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_double]) -> emath.DArray: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_int8]) -> emath.I8Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_uint8]) -> emath.U8Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_int16]) -> emath.I16Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_uint16]) -> emath.U16Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_int32]) -> emath.I32Array: ...
+
+    @overload
+    def to_array(self: GBufferView[ctypes.c_uint32]) -> emath.U32Array: ...
+
+    def to_array(self) -> Any:
+        try:
+            array_type = _BUFFER_VIEW_TYPE_TO_ARRAY[self._data_type]
+        except KeyError:
+            raise TypeError(f"{self._data_type!r} has no array type")
+        count = len(self)
+        if count <= 0:
+            return array_type()
+        data_type_size = _get_size_of_bvt(self._data_type)
+        read_length = ((count - 1) * self._stride) + data_type_size
+        with self._g_buffer._map_read(self._offset, read_length) as memory:
+            data = gather_strided_data(memory, data_type_size, self._stride, count)
+        return array_type.from_buffer(data)
+
     @property
     def g_buffer(self) -> GBuffer:
         return self._g_buffer
@@ -239,8 +594,15 @@ class GBufferView(Generic[_BVT]):
 
     @property
     def length(self) -> int:
+        self._check_extent()
+        if self._length is None:
+            return len(self._g_buffer) - self._offset
         return self._length
 
+    def _check_extent(self) -> None:
+        if self._offset + (self._length or 0) > len(self._g_buffer):
+            raise ValueError("length/offset goes beyond buffer size")
+
     @property
     def stride(self) -> int:
         return self._stride
@@ -253,6 +615,10 @@ class GBufferView(Generic[_BVT]):
     def instancing_divisor(self) -> int | None:
         return self._instancing_divisor
 
+    @property
+    def format(self) -> GBufferViewFormat:
+        return self._format
+
     def _acquire_shader_storage_buffer_unit(self) -> None:
         if self._open_shader_storage_buffer_units:
             self._shader_storage_buffer_unit = self._open_shader_storage_buffer_units.pop()
@@ -282,12 +648,13 @@ class GBufferView(Generic[_BVT]):
         self._acquire_shader_storage_buffer_unit()
 
     def _bind_shader_storage_buffer_unit(self) -> int:
+        length = self.length
         if self._shader_storage_buffer_unit is None:
             self._acquire_shader_storage_buffer_unit()
         assert self._shader_storage_buffer_unit is not None
         gl_buffer = get_g_buffer_gl_buffer(self._g_buffer)
         set_shader_storage_buffer_unit(
-            self._shader_storage_buffer_unit, gl_buffer, self._offset, self._length
+            self._shader_storage_buffer_unit, gl_buffer, self._offset, length
         )
         return self._shader_storage_buffer_unit
 
@@ -295,250 +662,455 @@ class GBufferView(Generic[_BVT]):
         assert self._shader_storage_buffer_unit is not None
         self._unbound_shader_storage_buffer_units.add(self)
 
+    def _acquire_uniform_buffer_unit(self) -> None:
+        if self._open_uniform_buffer_units:
+            self._uniform_buffer_unit = self._open_uniform_buffer_units.pop()
+            return
+        assert self._next_uniform_buffer_unit <= GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE
+        if self._next_uniform_buffer_unit == GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE:
+            self._steal_uniform_buffer_unit()
+        else:
+            self._uniform_buffer_unit = self._next_uniform_buffer_unit
+            GBufferView._next_uniform_buffer_unit += 1
+
+    def _release_uniform_buffer_unit(self) -> None:
+        assert self._uniform_buffer_unit is not None
+        self._open_uniform_buffer_units.add(self._uniform_buffer_unit)
+        self._uniform_buffer_unit = None
+        try:
+            self._unbound_uniform_buffer_units.remove(self)
+        except KeyError:
+            pass
+
+    def _steal_uniform_buffer_unit(self) -> None:
+        try:
+            g_buffer_view = self._unbound_uniform_buffer_units.pop()
+        except IndexError:
+            raise RuntimeError("no uniform buffer unit available")
+        g_buffer_view._release_uniform_buffer_unit()
+        self._acquire_uniform_buffer_unit()
+
+    def _bind_uniform_buffer_unit(self) -> int:
+        length = self.length
+        if self._uniform_buffer_unit is None:
+            self._acquire_uniform_buffer_unit()
+        assert self._uniform_buffer_unit is not None
+        gl_buffer = get_g_buffer_gl_buffer(self._g_buffer)
+        set_uniform_buffer_unit(self._uniform_buffer_unit, gl_buffer, self._offset, length)
+        return self._uniform_buffer_unit
+
+    def _unbind_uniform_buffer_unit(self) -> None:
+        assert self._uniform_buffer_unit is not None
+        self._unbound_uniform_buffer_units.add(self)
+
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FVector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FVector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FVector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.DVector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.DVector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.DVector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I8Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I8Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I8Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U8Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U8Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U8Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I16Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I16Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I16Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U16Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U16Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U16Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I32Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I32Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I32Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U32Vector2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U32Vector2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U32Vector2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FVector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FVector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FVector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.DVector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.DVector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.DVector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I8Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I8Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I8Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U8Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U8Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U8Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I16Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I16Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I16Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U16Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U16Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U16Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I32Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I32Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I32Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U32Vector3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U32Vector3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U32Vector3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FVector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FVector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FVector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.DVector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.DVector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.DVector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I8Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I8Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I8Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U8Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U8Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U8Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I16Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I16Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I16Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U16Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U16Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U16Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I32Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I32Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.I32Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U32Vector4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U32Vector4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.U32Vector4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix2x2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix2x2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix2x2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix2x3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix2x3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix2x3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix2x4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix2x4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix2x4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix3x2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix3x2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix3x2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix3x3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix3x3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix3x3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix3x4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix3x4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix3x4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix4x2Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix4x2Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix4x2]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix4x3Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix4x3Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix4x3]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FMatrix4x4Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FMatrix4x4Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[emath.FMatrix4x4]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.FArray, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.FArray,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_float]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.DArray, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.DArray,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_double]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I8Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I8Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_int8]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U8Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U8Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_uint8]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I16Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I16Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_int16]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U16Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U16Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_uint16]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.I32Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.I32Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_int32]: ...
 
     @overload
     @classmethod
     def from_array(
-        cls, array: emath.U32Array, *, instancing_divisor: int | None = None
+        cls,
+        array: emath.U32Array,
+        *,
+        instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView[ctypes.c_uint32]: ...
 
     @classmethod
@@ -596,10 +1168,70 @@ class GBufferView(Generic[_BVT]):
         | emath.U32Array,
         *,
         instancing_divisor: int | None = None,
+        format: GBufferViewFormat = GBufferViewFormat.DEFAULT,
     ) -> GBufferView:
         data_type = _ARRAY_TO_BUFFER_VIEW_TYPE[type(array)]
         buffer = GBuffer(array)
-        return GBufferView(buffer, data_type, instancing_divisor=instancing_divisor)
+        return GBufferView(buffer, data_type, instancing_divisor=instancing_divisor, format=format)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Mapping[str, _Array],
+        *,
+        alignment: int = 4,
+        instancing_divisor: int | None = None,
+        formats: Mapping[str, GBufferViewFormat] | None = None,
+        frequency: GBufferFrequency = GBufferFrequency.STATIC,
+        nature: GBufferNature = GBufferNature.DRAW,
+    ) -> dict[str, GBufferView]:
+        if formats is None:
+            formats = {}
+        if not arrays:
+            raise ValueError("at least one array must be supplied")
+        if alignment < 1:
+            raise ValueError("alignment must be greater than 0")
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError("arrays must all be the same length")
+        (count,) = lengths
+
+        data_types: dict[str, Any] = {}
+        sources: list[tuple[_Array, int, int]] = []
+        stride = 0
+        for name, array in arrays.items():
+            data_type = data_types[name] = _ARRAY_TO_BUFFER_VIEW_TYPE[type(array)]
+            data_type_size = _get_size_of_bvt(data_type)
+            offset = -(-stride // alignment) * alignment
+            sources.append((array, data_type_size, offset))
+            stride = offset + data_type_size
+        stride = -(-stride // alignment) * alignment
+
+        g_buffer = GBuffer(
+            interleave_data(sources, stride, count), frequency=frequency, nature=nature
+        )
+        if count == 0:
+            return {
+                name: GBufferView(
+                    g_buffer,
+                    data_types[name],
+                    instancing_divisor=instancing_divisor,
+                    format=formats.get(name, GBufferViewFormat.DEFAULT),
+                )
+                for name in arrays
+            }
+        return {
+            name: GBufferView(
+                g_buffer,
+                data_types[name],
+                length=(stride * (count - 1)) + data_type_size,
+                stride=stride,
+                offset=offset,
+                instancing_divisor=instancing_divisor,
+                format=formats.get(name, GBufferViewFormat.DEFAULT),
+            )
+            for name, (_, data_type_size, offset) in zip(arrays, sources)
+        }
 
 
 class _ShaderStorageBufferBind:
@@ -628,3 +1260,29 @@ def bind_g_buffer_view_shader_storage_buffer_unit(
     g_buffer_view: GBufferView,
 ) -> _ShaderStorageBufferBind:
     return _ShaderStorageBufferBind(g_buffer_view)
+
+
+class _UniformBufferBind:
+    _refs: int = 0
+
+    def __init__(self, g_buffer_view: GBufferView):
+        self._g_buffer_view = g_buffer_view
+        self._unit: int | None = None
+
+    def __enter__(self) -> int:
+        if self._refs == 0:
+            self._unit = self._g_buffer_view._bind_uniform_buffer_unit()
+        self._refs += 1
+        assert self._unit is not None
+        return self._unit
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        self._refs -= 1
+        if self._refs == 0:
+            assert self._unit is not None
+            self._g_buffer_view._unbind_uniform_buffer_unit()
+        assert self._refs >= 0
+
+
+def bind_g_buffer_view_uniform_buffer_unit(g_buffer_view: GBufferView) -> _UniformBufferBind:
+    return _UniformBufferBind(g_buffer_view)
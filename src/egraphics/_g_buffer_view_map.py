@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-__all__ = ["GBufferViewMap", "IndexGBufferView"]
+__all__ = ["GBufferViewMap", "GBufferViewMapCacheInfo", "IndexGBufferView"]
 
 import ctypes
 from collections.abc import Mapping
@@ -8,7 +8,9 @@ from collections.abc import Set
 from typing import Any
 from typing import ClassVar
 from typing import Final
+from typing import NamedTuple
 from typing import Sequence
+from typing import TypeAlias
 from weakref import WeakKeyDictionary
 from weakref import ref
 
@@ -18,27 +20,47 @@ from ._egraphics import GL_BYTE
 from ._egraphics import GL_DOUBLE
 from ._egraphics import GL_ELEMENT_ARRAY_BUFFER
 from ._egraphics import GL_FLOAT
+from ._egraphics import GL_HALF_FLOAT
 from ._egraphics import GL_INT
+from ._egraphics import GL_INT_2_10_10_10_REV
 from ._egraphics import GL_SHORT
 from ._egraphics import GL_UNSIGNED_BYTE
 from ._egraphics import GL_UNSIGNED_INT
+from ._egraphics import GL_UNSIGNED_INT_2_10_10_10_REV
 from ._egraphics import GL_UNSIGNED_SHORT
+from ._egraphics import GL_VERTEX_ATTRIB_BINDING_SUPPORTED
+from ._egraphics import GlBuffer
 from ._egraphics import GlType
 from ._egraphics import GlVertexArray
 from ._egraphics import activate_gl_vertex_array
+from ._egraphics import bind_gl_vertex_buffers
+from ._egraphics import configure_gl_vertex_array_format
 from ._egraphics import configure_gl_vertex_array_location
 from ._egraphics import create_gl_vertex_array
 from ._egraphics import delete_gl_vertex_array
 from ._egraphics import set_gl_buffer_target
+from ._egraphics import set_gl_vertex_array_binding_divisor
+from ._g_buffer import GBuffer
 from ._g_buffer import GBufferTarget
 from ._g_buffer import get_g_buffer_gl_buffer
 from ._g_buffer_view import GBufferView
+from ._g_buffer_view import GBufferViewFormat
 from ._shader import Shader
+from ._shader import ShaderAttribute
+from ._state import register_reset_state_callback
 
 IndexGBufferView = (
     GBufferView[ctypes.c_uint8] | GBufferView[ctypes.c_uint16] | GBufferView[ctypes.c_uint32]
 )
 
+_VertexArrayLayout: TypeAlias = tuple[tuple[str, int, int, Any], ...]
+
+
+class GBufferViewMapCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    vertex_arrays: int
+
 
 class GBufferViewMap:
     _mapping: dict[str, GBufferView | tuple[GBufferView, ...]]
@@ -48,6 +70,8 @@ class GBufferViewMap:
         mapping: Mapping[str, GBufferView | Sequence[GBufferView]],
         indices: tuple[int, int] | IndexGBufferView,
         /,
+        *,
+        primitive_restart: bool = False,
     ) -> None:
         if isinstance(indices, GBufferView):
             if indices.stride != indices.data_type_size:
@@ -60,12 +84,26 @@ class GBufferViewMap:
                 raise ValueError(
                     f"view buffer with type {indices.data_type} cannot be used for indexing"
                 )
+        elif primitive_restart:
+            raise ValueError("primitive restart requires indices to be a view buffer")
 
         self._mapping = {
             n: v if isinstance(v, GBufferView) else tuple(v) for n, v in mapping.items()
         }
-        self._shader_mapping: WeakKeyDictionary[Shader, _GlVertexArray] = WeakKeyDictionary()
+        self._views = tuple(
+            view
+            for views in self._mapping.values()
+            for view in ((views,) if isinstance(views, GBufferView) else views)
+        ) + ((indices,) if isinstance(indices, GBufferView) else ())
+        self._shader_layouts: WeakKeyDictionary[Shader, _VertexArrayLayout] = WeakKeyDictionary()
+        self._layout_vertex_arrays: dict[
+            _VertexArrayLayout, _GlPointerVertexArray | _GlVertexBuffers
+        ] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._indices = indices
+        self._primitive_restart = primitive_restart
+        self._checked_size_generation: int | None = None
 
     def __len__(self) -> int:
         return len(self._mapping)
@@ -73,73 +111,140 @@ class GBufferViewMap:
     def __getitem__(self, key: str) -> GBufferView | Sequence[GBufferView]:
         return self._mapping[key]
 
-    def _get_gl_vertex_array_for_shader(self, shader: Shader) -> _GlVertexArray:
+    def _get_layout_for_shader(self, shader: Shader) -> _VertexArrayLayout:
         try:
-            return self._shader_mapping[shader]
+            return self._shader_layouts[shader]
         except (TypeError, KeyError):
             pass
-        gl_vertex_array = self._shader_mapping[shader] = _GlVertexArray(
-            shader, self._mapping, None if isinstance(self._indices, tuple) else self._indices
+        layout = self._shader_layouts[shader] = _get_vertex_array_layout(
+            shader.attributes, self._mapping
         )
+        return layout
+
+    def _get_gl_vertex_array_for_shader(
+        self, shader: Shader
+    ) -> _GlPointerVertexArray | _GlVertexBuffers:
+        layout = self._get_layout_for_shader(shader)
+        try:
+            gl_vertex_array = self._layout_vertex_arrays[layout]
+        except KeyError:
+            pass
+        else:
+            self._cache_hits += 1
+            return gl_vertex_array
+        self._cache_misses += 1
+        index_g_buffer_view = None if isinstance(self._indices, tuple) else self._indices
+        vertex_attributes = _get_vertex_attributes(layout, self._mapping)
+        if GL_VERTEX_ATTRIB_BINDING_SUPPORTED:
+            gl_vertex_array = _GlVertexBuffers(vertex_attributes, index_g_buffer_view)
+        else:
+            gl_vertex_array = _GlPointerVertexArray(vertex_attributes, index_g_buffer_view)
+        self._layout_vertex_arrays[layout] = gl_vertex_array
         return gl_vertex_array
 
+    def cache_info(self) -> GBufferViewMapCacheInfo:
+        return GBufferViewMapCacheInfo(
+            self._cache_hits, self._cache_misses, len(self._layout_vertex_arrays)
+        )
+
+    def _check_extents(self) -> None:
+        if self._checked_size_generation == GBuffer._size_generation:
+            return
+        for view in self._views:
+            view._check_extent()
+        self._checked_size_generation = GBuffer._size_generation
+
     def activate_for_shader(self, shader: Shader) -> None:
+        self._check_extents()
         gl_vertex_array = self._get_gl_vertex_array_for_shader(shader)
-        gl_vertex_array._activate()
+        gl_vertex_array.activate()
 
     @property
     def indices(self) -> tuple[int, int] | IndexGBufferView:
         return self._indices
 
+    @property
+    def primitive_restart(self) -> bool:
+        return self._primitive_restart
 
-class _GlVertexArray:
-    _active: ClassVar[ref[_GlVertexArray] | None] = None
 
-    _gl_vertex_array: GlVertexArray | None
+class _VertexAttribute(NamedTuple):
+    location: int
+    size: int
+    gl_type: GlType
+    normalized: bool
+    pointer_gl_type: GlType
+    relative_offset: int
+    g_buffer_view: GBufferView
 
-    def __init__(
-        self,
-        shader: Shader,
-        mapping: Mapping[str, GBufferView | tuple[GBufferView, ...]],
-        index_g_buffer_view: IndexGBufferView | None,
-    ) -> None:
-        self._gl_vertex_array = create_gl_vertex_array()
-        self._activate()
 
-        if index_g_buffer_view is not None:
-            set_gl_buffer_target(
-                GL_ELEMENT_ARRAY_BUFFER, get_g_buffer_gl_buffer(index_g_buffer_view.g_buffer)
-            )
+def _get_vertex_attributes(
+    layout: _VertexArrayLayout, mapping: Mapping[str, GBufferView | tuple[GBufferView, ...]]
+) -> list[_VertexAttribute]:
+    vertex_attributes: list[_VertexAttribute] = []
+    for attribute_name, attribute_location, attribute_size, attribute_data_type in layout:
+        buffer_views = mapping[attribute_name]
+        if isinstance(buffer_views, GBufferView):
+            buffer_views = (buffer_views,)
 
-        for attribute in shader.attributes:
-            try:
-                buffer_views = mapping[attribute.name]
-            except KeyError:
-                continue
-            if isinstance(buffer_views, GBufferView):
-                buffer_views = (buffer_views,)
-
-            for i, buffer_view in enumerate(buffer_views):
-                if i >= attribute.size:
-                    break
-                GBufferTarget.ARRAY.g_buffer = buffer_view.g_buffer
-                view_gl_type, count, locations = _BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
-                    buffer_view.data_type
-                ]
-                i_location_offset = locations * i
-                for location_offset in range(locations):
-                    location = attribute.location + location_offset + i_location_offset
-                    offset = buffer_view.offset + (
-                        (buffer_view.data_type_size // locations) * location_offset
-                    )
-                    configure_gl_vertex_array_location(
-                        location,
+        attribute_gl_type = _ATTRIBUTE_TYPE_TO_GL_TYPE.get(attribute_data_type, GL_FLOAT)
+        for i, buffer_view in enumerate(buffer_views):
+            if i >= attribute_size:
+                break
+            view_gl_type, count, locations = _BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
+                buffer_view.data_type
+            ]
+            if buffer_view.format == GBufferViewFormat.HALF_FLOAT:
+                view_gl_type = GL_HALF_FLOAT
+            elif buffer_view.format == GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV:
+                if buffer_view.data_type is ctypes.c_uint32:
+                    view_gl_type = GL_UNSIGNED_INT_2_10_10_10_REV
+                else:
+                    view_gl_type = GL_INT_2_10_10_10_REV
+                count = 4
+            if attribute_gl_type in _INTEGER_GL_TYPES:
+                compatible = (
+                    view_gl_type in _INTEGER_GL_TYPES
+                    and buffer_view.format == GBufferViewFormat.DEFAULT
+                )
+                pointer_gl_type = GL_INT
+            elif attribute_gl_type == GL_DOUBLE:
+                compatible = view_gl_type == GL_DOUBLE
+                pointer_gl_type = GL_DOUBLE
+            else:
+                compatible = True
+                pointer_gl_type = GL_FLOAT
+            if not compatible:
+                raise ValueError(
+                    f"{buffer_view.format} view buffer with type {buffer_view.data_type!r} "
+                    f"cannot be used for {attribute_name!r} attribute of type "
+                    f"{attribute_data_type!r}"
+                )
+            normalized = buffer_view.format in _NORMALIZED_FORMATS
+            i_location_offset = locations * i
+            for location_offset in range(locations):
+                vertex_attributes.append(
+                    _VertexAttribute(
+                        attribute_location + location_offset + i_location_offset,
                         count,
                         view_gl_type,
-                        buffer_view.stride,
-                        offset,
-                        buffer_view.instancing_divisor,
+                        normalized,
+                        pointer_gl_type,
+                        (buffer_view.data_type_size // locations) * location_offset,
+                        buffer_view,
                     )
+                )
+    return vertex_attributes
+
+
+class _GlVertexArray:
+    _active: ClassVar[ref[_GlVertexArray] | None] = None
+
+    _gl_vertex_array: GlVertexArray | None
+
+    def __init__(self) -> None:
+        self._gl_vertex_array = create_gl_vertex_array()
+        self._activate()
 
     def _activate(self) -> None:
         if self._active and self._active() is self:
@@ -156,6 +261,122 @@ class _GlVertexArray:
             self._gl_vertex_array = None
 
 
+class _GlPointerVertexArray(_GlVertexArray):
+    def __init__(
+        self,
+        vertex_attributes: Sequence[_VertexAttribute],
+        index_g_buffer_view: IndexGBufferView | None,
+    ) -> None:
+        super().__init__()
+
+        if index_g_buffer_view is not None:
+            set_gl_buffer_target(
+                GL_ELEMENT_ARRAY_BUFFER, get_g_buffer_gl_buffer(index_g_buffer_view.g_buffer)
+            )
+
+        for vertex_attribute in vertex_attributes:
+            buffer_view = vertex_attribute.g_buffer_view
+            GBufferTarget.ARRAY.g_buffer = buffer_view.g_buffer
+            configure_gl_vertex_array_location(
+                vertex_attribute.location,
+                vertex_attribute.size,
+                vertex_attribute.gl_type,
+                vertex_attribute.normalized,
+                vertex_attribute.pointer_gl_type,
+                buffer_view.stride,
+                buffer_view.offset + vertex_attribute.relative_offset,
+                buffer_view.instancing_divisor,
+            )
+
+    def activate(self) -> None:
+        self._activate()
+
+
+_VertexFormat: TypeAlias = tuple[
+    tuple[tuple[int, int, GlType, bool, GlType, int, int], ...], tuple[int, ...]
+]
+
+
+class _GlFormatVertexArray(_GlVertexArray):
+    _bindings: tuple[tuple[GlBuffer, int, int], ...] | None = None
+
+    def __init__(self, vertex_format: _VertexFormat) -> None:
+        super().__init__()
+        attribute_formats, binding_divisors = vertex_format
+        for attribute_format in attribute_formats:
+            configure_gl_vertex_array_format(*attribute_format)
+        for binding_index, divisor in enumerate(binding_divisors):
+            if divisor:
+                set_gl_vertex_array_binding_divisor(binding_index, divisor)
+
+
+_gl_format_vertex_arrays: dict[_VertexFormat, _GlFormatVertexArray] = {}
+
+
+@register_reset_state_callback
+def _reset_gl_format_vertex_arrays() -> None:
+    _gl_format_vertex_arrays.clear()
+
+
+class _GlVertexBuffers:
+    def __init__(
+        self,
+        vertex_attributes: Sequence[_VertexAttribute],
+        index_g_buffer_view: IndexGBufferView | None,
+    ) -> None:
+        binding_indices: dict[GBufferView, int] = {}
+        bindings: list[tuple[GlBuffer, int, int]] = []
+        binding_divisors: list[int] = []
+        attribute_formats: list[tuple[int, int, GlType, bool, GlType, int, int]] = []
+        for vertex_attribute in vertex_attributes:
+            buffer_view = vertex_attribute.g_buffer_view
+            try:
+                binding_index = binding_indices[buffer_view]
+            except KeyError:
+                binding_index = binding_indices[buffer_view] = len(bindings)
+                bindings.append(
+                    (
+                        get_g_buffer_gl_buffer(buffer_view.g_buffer),
+                        buffer_view.offset,
+                        buffer_view.stride,
+                    )
+                )
+                binding_divisors.append(buffer_view.instancing_divisor or 0)
+            attribute_formats.append(
+                (
+                    vertex_attribute.location,
+                    vertex_attribute.size,
+                    vertex_attribute.gl_type,
+                    vertex_attribute.normalized,
+                    vertex_attribute.pointer_gl_type,
+                    vertex_attribute.relative_offset,
+                    binding_index,
+                )
+            )
+        self._vertex_format: _VertexFormat = (tuple(attribute_formats), tuple(binding_divisors))
+        self._bindings = tuple(bindings)
+        self._index_gl_buffer = (
+            None
+            if index_g_buffer_view is None
+            else get_g_buffer_gl_buffer(index_g_buffer_view.g_buffer)
+        )
+
+    def activate(self) -> None:
+        try:
+            gl_vertex_array = _gl_format_vertex_arrays[self._vertex_format]
+        except KeyError:
+            gl_vertex_array = _gl_format_vertex_arrays[self._vertex_format] = _GlFormatVertexArray(
+                self._vertex_format
+            )
+        gl_vertex_array._activate()
+        if gl_vertex_array._bindings is self._bindings:
+            return
+        if self._index_gl_buffer is not None:
+            set_gl_buffer_target(GL_ELEMENT_ARRAY_BUFFER, self._index_gl_buffer)
+        bind_gl_vertex_buffers(self._bindings)
+        gl_vertex_array._bindings = self._bindings
+
+
 _BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER: Final[Mapping[Any, tuple[GlType, int, int]]] = {
     ctypes.c_float: (GL_FLOAT, 1, 1),
     ctypes.c_double: (GL_DOUBLE, 1, 1),
@@ -209,4 +430,51 @@ _BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER: Final[Mapping[Any, tuple[GlType, int
     emath.DMatrix4x4: (GL_DOUBLE, 4, 4),
 }
 
+
+def _get_vertex_array_layout(
+    attributes: Sequence[ShaderAttribute], mapping: Mapping[str, Any]
+) -> _VertexArrayLayout:
+    return tuple(
+        sorted((a.name, a.location, a.size, a.data_type) for a in attributes if a.name in mapping)
+    )
+
+
+_NORMALIZED_FORMATS: Final[Set] = {
+    GBufferViewFormat.NORMALIZED,
+    GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV,
+}
+
+_ATTRIBUTE_TYPE_TO_GL_TYPE: Final[Mapping[Any, GlType]] = {
+    ctypes.c_double: GL_DOUBLE,
+    emath.DVector2: GL_DOUBLE,
+    emath.DVector3: GL_DOUBLE,
+    emath.DVector4: GL_DOUBLE,
+    emath.DMatrix2x2: GL_DOUBLE,
+    emath.DMatrix2x3: GL_DOUBLE,
+    emath.DMatrix2x4: GL_DOUBLE,
+    emath.DMatrix3x2: GL_DOUBLE,
+    emath.DMatrix3x3: GL_DOUBLE,
+    emath.DMatrix3x4: GL_DOUBLE,
+    emath.DMatrix4x2: GL_DOUBLE,
+    emath.DMatrix4x3: GL_DOUBLE,
+    emath.DMatrix4x4: GL_DOUBLE,
+    ctypes.c_int32: GL_INT,
+    emath.I32Vector2: GL_INT,
+    emath.I32Vector3: GL_INT,
+    emath.I32Vector4: GL_INT,
+    ctypes.c_uint32: GL_UNSIGNED_INT,
+    emath.U32Vector2: GL_UNSIGNED_INT,
+    emath.U32Vector3: GL_UNSIGNED_INT,
+    emath.U32Vector4: GL_UNSIGNED_INT,
+}
+
+_INTEGER_GL_TYPES: Final[Set] = {
+    GL_BYTE,
+    GL_UNSIGNED_BYTE,
+    GL_SHORT,
+    GL_UNSIGNED_SHORT,
+    GL_INT,
+    GL_UNSIGNED_INT,
+}
+
 _INDEX_BUFFER_TYPES: Final[Set] = {ctypes.c_uint8, ctypes.c_uint16, ctypes.c_uint32}
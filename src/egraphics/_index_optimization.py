@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+__all__ = [
+    "join_index_strips",
+    "narrow_indices",
+    "optimize_overdraw",
+    "optimize_vertex_cache",
+    "optimize_vertex_fetch",
+]
+
+import ctypes
+from typing import Any
+from typing import Final
+from typing import Mapping
+from typing import Sequence
+
+import emath
+
+from ._egraphics import join_index_data_strips
+from ._egraphics import narrow_index_data
+from ._egraphics import optimize_index_data_overdraw
+from ._egraphics import optimize_index_data_vertex_cache
+from ._egraphics import optimize_index_data_vertex_fetch
+from ._egraphics import remap_vertex_data
+from ._g_buffer import GBuffer
+from ._g_buffer import GBufferFrequency
+from ._g_buffer import GBufferNature
+from ._g_buffer_view import GBufferView
+from ._g_buffer_view_map import IndexGBufferView
+
+_INDEX_SIZE_TO_DATA_TYPE: Final[Mapping[int, Any]] = {
+    1: ctypes.c_uint8,
+    2: ctypes.c_uint16,
+    4: ctypes.c_uint32,
+}
+
+_INDEX_ARRAY_INDEX_SIZE: Final[Mapping[Any, int]] = {
+    emath.U8Array: 1,
+    emath.U16Array: 2,
+    emath.U32Array: 4,
+}
+
+
+def _get_index_size(indices: IndexGBufferView) -> int:
+    index_size = ctypes.sizeof(indices.data_type)
+    if _INDEX_SIZE_TO_DATA_TYPE.get(index_size) is not indices.data_type:
+        raise ValueError(f"view buffer with type {indices.data_type} cannot be used for indexing")
+    if indices.stride != index_size:
+        raise ValueError(
+            "view buffer with a stride different from its type cannot be used for indexing"
+        )
+    return index_size
+
+
+def _get_triangle_list_index_size(indices: IndexGBufferView) -> int:
+    index_size = _get_index_size(indices)
+    if len(indices) % 3 != 0:
+        raise ValueError("indices length must be a multiple of 3")
+    return index_size
+
+
+def _create_index_g_buffer_view(
+    indices: IndexGBufferView, data: bytes, index_size: int
+) -> IndexGBufferView:
+    g_buffer = GBuffer(data, frequency=indices.g_buffer.frequency, nature=indices.g_buffer.nature)
+    return GBufferView(g_buffer, _INDEX_SIZE_TO_DATA_TYPE[index_size])
+
+
+def optimize_vertex_cache(indices: IndexGBufferView, *, cache_size: int = 16) -> IndexGBufferView:
+    index_size = _get_triangle_list_index_size(indices)
+    if cache_size < 1:
+        raise ValueError("cache size must be greater than 0")
+    offset = indices.offset
+    with memoryview(indices.g_buffer) as data:
+        with data[offset : offset + len(indices) * index_size] as index_data:
+            optimized = optimize_index_data_vertex_cache(index_data, index_size, cache_size)
+    return _create_index_g_buffer_view(indices, optimized, index_size)
+
+
+def optimize_overdraw(
+    indices: IndexGBufferView, positions: GBufferView[emath.FVector3], *, cache_size: int = 16
+) -> IndexGBufferView:
+    index_size = _get_triangle_list_index_size(indices)
+    if positions.data_type is not emath.FVector3:
+        raise ValueError("positions data type must be FVector3")
+    if cache_size < 1:
+        raise ValueError("cache size must be greater than 0")
+    index_start = indices.offset
+    index_end = index_start + len(indices) * index_size
+    position_start = positions.offset
+    position_end = position_start + positions.length
+    with memoryview(indices.g_buffer) as data, memoryview(positions.g_buffer) as position_data:
+        with (
+            data[index_start:index_end] as index_data,
+            position_data[position_start:position_end] as positions_data,
+        ):
+            optimized = optimize_index_data_overdraw(
+                index_data, index_size, positions_data, positions.stride, cache_size
+            )
+    return _create_index_g_buffer_view(indices, optimized, index_size)
+
+
+def optimize_vertex_fetch(
+    indices: IndexGBufferView, attributes: Mapping[str, GBufferView | Sequence[GBufferView]]
+) -> tuple[IndexGBufferView, dict[str, GBufferView | tuple[GBufferView, ...]]]:
+    index_size = _get_index_size(indices)
+    offset = indices.offset
+    with memoryview(indices.g_buffer) as data:
+        with data[offset : offset + len(indices) * index_size] as index_data:
+            optimized, order = optimize_index_data_vertex_fetch(index_data, index_size)
+
+    groups: dict[tuple[GBuffer, int], list[GBufferView]] = {}
+    for value in attributes.values():
+        for g_buffer_view in (value,) if isinstance(value, GBufferView) else value:
+            if g_buffer_view.instancing_divisor is not None:
+                continue
+            groups.setdefault((g_buffer_view.g_buffer, g_buffer_view.stride), []).append(
+                g_buffer_view
+            )
+
+    remapped: dict[GBufferView, GBufferView] = {}
+    for (g_buffer, stride), g_buffer_views in groups.items():
+        base = min(v.offset for v in g_buffer_views)
+        record_size = max(v.offset - base + v.data_type_size for v in g_buffer_views)
+        with memoryview(g_buffer) as data:
+            with data[base:] as vertex_data:
+                remapped_data = remap_vertex_data(vertex_data, stride, record_size, order)
+        remapped_g_buffer = GBuffer(
+            remapped_data, frequency=g_buffer.frequency, nature=g_buffer.nature
+        )
+        for g_buffer_view in g_buffer_views:
+            remapped[g_buffer_view] = GBufferView(
+                remapped_g_buffer,
+                g_buffer_view.data_type,
+                stride=stride,
+                offset=g_buffer_view.offset - base,
+                format=g_buffer_view.format,
+            )
+
+    return _create_index_g_buffer_view(indices, optimized, index_size), {
+        name: remapped.get(value, value)
+        if isinstance(value, GBufferView)
+        else tuple(remapped.get(v, v) for v in value)
+        for name, value in attributes.items()
+    }
+
+
+def narrow_indices(indices: IndexGBufferView) -> IndexGBufferView:
+    index_size = _get_index_size(indices)
+    offset = indices.offset
+    with memoryview(indices.g_buffer) as data:
+        with data[offset : offset + len(indices) * index_size] as index_data:
+            narrowed, narrow_index_size = narrow_index_data(index_data, index_size)
+    return _create_index_g_buffer_view(indices, narrowed, narrow_index_size)
+
+
+def join_index_strips(
+    strips: Sequence[emath.U8Array | emath.U16Array | emath.U32Array],
+    *,
+    data_type: type[ctypes.c_uint8] | type[ctypes.c_uint16] | type[ctypes.c_uint32] | None = None,
+    frequency: GBufferFrequency = GBufferFrequency.STATIC,
+    nature: GBufferNature = GBufferNature.DRAW,
+) -> IndexGBufferView:
+    strip_data: list[tuple[emath.U8Array | emath.U16Array | emath.U32Array, int]] = []
+    for strip in strips:
+        try:
+            strip_data.append((strip, _INDEX_ARRAY_INDEX_SIZE[type(strip)]))
+        except KeyError:
+            raise TypeError(f"{type(strip)!r} is not an index array")
+    if data_type is None:
+        index_size = None
+    else:
+        index_size = ctypes.sizeof(data_type)
+        if _INDEX_SIZE_TO_DATA_TYPE.get(index_size) is not data_type:
+            raise ValueError(f"view buffer with type {data_type} cannot be used for indexing")
+    joined, index_size = join_index_data_strips(strip_data, index_size)
+    g_buffer = GBuffer(joined, frequency=frequency, nature=nature)
+    return GBufferView(g_buffer, _INDEX_SIZE_TO_DATA_TYPE[index_size])
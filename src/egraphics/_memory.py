@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+__all__ = [
+    "memory_stats",
+    "MemoryKind",
+    "MemoryStats",
+    "MemoryUsage",
+    "register_memory",
+    "resize_memory",
+    "unregister_memory",
+]
+
+from collections.abc import Hashable
+from enum import Enum
+from typing import TYPE_CHECKING
+from typing import Mapping
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from ._g_buffer import GBufferFrequency
+    from ._g_buffer import GBufferNature
+    from ._texture import TextureComponents
+    from ._texture import TextureDataType
+
+
+class MemoryKind(Enum):
+    G_BUFFER = 0
+    TEXTURE = 1
+    RENDERBUFFER = 2
+    SHADER = 3
+
+
+class MemoryUsage(NamedTuple):
+    bytes: int
+    count: int
+    peak_bytes: int
+    peak_count: int
+
+
+class MemoryStats(NamedTuple):
+    total: MemoryUsage
+    kinds: Mapping[MemoryKind, MemoryUsage]
+    g_buffer_usages: Mapping[tuple[GBufferFrequency, GBufferNature], MemoryUsage]
+    texture_formats: Mapping[tuple[TextureComponents, type[TextureDataType]], MemoryUsage]
+
+
+class _MemoryCounter:
+    def __init__(self) -> None:
+        self.bytes = 0
+        self.count = 0
+        self.peak_bytes = 0
+        self.peak_count = 0
+
+    def add(self, size: int, count: int) -> None:
+        self.bytes += size
+        self.count += count
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        self.peak_count = max(self.peak_count, self.count)
+
+    def usage(self) -> MemoryUsage:
+        return MemoryUsage(self.bytes, self.count, self.peak_bytes, self.peak_count)
+
+
+class _MemoryRecord(NamedTuple):
+    kind: MemoryKind
+    category: Hashable | None
+    size: int
+
+
+_records: dict[int, _MemoryRecord] = {}
+_total = _MemoryCounter()
+_kinds: dict[MemoryKind, _MemoryCounter] = {}
+_categories: dict[tuple[MemoryKind, Hashable], _MemoryCounter] = {}
+
+
+def _get_counters(kind: MemoryKind, category: Hashable | None) -> list[_MemoryCounter]:
+    kind_counter = _kinds.get(kind)
+    if kind_counter is None:
+        kind_counter = _kinds[kind] = _MemoryCounter()
+    if category is None:
+        return [_total, kind_counter]
+    category_counter = _categories.get((kind, category))
+    if category_counter is None:
+        category_counter = _categories[(kind, category)] = _MemoryCounter()
+    return [_total, kind_counter, category_counter]
+
+
+def register_memory(
+    resource: object, kind: MemoryKind, size: int, category: Hashable | None = None
+) -> None:
+    assert id(resource) not in _records
+    _records[id(resource)] = _MemoryRecord(kind, category, size)
+    for counter in _get_counters(kind, category):
+        counter.add(size, 1)
+
+
+def resize_memory(resource: object, size: int) -> None:
+    record = _records[id(resource)]
+    _records[id(resource)] = record._replace(size=size)
+    for counter in _get_counters(record.kind, record.category):
+        counter.add(size - record.size, 0)
+
+
+def unregister_memory(resource: object) -> None:
+    record = _records.pop(id(resource), None)
+    if record is None:
+        return
+    for counter in _get_counters(record.kind, record.category):
+        counter.add(-record.size, -1)
+
+
+def memory_stats() -> MemoryStats:
+    return MemoryStats(
+        _total.usage(),
+        {kind: counter.usage() for kind, counter in _kinds.items()},
+        {
+            category: counter.usage()
+            for (kind, category), counter in _categories.items()
+            if kind == MemoryKind.G_BUFFER
+        },
+        {
+            category: counter.usage()
+            for (kind, category), counter in _categories.items()
+            if kind == MemoryKind.TEXTURE
+        },
+    )
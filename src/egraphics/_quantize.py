@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+__all__ = ["pack_int_2_10_10_10_rev", "quantize_half_float", "quantize_normalized"]
+
+import ctypes
+from typing import Any
+from typing import Final
+from typing import Mapping
+from typing import TypeAlias
+from typing import overload
+
+import emath
+
+from ._egraphics import GL_BYTE
+from ._egraphics import GL_SHORT
+from ._egraphics import GL_UNSIGNED_BYTE
+from ._egraphics import GL_UNSIGNED_SHORT
+from ._egraphics import GlType
+from ._egraphics import pack_int_2_10_10_10_rev_data
+from ._egraphics import quantize_half_float_data
+from ._egraphics import quantize_normalized_data
+
+_FloatArray: TypeAlias = (
+    emath.FArray | emath.FVector2Array | emath.FVector3Array | emath.FVector4Array
+)
+
+_NormalizedDataType: TypeAlias = (
+    type[ctypes.c_int8] | type[ctypes.c_uint8] | type[ctypes.c_int16] | type[ctypes.c_uint16]
+)
+
+_FLOAT_ARRAY_COMPONENTS: Final[Mapping[Any, int]] = {
+    emath.FArray: 1,
+    emath.FVector2Array: 2,
+    emath.FVector3Array: 3,
+    emath.FVector4Array: 4,
+}
+
+_NORMALIZED_DATA_TYPE_TO_GL_TYPE: Final[Mapping[Any, GlType]] = {
+    ctypes.c_int8: GL_BYTE,
+    ctypes.c_uint8: GL_UNSIGNED_BYTE,
+    ctypes.c_int16: GL_SHORT,
+    ctypes.c_uint16: GL_UNSIGNED_SHORT,
+}
+
+_NORMALIZED_ARRAY_TYPES: Final[Mapping[tuple[Any, int], Any]] = {
+    (ctypes.c_int8, 1): emath.I8Array,
+    (ctypes.c_int8, 2): emath.I8Vector2Array,
+    (ctypes.c_int8, 3): emath.I8Vector3Array,
+    (ctypes.c_int8, 4): emath.I8Vector4Array,
+    (ctypes.c_uint8, 1): emath.U8Array,
+    (ctypes.c_uint8, 2): emath.U8Vector2Array,
+    (ctypes.c_uint8, 3): emath.U8Vector3Array,
+    (ctypes.c_uint8, 4): emath.U8Vector4Array,
+    (ctypes.c_int16, 1): emath.I16Array,
+    (ctypes.c_int16, 2): emath.I16Vector2Array,
+    (ctypes.c_int16, 3): emath.I16Vector3Array,
+    (ctypes.c_int16, 4): emath.I16Vector4Array,
+    (ctypes.c_uint16, 1): emath.U16Array,
+    (ctypes.c_uint16, 2): emath.U16Vector2Array,
+    (ctypes.c_uint16, 3): emath.U16Vector3Array,
+    (ctypes.c_uint16, 4): emath.U16Vector4Array,
+}
+
+_HALF_FLOAT_ARRAY_TYPES: Final[Mapping[int, Any]] = {
+    1: emath.U16Array,
+    2: emath.U16Vector2Array,
+    3: emath.U16Vector3Array,
+    4: emath.U16Vector4Array,
+}
+
+
+def _get_float_array_components(array: _FloatArray) -> int:
+    try:
+        return _FLOAT_ARRAY_COMPONENTS[type(array)]
+    except KeyError:
+        raise TypeError(f"{type(array)!r} is not a float array")
+
+
+@overload
+def quantize_normalized(array: emath.FArray, data_type: type[ctypes.c_int8]) -> emath.I8Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector2Array, data_type: type[ctypes.c_int8]
+) -> emath.I8Vector2Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector3Array, data_type: type[ctypes.c_int8]
+) -> emath.I8Vector3Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector4Array, data_type: type[ctypes.c_int8]
+) -> emath.I8Vector4Array: ...
+
+
+@overload
+def quantize_normalized(array: emath.FArray, data_type: type[ctypes.c_uint8]) -> emath.U8Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector2Array, data_type: type[ctypes.c_uint8]
+) -> emath.U8Vector2Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector3Array, data_type: type[ctypes.c_uint8]
+) -> emath.U8Vector3Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector4Array, data_type: type[ctypes.c_uint8]
+) -> emath.U8Vector4Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FArray, data_type: type[ctypes.c_int16]
+) -> emath.I16Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector2Array, data_type: type[ctypes.c_int16]
+) -> emath.I16Vector2Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector3Array, data_type: type[ctypes.c_int16]
+) -> emath.I16Vector3Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector4Array, data_type: type[ctypes.c_int16]
+) -> emath.I16Vector4Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FArray, data_type: type[ctypes.c_uint16]
+) -> emath.U16Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector2Array, data_type: type[ctypes.c_uint16]
+) -> emath.U16Vector2Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector3Array, data_type: type[ctypes.c_uint16]
+) -> emath.U16Vector3Array: ...
+
+
+@overload
+def quantize_normalized(
+    array: emath.FVector4Array, data_type: type[ctypes.c_uint16]
+) -> emath.U16Vector4Array: ...
+
+
+def quantize_normalized(array: _FloatArray, data_type: _NormalizedDataType) -> Any:
+    components = _get_float_array_components(array)
+    try:
+        gl_type = _NORMALIZED_DATA_TYPE_TO_GL_TYPE[data_type]
+    except KeyError:
+        raise ValueError(f"cannot quantize to {data_type!r}")
+    array_type = _NORMALIZED_ARRAY_TYPES[(data_type, components)]
+    return array_type.from_buffer(quantize_normalized_data(array, gl_type))
+
+
+@overload
+def quantize_half_float(array: emath.FArray) -> emath.U16Array: ...
+
+
+@overload
+def quantize_half_float(array: emath.FVector2Array) -> emath.U16Vector2Array: ...
+
+
+@overload
+def quantize_half_float(array: emath.FVector3Array) -> emath.U16Vector3Array: ...
+
+
+@overload
+def quantize_half_float(array: emath.FVector4Array) -> emath.U16Vector4Array: ...
+
+
+def quantize_half_float(array: _FloatArray) -> Any:
+    components = _get_float_array_components(array)
+    array_type = _HALF_FLOAT_ARRAY_TYPES[components]
+    return array_type.from_buffer(quantize_half_float_data(array))
+
+
+def pack_int_2_10_10_10_rev(array: emath.FVector3Array | emath.FVector4Array) -> emath.I32Array:
+    components = _get_float_array_components(array)
+    if components not in (3, 4):
+        raise TypeError(f"{type(array)!r} is not a 3 or 4 component float array")
+    return emath.I32Array.from_buffer(pack_int_2_10_10_10_rev_data(array, components))
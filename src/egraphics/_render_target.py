@@ -14,6 +14,7 @@ __all__ = [
 
 import sys
 from typing import Any
+from typing import Final
 from typing import Protocol
 from typing import Sequence
 
@@ -23,13 +24,18 @@ from emath import FVector4
 from emath import FVector4Array
 from emath import IVector2
 
+from ._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
 from ._egraphics import GlFramebuffer
 from ._egraphics import GlRenderbuffer
+from ._egraphics import attach_color_texture_to_gl_named_framebuffer
 from ._egraphics import attach_color_texture_to_gl_read_framebuffer
+from ._egraphics import attach_depth_renderbuffer_to_gl_named_framebuffer
 from ._egraphics import attach_depth_renderbuffer_to_gl_read_framebuffer
+from ._egraphics import attach_depth_texture_to_gl_named_framebuffer
 from ._egraphics import attach_depth_texture_to_gl_read_framebuffer
 from ._egraphics import clear_framebuffer
 from ._egraphics import create_gl_framebuffer
+from ._egraphics import create_gl_named_framebuffer
 from ._egraphics import delete_gl_framebuffer
 from ._egraphics import delete_gl_renderbuffer
 from ._egraphics import read_color_from_framebuffer
@@ -37,10 +43,17 @@ from ._egraphics import read_depth_from_framebuffer
 from ._egraphics import set_draw_framebuffer
 from ._egraphics import set_read_framebuffer
 from ._egraphics import set_texture_locations_on_gl_draw_framebuffer
+from ._egraphics import set_texture_locations_on_gl_named_framebuffer
+from ._memory import MemoryKind
+from ._memory import register_memory
+from ._memory import unregister_memory
 from ._state import register_reset_state_callback
 from ._texture import get_gl_texture
 from ._texture_2d import Texture2d
 
+# depth renderbuffers are GL_DEPTH_COMPONENT24, which drivers store padded to 32 bits
+_DEPTH_RENDERBUFFER_PIXEL_SIZE: Final = 4
+
 
 class RenderTarget(Protocol):
     @property
@@ -70,6 +83,11 @@ class TextureRenderTarget:
 
         self._gl_renderbuffers = set()
         self._size = IVector2(*size)
+
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED:
+            self._init_named_framebuffer()
+            return
+
         self.__gl_framebuffer = create_gl_framebuffer()
 
         set_read_render_target(self)
@@ -85,13 +103,47 @@ class TextureRenderTarget:
             self._gl_renderbuffers.add(
                 attach_depth_renderbuffer_to_gl_read_framebuffer(self._size)
             )
+            self._register_depth_renderbuffer_memory()
 
         set_draw_render_target(self)
         set_texture_locations_on_gl_draw_framebuffer(
             [None if texture is None else i for i, texture in enumerate(self._textures)]
         )
 
+    def _init_named_framebuffer(self) -> None:
+        gl_framebuffer = self.__gl_framebuffer = create_gl_named_framebuffer()
+
+        for i, texture in enumerate(self._textures):
+            if texture is None:
+                continue
+            attach_color_texture_to_gl_named_framebuffer(
+                gl_framebuffer, get_gl_texture(texture), i
+            )
+
+        if isinstance(self._depth, Texture2d):
+            attach_depth_texture_to_gl_named_framebuffer(
+                gl_framebuffer, get_gl_texture(self._depth)
+            )
+        elif self._depth:
+            self._gl_renderbuffers.add(
+                attach_depth_renderbuffer_to_gl_named_framebuffer(gl_framebuffer, self._size)
+            )
+            self._register_depth_renderbuffer_memory()
+
+        set_texture_locations_on_gl_named_framebuffer(
+            gl_framebuffer,
+            [None if texture is None else i for i, texture in enumerate(self._textures)],
+        )
+
+    def _register_depth_renderbuffer_memory(self) -> None:
+        register_memory(
+            self,
+            MemoryKind.RENDERBUFFER,
+            self._size.x * self._size.y * _DEPTH_RENDERBUFFER_PIXEL_SIZE,
+        )
+
     def __del__(self) -> None:
+        unregister_memory(self)
         if self.__gl_framebuffer is not None:
             delete_gl_framebuffer(self.__gl_framebuffer)
             self.__gl_framebuffer = None
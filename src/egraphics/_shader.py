@@ -7,31 +7,42 @@ __all__ = [
     "DepthTest",
     "FaceCull",
     "FaceRasterization",
+    "PreparedComputeShader",
+    "PreparedShader",
     "PrimitiveMode",
     "Shader",
     "ShaderAttribute",
+    "ShaderCompileFuture",
     "ShaderStorageBlock",
     "ShaderUniform",
+    "ShaderUniformBlock",
     "ShaderInputMap",
     "ShaderUniformValue",
 ]
 
 
 import ctypes
+from asyncio import sleep
 from collections.abc import Buffer
 from collections.abc import Mapping
 from collections.abc import Set
 from contextlib import ExitStack
+from contextlib import contextmanager
 from ctypes import addressof
 from ctypes import c_int32
 from enum import Enum
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import ClassVar
 from typing import Collection
 from typing import Final
+from typing import Generator
 from typing import Generic
+from typing import Iterable
 from typing import Mapping
+from typing import NamedTuple
+from typing import Self
 from typing import Sequence
 from typing import TypeAlias
 from typing import TypeVar
@@ -41,6 +52,7 @@ import emath
 from egeometry import IBoundingBox2d
 from emath import FVector4
 from emath import I32Array
+from emath import I32Vector4Array
 from emath import IVector2
 
 from ._egraphics import GL_ALWAYS
@@ -138,6 +150,7 @@ from ._egraphics import GL_TRIANGLE_STRIP
 from ._egraphics import GL_TRIANGLE_STRIP_ADJACENCY
 from ._egraphics import GL_TRIANGLES
 from ._egraphics import GL_TRIANGLES_ADJACENCY
+from ._egraphics import GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE
 from ._egraphics import GL_UNSIGNED_BYTE
 from ._egraphics import GL_UNSIGNED_INT
 from ._egraphics import GL_UNSIGNED_INT_SAMPLER_1D
@@ -168,15 +181,19 @@ from ._egraphics import GL_FLOAT_MAT3x2
 from ._egraphics import GL_FLOAT_MAT3x4
 from ._egraphics import GL_FLOAT_MAT4x2
 from ._egraphics import GL_FLOAT_MAT4x3
+from ._egraphics import GlBuffer
+from ._egraphics import GlProgram
 from ._egraphics import GlType
-from ._egraphics import create_gl_program
+from ._egraphics import cancel_gl_program
 from ._egraphics import delete_gl_program
 from ._egraphics import execute_gl_program_compute
 from ._egraphics import execute_gl_program_index_buffer
 from ._egraphics import execute_gl_program_indices
-from ._egraphics import get_gl_program_attributes
-from ._egraphics import get_gl_program_storage_blocks
-from ._egraphics import get_gl_program_uniforms
+from ._egraphics import execute_gl_program_indirect
+from ._egraphics import execute_gl_program_ranges
+from ._egraphics import finish_gl_program
+from ._egraphics import get_gl_program_binary_length
+from ._egraphics import is_gl_program_complete
 from ._egraphics import set_active_gl_program_uniform_double
 from ._egraphics import set_active_gl_program_uniform_double_2
 from ._egraphics import set_active_gl_program_uniform_double_2x2
@@ -213,12 +230,23 @@ from ._egraphics import set_active_gl_program_uniform_unsigned_int_3
 from ._egraphics import set_active_gl_program_uniform_unsigned_int_4
 from ._egraphics import set_gl_execution_state
 from ._egraphics import set_program_shader_storage_block_binding
+from ._egraphics import set_program_uniform_block_binding
+from ._egraphics import start_gl_program
 from ._egraphics import use_gl_program
 from ._g_buffer import GBuffer
+from ._g_buffer import get_g_buffer_gl_buffer
 from ._g_buffer_view import GBufferView
 from ._g_buffer_view import bind_g_buffer_view_shader_storage_buffer_unit
+from ._g_buffer_view import bind_g_buffer_view_uniform_buffer_unit
+from ._memory import MemoryKind
+from ._memory import register_memory
+from ._memory import unregister_memory
 from ._render_target import RenderTarget
 from ._render_target import set_draw_render_target
+from ._shader_binary_cache import GlProgramReflection
+from ._shader_binary_cache import ShaderBinaryCache
+from ._shader_binary_cache import create_gl_program_with_cache
+from ._shader_binary_cache import reflect_gl_program
 from ._state import register_reset_state_callback
 from ._texture import Texture
 from ._texture import bind_texture_image_unit
@@ -226,8 +254,10 @@ from ._texture import bind_texture_unit
 
 if TYPE_CHECKING:
     from ._g_buffer_view_map import GBufferViewMap
+    from ._g_buffer_view_map import IndexGBufferView
 
 _T = TypeVar("_T")
+_S = TypeVar("_S", bound="Shader | ComputeShader")
 
 
 class DepthTest(Enum):
@@ -278,24 +308,44 @@ class FaceRasterization(Enum):
     FILL = GL_FILL
 
 
+class _PreparedInputs(NamedTuple):
+    uniforms: tuple[tuple[ShaderUniform, Any, Any, int, bool], ...]
+    texture_uniforms: tuple[tuple[ShaderUniform, Any], ...]
+    storage_blocks: tuple[tuple[ShaderStorageBlock, GBufferView], ...]
+    uniform_blocks: tuple[tuple[ShaderUniformBlock, GBufferView], ...]
+
+
 class _CoreShader:
     _active: ClassVar[ref[_CoreShader] | None] = None
 
-    def __init__(self, gl_program: Any) -> None:
+    def __init__(self, gl_program: Any, reflection: GlProgramReflection) -> None:
         self._gl_program = gl_program
 
         self._uniforms = tuple(
             ShaderUniform(name.removesuffix("[0]"), _GL_TYPE_TO_PY[type], size, location, type)
-            for name, size, type, location in get_gl_program_uniforms(self._gl_program)
-            if not name.startswith("gl_")
+            for name, size, type, location in reflection.uniforms
+            if not name.startswith("gl_") and location != -1
         )
 
         self._storage_blocks = tuple(
-            ShaderStorageBlock(name, index)
-            for index, name in enumerate(get_gl_program_storage_blocks(self._gl_program))
+            ShaderStorageBlock(name, index) for index, name in enumerate(reflection.storage_blocks)
+        )
+
+        self._uniform_blocks = tuple(
+            ShaderUniformBlock(name, index, size)
+            for index, (name, size) in enumerate(reflection.uniform_blocks)
         )
 
+        self._input_setters: dict[str, tuple[Callable[..., None], Any]] = {
+            **{u.name: (_CoreShader._set_uniform, u) for u in self._uniforms},
+            **{b.name: (_CoreShader._set_storage_block, b) for b in self._storage_blocks},
+            **{b.name: (_CoreShader._set_uniform_block, b) for b in self._uniform_blocks},
+        }
+
+        register_memory(self, MemoryKind.SHADER, get_gl_program_binary_length(self._gl_program))
+
     def __del__(self) -> None:
+        unregister_memory(self)
         if self._active and self._active() is self:
             use_gl_program(None)
             _CoreShader._active = None
@@ -355,25 +405,25 @@ class _CoreShader:
                     raise
                 input_value = value.address
         else:
-            if isinstance(value, uniform._set_type):
-                set_size = 1
-                if uniform._set_type in _POD_UNIFORM_TYPES:
-                    input_value = value
-                    cache_key = value.value  # type: ignore
-                else:
-                    input_value = value.address  # type: ignore
-            else:
-                array_type = _PY_TYPE_TO_ARRAY[uniform.data_type]
-                if not isinstance(value, array_type):
-                    raise ValueError(
-                        f"expected {uniform._set_type} or {array_type} for {uniform.name} "
-                        f"(got {type(value)})"
-                    )
-                input_value = value.address  # type: ignore
-                set_size = min(uniform.size, len(value))  # type: ignore
+            input_value, set_size, is_pod = self._resolve_uniform(uniform, value)
+            if is_pod:
+                cache_key = value.value  # type: ignore
         if set_size != 0:
             uniform._set(uniform.location, set_size, input_value, cache_key)
 
+    def _resolve_uniform(self, uniform: ShaderUniform, value: Any) -> tuple[Any, int, bool]:
+        if isinstance(value, uniform._set_type):
+            if uniform._set_type in _POD_UNIFORM_TYPES:
+                return value, 1, True
+            return value.address, 1, False
+        array_type = _PY_TYPE_TO_ARRAY[uniform.data_type]
+        if not isinstance(value, array_type):
+            raise ValueError(
+                f"expected {uniform._set_type} or {array_type} for {uniform.name} "
+                f"(got {type(value)})"
+            )
+        return value.address, min(uniform.size, len(value)), False
+
     def _set_storage_block(
         self,
         storage_block: ShaderStorageBlock,
@@ -381,21 +431,116 @@ class _CoreShader:
         exit_stack: ExitStack,
     ) -> None:
         assert storage_block in self._storage_blocks
+        view = self._resolve_storage_block(storage_block, value)
+        storage_block._set_binding(
+            self, exit_stack.enter_context(bind_g_buffer_view_shader_storage_buffer_unit(view))
+        )
+
+    def _resolve_storage_block(
+        self, storage_block: ShaderStorageBlock, value: GBuffer | GBufferView
+    ) -> GBufferView:
         if isinstance(value, GBufferView):
-            storage_block._set_binding(
-                self,
-                exit_stack.enter_context(bind_g_buffer_view_shader_storage_buffer_unit(value)),
-            )
+            return value
         elif isinstance(value, GBuffer):
-            view = GBufferView(value, ctypes.c_uint8, offset=0, length=len(value))
+            return GBufferView(value, ctypes.c_uint8, offset=0, length=len(value))
+        raise ValueError(
+            f"expected {GBuffer} or {GBufferView} for {storage_block.name} (got {type(value)})"
+        )
+
+    def _set_uniform_block(
+        self,
+        uniform_block: ShaderUniformBlock,
+        value: GBuffer | GBufferView,
+        exit_stack: ExitStack,
+    ) -> None:
+        assert uniform_block in self._uniform_blocks
+        view = self._resolve_uniform_block(uniform_block, value)
+        uniform_block._set_binding(
+            self, exit_stack.enter_context(bind_g_buffer_view_uniform_buffer_unit(view))
+        )
+
+    def _resolve_uniform_block(
+        self, uniform_block: ShaderUniformBlock, value: GBuffer | GBufferView
+    ) -> GBufferView:
+        if isinstance(value, GBuffer):
+            value = GBufferView(value, ctypes.c_uint8, offset=0, length=len(value))
+        elif not isinstance(value, GBufferView):
+            raise ValueError(
+                f"expected {GBuffer} or {GBufferView} for {uniform_block.name} (got {type(value)})"
+            )
+        if value.offset % GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE != 0:
+            raise ValueError(
+                f"offset for {uniform_block.name} must be a multiple of "
+                f"{GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT_VALUE} (got {value.offset})"
+            )
+        if value.length < uniform_block.size:
+            raise ValueError(
+                f"expected at least {uniform_block.size} bytes for {uniform_block.name} "
+                f"(got {value.length})"
+            )
+        return value
+
+    def _prepare_inputs(self, input_map: ShaderInputMap) -> _PreparedInputs:
+        uniforms: list[tuple[ShaderUniform, Any, Any, int, bool]] = []
+        texture_uniforms: list[tuple[ShaderUniform, Any]] = []
+        for uniform in self._uniforms:
+            try:
+                value = input_map[uniform.name]
+            except KeyError:
+                continue
+            if uniform.data_type is Texture:
+                texture_uniforms.append((uniform, value))
+                continue
+            input_value, set_size, is_pod = self._resolve_uniform(uniform, value)
+            if set_size != 0:
+                uniforms.append((uniform, value, input_value, set_size, is_pod))
+
+        storage_blocks: list[tuple[ShaderStorageBlock, GBufferView]] = []
+        for storage_block in self._storage_blocks:
+            try:
+                value = input_map[storage_block.name]
+            except KeyError:
+                continue
+            storage_blocks.append(
+                (storage_block, self._resolve_storage_block(storage_block, value))  # type: ignore
+            )
+
+        uniform_blocks: list[tuple[ShaderUniformBlock, GBufferView]] = []
+        for uniform_block in self._uniform_blocks:
+            try:
+                value = input_map[uniform_block.name]
+            except KeyError:
+                continue
+            uniform_blocks.append(
+                (uniform_block, self._resolve_uniform_block(uniform_block, value))  # type: ignore
+            )
+
+        return _PreparedInputs(
+            tuple(uniforms), tuple(texture_uniforms), tuple(storage_blocks), tuple(uniform_blocks)
+        )
+
+    def _set_prepared_inputs(self, inputs: _PreparedInputs, exit_stack: ExitStack) -> None:
+        for uniform, value, input_value, set_size, is_pod in inputs.uniforms:
+            uniform._set(uniform.location, set_size, input_value, value.value if is_pod else value)
+        for uniform, value in inputs.texture_uniforms:
+            self._set_uniform(uniform, value, exit_stack)
+        for storage_block, view in inputs.storage_blocks:
             storage_block._set_binding(
                 self, exit_stack.enter_context(bind_g_buffer_view_shader_storage_buffer_unit(view))
             )
-        else:
-            raise ValueError(
-                f"expected {GBuffer} or {GBufferView} for {storage_block.name} (got {type(value)})"
+        for uniform_block, view in inputs.uniform_blocks:
+            uniform_block._set_binding(
+                self, exit_stack.enter_context(bind_g_buffer_view_uniform_buffer_unit(view))
             )
 
+    def _set_inputs(self, input_map: ShaderInputMap, exit_stack: ExitStack) -> None:
+        for name, value in input_map.items():
+            try:
+                setter, target = self._input_setters[name]
+            except KeyError:
+                continue
+            setter(self, target, value, exit_stack)
+
     @property
     def uniforms(self) -> tuple[ShaderUniform, ...]:
         return self._uniforms
@@ -404,6 +549,20 @@ class _CoreShader:
     def storage_blocks(self) -> tuple[ShaderStorageBlock, ...]:
         return self._storage_blocks
 
+    @property
+    def uniform_blocks(self) -> tuple[ShaderUniformBlock, ...]:
+        return self._uniform_blocks
+
+
+def _check_shader_stages(
+    vertex: Buffer | None, geometry: Buffer | None, fragment: Buffer | None
+) -> None:
+    if vertex is None and geometry is None and fragment is None:
+        raise TypeError("vertex, geometry or fragment must be provided")
+
+    if geometry is not None and vertex is None:
+        raise TypeError("geometry shader requires vertex shader")
+
 
 class Shader(_CoreShader):
     def __init__(
@@ -412,19 +571,30 @@ class Shader(_CoreShader):
         vertex: Buffer | None = None,
         geometry: Buffer | None = None,
         fragment: Buffer | None = None,
+        binary_cache: ShaderBinaryCache | None = None,
     ):
-        if vertex is None and geometry is None and fragment is None:
-            raise TypeError("vertex, geometry or fragment must be provided")
+        _check_shader_stages(vertex, geometry, fragment)
+        self._initialize(
+            *create_gl_program_with_cache(binary_cache, vertex, geometry, fragment, None)
+        )
 
-        if geometry is not None and vertex is None:
-            raise TypeError("geometry shader requires vertex shader")
+    @classmethod
+    def compile_async(
+        cls,
+        *,
+        vertex: Buffer | None = None,
+        geometry: Buffer | None = None,
+        fragment: Buffer | None = None,
+    ) -> ShaderCompileFuture[Self]:
+        _check_shader_stages(vertex, geometry, fragment)
+        return ShaderCompileFuture(cls, vertex, geometry, fragment, None)
 
-        gl_program = create_gl_program(vertex, geometry, fragment, None)
-        super().__init__(gl_program)
+    def _initialize(self, gl_program: GlProgram, reflection: GlProgramReflection) -> None:
+        super().__init__(gl_program, reflection)
 
         self._attributes = tuple(
             ShaderAttribute(name.removesuffix("[0]"), _GL_TYPE_TO_PY[type], size, location)
-            for name, size, type, location in get_gl_program_attributes(self._gl_program)
+            for name, size, type, location in reflection.attributes
             if not name.startswith("gl_")
         )
 
@@ -440,9 +610,8 @@ class Shader(_CoreShader):
     def attributes(self) -> tuple[ShaderAttribute, ...]:
         return self._attributes
 
-    def execute(
+    def prepare(
         self,
-        render_target: RenderTarget,
         primitive_mode: PrimitiveMode,
         buffer_view_map: GBufferViewMap,
         input_map: ShaderInputMap,
@@ -458,17 +627,55 @@ class Shader(_CoreShader):
         depth_write: bool = False,
         depth_clamp: bool = False,
         face_cull: FaceCull = FaceCull.NONE,
-        instances: int = 1,
         scissor: IBoundingBox2d | None = None,
         face_rasterization: FaceRasterization = FaceRasterization.FILL,
         point_size: float = 1.0,
         clip_distances: int = 0,
-    ) -> None:
-        if instances < 0:
-            raise ValueError("instances must be 0 or more")
-        elif instances == 0:
-            return
+    ) -> PreparedShader:
+        return PreparedShader(
+            self,
+            primitive_mode,
+            buffer_view_map,
+            input_map,
+            blend_source,
+            blend_destination,
+            blend_source_alpha,
+            blend_destination_alpha,
+            blend_function,
+            blend_color,
+            color_write,
+            depth_test,
+            depth_write,
+            depth_clamp,
+            face_cull,
+            scissor,
+            face_rasterization,
+            point_size,
+            clip_distances,
+        )
 
+    @contextmanager
+    def _prepare_execute(
+        self,
+        render_target: RenderTarget,
+        buffer_view_map: GBufferViewMap,
+        input_map: ShaderInputMap,
+        blend_source: BlendFactor,
+        blend_destination: BlendFactor,
+        blend_source_alpha: BlendFactor | None,
+        blend_destination_alpha: BlendFactor | None,
+        blend_function: BlendFunction,
+        blend_color: FVector4 | None,
+        color_write: tuple[bool, bool, bool, bool],
+        depth_test: DepthTest,
+        depth_write: bool,
+        depth_clamp: bool,
+        face_cull: FaceCull,
+        scissor: IBoundingBox2d | None,
+        face_rasterization: FaceRasterization,
+        point_size: float,
+        clip_distances: int,
+    ) -> Generator[None, None, None]:
         uniform_values: list[tuple[ShaderUniform, Any]] = []
         for uniform in self.uniforms:
             try:
@@ -485,6 +692,14 @@ class Shader(_CoreShader):
                 continue
             storage_block_values.append((storage_block, value))
 
+        uniform_block_values: list[tuple[ShaderUniformBlock, Any]] = []
+        for uniform_block in self.uniform_blocks:
+            try:
+                value = input_map[uniform_block.name]
+            except KeyError:
+                continue
+            uniform_block_values.append((uniform_block, value))
+
         set_gl_execution_state(
             depth_write,
             depth_test.value,
@@ -506,6 +721,7 @@ class Shader(_CoreShader):
             face_rasterization.value,
             point_size,
             clip_distances,
+            buffer_view_map.primitive_restart,
         )
 
         set_draw_render_target(render_target)
@@ -516,8 +732,60 @@ class Shader(_CoreShader):
                 self._set_uniform(uniform, value, exit_stack)
             for storage_block, value in storage_block_values:
                 self._set_storage_block(storage_block, value, exit_stack)
+            for uniform_block, value in uniform_block_values:
+                self._set_uniform_block(uniform_block, value, exit_stack)
             buffer_view_map.activate_for_shader(self)
+            yield
+
+    def execute(
+        self,
+        render_target: RenderTarget,
+        primitive_mode: PrimitiveMode,
+        buffer_view_map: GBufferViewMap,
+        input_map: ShaderInputMap,
+        *,
+        blend_source: BlendFactor = BlendFactor.ONE,
+        blend_destination: BlendFactor = BlendFactor.ZERO,
+        blend_source_alpha: BlendFactor | None = None,
+        blend_destination_alpha: BlendFactor | None = None,
+        blend_function: BlendFunction = BlendFunction.ADD,
+        blend_color: FVector4 | None = None,
+        color_write: tuple[bool, bool, bool, bool] = (True, True, True, True),
+        depth_test: DepthTest = DepthTest.ALWAYS,
+        depth_write: bool = False,
+        depth_clamp: bool = False,
+        face_cull: FaceCull = FaceCull.NONE,
+        instances: int = 1,
+        scissor: IBoundingBox2d | None = None,
+        face_rasterization: FaceRasterization = FaceRasterization.FILL,
+        point_size: float = 1.0,
+        clip_distances: int = 0,
+    ) -> None:
+        if instances < 0:
+            raise ValueError("instances must be 0 or more")
+        elif instances == 0:
+            return
 
+        with self._prepare_execute(
+            render_target,
+            buffer_view_map,
+            input_map,
+            blend_source,
+            blend_destination,
+            blend_source_alpha,
+            blend_destination_alpha,
+            blend_function,
+            blend_color,
+            color_write,
+            depth_test,
+            depth_write,
+            depth_clamp,
+            face_cull,
+            scissor,
+            face_rasterization,
+            point_size,
+            clip_distances,
+        ):
             if isinstance(buffer_view_map.indices, GBufferView):
                 index_gl_type = _INDEX_BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
                     buffer_view_map.indices.data_type
@@ -535,11 +803,199 @@ class Shader(_CoreShader):
                     primitive_mode.value, index_range[0], index_range[1], instances
                 )
 
+    def execute_ranges(
+        self,
+        render_target: RenderTarget,
+        primitive_mode: PrimitiveMode,
+        buffer_view_map: GBufferViewMap,
+        input_map: ShaderInputMap,
+        ranges: Iterable[tuple[int, int, int, int]] | I32Array | I32Vector4Array,
+        *,
+        blend_source: BlendFactor = BlendFactor.ONE,
+        blend_destination: BlendFactor = BlendFactor.ZERO,
+        blend_source_alpha: BlendFactor | None = None,
+        blend_destination_alpha: BlendFactor | None = None,
+        blend_function: BlendFunction = BlendFunction.ADD,
+        blend_color: FVector4 | None = None,
+        color_write: tuple[bool, bool, bool, bool] = (True, True, True, True),
+        depth_test: DepthTest = DepthTest.ALWAYS,
+        depth_write: bool = False,
+        depth_clamp: bool = False,
+        face_cull: FaceCull = FaceCull.NONE,
+        instances: int = 1,
+        scissor: IBoundingBox2d | None = None,
+        face_rasterization: FaceRasterization = FaceRasterization.FILL,
+        point_size: float = 1.0,
+        clip_distances: int = 0,
+    ) -> None:
+        if instances < 0:
+            raise ValueError("instances must be 0 or more")
+        elif instances == 0:
+            return
+
+        if not isinstance(ranges, (I32Array, I32Vector4Array)):
+            if isinstance(ranges, Buffer):
+                raise TypeError(
+                    f"expected {I32Array}, {I32Vector4Array} or iterable of tuples for ranges "
+                    f"(got {type(ranges)})"
+                )
+            range_values: list[int] = []
+            for range_ in ranges:
+                range_ = tuple(range_)
+                if len(range_) != 4:
+                    raise ValueError("ranges must contain 4 values per range")
+                range_values.extend(range_)
+            ranges = I32Array(*range_values)
+
+        if isinstance(buffer_view_map.indices, GBufferView):
+            index_gl_type: GlType | None = _INDEX_BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
+                buffer_view_map.indices.data_type
+            ]
+            index_size = ctypes.sizeof(buffer_view_map.indices.data_type)
+            index_offset = buffer_view_map.indices.offset
+            index_count = len(buffer_view_map.indices)
+        else:
+            index_gl_type = None
+            index_size = index_offset = index_count = 0
+
+        with self._prepare_execute(
+            render_target,
+            buffer_view_map,
+            input_map,
+            blend_source,
+            blend_destination,
+            blend_source_alpha,
+            blend_destination_alpha,
+            blend_function,
+            blend_color,
+            color_write,
+            depth_test,
+            depth_write,
+            depth_clamp,
+            face_cull,
+            scissor,
+            face_rasterization,
+            point_size,
+            clip_distances,
+        ):
+            execute_gl_program_ranges(
+                primitive_mode.value,
+                index_gl_type,
+                index_size,
+                index_offset,
+                index_count,
+                ranges,
+                instances,
+            )
+
+    def execute_indirect(
+        self,
+        render_target: RenderTarget,
+        primitive_mode: PrimitiveMode,
+        buffer_view_map: GBufferViewMap,
+        input_map: ShaderInputMap,
+        commands: GBufferView,
+        *,
+        count: int | GBufferView[ctypes.c_uint32] | None = None,
+        blend_source: BlendFactor = BlendFactor.ONE,
+        blend_destination: BlendFactor = BlendFactor.ZERO,
+        blend_source_alpha: BlendFactor | None = None,
+        blend_destination_alpha: BlendFactor | None = None,
+        blend_function: BlendFunction = BlendFunction.ADD,
+        blend_color: FVector4 | None = None,
+        color_write: tuple[bool, bool, bool, bool] = (True, True, True, True),
+        depth_test: DepthTest = DepthTest.ALWAYS,
+        depth_write: bool = False,
+        depth_clamp: bool = False,
+        face_cull: FaceCull = FaceCull.NONE,
+        scissor: IBoundingBox2d | None = None,
+        face_rasterization: FaceRasterization = FaceRasterization.FILL,
+        point_size: float = 1.0,
+        clip_distances: int = 0,
+    ) -> None:
+        if isinstance(buffer_view_map.indices, GBufferView):
+            if buffer_view_map.indices.offset != 0:
+                raise ValueError("indices offset must be 0 for indirect execution")
+            index_gl_type: GlType | None = _INDEX_BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
+                buffer_view_map.indices.data_type
+            ]
+            command_size = _DRAW_ELEMENTS_INDIRECT_COMMAND_SIZE
+        else:
+            index_gl_type = None
+            command_size = _DRAW_ARRAYS_INDIRECT_COMMAND_SIZE
+
+        if commands.offset % 4 != 0:
+            raise ValueError("commands offset must be a multiple of 4")
+        if commands.stride % 4 != 0 or commands.stride < command_size:
+            raise ValueError(
+                f"commands stride must be a multiple of 4 and at least {command_size}"
+            )
+        if commands.length < command_size:
+            command_count = 0
+        else:
+            command_count = (commands.length - command_size) // commands.stride + 1
+
+        if isinstance(count, GBufferView):
+            if count.data_type is not ctypes.c_uint32:
+                raise ValueError("count data type must be c_uint32")
+            if count.offset % 4 != 0:
+                raise ValueError("count offset must be a multiple of 4")
+            max_count = command_count
+            count_gl_buffer: GlBuffer | None = get_g_buffer_gl_buffer(count.g_buffer)
+            count_offset = count.offset
+        else:
+            if count is None:
+                count = command_count
+            elif count < 0 or count > command_count:
+                raise ValueError(f"count must be between 0 and {command_count}")
+            max_count = count
+            count_gl_buffer = None
+            count_offset = 0
+        if max_count == 0:
+            return
+
+        with self._prepare_execute(
+            render_target,
+            buffer_view_map,
+            input_map,
+            blend_source,
+            blend_destination,
+            blend_source_alpha,
+            blend_destination_alpha,
+            blend_function,
+            blend_color,
+            color_write,
+            depth_test,
+            depth_write,
+            depth_clamp,
+            face_cull,
+            scissor,
+            face_rasterization,
+            point_size,
+            clip_distances,
+        ):
+            execute_gl_program_indirect(
+                primitive_mode.value,
+                index_gl_type,
+                get_g_buffer_gl_buffer(commands.g_buffer),
+                commands.offset,
+                max_count,
+                commands.stride,
+                count_gl_buffer,
+                count_offset,
+            )
+
 
 class ComputeShader(_CoreShader):
-    def __init__(self, compute: Buffer) -> None:
-        gl_program = create_gl_program(None, None, None, compute)
-        super().__init__(gl_program)
+    def __init__(self, compute: Buffer, *, binary_cache: ShaderBinaryCache | None = None) -> None:
+        self._initialize(*create_gl_program_with_cache(binary_cache, None, None, None, compute))
+
+    @classmethod
+    def compile_async(cls, compute: Buffer) -> ShaderCompileFuture[Self]:
+        return ShaderCompileFuture(cls, None, None, None, compute)
+
+    def _initialize(self, gl_program: GlProgram, reflection: GlProgramReflection) -> None:
+        super().__init__(gl_program, reflection)
 
         self._inputs: dict[str, ShaderUniform] = {
             uniform.name: uniform for uniform in self._uniforms
@@ -548,6 +1004,9 @@ class ComputeShader(_CoreShader):
     def __getitem__(self, name: str) -> ShaderUniform:
         return self._inputs[name]
 
+    def prepare(self, input_map: ShaderInputMap) -> PreparedComputeShader:
+        return PreparedComputeShader(self, input_map)
+
     def execute(
         self, input_map: ShaderInputMap, num_groups_x: int, num_groups_y: int, num_groups_z: int
     ) -> None:
@@ -567,6 +1026,14 @@ class ComputeShader(_CoreShader):
                 continue
             storage_block_values.append((storage_block, value))
 
+        uniform_block_values: list[tuple[ShaderUniformBlock, Any]] = []
+        for uniform_block in self.uniform_blocks:
+            try:
+                value = input_map[uniform_block.name]
+            except KeyError:
+                continue
+            uniform_block_values.append((uniform_block, value))
+
         self._activate()
 
         with ExitStack() as exit_stack:
@@ -574,6 +1041,8 @@ class ComputeShader(_CoreShader):
                 self._set_uniform(uniform, value, exit_stack)
             for storage_block, value in storage_block_values:
                 self._set_storage_block(storage_block, value, exit_stack)
+            for uniform_block, value in uniform_block_values:
+                self._set_uniform_block(uniform_block, value, exit_stack)
 
             execute_gl_program_compute(num_groups_x, num_groups_y, num_groups_z)
 
@@ -583,6 +1052,204 @@ def _reset_shader_state() -> None:
     _CoreShader._active = None
 
 
+class ShaderCompileFuture(Generic[_S]):
+    _gl_program: GlProgram | None = None
+
+    def __init__(
+        self,
+        shader_cls: type[_S],
+        vertex: Buffer | None,
+        geometry: Buffer | None,
+        fragment: Buffer | None,
+        compute: Buffer | None,
+    ):
+        self._shader_cls = shader_cls
+        self._shader: _S | None = None
+        self._error: RuntimeError | None = None
+        self._gl_program, self._gl_shaders = start_gl_program(vertex, geometry, fragment, compute)
+
+    def __del__(self) -> None:
+        if self._gl_program is not None:
+            cancel_gl_program(self._gl_program, self._gl_shaders)
+            self._gl_program = None
+
+    def __await__(self) -> Generator[Any, None, _S]:
+        while not self.done():
+            yield from sleep(0.001).__await__()
+        return self.result()
+
+    def done(self) -> bool:
+        if self._gl_program is None:
+            return True
+        return is_gl_program_complete(self._gl_program)
+
+    def result(self) -> _S:
+        if self._error is not None:
+            raise self._error
+        if self._shader is None:
+            gl_program = self._gl_program
+            assert gl_program is not None
+            self._gl_program = None
+            try:
+                gl_program = finish_gl_program(gl_program, self._gl_shaders)
+            except RuntimeError as ex:
+                self._error = ex
+                raise
+            shader = self._shader_cls.__new__(self._shader_cls)
+            shader._initialize(gl_program, reflect_gl_program(gl_program))
+            self._shader = shader
+        return self._shader
+
+
+class PreparedShader:
+    def __init__(
+        self,
+        shader: Shader,
+        primitive_mode: PrimitiveMode,
+        buffer_view_map: GBufferViewMap,
+        input_map: ShaderInputMap,
+        blend_source: BlendFactor,
+        blend_destination: BlendFactor,
+        blend_source_alpha: BlendFactor | None,
+        blend_destination_alpha: BlendFactor | None,
+        blend_function: BlendFunction,
+        blend_color: FVector4 | None,
+        color_write: tuple[bool, bool, bool, bool],
+        depth_test: DepthTest,
+        depth_write: bool,
+        depth_clamp: bool,
+        face_cull: FaceCull,
+        scissor: IBoundingBox2d | None,
+        face_rasterization: FaceRasterization,
+        point_size: float,
+        clip_distances: int,
+    ):
+        self._shader = shader
+        self._primitive_mode = primitive_mode
+        self._buffer_view_map = buffer_view_map
+        self._inputs = shader._prepare_inputs(input_map)
+        self._gl_vertex_array = buffer_view_map._get_gl_vertex_array_for_shader(shader)
+
+        indices = buffer_view_map.indices
+        if isinstance(indices, GBufferView):
+            self._index_g_buffer_view: IndexGBufferView | None = indices
+            self._index_gl_type: GlType | None = _INDEX_BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER[
+                indices.data_type
+            ]
+            self._index_offset = indices.offset
+            self._index_count = 0
+        else:
+            self._index_g_buffer_view = None
+            self._index_gl_type = None
+            self._index_offset, self._index_count = indices
+
+        self._scissor = scissor
+        self._execution_state_prefix = (
+            depth_write,
+            depth_test.value,
+            *color_write,
+            blend_source.value,
+            blend_destination.value,
+            None if blend_source_alpha is None else blend_source_alpha.value,
+            None if blend_destination_alpha is None else blend_destination_alpha.value,
+            blend_function.value,
+            blend_color,
+            face_cull.value,
+        )
+        self._execution_state_suffix = (
+            depth_clamp,
+            face_rasterization.value,
+            point_size,
+            clip_distances,
+            buffer_view_map.primitive_restart,
+        )
+
+    def execute(
+        self,
+        render_target: RenderTarget,
+        input_map: ShaderInputMap | None = None,
+        *,
+        instances: int = 1,
+    ) -> None:
+        if instances < 0:
+            raise ValueError("instances must be 0 or more")
+        elif instances == 0:
+            return
+
+        shader = self._shader
+        scissor = self._scissor
+        set_gl_execution_state(
+            *self._execution_state_prefix,
+            None
+            if scissor is None
+            else IVector2(
+                scissor.position.x, render_target.size.y - scissor.position.y - scissor.size.y
+            ),
+            None if scissor is None else scissor.size,
+            *self._execution_state_suffix,
+        )
+
+        set_draw_render_target(render_target)
+        shader._activate()
+
+        with ExitStack() as exit_stack:
+            shader._set_prepared_inputs(self._inputs, exit_stack)
+            if input_map is not None:
+                shader._set_inputs(input_map, exit_stack)
+            self._buffer_view_map._check_extents()
+            self._gl_vertex_array.activate()
+            if self._index_g_buffer_view is None:
+                execute_gl_program_indices(
+                    self._primitive_mode.value, self._index_offset, self._index_count, instances
+                )
+            else:
+                execute_gl_program_index_buffer(
+                    self._primitive_mode.value,
+                    len(self._index_g_buffer_view),
+                    self._index_offset,
+                    self._index_gl_type,
+                    instances,
+                )
+
+    @property
+    def shader(self) -> Shader:
+        return self._shader
+
+    @property
+    def primitive_mode(self) -> PrimitiveMode:
+        return self._primitive_mode
+
+    @property
+    def buffer_view_map(self) -> GBufferViewMap:
+        return self._buffer_view_map
+
+
+class PreparedComputeShader:
+    def __init__(self, shader: ComputeShader, input_map: ShaderInputMap):
+        self._shader = shader
+        self._inputs = shader._prepare_inputs(input_map)
+
+    def execute(
+        self,
+        num_groups_x: int,
+        num_groups_y: int,
+        num_groups_z: int,
+        input_map: ShaderInputMap | None = None,
+    ) -> None:
+        shader = self._shader
+        shader._activate()
+
+        with ExitStack() as exit_stack:
+            shader._set_prepared_inputs(self._inputs, exit_stack)
+            if input_map is not None:
+                shader._set_inputs(input_map, exit_stack)
+            execute_gl_program_compute(num_groups_x, num_groups_y, num_groups_z)
+
+    @property
+    def shader(self) -> ComputeShader:
+        return self._shader
+
+
 class ShaderAttribute(Generic[_T]):
     def __init__(self, name: str, data_type: type[_T], size: int, location: int) -> None:
         self._name = name
@@ -678,6 +1345,29 @@ class ShaderStorageBlock:
         return self._name
 
 
+class ShaderUniformBlock:
+    _binding: int | None = None
+
+    def __init__(self, name: str, index: int, size: int):
+        self._name = name
+        self._index = index
+        self._size = size
+
+    def _set_binding(self, shader: _CoreShader, binding: int) -> None:
+        if self._binding == binding:
+            return
+        set_program_uniform_block_binding(shader._gl_program, self._index, binding)
+        self._binding = binding
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
 _GL_IMAGE_TYPES: Final[Collection[GlType]] = {
     GL_IMAGE_2D,
     GL_IMAGE_3D,
@@ -954,3 +1644,6 @@ _INDEX_BUFFER_VIEW_TYPE_TO_VERTEX_ATTRIB_POINTER: Final[Mapping[Any, GlType]] =
     ctypes.c_uint16: GL_UNSIGNED_SHORT,
     ctypes.c_uint32: GL_UNSIGNED_INT,
 }
+
+_DRAW_ARRAYS_INDIRECT_COMMAND_SIZE: Final = 16
+_DRAW_ELEMENTS_INDIRECT_COMMAND_SIZE: Final = 20
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+__all__ = [
+    "create_gl_program_with_cache",
+    "GlProgramReflection",
+    "reflect_gl_program",
+    "ShaderBinaryCache",
+]
+
+import json
+import os
+import struct
+from collections.abc import Buffer
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Final
+from typing import NamedTuple
+
+from ._egraphics import GlProgram
+from ._egraphics import create_gl_program
+from ._egraphics import create_gl_program_from_binary
+from ._egraphics import delete_gl_program
+from ._egraphics import get_gl_program_attributes
+from ._egraphics import get_gl_program_binary
+from ._egraphics import get_gl_program_binary_length
+from ._egraphics import get_gl_program_storage_blocks
+from ._egraphics import get_gl_program_uniform_blocks
+from ._egraphics import get_gl_program_uniforms
+from ._egraphics import get_gl_renderer
+from ._egraphics import get_gl_vendor
+from ._egraphics import get_gl_version
+
+_FILE_MAGIC: Final = b"EGPB"
+_FILE_VERSION: Final = 2
+_FILE_HEADER: Final = struct.Struct("<4sII")
+
+_STAGE_NAMES: Final = (b"vertex", b"geometry", b"fragment", b"compute")
+
+
+class GlProgramReflection(NamedTuple):
+    uniforms: tuple[tuple[str, int, int, int], ...]
+    attributes: tuple[tuple[str, int, int, int], ...]
+    storage_blocks: tuple[str, ...]
+    uniform_blocks: tuple[tuple[str, int], ...]
+
+
+def reflect_gl_program(gl_program: GlProgram) -> GlProgramReflection:
+    return GlProgramReflection(
+        tuple(get_gl_program_uniforms(gl_program)),
+        tuple(get_gl_program_attributes(gl_program)),
+        tuple(get_gl_program_storage_blocks(gl_program)),
+        tuple(get_gl_program_uniform_blocks(gl_program)),
+    )
+
+
+class ShaderBinaryCache:
+    def __init__(self, directory: Path | str):
+        self._directory = Path(directory)
+        self._hits = 0
+        self._misses = 0
+
+    def _get_key(self, sources: tuple[Buffer | None, ...]) -> str:
+        key = sha256()
+        for stage_name, source in zip(_STAGE_NAMES, sources):
+            if source is None:
+                continue
+            data = memoryview(source).cast("B")
+            key.update(stage_name)
+            key.update(struct.pack("<Q", len(data)))
+            key.update(data)
+        for gl_string in (get_gl_vendor(), get_gl_renderer(), get_gl_version()):
+            data = gl_string.encode("utf8")
+            key.update(struct.pack("<Q", len(data)))
+            key.update(data)
+        return key.hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}.bin"
+
+    def _load(self, key: str) -> tuple[int, bytes, GlProgramReflection] | None:
+        try:
+            data = self._get_path(key).read_bytes()
+            magic, version, metadata_length = _FILE_HEADER.unpack_from(data)
+            if magic != _FILE_MAGIC or version != _FILE_VERSION:
+                return None
+            metadata_end = _FILE_HEADER.size + metadata_length
+            metadata = json.loads(data[_FILE_HEADER.size : metadata_end])
+            reflection = GlProgramReflection(
+                tuple((str(n), int(s), int(t), int(l)) for n, s, t, l in metadata["uniforms"]),
+                tuple((str(n), int(s), int(t), int(l)) for n, s, t, l in metadata["attributes"]),
+                tuple(str(n) for n in metadata["storage_blocks"]),
+                tuple((str(n), int(s)) for n, s in metadata["uniform_blocks"]),
+            )
+            return int(metadata["format"]), data[metadata_end:], reflection
+        except (OSError, ValueError, KeyError, TypeError, struct.error):
+            return None
+
+    def _store(
+        self, key: str, format: int, binary: bytes, reflection: GlProgramReflection
+    ) -> None:
+        metadata = json.dumps(
+            {
+                "format": format,
+                "uniforms": reflection.uniforms,
+                "attributes": reflection.attributes,
+                "storage_blocks": reflection.storage_blocks,
+                "uniform_blocks": reflection.uniform_blocks,
+            }
+        ).encode("utf8")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=self._directory, suffix=".tmp", delete=False) as f:
+            try:
+                f.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, len(metadata)))
+                f.write(metadata)
+                f.write(binary)
+                f.close()
+                os.replace(f.name, self._get_path(key))
+            except BaseException:
+                f.close()
+                with suppress(OSError):
+                    os.unlink(f.name)
+                raise
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+
+def create_gl_program_with_cache(
+    cache: ShaderBinaryCache | None,
+    vertex: Buffer | None,
+    geometry: Buffer | None,
+    fragment: Buffer | None,
+    compute: Buffer | None,
+) -> tuple[GlProgram, GlProgramReflection]:
+    if cache is None:
+        gl_program = create_gl_program(vertex, geometry, fragment, compute)
+        return gl_program, reflect_gl_program(gl_program)
+
+    key = cache._get_key((vertex, geometry, fragment, compute))
+    entry = cache._load(key)
+    if entry is not None:
+        format, binary, reflection = entry
+        loaded_gl_program = create_gl_program_from_binary(format, binary)
+        if loaded_gl_program is not None:
+            cache._hits += 1
+            return loaded_gl_program, reflection
+
+    cache._misses += 1
+    gl_program = create_gl_program(vertex, geometry, fragment, compute)
+    try:
+        reflection = reflect_gl_program(gl_program)
+        if get_gl_program_binary_length(gl_program):
+            format, binary = get_gl_program_binary(gl_program)
+            try:
+                cache._store(key, format, binary, reflection)
+            except OSError:
+                pass
+    except BaseException:
+        delete_gl_program(gl_program)
+        raise
+    return gl_program, reflection
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+__all__ = ["ShaderDefineValue", "ShaderLibrary", "ShaderLibraryCacheInfo"]
+
+import re
+from collections import OrderedDict
+from collections.abc import Buffer
+from hashlib import sha256
+from pathlib import Path
+from typing import Final
+from typing import Mapping
+from typing import NamedTuple
+from typing import Sequence
+from typing import TypeAlias
+
+from ._shader import ComputeShader
+from ._shader import Shader
+from ._shader_binary_cache import ShaderBinaryCache
+
+ShaderDefineValue: TypeAlias = bool | int | float | str | None
+
+_STAGE_NAMES: Final = (b"vertex", b"geometry", b"fragment", b"compute")
+_INCLUDE_PATTERN: Final = re.compile(rb'^[ \t]*#[ \t]*include[ \t]+(?:"([^"]+)"|<([^>]+)>)[ \t]*$')
+_VERSION_PATTERN: Final = re.compile(rb"^[ \t]*#[ \t]*version[ \t]+([0-9]+)")
+_DEFINE_NAME_PATTERN: Final = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_Sources: TypeAlias = tuple[bytes | None, bytes | None, bytes | None, bytes | None]
+_RequestKey: TypeAlias = tuple[_Sources, tuple[tuple[str, type, ShaderDefineValue], ...]]
+
+
+class ShaderLibraryCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    shaders: int
+    max_size: int
+
+
+class ShaderLibrary:
+    def __init__(
+        self,
+        *,
+        includes: Mapping[str, Buffer] | None = None,
+        include_directories: Sequence[Path | str] = (),
+        max_size: int = 128,
+        binary_cache: ShaderBinaryCache | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max size must be greater than 0")
+        self._includes = {} if includes is None else {n: bytes(s) for n, s in includes.items()}
+        self._include_directories = tuple(Path(d) for d in include_directories)
+        self._max_size = max_size
+        self._binary_cache = binary_cache
+        self._shaders: OrderedDict[bytes, Shader | ComputeShader] = OrderedDict()
+        self._requests: dict[_RequestKey, bytes] = {}
+        self._shader_requests: dict[bytes, list[_RequestKey]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __len__(self) -> int:
+        return len(self._shaders)
+
+    def _load_include(self, name: str) -> bytes:
+        try:
+            return self._includes[name]
+        except KeyError:
+            pass
+        for directory in self._include_directories:
+            try:
+                source = (directory / name).read_bytes()
+            except OSError:
+                continue
+            self._includes[name] = source
+            return source
+        raise ValueError(f"include {name!r} not found")
+
+    def _expand_includes(
+        self,
+        lines: list[bytes],
+        first_line_number: int,
+        source_number: int,
+        include_stack: list[str],
+        include_source_numbers: dict[str, int],
+        line_offset: int,
+    ) -> list[bytes]:
+        expanded: list[bytes] = []
+        for line_number, line in enumerate(lines, first_line_number):
+            match = _INCLUDE_PATTERN.match(line)
+            if match is None:
+                expanded.append(line)
+                continue
+            name = (match.group(1) or match.group(2)).decode("utf8")
+            if name in include_stack:
+                raise ValueError(f"circular include of {name!r}")
+            include_source_number = include_source_numbers.setdefault(
+                name, len(include_source_numbers) + 1
+            )
+            include_stack.append(name)
+            expanded.append(_format_line(1, include_source_number, line_offset))
+            expanded.extend(
+                self._expand_includes(
+                    self._load_include(name).splitlines(),
+                    1,
+                    include_source_number,
+                    include_stack,
+                    include_source_numbers,
+                    line_offset,
+                )
+            )
+            expanded.append(_format_line(line_number + 1, source_number, line_offset))
+            include_stack.pop()
+        return expanded
+
+    def preprocess(
+        self, source: Buffer, *, defines: Mapping[str, ShaderDefineValue] | None = None
+    ) -> bytes:
+        lines = bytes(source).splitlines()
+        define_lines = [
+            _format_define(name, value)
+            for name, value in sorted(({} if defines is None else defines).items())
+        ]
+        # before GLSL 3.30 the line following "#line N" is numbered N + 1
+        version_index = -1
+        line_offset = 1
+        for i, line in enumerate(lines):
+            match = _VERSION_PATTERN.match(line)
+            if match is not None:
+                version_index = i
+                line_offset = 0 if int(match.group(1)) >= 330 else 1
+                break
+        include_stack: list[str] = []
+        include_source_numbers: dict[str, int] = {}
+        expanded = self._expand_includes(
+            lines[: version_index + 1], 1, 0, include_stack, include_source_numbers, line_offset
+        )
+        if define_lines:
+            expanded.extend(define_lines)
+            expanded.append(_format_line(version_index + 2, 0, line_offset))
+        expanded.extend(
+            self._expand_includes(
+                lines[version_index + 1 :],
+                version_index + 2,
+                0,
+                include_stack,
+                include_source_numbers,
+                line_offset,
+            )
+        )
+        return b"\n".join(expanded) + b"\n"
+
+    def _get_shader(
+        self,
+        sources: tuple[Buffer | None, Buffer | None, Buffer | None, Buffer | None],
+        defines: Mapping[str, ShaderDefineValue] | None,
+    ) -> Shader | ComputeShader:
+        request_key: _RequestKey = (
+            tuple(None if s is None else bytes(s) for s in sources),  # type: ignore
+            tuple(
+                (name, type(value), value)
+                for name, value in sorted(({} if defines is None else defines).items())
+            ),
+        )
+        try:
+            key = self._requests[request_key]
+        except KeyError:
+            pass
+        else:
+            self._shaders.move_to_end(key)
+            self._cache_hits += 1
+            return self._shaders[key]
+
+        vertex, geometry, fragment, compute = (
+            None if s is None else self.preprocess(s, defines=defines) for s in request_key[0]
+        )
+        key = _hash_sources((vertex, geometry, fragment, compute))
+        try:
+            shader = self._shaders[key]
+        except KeyError:
+            self._cache_misses += 1
+            if compute is None:
+                shader = Shader(
+                    vertex=vertex,
+                    geometry=geometry,
+                    fragment=fragment,
+                    binary_cache=self._binary_cache,
+                )
+            else:
+                shader = ComputeShader(compute, binary_cache=self._binary_cache)
+            self._shaders[key] = shader
+            while len(self._shaders) > self._max_size:
+                evicted_key, _ = self._shaders.popitem(last=False)
+                self._forget(evicted_key)
+        else:
+            self._shaders.move_to_end(key)
+            self._cache_hits += 1
+        self._requests[request_key] = key
+        self._shader_requests.setdefault(key, []).append(request_key)
+        return shader
+
+    def _forget(self, key: bytes) -> None:
+        for request_key in self._shader_requests.pop(key, ()):
+            del self._requests[request_key]
+
+    def get_shader(
+        self,
+        *,
+        vertex: Buffer | None = None,
+        geometry: Buffer | None = None,
+        fragment: Buffer | None = None,
+        defines: Mapping[str, ShaderDefineValue] | None = None,
+    ) -> Shader:
+        shader = self._get_shader((vertex, geometry, fragment, None), defines)
+        assert isinstance(shader, Shader)
+        return shader
+
+    def get_compute_shader(
+        self, compute: Buffer, *, defines: Mapping[str, ShaderDefineValue] | None = None
+    ) -> ComputeShader:
+        shader = self._get_shader((None, None, None, compute), defines)
+        assert isinstance(shader, ComputeShader)
+        return shader
+
+    def clear(self) -> None:
+        self._shaders.clear()
+        self._requests.clear()
+        self._shader_requests.clear()
+
+    def cache_info(self) -> ShaderLibraryCacheInfo:
+        return ShaderLibraryCacheInfo(
+            self._cache_hits, self._cache_misses, len(self._shaders), self._max_size
+        )
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+
+def _format_define(name: str, value: ShaderDefineValue) -> bytes:
+    if not _DEFINE_NAME_PATTERN.match(name):
+        raise ValueError(f"invalid define name {name!r}")
+    if value is None:
+        return f"#define {name}".encode("utf8")
+    if isinstance(value, bool):
+        value = int(value)
+    return f"#define {name} {value}".encode("utf8")
+
+
+def _format_line(line_number: int, source_number: int, line_offset: int) -> bytes:
+    return f"#line {line_number - line_offset} {source_number}".encode("utf8")
+
+
+def _canonicalize_line(line: bytes) -> bytes:
+    stripped = line.rstrip()
+    # stripping the whitespace after a backslash would turn it into a line continuation
+    if stripped.endswith(b"\\"):
+        return line
+    return stripped
+
+
+def _hash_sources(sources: tuple[bytes | None, ...]) -> bytes:
+    key = sha256()
+    for stage_name, source in zip(_STAGE_NAMES, sources):
+        if source is None:
+            continue
+        source = b"\n".join(_canonicalize_line(line) for line in source.splitlines())
+        key.update(stage_name)
+        key.update(len(source).to_bytes(8, "little"))
+        key.update(source)
+    return key.digest()
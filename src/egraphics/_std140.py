@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+__all__ = ["pack_std140"]
+
+import ctypes
+from typing import Any
+from typing import Final
+from typing import Mapping
+from typing import Sequence
+
+import emath
+
+from ._egraphics import interleave_data
+
+_STD140_TYPES: Final[Mapping[Any, tuple[Any, int, int, int]]] = {
+    ctypes.c_float: (emath.FArray, 4, 1, 1),
+    emath.FVector2: (emath.FVector2Array, 4, 2, 1),
+    emath.FVector3: (emath.FVector3Array, 4, 3, 1),
+    emath.FVector4: (emath.FVector4Array, 4, 4, 1),
+    ctypes.c_double: (emath.DArray, 8, 1, 1),
+    emath.DVector2: (emath.DVector2Array, 8, 2, 1),
+    emath.DVector3: (emath.DVector3Array, 8, 3, 1),
+    emath.DVector4: (emath.DVector4Array, 8, 4, 1),
+    ctypes.c_int32: (emath.I32Array, 4, 1, 1),
+    emath.I32Vector2: (emath.I32Vector2Array, 4, 2, 1),
+    emath.I32Vector3: (emath.I32Vector3Array, 4, 3, 1),
+    emath.I32Vector4: (emath.I32Vector4Array, 4, 4, 1),
+    ctypes.c_uint32: (emath.U32Array, 4, 1, 1),
+    emath.U32Vector2: (emath.U32Vector2Array, 4, 2, 1),
+    emath.U32Vector3: (emath.U32Vector3Array, 4, 3, 1),
+    emath.U32Vector4: (emath.U32Vector4Array, 4, 4, 1),
+    ctypes.c_bool: (emath.U32Array, 4, 1, 1),
+    emath.FMatrix2x2: (emath.FMatrix2x2Array, 4, 2, 2),
+    emath.FMatrix2x3: (emath.FMatrix2x3Array, 4, 3, 2),
+    emath.FMatrix2x4: (emath.FMatrix2x4Array, 4, 4, 2),
+    emath.FMatrix3x2: (emath.FMatrix3x2Array, 4, 2, 3),
+    emath.FMatrix3x3: (emath.FMatrix3x3Array, 4, 3, 3),
+    emath.FMatrix3x4: (emath.FMatrix3x4Array, 4, 4, 3),
+    emath.FMatrix4x2: (emath.FMatrix4x2Array, 4, 2, 4),
+    emath.FMatrix4x3: (emath.FMatrix4x3Array, 4, 3, 4),
+    emath.FMatrix4x4: (emath.FMatrix4x4Array, 4, 4, 4),
+    emath.DMatrix2x2: (emath.DMatrix2x2Array, 8, 2, 2),
+    emath.DMatrix2x3: (emath.DMatrix2x3Array, 8, 3, 2),
+    emath.DMatrix2x4: (emath.DMatrix2x4Array, 8, 4, 2),
+    emath.DMatrix3x2: (emath.DMatrix3x2Array, 8, 2, 3),
+    emath.DMatrix3x3: (emath.DMatrix3x3Array, 8, 3, 3),
+    emath.DMatrix3x4: (emath.DMatrix3x4Array, 8, 4, 3),
+    emath.DMatrix4x2: (emath.DMatrix4x2Array, 8, 2, 4),
+    emath.DMatrix4x3: (emath.DMatrix4x3Array, 8, 3, 4),
+    emath.DMatrix4x4: (emath.DMatrix4x4Array, 8, 4, 4),
+}
+
+_STD140_ARRAY_TYPES: Final[Mapping[Any, tuple[int, int, int]]] = {
+    array_type: (component_size, components, columns)
+    for data_type, (array_type, component_size, components, columns) in _STD140_TYPES.items()
+    if data_type is not ctypes.c_bool
+}
+
+
+def _round_up(value: int, alignment: int) -> int:
+    return -(-value // alignment) * alignment
+
+
+def pack_std140(values: Sequence[Any]) -> bytes:
+    data = bytearray()
+    for value in values:
+        try:
+            array_type, component_size, components, columns = _STD140_TYPES[type(value)]
+        except KeyError:
+            try:
+                component_size, components, columns = _STD140_ARRAY_TYPES[type(value)]
+            except KeyError:
+                raise TypeError(f"{type(value)!r} cannot be packed with std140 layout")
+            is_array = True
+            count = len(value)
+        else:
+            is_array = False
+            count = 1
+            value = array_type(value.value if components == 1 else value)
+
+        column_size = component_size * components
+        column_alignment = component_size * (4 if components == 3 else components)
+        if is_array or columns > 1:
+            column_alignment = _round_up(column_alignment, 16)
+            column_stride = column_alignment
+        else:
+            column_stride = column_size
+
+        data.extend(bytes(_round_up(len(data), column_alignment) - len(data)))
+        if column_stride == column_size:
+            data += value
+        else:
+            data += interleave_data([(value, column_size, 0)], column_stride, count * columns)
+    data.extend(bytes(_round_up(len(data), 16) - len(data)))
+    return bytes(data)
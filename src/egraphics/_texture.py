@@ -16,6 +16,7 @@ import ctypes
 from collections.abc import Buffer
 from ctypes import sizeof as c_sizeof
 from enum import Enum
+from math import log2
 from math import prod
 from typing import Any
 from typing import ClassVar
@@ -36,6 +37,7 @@ from ._egraphics import GL_BYTE
 from ._egraphics import GL_CLAMP_TO_BORDER
 from ._egraphics import GL_CLAMP_TO_EDGE
 from ._egraphics import GL_DEPTH_COMPONENT
+from ._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
 from ._egraphics import GL_FLOAT
 from ._egraphics import GL_INT
 from ._egraphics import GL_LINEAR
@@ -62,14 +64,22 @@ from ._egraphics import GlTextureComponents
 from ._egraphics import GlTextureFilter
 from ._egraphics import GlTextureWrap
 from ._egraphics import GlType
+from ._egraphics import create_gl_named_texture
 from ._egraphics import create_gl_texture
 from ._egraphics import delete_gl_texture
+from ._egraphics import generate_gl_named_texture_mipmaps
 from ._egraphics import generate_gl_texture_target_mipmaps
 from ._egraphics import set_active_gl_texture_unit
+from ._egraphics import set_gl_named_texture_2d_storage
+from ._egraphics import set_gl_named_texture_parameters
 from ._egraphics import set_gl_texture_target
 from ._egraphics import set_gl_texture_target_2d_data
 from ._egraphics import set_gl_texture_target_parameters
 from ._egraphics import set_image_unit
+from ._egraphics import write_gl_named_texture_2d_data
+from ._memory import MemoryKind
+from ._memory import register_memory
+from ._memory import unregister_memory
 from ._state import register_reset_state_callback
 
 _DEFAULT_TEXTURE_UNIT: Final[int] = 0
@@ -296,6 +306,20 @@ _TEXTURE_COMPONENTS_TO_GL_FORMAT: Final[
     },
 }
 
+_SIZED_TEXTURE_COMPONENTS: Final = frozenset(
+    (TextureComponents.X, TextureComponents.XY, TextureComponents.XYZ, TextureComponents.XYZW)
+)
+
+
+def _get_texture_memory_size(size: UVector2, pixel_size: int, levels: int) -> int:
+    memory_size = 0
+    width, height = size
+    for _ in range(levels):
+        memory_size += width * height * pixel_size
+        width = max(1, width // 2)
+        height = max(1, height // 2)
+    return memory_size
+
 
 class Texture:
     _gl_texture: GlTexture | None = None
@@ -364,40 +388,73 @@ class Texture:
             expected_data_length = prod(size) * component_count * c_sizeof(data_type)
             if memoryview(buffer).nbytes != expected_data_length:
                 raise ValueError("too much or not enough data")
+        gl_format = _TEXTURE_COMPONENTS_TO_GL_FORMAT[(components, data_type)]
+        gl_target = self._type.value.target._gl_target
+        assert type == TextureType.TWO_DIMENSIONS
+        self._size = size
+        self._mipmap_selection = mipmap_selection
+        self._minify_filter = minify_filter
+        self._magnify_filter = magnify_filter
+        self._wrap = wrap
+        self._wrap_color = wrap_color
+        self._anisotropy = anisotropy
+        gl_wrap_args: tuple[GlTextureWrap, GlTextureWrap | None, GlTextureWrap | None] = tuple(
+            (*(w.value for w in wrap), *(None for i in range(3 - len(wrap))))
+        )  # type: ignore
+        levels = 1
+        if mipmap_selection != MipmapSelection.NONE:
+            levels = int(log2(max(size))) + 1
+        pixel_size = component_count * c_sizeof(data_type)
+        # sized formats can use immutable storage and be created without being bound, unsized
+        # formats have no storage equivalent and must go through the bind path
+        if GL_DIRECT_STATE_ACCESS_SUPPORTED and components in _SIZED_TEXTURE_COMPONENTS:
+            self._gl_texture = create_gl_named_texture(gl_target)
+            register_memory(
+                self,
+                MemoryKind.TEXTURE,
+                _get_texture_memory_size(size, pixel_size, levels),
+                (components, data_type),
+            )
+            set_gl_named_texture_2d_storage(
+                self._gl_texture, levels, self._gl_internal_format, size
+            )
+            if buffer is not None:
+                write_gl_named_texture_2d_data(
+                    self._gl_texture, size, gl_format, gl_data_type, buffer
+                )
+            if mipmap_selection != MipmapSelection.NONE:
+                generate_gl_named_texture_mipmaps(self._gl_texture)
+            set_gl_named_texture_parameters(
+                self._gl_texture,
+                gl_min_filter,
+                gl_mag_filter,
+                *gl_wrap_args,
+                wrap_color,
+                anisotropy,
+            )
+            return
         # generate the texture and copy the data to it
         self._gl_texture = create_gl_texture()
+        register_memory(
+            self,
+            MemoryKind.TEXTURE,
+            _get_texture_memory_size(size, pixel_size, levels),
+            (components, data_type),
+        )
         with bind_texture(self):
-            gl_target = self._type.value.target._gl_target
-            assert type == TextureType.TWO_DIMENSIONS
             set_gl_texture_target_2d_data(
-                gl_target,
-                self._gl_internal_format,
-                size,
-                _TEXTURE_COMPONENTS_TO_GL_FORMAT[(components, data_type)],
-                gl_data_type,
-                buffer,
+                gl_target, self._gl_internal_format, size, gl_format, gl_data_type, buffer
             )
-            self._size = size
             # we only need to generate mipmaps if we're using a mipmap selection
             # that would actually check the mipmaps
-            self._mipmap_selection = mipmap_selection
             if mipmap_selection != MipmapSelection.NONE:
                 generate_gl_texture_target_mipmaps(gl_target)
-            # set parameters
-            self._minify_filter = minify_filter
-            self._magnify_filter = magnify_filter
-            self._wrap = wrap
-            self._wrap_color = wrap_color
-            self._anisotropy = anisotropy
-
-            gl_wrap_args: tuple[GlTextureWrap, GlTextureWrap | None, GlTextureWrap | None] = tuple(
-                (*(w.value for w in wrap), *(None for i in range(3 - len(wrap))))
-            )  # type: ignore
             set_gl_texture_target_parameters(
                 gl_target, gl_min_filter, gl_mag_filter, *gl_wrap_args, wrap_color, anisotropy
             )
 
     def __del__(self) -> None:
+        unregister_memory(self)
         if self._image_unit is not None:
             self._release_image_unit()
         if self._texture_unit is not None:
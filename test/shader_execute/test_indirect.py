@@ -0,0 +1,216 @@
+import ctypes
+
+import pytest
+from egeometry import IRectangle
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector4
+from emath import IVector2
+from emath import U8Array
+from emath import U32Array
+
+from egraphics import GBuffer
+from egraphics import GBufferView
+from egraphics import GBufferViewMap
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import read_color_from_render_target
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+void main()
+{
+    gl_Position = vec4(xy, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+out vec4 FragColor;
+void main()
+{
+    FragColor = vec4(1);
+}
+"""
+
+QUADS = FVector2Array(
+    FVector2(-1, -1),
+    FVector2(-1, 1),
+    FVector2(0, 1),
+    FVector2(0, -1),
+    FVector2(0, -1),
+    FVector2(0, 1),
+    FVector2(1, 1),
+    FVector2(1, -1),
+)
+
+
+def _create_commands(*commands, stride):
+    return GBufferView(GBuffer(U32Array(*commands)), ctypes.c_uint32, stride=stride)
+
+
+def _read_halves(render_target):
+    colors = read_color_from_render_target(
+        render_target, IRectangle(IVector2(0), render_target.size)
+    )
+    width = render_target.size.x
+    left = [c for i, c in enumerate(colors) if i % width < width // 2]
+    right = [c for i, c in enumerate(colors) if i % width >= width // 2]
+    return left, right
+
+
+def _array_map():
+    return GBufferViewMap({"xy": GBufferView.from_array(QUADS)}, (0, 8))
+
+
+def _element_map():
+    return GBufferViewMap(
+        {"xy": GBufferView.from_array(QUADS)}, GBufferView.from_array(U8Array(0, 1, 2, 3))
+    )
+
+
+def _array_commands():
+    return _create_commands(4, 1, 0, 0, 4, 1, 4, 0, stride=16)
+
+
+def _element_commands():
+    return _create_commands(4, 1, 0, 0, 0, 4, 1, 0, 4, 0, stride=20)
+
+
+@pytest.mark.parametrize(
+    "create_map, create_commands",
+    [(_array_map, _array_commands), (_element_map, _element_commands)],
+)
+@pytest.mark.parametrize("count", [None, 0, 1, 2])
+def test_execute_indirect(render_target, gl_version, create_map, create_commands, count):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    shader.execute_indirect(
+        render_target, PrimitiveMode.TRIANGLE_FAN, create_map(), {}, create_commands(), count=count
+    )
+
+    left, right = _read_halves(render_target)
+    expected_count = 2 if count is None else count
+    assert all(c == FVector4(int(expected_count > 0)) for c in left)
+    assert all(c == FVector4(int(expected_count > 1)) for c in right)
+
+
+@pytest.mark.parametrize(
+    "create_map, create_commands",
+    [(_array_map, _array_commands), (_element_map, _element_commands)],
+)
+@pytest.mark.parametrize("count", [0, 1, 2, 3])
+def test_execute_indirect_count_buffer(
+    render_target, gl_version, create_map, create_commands, count
+):
+    if gl_version < (4, 6):
+        pytest.xfail()
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    shader.execute_indirect(
+        render_target,
+        PrimitiveMode.TRIANGLE_FAN,
+        create_map(),
+        {},
+        create_commands(),
+        count=GBufferView.from_array(U32Array(count)),
+    )
+
+    left, right = _read_halves(render_target)
+    assert all(c == FVector4(int(count > 0)) for c in left)
+    assert all(c == FVector4(int(count > 1)) for c in right)
+
+
+@pytest.mark.parametrize("create_map, command_size", [(_array_map, 16), (_element_map, 20)])
+@pytest.mark.parametrize("stride", [4, 15, 21])
+def test_execute_indirect_invalid_stride(render_target, create_map, command_size, stride):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            create_map(),
+            {},
+            GBufferView(GBuffer(64), ctypes.c_uint32, stride=stride),
+        )
+    assert str(excinfo.value) == (
+        f"commands stride must be a multiple of 4 and at least {command_size}"
+    )
+
+
+def test_execute_indirect_invalid_offset(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            _array_map(),
+            {},
+            GBufferView(GBuffer(64), ctypes.c_uint32, stride=16, offset=2),
+        )
+    assert str(excinfo.value) == "commands offset must be a multiple of 4"
+
+
+@pytest.mark.parametrize("count", [-1, 3])
+def test_execute_indirect_invalid_count(render_target, count):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            _array_map(),
+            {},
+            _array_commands(),
+            count=count,
+        )
+    assert str(excinfo.value) == "count must be between 0 and 2"
+
+
+def test_execute_indirect_invalid_count_buffer_data_type(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            _array_map(),
+            {},
+            _array_commands(),
+            count=GBufferView(GBuffer(4), ctypes.c_int32),  # type: ignore
+        )
+    assert str(excinfo.value) == "count data type must be c_uint32"
+
+
+def test_execute_indirect_invalid_count_buffer_offset(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            _array_map(),
+            {},
+            _array_commands(),
+            count=GBufferView(GBuffer(8), ctypes.c_uint32, offset=2, length=4),
+        )
+    assert str(excinfo.value) == "count offset must be a multiple of 4"
+
+
+def test_execute_indirect_invalid_indices_offset(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_indirect(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            GBufferViewMap(
+                {"xy": GBufferView.from_array(QUADS)},
+                GBufferView(GBuffer(U8Array(0, 0, 1, 2, 3)), ctypes.c_uint8, offset=1),
+            ),
+            {},
+            _element_commands(),
+        )
+    assert str(excinfo.value) == "indices offset must be 0 for indirect execution"
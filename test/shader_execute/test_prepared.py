@@ -0,0 +1,152 @@
+import ctypes
+
+import pytest
+from egeometry import IRectangle
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector4
+from emath import FVector4Array
+from emath import IVector2
+from emath import U8Array
+
+from egraphics import ComputeShader
+from egraphics import GBuffer
+from egraphics import GBufferView
+from egraphics import GBufferViewMap
+from egraphics import PreparedComputeShader
+from egraphics import PreparedShader
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import read_color_from_render_target
+
+
+def _create_shader():
+    return Shader(
+        vertex=b"""
+        #version 140
+        in vec2 xy;
+        void main()
+        {
+            gl_Position = vec4(xy, 0, 1.0);
+        }
+        """,
+        fragment=b"""
+        #version 140
+        uniform vec4 color;
+        out vec4 FragColor;
+        void main()
+        {
+            FragColor = color;
+        }
+        """,
+    )
+
+
+def _read_colors(render_target):
+    return set(
+        read_color_from_render_target(
+            render_target, IRectangle(IVector2(0, 0), render_target.size)
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "create_indices", [lambda: (0, 4), lambda: GBufferView.from_array(U8Array(0, 1, 2, 3))]
+)
+def test_prepared(render_target, create_indices):
+    shader = _create_shader()
+    buffer_view_map = GBufferViewMap(
+        {
+            "xy": GBufferView.from_array(
+                FVector2Array(FVector2(-1, -1), FVector2(-1, 1), FVector2(1, 1), FVector2(1, -1))
+            )
+        },
+        create_indices(),
+    )
+    prepared = shader.prepare(
+        PrimitiveMode.TRIANGLE_FAN, buffer_view_map, {"color": FVector4(1, 0, 0, 1)}
+    )
+    assert isinstance(prepared, PreparedShader)
+    assert prepared.shader is shader
+    assert prepared.primitive_mode == PrimitiveMode.TRIANGLE_FAN
+    assert prepared.buffer_view_map is buffer_view_map
+
+    clear_render_target(render_target, color=FVector4(0), depth=True)
+    prepared.execute(render_target)
+    assert _read_colors(render_target) == {FVector4(1, 0, 0, 1)}
+
+    prepared.execute(render_target, {"color": FVector4(0, 1, 0, 1), "not_an_input": None})
+    assert _read_colors(render_target) == {FVector4(0, 1, 0, 1)}
+
+    prepared.execute(render_target)
+    assert _read_colors(render_target) == {FVector4(1, 0, 0, 1)}
+
+
+def test_prepared_instances(render_target):
+    shader = _create_shader()
+    prepared = shader.prepare(
+        PrimitiveMode.TRIANGLE_FAN,
+        GBufferViewMap(
+            {
+                "xy": GBufferView.from_array(
+                    FVector2Array(
+                        FVector2(-1, -1), FVector2(-1, 1), FVector2(1, 1), FVector2(1, -1)
+                    )
+                )
+            },
+            (0, 4),
+        ),
+        {"color": FVector4(1)},
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        prepared.execute(render_target, instances=-1)
+    assert str(excinfo.value) == "instances must be 0 or more"
+
+    clear_render_target(render_target, color=FVector4(0), depth=True)
+    prepared.execute(render_target, instances=0)
+    assert _read_colors(render_target) == {FVector4(0)}
+
+
+def test_prepared_invalid_input(render_target):
+    shader = _create_shader()
+    with pytest.raises(ValueError) as excinfo:
+        shader.prepare(
+            PrimitiveMode.POINT,
+            GBufferViewMap({"xy": GBufferView.from_array(FVector2Array(FVector2(0)))}, (0, 1)),
+            {"color": FVector2(0)},
+        )
+    assert str(excinfo.value) == (
+        f"expected {FVector4} or {FVector4Array} for color (got {FVector2})"
+    )
+
+
+def test_prepared_compute(gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+
+    shader = ComputeShader(
+        b"""#version 430 core
+layout (local_size_x=1) in;
+layout(std430) buffer OutputBuffer
+{
+    float data[];
+};
+uniform float value;
+void main()
+{
+    data[gl_GlobalInvocationID.x] = value;
+}
+"""
+    )
+    g_buffer = GBuffer(ctypes.sizeof(ctypes.c_float) * 4)
+    prepared = shader.prepare({"OutputBuffer": g_buffer, "value": ctypes.c_float(1)})
+    assert isinstance(prepared, PreparedComputeShader)
+    assert prepared.shader is shader
+
+    prepared.execute(4, 1, 1)
+    assert list(GBufferView(g_buffer, ctypes.c_float)) == [1, 1, 1, 1]
+
+    prepared.execute(2, 1, 1, {"value": ctypes.c_float(2)})
+    assert list(GBufferView(g_buffer, ctypes.c_float)) == [2, 2, 1, 1]
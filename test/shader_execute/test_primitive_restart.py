@@ -0,0 +1,64 @@
+import pytest
+from egeometry import IRectangle
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector4
+from emath import IVector2
+from emath import U8Array
+
+from egraphics import GBufferView
+from egraphics import GBufferViewMap
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import join_index_strips
+from egraphics import read_color_from_render_target
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+void main()
+{
+    gl_Position = vec4(xy, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+out vec4 FragColor;
+void main()
+{
+    FragColor = vec4(1);
+}
+"""
+
+QUADS = FVector2Array(
+    FVector2(-1, -1),
+    FVector2(-1, 1),
+    FVector2(0, -1),
+    FVector2(0, 1),
+    FVector2(0, 1),
+    FVector2(1, 1),
+    FVector2(0, -1),
+    FVector2(1, -1),
+)
+
+
+def test_primitive_restart(render_target, gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    indices = join_index_strips([U8Array(0, 1, 2, 3), U8Array(4, 5, 6, 7)])
+    shader.execute(
+        render_target,
+        PrimitiveMode.TRIANGLE_STRIP,
+        GBufferViewMap({"xy": GBufferView.from_array(QUADS)}, indices, primitive_restart=True),
+        {},
+    )
+
+    colors = read_color_from_render_target(
+        render_target, IRectangle(IVector2(0), render_target.size)
+    )
+    assert all(c == FVector4(1) for c in colors)
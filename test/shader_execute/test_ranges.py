@@ -0,0 +1,185 @@
+import ctypes
+
+import pytest
+from egeometry import IRectangle
+from emath import FArray
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector4
+from emath import I32Array
+from emath import I32Vector4
+from emath import I32Vector4Array
+from emath import IVector2
+from emath import U16Array
+from emath import U32Array
+
+from egraphics import GBuffer
+from egraphics import GBufferView
+from egraphics import GBufferViewMap
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import read_color_from_render_target
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+in float brightness;
+out float vertex_brightness;
+void main()
+{
+    vertex_brightness = brightness;
+    gl_Position = vec4(xy, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+in float vertex_brightness;
+out vec4 FragColor;
+void main()
+{
+    FragColor = vec4(vertex_brightness, vertex_brightness, vertex_brightness, 1);
+}
+"""
+
+QUADS = FVector2Array(
+    FVector2(-1, -1),
+    FVector2(-1, 1),
+    FVector2(0, 1),
+    FVector2(0, -1),
+    FVector2(0, -1),
+    FVector2(0, 1),
+    FVector2(1, 1),
+    FVector2(1, -1),
+)
+
+
+def _read_halves(render_target):
+    colors = read_color_from_render_target(
+        render_target, IRectangle(IVector2(0), render_target.size)
+    )
+    width = render_target.size.x
+    left = [c for i, c in enumerate(colors) if i % width < width // 2]
+    right = [c for i, c in enumerate(colors) if i % width >= width // 2]
+    return left, right
+
+
+def _create_indices(*indices, offset=0):
+    return GBufferView(GBuffer(U16Array(*indices)), ctypes.c_uint16, offset=offset)
+
+
+def _create_map(indices, brightness=(1, 1)):
+    if callable(indices):
+        indices = indices()
+    return GBufferViewMap(
+        {
+            "xy": GBufferView.from_array(QUADS),
+            "brightness": GBufferView.from_array(FArray(*brightness), instancing_divisor=1),
+        },
+        indices,
+    )
+
+
+@pytest.mark.parametrize(
+    "indices, ranges, expected_left, expected_right",
+    [
+        ((0, 8), [], 0, 0),
+        ((0, 8), [(0, 4, 0, 0)], 1, 0),
+        ((0, 8), [(4, 4, 0, 0)], 0, 1),
+        ((0, 8), [(0, 4, 0, 0), (4, 4, 0, 0)], 1, 1),
+        ((0, 8), [(0, 4, 4, 0)], 0, 1),
+        (lambda: _create_indices(0, 1, 2, 3), [(0, 4, 0, 0), (0, 4, 4, 0)], 1, 1),
+        (lambda: _create_indices(0, 1, 2, 3), [(0, 4, 4, 0)], 0, 1),
+        (lambda: _create_indices(9, 0, 1, 2, 3), [(1, 4, 0, 0)], 1, 0),
+        (lambda: _create_indices(9, 0, 1, 2, 3, offset=2), [(0, 4, 4, 0)], 0, 1),
+    ],
+)
+@pytest.mark.parametrize(
+    "convert_ranges", [list, lambda r: I32Vector4Array(*(I32Vector4(*v) for v in r))]
+)
+def test_execute_ranges(
+    render_target, indices, ranges, expected_left, expected_right, convert_ranges
+):
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    shader.execute_ranges(
+        render_target, PrimitiveMode.TRIANGLE_FAN, _create_map(indices), {}, convert_ranges(ranges)
+    )
+
+    left, right = _read_halves(render_target)
+    assert all(c == FVector4(expected_left, expected_left, expected_left, 1) for c in left)
+    assert all(c == FVector4(expected_right, expected_right, expected_right, 1) for c in right)
+
+
+@pytest.mark.parametrize("indices", [(0, 8), lambda: _create_indices(0, 1, 2, 3, 4, 5, 6, 7)])
+def test_execute_ranges_base_instance(render_target, gl_version, indices):
+    if gl_version < (4, 2):
+        pytest.xfail()
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    shader.execute_ranges(
+        render_target,
+        PrimitiveMode.TRIANGLE_FAN,
+        _create_map(indices, brightness=(0, 1)),
+        {},
+        [(0, 4, 0, 1), (4, 4, 0, 0)],
+    )
+
+    left, right = _read_halves(render_target)
+    assert all(c == FVector4(1, 1, 1, 1) for c in left)
+    assert all(c == FVector4(0, 0, 0, 1) for c in right)
+
+
+def test_execute_ranges_instances(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_ranges(
+            render_target,
+            PrimitiveMode.TRIANGLE_FAN,
+            _create_map((0, 8)),
+            {},
+            [(0, 4, 0, 0)],
+            instances=-1,
+        )
+    assert str(excinfo.value) == "instances must be 0 or more"
+
+
+@pytest.mark.parametrize(
+    "indices, ranges, expected_message",
+    [
+        ((0, 8), [(-1, 4, 0, 0)], "range first must be 0 or more"),
+        ((0, 8), [(0, -1, 0, 0)], "range count must be 0 or more"),
+        ((0, 8), [(0, 4, 0, -1)], "range base instance must be 0 or more"),
+        ((0, 8), [(0, 4, -1, 0)], "range first plus base vertex must be 0 or more"),
+        (lambda: _create_indices(0, 1, 2, 3), [(1, 4, 0, 0)], "range goes beyond indices"),
+        ((0, 8), I32Array(0, 4, 0), "ranges must contain 4 values per range"),
+        ((0, 8), [(0, 4, 0)], "ranges must contain 4 values per range"),
+        ((0, 8), [(0, 4, 0, 0, 0)], "ranges must contain 4 values per range"),
+        ((0, 8), [(0, 4, 0, 0), (0, 4, 0)], "ranges must contain 4 values per range"),
+    ],
+)
+def test_execute_ranges_invalid(render_target, indices, ranges, expected_message):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(ValueError) as excinfo:
+        shader.execute_ranges(
+            render_target, PrimitiveMode.TRIANGLE_FAN, _create_map(indices), {}, ranges
+        )
+    assert str(excinfo.value) == expected_message
+
+
+@pytest.mark.parametrize(
+    "ranges", [U32Array(0, 4, 0, 0), bytes(I32Array(0, 4, 0, 0)), memoryview(b"\x00" * 16)]
+)
+def test_execute_ranges_invalid_buffer(render_target, ranges):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    with pytest.raises(TypeError) as excinfo:
+        shader.execute_ranges(
+            render_target, PrimitiveMode.TRIANGLE_FAN, _create_map((0, 8)), {}, ranges
+        )
+    assert str(excinfo.value) == (
+        f"expected {I32Array}, {I32Vector4Array} or iterable of tuples for ranges "
+        f"(got {type(ranges)})"
+    )
@@ -0,0 +1,71 @@
+from ctypes import c_float
+from unittest.mock import patch
+
+from egeometry import IRectangle
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector4
+from emath import IVector2
+
+from egraphics import GBuffer
+from egraphics import GBufferView
+from egraphics import GBufferViewMap
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import pack_std140
+from egraphics import read_color_from_render_target
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+void main()
+{
+    gl_Position = vec4(xy, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+layout(std140) uniform Material
+{
+    vec4 color;
+    float brightness;
+};
+out vec4 FragColor;
+void main()
+{
+    FragColor = vec4(color.rgb * brightness, color.a);
+}
+"""
+
+QUAD = FVector2Array(FVector2(-1, -1), FVector2(-1, 1), FVector2(1, 1), FVector2(1, -1))
+
+
+def _read_colors(render_target):
+    return set(
+        read_color_from_render_target(render_target, IRectangle(IVector2(0), render_target.size))
+    )
+
+
+def test_uniform_block(render_target):
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    buffer_view_map = GBufferViewMap({"xy": GBufferView.from_array(QUAD)}, (0, 4))
+    g_buffer = GBuffer(pack_std140([FVector4(0), c_float(0)]))
+
+    with patch("egraphics._g_buffer_view.GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE", 2):
+        for color, brightness in (
+            (FVector4(1, 0, 0, 1), 1.0),
+            (FVector4(0, 1, 0, 1), 1.0),
+            (FVector4(0, 0, 1, 1), 1.0),
+            (FVector4(1, 1, 1, 1), 0.0),
+            (FVector4(1, 0, 1, 1), 1.0),
+        ):
+            g_buffer.write(pack_std140([color, c_float(brightness)]))
+            clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+            shader.execute(
+                render_target, PrimitiveMode.TRIANGLE_FAN, buffer_view_map, {"Material": g_buffer}
+            )
+            assert _read_colors(render_target) == {
+                FVector4(color.x * brightness, color.y * brightness, color.z * brightness, color.w)
+            }
@@ -0,0 +1,127 @@
+import ctypes
+
+import pytest
+from egeometry import IRectangle
+from emath import DVector2
+from emath import DVector2Array
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector3
+from emath import FVector3Array
+from emath import FVector4
+from emath import FVector4Array
+from emath import IVector2
+
+from egraphics import GBufferView
+from egraphics import GBufferViewFormat
+from egraphics import GBufferViewMap
+from egraphics import PrimitiveMode
+from egraphics import Shader
+from egraphics import clear_render_target
+from egraphics import pack_int_2_10_10_10_rev
+from egraphics import quantize_half_float
+from egraphics import quantize_normalized
+from egraphics import read_color_from_render_target
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+in vec4 color;
+out vec4 vertex_color;
+void main()
+{
+    vertex_color = color;
+    gl_Position = vec4(xy, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+in vec4 vertex_color;
+out vec4 FragColor;
+void main()
+{
+    FragColor = vertex_color;
+}
+"""
+
+QUAD = FVector2Array(FVector2(-1, -1), FVector2(-1, 1), FVector2(1, 1), FVector2(1, -1))
+
+COLOR = FVector4(1, 0, 1, 1)
+
+
+def _default_xy():
+    return GBufferView.from_array(QUAD)
+
+
+def _normalized_xy():
+    return GBufferView.from_array(
+        quantize_normalized(QUAD, ctypes.c_int8), format=GBufferViewFormat.NORMALIZED
+    )
+
+
+def _half_float_xy():
+    return GBufferView.from_array(quantize_half_float(QUAD), format=GBufferViewFormat.HALF_FLOAT)
+
+
+def _packed_xy():
+    return GBufferView.from_array(
+        pack_int_2_10_10_10_rev(FVector3Array(*(FVector3(*v, 0) for v in QUAD))),
+        format=GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV,
+    )
+
+
+@pytest.mark.parametrize("xy", [_default_xy, _normalized_xy, _half_float_xy, _packed_xy])
+def test_vertex_format(render_target, xy):
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    color = GBufferView.from_array(
+        quantize_normalized(FVector4Array(*(COLOR for _ in range(4))), ctypes.c_uint8),
+        format=GBufferViewFormat.NORMALIZED,
+    )
+    shader.execute(
+        render_target,
+        PrimitiveMode.TRIANGLE_FAN,
+        GBufferViewMap({"xy": xy(), "color": color}, (0, 4)),
+        {},
+    )
+
+    colors = read_color_from_render_target(
+        render_target, IRectangle(IVector2(0), render_target.size)
+    )
+    assert all(c == COLOR for c in colors)
+
+
+def test_double_attribute(render_target, gl_version):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    clear_render_target(render_target, color=FVector4(0, 0, 0, 1))
+
+    shader = Shader(
+        vertex=b"""
+        #version 410
+        in dvec2 xy;
+        void main()
+        {
+            gl_Position = vec4(vec2(xy), 0.0, 1.0);
+        }
+        """,
+        fragment=b"""
+        #version 410
+        out vec4 FragColor;
+        void main()
+        {
+            FragColor = vec4(1);
+        }
+        """,
+    )
+    xy = GBufferView.from_array(DVector2Array(*(DVector2(*v) for v in QUAD)))
+    shader.execute(
+        render_target, PrimitiveMode.TRIANGLE_FAN, GBufferViewMap({"xy": xy}, (0, 4)), {}
+    )
+
+    colors = read_color_from_render_target(
+        render_target, IRectangle(IVector2(0), render_target.size)
+    )
+    assert all(c.r == 1 and c.g == 1 and c.b == 1 for c in colors)
@@ -1,12 +1,18 @@
+import asyncio
+import os
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
 from emath import FVector3
+from eplatform import EventLoop
 from OpenGL.GL import GL_ARRAY_BUFFER
 from OpenGL.GL import GL_ARRAY_BUFFER_BINDING
 from OpenGL.GL import GL_BUFFER_SIZE
 from OpenGL.GL import GL_BUFFER_USAGE
 from OpenGL.GL import GL_COPY_READ_BUFFER_BINDING
+from OpenGL.GL import GL_COPY_WRITE_BUFFER_BINDING
 from OpenGL.GL import GL_DYNAMIC_COPY
 from OpenGL.GL import GL_DYNAMIC_DRAW
 from OpenGL.GL import GL_DYNAMIC_READ
@@ -23,7 +29,13 @@ from OpenGL.GL import glIsBuffer
 
 from egraphics import EditGBuffer
 from egraphics import GBuffer
+from egraphics import GBufferAccess
+from egraphics import GBufferMap
+from egraphics import GBufferReadFuture
+from egraphics._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
+from egraphics._egraphics import flush_gl_buffer_target_range
 from egraphics._egraphics import write_gl_buffer_target_data
+from egraphics._egraphics import write_gl_named_buffer_data
 from egraphics._g_buffer import _reset_g_buffer_target_state
 
 
@@ -134,6 +146,486 @@ def test_write(platform):
     assert bytes(g_buffer) == b"\x90\x91\x92"
 
 
+def test_write_many(platform):
+    g_buffer = GBuffer(b"\x00\x00\x00\x00")
+    g_buffer.write_many([])
+    assert bytes(g_buffer) == b"\x00\x00\x00\x00"
+    g_buffer.write_many([(b"\x01", 0), (b"\x02\x03", 2), (b"\x04", 3)])
+    assert bytes(g_buffer) == b"\x01\x00\x02\x04"
+    g_buffer.write_many(iter([(b"\x05", 1)]))
+    assert bytes(g_buffer) == b"\x01\x05\x02\x04"
+
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.write_many([(b"\xff", 0), (b"\xff\xff", 3)])
+    assert str(excinfo.value) == "write would overrun buffer (offset: 3, size: 2, buffer size: 4)"
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.write_many([(b"\xff", 0), (b"\xff", -1)])
+    assert str(excinfo.value) == "write would overrun buffer (offset: -1, size: 1, buffer size: 4)"
+    assert bytes(g_buffer) == b"\x01\x05\x02\x04"
+
+    g_buffer.write_many([[b"\x07", 1], iter((b"\x06", 0))])  # type: ignore
+    assert bytes(g_buffer) == b"\x06\x07\x02\x04"
+
+    with pytest.raises(ValueError):
+        g_buffer.write_many([(b"\x00",)])  # type: ignore
+
+
+def test_map(platform):
+    g_buffer = GBuffer(b"\x00\x01\x02\x03")
+
+    g_buffer_map = g_buffer.map()
+    assert isinstance(g_buffer_map, GBufferMap)
+    assert g_buffer_map.g_buffer is g_buffer
+    assert g_buffer_map.offset == 0
+    assert g_buffer_map.length == 4
+    assert g_buffer_map.access == GBufferAccess.READ | GBufferAccess.WRITE
+    with g_buffer_map as mv:
+        assert bytes(mv) == b"\x00\x01\x02\x03"
+        mv[0] = 9
+    assert bytes(g_buffer) == b"\x09\x01\x02\x03"
+
+    with g_buffer.map(offset=1, length=2, access=GBufferAccess.READ) as mv:
+        assert mv.readonly
+        assert bytes(mv) == b"\x01\x02"
+
+    with g_buffer.map(offset=2, access=GBufferAccess.WRITE | GBufferAccess.INVALIDATE_RANGE) as mv:
+        assert len(mv) == 2
+        mv[:] = b"\x07\x08"
+    assert bytes(g_buffer) == b"\x09\x01\x07\x08"
+
+    with g_buffer.map(offset=4) as mv:
+        assert bytes(mv) == b""
+
+
+def test_map_flush_explicit(platform):
+    g_buffer = GBuffer(b"\x00\x00\x00\x00")
+    g_buffer_map = g_buffer.map(
+        offset=1, access=GBufferAccess.WRITE | GBufferAccess.FLUSH_EXPLICIT
+    )
+    with g_buffer_map as mv:
+        mv[:] = b"\x01\x02\x03"
+        g_buffer_map.flush(offset=1, length=2)
+        g_buffer_map.flush()
+        with pytest.raises(ValueError) as excinfo:
+            g_buffer_map.flush(offset=2, length=2)
+        assert str(excinfo.value) == "flush would overrun map (offset: 2, size: 2, map size: 3)"
+    assert bytes(g_buffer) == b"\x00\x01\x02\x03"
+
+    with pytest.raises(RuntimeError) as excinfo:
+        g_buffer_map.flush()
+    assert str(excinfo.value) == "g buffer map is not active"
+
+    with g_buffer.map():
+        with pytest.raises(RuntimeError) as excinfo:
+            g_buffer.map().flush()
+        assert str(excinfo.value) == "g buffer map is not active"
+
+
+def test_map_flush_not_explicit(platform):
+    g_buffer = GBuffer(1)
+    g_buffer_map = g_buffer.map(access=GBufferAccess.WRITE)
+    with g_buffer_map:
+        with pytest.raises(RuntimeError) as excinfo:
+            g_buffer_map.flush()
+        assert str(excinfo.value) == "g buffer map was not created with FLUSH_EXPLICIT access"
+
+
+def test_map_already_mapped(platform):
+    g_buffer = GBuffer(1)
+    with g_buffer.map():
+        with pytest.raises(RuntimeError) as excinfo:
+            g_buffer.map().__enter__()
+        assert str(excinfo.value) == "g buffer is already mapped"
+        with pytest.raises(RuntimeError) as excinfo:
+            memoryview(g_buffer)
+        assert str(excinfo.value) == "g buffer is already mapped"
+
+    mv = memoryview(g_buffer)
+    with pytest.raises(RuntimeError) as excinfo:
+        g_buffer.map().__enter__()
+    assert str(excinfo.value) == "g buffer is already mapped"
+    del mv
+
+    with g_buffer.map():
+        pass
+
+
+@pytest.mark.parametrize("offset, length", [(-1, None), (0, 5), (4, 1), (2, -1), (5, None)])
+def test_map_overrun(platform, offset, length):
+    g_buffer = GBuffer(4)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.map(offset=offset, length=length)
+    if length is None:
+        length = 4 - offset
+    assert str(excinfo.value) == (
+        f"map would overrun buffer (offset: {offset}, size: {length}, buffer size: 4)"
+    )
+
+
+@pytest.mark.parametrize(
+    "access, message",
+    [
+        (GBufferAccess.INVALIDATE_RANGE, "access must include READ or WRITE"),
+        (GBufferAccess.FLUSH_EXPLICIT, "access must include READ or WRITE"),
+        (
+            GBufferAccess.READ | GBufferAccess.INVALIDATE_RANGE,
+            "READ access cannot be combined with "
+            "INVALIDATE_RANGE, INVALIDATE_BUFFER or UNSYNCHRONIZED",
+        ),
+        (
+            GBufferAccess.READ | GBufferAccess.INVALIDATE_BUFFER,
+            "READ access cannot be combined with "
+            "INVALIDATE_RANGE, INVALIDATE_BUFFER or UNSYNCHRONIZED",
+        ),
+        (
+            GBufferAccess.READ | GBufferAccess.UNSYNCHRONIZED,
+            "READ access cannot be combined with "
+            "INVALIDATE_RANGE, INVALIDATE_BUFFER or UNSYNCHRONIZED",
+        ),
+        (
+            GBufferAccess.READ | GBufferAccess.FLUSH_EXPLICIT,
+            "FLUSH_EXPLICIT access requires WRITE",
+        ),
+    ],
+)
+def test_map_invalid_access(platform, access, message):
+    g_buffer = GBuffer(4)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.map(access=access)
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize("data", [b"\x04\x05\x06", b"\x07", b"\x08\x09\x0a\x0b", b""])
+def test_replace(platform, data):
+    g_buffer = GBuffer(b"\x01\x02\x03", frequency=GBuffer.Frequency.STREAM)
+    gl_buffer = g_buffer._gl_buffer
+    g_buffer.replace(data)
+    assert g_buffer._gl_buffer == gl_buffer
+    assert len(g_buffer) == len(data)
+    assert bytes(g_buffer) == data
+
+    GBuffer.Target.ARRAY.g_buffer = g_buffer
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_SIZE) == len(data)
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_USAGE) == GL_STREAM_DRAW
+
+
+def test_replace_length(platform):
+    g_buffer = GBuffer(b"\x01\x02\x03")
+    g_buffer.replace(5)
+    assert len(g_buffer) == 5
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.replace(-1)
+    assert str(excinfo.value) == "data must be 0 or more"
+
+
+@pytest.mark.parametrize(
+    "length, expected_prefix",
+    [(3, b"\x01\x02\x03"), (2, b"\x01\x02"), (5, b"\x01\x02\x03"), (0, b"")],
+)
+def test_resize(platform, length, expected_prefix):
+    g_buffer = GBuffer(b"\x01\x02\x03")
+    gl_buffer = g_buffer._gl_buffer
+    g_buffer.resize(length)
+    assert g_buffer._gl_buffer == gl_buffer
+    assert len(g_buffer) == length
+    assert bytes(g_buffer)[: len(expected_prefix)] == expected_prefix
+
+
+def test_resize_from_empty(platform):
+    g_buffer = GBuffer(0)
+    g_buffer.resize(4)
+    assert len(g_buffer) == 4
+
+
+def test_resize_invalid_length(platform):
+    g_buffer = GBuffer(1)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.resize(-1)
+    assert str(excinfo.value) == "length must be 0 or more"
+
+
+def test_replace_resize_mapped(platform):
+    g_buffer = GBuffer(4)
+    with g_buffer.map():
+        with pytest.raises(RuntimeError) as excinfo:
+            g_buffer.replace(b"")
+        assert str(excinfo.value) == "g buffer is mapped"
+        with pytest.raises(RuntimeError) as excinfo:
+            g_buffer.resize(1)
+        assert str(excinfo.value) == "g buffer is mapped"
+
+    mv = memoryview(g_buffer)
+    with pytest.raises(RuntimeError) as excinfo:
+        g_buffer.resize(1)
+    assert str(excinfo.value) == "g buffer is mapped"
+    del mv
+
+
+def test_copy_to(platform):
+    src = GBuffer(b"\x01\x02\x03\x04")
+    dst = GBuffer(b"\x00\x00\x00")
+
+    src.copy_to(dst)
+    assert bytes(dst) == b"\x01\x02\x03"
+
+    src.copy_to(dst, src_offset=3, dst_offset=1, size=1)
+    assert bytes(dst) == b"\x01\x04\x03"
+
+    src.copy_to(dst, size=0)
+    assert bytes(dst) == b"\x01\x04\x03"
+
+    src.copy_to(src, src_offset=0, dst_offset=2, size=2)
+    assert bytes(src) == b"\x01\x02\x01\x02"
+
+
+@pytest.mark.parametrize(
+    "src_offset, dst_offset, size, message",
+    [
+        (-1, 0, 1, "copy would overrun source buffer (offset: -1, size: 1, buffer size: 4)"),
+        (0, 0, 5, "copy would overrun source buffer (offset: 0, size: 5, buffer size: 4)"),
+        (0, 0, -1, "copy would overrun source buffer (offset: 0, size: -1, buffer size: 4)"),
+        (0, -1, 1, "copy would overrun destination buffer (offset: -1, size: 1, buffer size: 3)"),
+        (0, 0, 4, "copy would overrun destination buffer (offset: 0, size: 4, buffer size: 3)"),
+    ],
+)
+def test_copy_to_invalid(platform, src_offset, dst_offset, size, message):
+    src = GBuffer(4)
+    dst = GBuffer(3)
+    with pytest.raises(ValueError) as excinfo:
+        src.copy_to(dst, src_offset=src_offset, dst_offset=dst_offset, size=size)
+    assert str(excinfo.value) == message
+    with pytest.raises(ValueError) as excinfo:
+        src.copy_to_many(dst, [(0, 0, 1), (src_offset, dst_offset, size)])
+    assert str(excinfo.value) == message
+
+
+def test_copy_to_overlap(platform):
+    g_buffer = GBuffer(4)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.copy_to(g_buffer, src_offset=0, dst_offset=1, size=2)
+    assert str(excinfo.value) == "copy source and destination overlap"
+
+
+def test_copy_to_many(platform):
+    src = GBuffer(b"\x01\x02\x03\x04")
+    dst = GBuffer(b"\x00\x00\x00\x00\x00")
+    src.copy_to_many(dst, [(0, 4, 1), (2, 0, 2), (1, 2, 0)])
+    assert bytes(dst) == b"\x03\x04\x00\x00\x01"
+    src.copy_to_many(dst, [])
+    assert bytes(dst) == b"\x03\x04\x00\x00\x01"
+
+
+def test_copy_to_mapped(platform):
+    src = GBuffer(1)
+    dst = GBuffer(1)
+    with src.map():
+        with pytest.raises(RuntimeError) as excinfo:
+            src.copy_to(dst)
+        assert str(excinfo.value) == "g buffer is mapped"
+        with pytest.raises(RuntimeError) as excinfo:
+            dst.copy_to(src)
+        assert str(excinfo.value) == "g buffer is mapped"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (b"\xab", b"\x00\xab\xab\xab" + b"\xab" * 12),
+        (b"\x01\x02", b"\x00\x00\x01\x02" + b"\x01\x02" * 6),
+        (b"\x01\x02\x03\x04", b"\x00\x00\x00\x00" + b"\x01\x02\x03\x04" * 3),
+    ],
+)
+def test_fill(platform, value, expected):
+    g_buffer = GBuffer(b"\x00" * 16)
+    g_buffer.fill(value, offset=4)
+    if len(value) == 1:
+        g_buffer.fill(value, offset=1, size=3)
+    assert bytes(g_buffer) == expected
+
+
+def test_fill_many(platform):
+    g_buffer = GBuffer(b"\x00" * 8)
+    g_buffer.fill_many(b"\x01\x02", [(0, 2), (4, 4), (6, 0)])
+    assert bytes(g_buffer) == b"\x01\x02\x00\x00\x01\x02\x01\x02"
+    g_buffer.fill_many(b"\xff", [])
+    assert bytes(g_buffer) == b"\x01\x02\x00\x00\x01\x02\x01\x02"
+
+
+def test_direct_state_access_does_not_bind(platform):
+    if not GL_DIRECT_STATE_ACCESS_SUPPORTED:
+        pytest.xfail()
+    GBuffer.Target.ARRAY.g_buffer = None
+    GBuffer.Target.COPY_READ.g_buffer = None
+    GBuffer.Target.COPY_WRITE.g_buffer = None
+
+    g_buffer = GBuffer(b"\x00" * 8)
+    other = GBuffer(8)
+    g_buffer.write(b"\x01\x02", offset=2)
+    g_buffer.write_many([(b"\x03", 0), (b"\x04", 7)])
+    g_buffer.copy_to(other)
+    other.fill(b"\xff", offset=4, size=4)
+    with other.map(access=GBufferAccess.WRITE) as memory:
+        memory[0] = 5
+    g_buffer.replace(b"\x06")
+    assert bytes(g_buffer) == b"\x06"
+    assert bytes(other) == b"\x05\x00\x01\x02\xff\xff\xff\xff"
+
+    assert glGetIntegerv(GL_ARRAY_BUFFER_BINDING) == 0
+    assert glGetIntegerv(GL_COPY_READ_BUFFER_BINDING) == 0
+    assert glGetIntegerv(GL_COPY_WRITE_BUFFER_BINDING) == 0
+
+
+def test_direct_state_access_not_supported():
+    process = subprocess.Popen(
+        [sys.executable, "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=os.environ | {"EGRAPHICS_GL_DIRECT_STATE_ACCESS": "disabled"},
+    )
+    out, err = process.communicate(
+        """
+import os
+
+if hasattr(os, "add_dll_directory"):
+    os.add_dll_directory(os.getcwd() + "/vendor/SDL")
+
+from egraphics import EditGBuffer, GBuffer
+from egraphics._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
+from eplatform import Platform, OpenGlWindow
+
+assert not GL_DIRECT_STATE_ACCESS_SUPPORTED
+
+with Platform(window_cls=OpenGlWindow):
+    g_buffer = GBuffer(b"\\x00" * 8)
+    g_buffer.write(b"\\x01\\x02", offset=2)
+    g_buffer.write_many([(b"\\x03", 0), (b"\\x04", 7)])
+    edit_g_buffer = EditGBuffer(g_buffer)
+    edit_g_buffer.write(b"\\x05", offset=1)
+    edit_g_buffer.flush()
+    other = GBuffer(8)
+    g_buffer.copy_to(other)
+    other.fill(b"\\xff", offset=4, size=4)
+    assert bytes(other) == b"\\x03\\x05\\x01\\x02\\xff\\xff\\xff\\xff"
+    """.encode("utf8")
+    )
+    assert process.returncode == 0, (out, err)
+
+
+def test_fill_clear_buffer_not_supported():
+    process = subprocess.Popen(
+        [sys.executable, "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=os.environ | {"EGRAPHICS_GL_CLEAR_BUFFER": "disabled"},
+    )
+    out, err = process.communicate(
+        """
+import os
+
+if hasattr(os, "add_dll_directory"):
+    os.add_dll_directory(os.getcwd() + "/vendor/SDL")
+
+from egraphics import GBuffer
+from eplatform import Platform, OpenGlWindow
+
+with Platform(window_cls=OpenGlWindow):
+    g_buffer = GBuffer(b"\\x00" * 12)
+    g_buffer.fill_many(b"\\x01\\x02", [(0, 2), (6, 6)])
+    assert bytes(g_buffer) == b"\\x01\\x02\\x00\\x00\\x00\\x00" + b"\\x01\\x02" * 3
+    """.encode("utf8")
+    )
+    assert process.returncode == 0, (out, err)
+
+
+@pytest.mark.parametrize("value_size", [0, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 17])
+def test_fill_invalid_value(platform, value_size):
+    g_buffer = GBuffer(64)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.fill(b"\x00" * value_size)
+    assert str(excinfo.value) == "value size must be 1, 2, 4, 8, 12 or 16 bytes"
+
+
+@pytest.mark.parametrize(
+    "offset, size, message",
+    [
+        (-4, 4, "fill would overrun buffer (offset: -4, size: 4, buffer size: 8)"),
+        (4, 8, "fill would overrun buffer (offset: 4, size: 8, buffer size: 8)"),
+        (0, -4, "fill would overrun buffer (offset: 0, size: -4, buffer size: 8)"),
+        (1, 4, "fill offset and size must be multiples of the value size"),
+        (0, 3, "fill offset and size must be multiples of the value size"),
+    ],
+)
+def test_fill_invalid_range(platform, offset, size, message):
+    g_buffer = GBuffer(8)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.fill(b"\x00\x00\x00\x00", offset=offset, size=size)
+    assert str(excinfo.value) == message
+
+
+def test_read_async(platform):
+    g_buffer = GBuffer(b"\x01\x02\x03\x04")
+    future = g_buffer.read_async(offset=1, size=2)
+    assert isinstance(future, GBufferReadFuture)
+    g_buffer.write(b"\x00\x00\x00\x00")
+
+    staging = future.result()
+    assert future.done()
+    assert future._fence is None
+    assert isinstance(staging, GBuffer)
+    assert staging.frequency == GBuffer.Frequency.STREAM
+    assert staging.nature == GBuffer.Nature.READ
+    assert bytes(staging) == b"\x02\x03"
+    assert future.result() is staging
+
+
+def test_read_async_defaults(platform):
+    g_buffer = GBuffer(b"\x01\x02\x03")
+    assert bytes(g_buffer.read_async().result()) == b"\x01\x02\x03"
+    assert bytes(g_buffer.read_async(offset=1).result()) == b"\x02\x03"
+    assert bytes(g_buffer.read_async(offset=3).result()) == b""
+
+
+def test_read_async_await(platform):
+    g_buffer = GBuffer(b"\x01\x02\x03")
+    result = None
+
+    async def test():
+        nonlocal result
+        result = await g_buffer.read_async()
+
+    loop = EventLoop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(test())
+    assert bytes(result) == b"\x01\x02\x03"
+
+
+def test_read_async_poll(platform):
+    g_buffer = GBuffer(b"\x01\x02\x03")
+    future = g_buffer.read_async()
+    while not future.done():
+        pass
+    assert bytes(future.result()) == b"\x01\x02\x03"
+
+
+@pytest.mark.parametrize(
+    "offset, size, message",
+    [
+        (-1, 1, "read would overrun buffer (offset: -1, size: 1, buffer size: 3)"),
+        (0, 4, "read would overrun buffer (offset: 0, size: 4, buffer size: 3)"),
+        (1, -1, "read would overrun buffer (offset: 1, size: -1, buffer size: 3)"),
+        (4, None, "read would overrun buffer (offset: 4, size: -1, buffer size: 3)"),
+    ],
+)
+def test_read_async_invalid(platform, offset, size, message):
+    g_buffer = GBuffer(3)
+    with pytest.raises(ValueError) as excinfo:
+        g_buffer.read_async(offset=offset, size=size)
+    assert str(excinfo.value) == message
+
+
+@patch("egraphics._g_buffer.GL_DIRECT_STATE_ACCESS_SUPPORTED", False)
 @patch("egraphics._g_buffer.write_gl_buffer_target_data")
 def test_edit(write_gl_buffer_target_data_mock, platform):
     write_gl_buffer_target_data_mock.side_effect = write_gl_buffer_target_data
@@ -202,11 +694,110 @@ def test_edit(write_gl_buffer_target_data_mock, platform):
     assert write_gl_buffer_target_data_mock.call_count == 1
 
 
+@patch("egraphics._g_buffer.write_gl_buffer_target_data")
+@patch("egraphics._g_buffer.write_gl_named_buffer_data")
+def test_edit_direct_state_access(
+    write_gl_named_buffer_data_mock, write_gl_buffer_target_data_mock, platform
+):
+    if not GL_DIRECT_STATE_ACCESS_SUPPORTED:
+        pytest.xfail()
+    write_gl_named_buffer_data_mock.side_effect = write_gl_named_buffer_data
+
+    g_buffer = GBuffer(b"\x00\x00\x00\x00")
+    edit_g_buffer = EditGBuffer(g_buffer)
+    edit_g_buffer.write(b"\x01", offset=0)
+    edit_g_buffer.write(b"\x02", offset=1)
+    edit_g_buffer.write(b"\x04", offset=3)
+    edit_g_buffer.flush()
+    assert bytes(g_buffer) == b"\x01\x02\x00\x04"
+    assert write_gl_named_buffer_data_mock.call_count == 2
+    assert write_gl_buffer_target_data_mock.call_count == 0
+
+
+def test_edit_defaults(platform):
+    g_buffer = GBuffer(1)
+    edit_g_buffer = EditGBuffer(g_buffer)
+    assert edit_g_buffer.g_buffer is g_buffer
+    assert not edit_g_buffer.mapped
+    assert not edit_g_buffer.unsynchronized
+
+
+def test_edit_invalid_unsynchronized(platform):
+    g_buffer = GBuffer(1)
+    with pytest.raises(ValueError) as excinfo:
+        EditGBuffer(g_buffer, unsynchronized=True)
+    assert str(excinfo.value) == "unsynchronized requires mapped"
+
+
+@patch("egraphics._g_buffer.GL_DIRECT_STATE_ACCESS_SUPPORTED", False)
+@patch("egraphics._g_buffer.flush_gl_buffer_target_range")
+@patch("egraphics._g_buffer.write_gl_buffer_target_data")
+def test_edit_mapped(write_gl_buffer_target_data_mock, flush_mock, platform):
+    flush_mock.side_effect = flush_gl_buffer_target_range
+
+    g_buffer = GBuffer(b"\x00" * 8)
+    edit_g_buffer = EditGBuffer(g_buffer, mapped=True)
+    assert edit_g_buffer.mapped
+
+    edit_g_buffer.flush()
+    assert flush_mock.call_count == 0
+
+    edit_g_buffer.write(b"\x01\x02\x03")
+    edit_g_buffer.write(b"\x04", offset=3)
+    edit_g_buffer.write(b"\x05", offset=6)
+    assert bytes(g_buffer) == b"\x00" * 8
+    edit_g_buffer.flush()
+    assert bytes(g_buffer) == b"\x01\x02\x03\x04\x00\x00\x05\x00"
+    assert flush_mock.call_count == 2
+    assert write_gl_buffer_target_data_mock.call_count == 0
+
+    flush_mock.reset_mock()
+    edit_g_buffer.write(b"\xaa\xaa\xaa", offset=1)
+    edit_g_buffer.write(b"\xbb", offset=2)
+    edit_g_buffer.write(b"\xcc\xcc", offset=0)
+    edit_g_buffer.flush()
+    assert bytes(g_buffer) == b"\xcc\xcc\xbb\xaa\x00\x00\x05\x00"
+    assert flush_mock.call_count == 1
+
+    flush_mock.reset_mock()
+    edit_g_buffer.write(b"\xff", offset=0)
+    edit_g_buffer.write(b"\xff\xff", offset=7)
+    with pytest.raises(ValueError) as excinfo:
+        edit_g_buffer.flush()
+    assert str(excinfo.value) == "write would overrun buffer (offset: 7, size: 2, buffer size: 8)"
+    assert bytes(g_buffer) == b"\xcc\xcc\xbb\xaa\x00\x00\x05\x00"
+    assert flush_mock.call_count == 0
+
+    edit_g_buffer.clear()
+    edit_g_buffer.write(b"", offset=8)
+    edit_g_buffer.flush()
+    assert flush_mock.call_count == 0
+
+
+@pytest.mark.parametrize("unsynchronized", [False, True])
+def test_edit_mapped_access(platform, unsynchronized):
+    g_buffer = GBuffer(b"\x00" * 4)
+    edit_g_buffer = EditGBuffer(g_buffer, mapped=True, unsynchronized=unsynchronized)
+    assert edit_g_buffer.unsynchronized == unsynchronized
+
+    edit_g_buffer.write(b"\x01", offset=1)
+    edit_g_buffer.write(b"\x03", offset=3)
+    with patch.object(GBuffer, "map", autospec=True, side_effect=GBuffer.map) as map_mock:
+        edit_g_buffer.flush()
+    assert bytes(g_buffer) == b"\x00\x01\x00\x03"
+
+    expected_access = GBufferAccess.WRITE | GBufferAccess.FLUSH_EXPLICIT
+    if unsynchronized:
+        expected_access |= GBufferAccess.UNSYNCHRONIZED
+    map_mock.assert_called_once_with(g_buffer, offset=1, length=3, access=expected_access)
+
+
 @pytest.mark.parametrize(
     "name, buffer_binding",
     [
         ("ARRAY", GL_ARRAY_BUFFER_BINDING),
         ("COPY_READ", GL_COPY_READ_BUFFER_BINDING),
+        ("COPY_WRITE", GL_COPY_WRITE_BUFFER_BINDING),
         ("SHADER_STORAGE", GL_SHADER_STORAGE_BUFFER_BINDING),
     ],
 )
@@ -223,6 +814,7 @@ def test_g_buffer_target_default_state(platform, gl_version, name, buffer_bindin
     [
         ("ARRAY", GL_ARRAY_BUFFER_BINDING),
         ("COPY_READ", GL_COPY_READ_BUFFER_BINDING),
+        ("COPY_WRITE", GL_COPY_WRITE_BUFFER_BINDING),
         ("SHADER_STORAGE", GL_SHADER_STORAGE_BUFFER_BINDING),
     ],
 )
@@ -243,6 +835,7 @@ def test_g_buffer_reset(platform, gl_version):
     g_buffer = GBuffer(0)
     GBuffer.Target.ARRAY.g_buffer = g_buffer
     GBuffer.Target.COPY_READ.g_buffer = g_buffer
+    GBuffer.Target.COPY_WRITE.g_buffer = g_buffer
     if gl_version >= (4, 3):
         GBuffer.Target.SHADER_STORAGE.g_buffer = g_buffer
 
@@ -250,5 +843,6 @@ def test_g_buffer_reset(platform, gl_version):
 
     assert GBuffer.Target.ARRAY.g_buffer is None
     assert GBuffer.Target.COPY_READ.g_buffer is None
+    assert GBuffer.Target.COPY_WRITE.g_buffer is None
     if gl_version >= (4, 3):
         assert GBuffer.Target.SHADER_STORAGE.g_buffer is None
@@ -0,0 +1,162 @@
+import ctypes
+
+import emath
+import pytest
+
+from egraphics import GBuffer
+from egraphics import GBufferHeap
+from egraphics import GBufferView
+
+
+def test_defaults(platform):
+    heap = GBufferHeap(16)
+    assert heap.page_size == 16
+    assert heap.alignment == 4
+    assert heap.frequency == GBuffer.Frequency.STATIC
+    assert heap.nature == GBuffer.Nature.DRAW
+    assert heap.g_buffers == ()
+    assert heap.size == 0
+    assert heap.used == 0
+    assert heap.available == 0
+    assert heap.largest_available == 0
+    assert heap.fragmentation == 0.0
+
+
+@pytest.mark.parametrize("page_size", [-1, 0])
+def test_invalid_page_size(platform, page_size):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferHeap(page_size)
+    assert str(excinfo.value) == "page size must be greater than 0"
+
+
+@pytest.mark.parametrize("alignment", [-1, 0])
+def test_invalid_alignment(platform, alignment):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferHeap(16, alignment=alignment)
+    assert str(excinfo.value) == "alignment must be greater than 0"
+
+
+def test_allocate(platform):
+    heap = GBufferHeap(16, frequency=GBuffer.Frequency.DYNAMIC)
+
+    view = heap.allocate(ctypes.c_uint8, 3, instancing_divisor=2)
+    assert isinstance(view, GBufferView)
+    assert view.data_type is ctypes.c_uint8
+    assert view.offset == 0
+    assert view.length == 3
+    assert view.instancing_divisor == 2
+    assert len(heap.g_buffers) == 1
+    assert view.g_buffer is heap.g_buffers[0]
+    assert view.g_buffer.frequency == GBuffer.Frequency.DYNAMIC
+    assert len(view.g_buffer) == 16
+    assert heap.used == 3
+    assert heap.available == 13
+
+    view = heap.allocate(ctypes.c_float, 8, stride=8)
+    assert view.offset == 4
+    assert view.stride == 8
+    assert view.g_buffer is heap.g_buffers[0]
+
+    view = heap.allocate(ctypes.c_uint8, 8)
+    assert view.offset == 0
+    assert len(heap.g_buffers) == 2
+    assert view.g_buffer is heap.g_buffers[1]
+
+    view = heap.allocate(ctypes.c_uint8, 32)
+    assert view.offset == 0
+    assert len(heap.g_buffers) == 3
+    assert len(view.g_buffer) == 32
+
+    with pytest.raises(ValueError) as excinfo:
+        heap.allocate(ctypes.c_uint8, -1)
+    assert str(excinfo.value) == "length must be 0 or greater"
+
+
+def test_write(platform):
+    heap = GBufferHeap(16)
+    view = heap.write(emath.FVector2Array(emath.FVector2(1, 2)), emath.FVector2)
+    assert view.offset == 0
+    assert view.length == 8
+    assert list(view) == [emath.FVector2(1, 2)]
+
+    view = heap.write(b"\x01\x02", ctypes.c_uint8)
+    assert view.offset == 8
+    assert list(view) == [1, 2]
+
+
+def test_free(platform):
+    heap = GBufferHeap(16)
+    a = heap.allocate(ctypes.c_uint8, 4)
+    b = heap.allocate(ctypes.c_uint8, 4)
+    c = heap.allocate(ctypes.c_uint8, 4)
+    assert heap.available == 4
+
+    heap.free(b)
+    assert heap.available == 8
+    assert heap.largest_available == 4
+    assert heap.fragmentation == 0.5
+
+    heap.free(a)
+    assert heap.largest_available == 8
+    assert heap.fragmentation == 0.5
+
+    assert heap.allocate(ctypes.c_uint8, 8).offset == 0
+    assert heap.fragmentation == 0.0
+
+    with pytest.raises(ValueError) as excinfo:
+        heap.free(a)
+    assert str(excinfo.value) == "g buffer view was not allocated by this heap"
+
+    with pytest.raises(ValueError) as excinfo:
+        heap.free(GBufferView(GBuffer(1), ctypes.c_uint8))
+    assert str(excinfo.value) == "g buffer view was not allocated by this heap"
+
+    heap.free(c)
+    assert len(heap.g_buffers) == 1
+
+
+def test_free_releases_empty_page(platform):
+    heap = GBufferHeap(4)
+    a = heap.allocate(ctypes.c_uint8, 4)
+    b = heap.allocate(ctypes.c_uint8, 4)
+    assert len(heap.g_buffers) == 2
+    heap.free(a)
+    assert heap.g_buffers == (b.g_buffer,)
+    heap.free(b)
+    assert heap.g_buffers == ()
+    assert heap.size == 0
+
+
+def test_defragment(platform):
+    heap = GBufferHeap(16)
+    a = heap.write(b"\x01\x01\x01\x01", ctypes.c_uint8)
+    b = heap.write(b"\x02\x02\x02\x02", ctypes.c_uint8)
+    c = heap.write(b"\x03\x03", ctypes.c_uint8)
+    d = heap.write(b"\x04\x04\x04\x04", ctypes.c_uint8, stride=2)
+    heap.free(a)
+    heap.free(c)
+    assert heap.fragmentation == 0.5
+
+    moved = heap.defragment()
+    assert set(moved.keys()) == {b, d}
+    new_b = moved[b]
+    new_d = moved[d]
+    assert new_b.g_buffer is b.g_buffer
+    assert new_b.offset == 0
+    assert list(new_b) == [2, 2, 2, 2]
+    assert new_d.offset == 4
+    assert new_d.stride == 2
+    assert list(new_d) == [4, 4]
+    assert heap.fragmentation == 0.0
+    assert heap.available == 8
+    assert heap.largest_available == 8
+
+    heap.free(new_b)
+    with pytest.raises(ValueError):
+        heap.free(b)
+    moved = heap.defragment()
+    assert set(moved.keys()) == {new_d}
+    assert moved[new_d].offset == 0
+    assert list(moved[new_d]) == [4, 4]
+
+    assert heap.defragment() == {}
@@ -0,0 +1,199 @@
+import ctypes
+
+import emath
+import pytest
+from OpenGL.GL import GL_ARRAY_BUFFER
+from OpenGL.GL import GL_BUFFER_ACCESS_FLAGS
+from OpenGL.GL import GL_BUFFER_IMMUTABLE_STORAGE
+from OpenGL.GL import GL_BUFFER_MAPPED
+from OpenGL.GL import GL_BUFFER_SIZE
+from OpenGL.GL import GL_MAP_COHERENT_BIT
+from OpenGL.GL import GL_MAP_PERSISTENT_BIT
+from OpenGL.GL import GL_MAP_READ_BIT
+from OpenGL.GL import GL_MAP_WRITE_BIT
+from OpenGL.GL import glGetBufferParameteriv
+
+from egraphics import GBuffer
+from egraphics import GBufferRing
+from egraphics import GBufferView
+
+
+@pytest.fixture
+def gl_buffer_storage(gl_version):
+    if gl_version < (4, 4):
+        pytest.xfail()
+
+
+def test_defaults(platform, gl_buffer_storage):
+    ring = GBufferRing(16)
+    assert ring.frame_size == 16
+    assert ring.frames == 3
+    assert ring.frame == 0
+    assert ring.alignment == 4
+    assert ring.available == 16
+    assert isinstance(ring.g_buffer, GBuffer)
+    assert len(ring.g_buffer) == 48
+    assert ring.g_buffer.frequency == GBuffer.Frequency.STREAM
+    assert ring.g_buffer.nature == GBuffer.Nature.DRAW
+
+    GBuffer.Target.ARRAY.g_buffer = ring.g_buffer
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_SIZE) == 48
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_IMMUTABLE_STORAGE)
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_MAPPED)
+    assert glGetBufferParameteriv(GL_ARRAY_BUFFER, GL_BUFFER_ACCESS_FLAGS) == (
+        GL_MAP_READ_BIT | GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+    )
+
+
+@pytest.mark.parametrize("frame_size", [-1, 0])
+def test_invalid_frame_size(platform, frame_size):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferRing(frame_size)
+    assert str(excinfo.value) == "frame size must be greater than 0"
+
+
+@pytest.mark.parametrize("frames", [-1, 0])
+def test_invalid_frames(platform, frames):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferRing(16, frames=frames)
+    assert str(excinfo.value) == "frames must be greater than 0"
+
+
+@pytest.mark.parametrize("alignment", [-1, 0])
+def test_invalid_alignment(platform, alignment):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferRing(16, alignment=alignment)
+    assert str(excinfo.value) == "alignment must be greater than 0"
+
+
+def test_allocate(platform, gl_buffer_storage):
+    ring = GBufferRing(16, frames=2)
+
+    view = ring.allocate(ctypes.c_uint8, 3, instancing_divisor=2)
+    assert isinstance(view, GBufferView)
+    assert view.g_buffer is ring.g_buffer
+    assert view.data_type is ctypes.c_uint8
+    assert view.offset == 0
+    assert view.length == 3
+    assert view.instancing_divisor == 2
+    assert ring.available == 13
+
+    view = ring.allocate(ctypes.c_float, 4, stride=8)
+    assert view.offset == 4
+    assert view.length == 4
+    assert view.stride == 8
+    assert ring.available == 8
+
+    view = ring.allocate(ctypes.c_uint8, 8)
+    assert view.offset == 8
+    assert ring.available == 0
+
+    with pytest.raises(RuntimeError) as excinfo:
+        ring.allocate(ctypes.c_uint8, 1)
+    assert str(excinfo.value) == "not enough space left in frame"
+
+    view = ring.allocate(ctypes.c_uint8, 0)
+    assert view.length == 0
+
+    with pytest.raises(ValueError) as excinfo:
+        ring.allocate(ctypes.c_uint8, -1)
+    assert str(excinfo.value) == "length must be 0 or greater"
+
+
+def test_write(platform, gl_buffer_storage):
+    ring = GBufferRing(16, frames=2)
+
+    view = ring.write(emath.FVector2Array(emath.FVector2(1, 2)), emath.FVector2)
+    assert view.offset == 0
+    assert view.length == 8
+    assert view.to_array() == emath.FVector2Array(emath.FVector2(1, 2))
+
+    view = ring.write(b"\x01\x02", ctypes.c_uint8)
+    assert view.offset == 8
+    assert view.to_array() == emath.U8Array(1, 2)
+
+    ring.advance()
+    view = ring.write(b"\x03", ctypes.c_uint8)
+    assert view.offset == 16
+    assert view.to_array() == emath.U8Array(3)
+    assert bytes(ring.g_buffer.read_async(offset=16, size=1).result()) == b"\x03"
+
+    with pytest.raises(RuntimeError) as excinfo:
+        ring.write(b"\x00" * 16, ctypes.c_uint8)
+    assert str(excinfo.value) == "not enough space left in frame"
+
+
+def test_advance(platform, gl_buffer_storage):
+    ring = GBufferRing(8, frames=3)
+
+    ring.allocate(ctypes.c_uint8, 8)
+    assert ring.available == 0
+    assert ring._fences == [None, None, None]
+
+    ring.advance()
+    assert ring.frame == 1
+    assert ring.available == 8
+    assert ring._fences[0] is not None
+    assert ring._fences[1] is None
+    assert ring._fences[2] is None
+    assert ring.allocate(ctypes.c_uint8, 1).offset == 8
+
+    ring.advance()
+    assert ring.frame == 2
+    assert ring.allocate(ctypes.c_uint8, 1).offset == 16
+
+    ring.advance()
+    assert ring.frame == 0
+    assert ring._fences[0] is None
+    assert ring._fences[1] is not None
+    assert ring._fences[2] is not None
+    assert ring.allocate(ctypes.c_uint8, 1).offset == 0
+
+
+def test_advance_single_frame(platform, gl_buffer_storage):
+    ring = GBufferRing(8, frames=1)
+    ring.allocate(ctypes.c_uint8, 8)
+    ring.advance()
+    assert ring.frame == 0
+    assert ring.available == 8
+    assert ring._fences == [None]
+
+
+def test_g_buffer_write(platform, gl_buffer_storage):
+    ring = GBufferRing(4, frames=1)
+    ring.g_buffer.write(b"\x00\x00\x00\x00")
+    ring.g_buffer.write(b"\x01\x02", offset=1)
+    assert bytes(ring.g_buffer.read_async().result()) == b"\x00\x01\x02\x00"
+    with pytest.raises(ValueError) as excinfo:
+        ring.g_buffer.write(b"\xff", offset=4)
+    assert str(excinfo.value) == "write would overrun buffer (offset: 4, size: 1, buffer size: 4)"
+    with pytest.raises(ValueError) as excinfo:
+        ring.g_buffer.write(b"\xff", offset=-1)
+    assert str(excinfo.value) == "write would overrun buffer (offset: -1, size: 1, buffer size: 4)"
+
+
+def test_g_buffer_map(platform, gl_buffer_storage):
+    ring = GBufferRing(4, frames=1)
+    with pytest.raises(RuntimeError) as excinfo:
+        ring.g_buffer.map()
+    assert str(excinfo.value) == "g buffer is persistently mapped"
+
+
+def test_g_buffer_replace_resize(platform, gl_buffer_storage):
+    ring = GBufferRing(4, frames=1)
+    with pytest.raises(RuntimeError) as excinfo:
+        ring.g_buffer.replace(b"")
+    assert str(excinfo.value) == "g buffer storage is immutable"
+    with pytest.raises(RuntimeError) as excinfo:
+        ring.g_buffer.resize(8)
+    assert str(excinfo.value) == "g buffer storage is immutable"
+
+
+def test_g_buffer_write_many(platform, gl_buffer_storage):
+    ring = GBufferRing(4, frames=1)
+    ring.g_buffer.write_many([(b"\x00\x00\x00\x00", 0), (b"\x01\x02", 1)])
+    assert bytes(ring.g_buffer.read_async().result()) == b"\x00\x01\x02\x00"
+    with pytest.raises(ValueError) as excinfo:
+        ring.g_buffer.write_many([(b"\xff", 0), (b"\xff", 4)])
+    assert str(excinfo.value) == "write would overrun buffer (offset: 4, size: 1, buffer size: 4)"
+    assert bytes(ring.g_buffer.read_async().result()) == b"\x00\x01\x02\x00"
@@ -5,13 +5,18 @@ from unittest.mock import patch
 import emath
 import pytest
 from OpenGL.GL import GL_SHADER_STORAGE_BUFFER_BINDING
+from OpenGL.GL import GL_UNIFORM_BUFFER_BINDING
 from OpenGL.GL import glGetIntegeri_v
 
 from egraphics import GBuffer
+from egraphics import GBufferRing
 from egraphics import GBufferView
+from egraphics import GBufferViewFormat
 from egraphics._g_buffer import get_g_buffer_gl_buffer
+from egraphics._g_buffer_view import _BUFFER_VIEW_TYPE_TO_ARRAY
 from egraphics._g_buffer_view import _get_size_of_bvt
 from egraphics._g_buffer_view import bind_g_buffer_view_shader_storage_buffer_unit
+from egraphics._g_buffer_view import bind_g_buffer_view_uniform_buffer_unit
 
 VIEW_DATA_TYPES = (
     ctypes.c_float,
@@ -88,9 +93,46 @@ def test_init_defaults(platform, data_type):
     assert view.length == len(buffer)
     assert view.offset == 0
     assert view.instancing_divisor is None
+    assert view.format == GBufferViewFormat.DEFAULT
     assert len(view) == 0
 
 
+@pytest.mark.parametrize(
+    "format, data_type",
+    [
+        (GBufferViewFormat.NORMALIZED, ctypes.c_int8),
+        (GBufferViewFormat.NORMALIZED, ctypes.c_uint32),
+        (GBufferViewFormat.NORMALIZED, emath.U8Vector4),
+        (GBufferViewFormat.NORMALIZED, emath.I16Vector3),
+        (GBufferViewFormat.HALF_FLOAT, ctypes.c_uint16),
+        (GBufferViewFormat.HALF_FLOAT, emath.U16Vector2),
+        (GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV, ctypes.c_uint32),
+        (GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV, ctypes.c_int32),
+    ],
+)
+def test_format(platform, format, data_type):
+    view = GBufferView(GBuffer(), data_type, format=format)
+    assert view.format == format
+    assert GBufferView.Format is GBufferViewFormat
+
+
+@pytest.mark.parametrize(
+    "format, data_type",
+    [
+        (GBufferViewFormat.NORMALIZED, ctypes.c_float),
+        (GBufferViewFormat.NORMALIZED, emath.DVector2),
+        (GBufferViewFormat.HALF_FLOAT, ctypes.c_int16),
+        (GBufferViewFormat.HALF_FLOAT, emath.FVector2),
+        (GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV, ctypes.c_uint16),
+        (GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV, emath.U32Vector4),
+    ],
+)
+def test_invalid_format(platform, format, data_type):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferView(GBuffer(), data_type, format=format)
+    assert str(excinfo.value) == f"{format} cannot be used with {data_type!r}"
+
+
 @pytest.mark.parametrize(
     "array, data_type",
     [
@@ -236,6 +278,182 @@ def test_read(platform, data_type, add_stride, item_length, offset, instancing_d
     assert list(view) == expected_python_data
 
 
+@pytest.mark.parametrize("data_type", VIEW_DATA_TYPES)
+@pytest.mark.parametrize("add_stride", [0, 1, 4])
+@pytest.mark.parametrize("item_length", [None, 4])
+@pytest.mark.parametrize("offset", [0, 1, 4])
+def test_to_array(platform, data_type, add_stride, item_length, offset):
+    data = bytes(range(255)) * 10
+    stride = _get_size_of_bvt(data_type) + add_stride
+    view = GBufferView(GBuffer(data), data_type, length=item_length, stride=stride, offset=offset)
+    try:
+        array_type = _BUFFER_VIEW_TYPE_TO_ARRAY[data_type]
+    except KeyError:
+        with pytest.raises(TypeError) as excinfo:
+            view.to_array()
+        assert str(excinfo.value) == f"{data_type!r} has no array type"
+        return
+    array = view.to_array()
+    assert type(array) is array_type
+    assert len(array) == len(view)
+    assert array == array_type(*view)
+
+
+def test_to_array_empty_g_buffer(platform):
+    view = GBufferView(GBuffer(), emath.FVector3)
+    assert view.to_array() == emath.FVector3Array()
+
+
+def test_to_array_persistent(platform, gl_version):
+    if gl_version < (4, 4):
+        pytest.xfail()
+    ring = GBufferRing(16)
+    view = ring.write(emath.U32Array(1, 2, 3), ctypes.c_uint32)
+    assert view.to_array() == emath.U32Array(1, 2, 3)
+
+
+@pytest.mark.parametrize("data_type", [ctypes.c_uint16, emath.FVector3, emath.FMatrix2x2])
+@pytest.mark.parametrize("add_stride", [0, 2])
+@pytest.mark.parametrize("offset", [0, 4])
+def test_getitem(platform, data_type, add_stride, offset):
+    data = bytes(range(255)) * 10
+    stride = _get_size_of_bvt(data_type) + add_stride
+    view = GBufferView(GBuffer(data), data_type, stride=stride, offset=offset)
+    expected = list(view)
+    for i in (0, 1, len(view) - 1):
+        assert view[i] == expected[i]
+        assert view[i - len(view)] == expected[i]
+
+
+@pytest.mark.parametrize("index", [3, 100, -4, -100])
+def test_getitem_out_of_range(platform, index):
+    view = GBufferView(GBuffer(b"\x00" * 12), ctypes.c_uint32)
+    with pytest.raises(IndexError) as excinfo:
+        view[index]
+    assert str(excinfo.value) == "g buffer view index out of range"
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(1, None),
+        slice(None, -1),
+        slice(1, 5),
+        slice(None, None, 2),
+        slice(1, None, 3),
+        slice(2, 9, 4),
+        slice(5, 2),
+        slice(100, None),
+    ],
+)
+@pytest.mark.parametrize("add_stride", [0, 4])
+@pytest.mark.parametrize("instancing_divisor", [None, 2])
+def test_slice(platform, index, add_stride, instancing_divisor):
+    g_buffer = GBuffer(bytes(range(200)))
+    view = GBufferView(
+        g_buffer,
+        ctypes.c_uint32,
+        stride=4 + add_stride,
+        offset=4,
+        instancing_divisor=instancing_divisor,
+        format=GBufferViewFormat.NORMALIZED,
+    )
+    sliced = view[index]
+    assert isinstance(sliced, GBufferView)
+    assert sliced.g_buffer is g_buffer
+    assert sliced.data_type is ctypes.c_uint32
+    assert sliced.instancing_divisor == instancing_divisor
+    assert sliced.format == GBufferViewFormat.NORMALIZED
+    assert list(sliced) == list(view)[index]
+    assert len(sliced) == len(list(view)[index])
+
+
+@pytest.mark.parametrize(
+    "step, message", [(0, "slice step cannot be zero"), (-1, "slice step must be greater than 0")]
+)
+def test_slice_invalid_step(platform, step, message):
+    view = GBufferView(GBuffer(b"\x00" * 12), ctypes.c_uint32)
+    with pytest.raises(ValueError) as excinfo:
+        view[::step]
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize("alignment", [1, 4, 16])
+@pytest.mark.parametrize("instancing_divisor", [None, 1])
+def test_from_arrays(platform, alignment, instancing_divisor):
+    position = emath.FVector3Array(emath.FVector3(0, 1, 2), emath.FVector3(3, 4, 5))
+    color = emath.U8Vector3Array(emath.U8Vector3(1, 2, 3), emath.U8Vector3(4, 5, 6))
+    uv = emath.FVector2Array(emath.FVector2(0.5, 1), emath.FVector2(2, 3.5))
+    views = GBufferView.from_arrays(
+        {"position": position, "color": color, "uv": uv},
+        alignment=alignment,
+        instancing_divisor=instancing_divisor,
+        frequency=GBuffer.Frequency.DYNAMIC,
+    )
+    assert list(views) == ["position", "color", "uv"]
+    g_buffer = views["position"].g_buffer
+    assert all(view.g_buffer is g_buffer for view in views.values())
+    assert g_buffer.frequency == GBuffer.Frequency.DYNAMIC
+    assert g_buffer.nature == GBuffer.Nature.DRAW
+
+    color_offset = 12
+    uv_offset = -(-(color_offset + 3) // alignment) * alignment
+    stride = -(-(uv_offset + 8) // alignment) * alignment
+    assert len(g_buffer) == stride * 2
+    assert views["position"].offset == 0
+    assert views["color"].offset == color_offset
+    assert views["uv"].offset == uv_offset
+    for view in views.values():
+        assert view.stride == stride
+        assert view.instancing_divisor == instancing_divisor
+        assert len(view) == 2
+
+    assert views["position"].to_array() == position
+    assert views["color"].to_array() == color
+    assert views["uv"].to_array() == uv
+
+
+def test_from_arrays_formats(platform):
+    views = GBufferView.from_arrays(
+        {
+            "position": emath.FVector3Array(emath.FVector3(0, 1, 2)),
+            "normal": emath.I8Vector4Array(emath.I8Vector4(0, 127, 0, 0)),
+        },
+        formats={"normal": GBufferViewFormat.NORMALIZED},
+    )
+    assert views["position"].format == GBufferViewFormat.DEFAULT
+    assert views["normal"].format == GBufferViewFormat.NORMALIZED
+
+
+def test_from_arrays_empty_arrays(platform):
+    views = GBufferView.from_arrays(
+        {"position": emath.FVector3Array(), "uv": emath.FVector2Array()}
+    )
+    assert len(views["position"].g_buffer) == 0
+    assert len(views["position"]) == 0
+    assert len(views["uv"]) == 0
+
+
+def test_from_arrays_no_arrays(platform):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferView.from_arrays({})
+    assert str(excinfo.value) == "at least one array must be supplied"
+
+
+@pytest.mark.parametrize("alignment", [-1, 0])
+def test_from_arrays_invalid_alignment(platform, alignment):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferView.from_arrays({"a": emath.FArray(0)}, alignment=alignment)
+    assert str(excinfo.value) == "alignment must be greater than 0"
+
+
+def test_from_arrays_mismatched_length(platform):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferView.from_arrays({"a": emath.FArray(0), "b": emath.FArray(0, 1)})
+    assert str(excinfo.value) == "arrays must all be the same length"
+
+
 def test_bind_g_buffer_view_shader_storage_buffer_unit_gl_state(platform, gl_version):
     if gl_version < (4, 3):
         pytest.xfail()
@@ -345,6 +563,92 @@ def test_out_of_g_buffer_view_shader_storage_buffer_units(platform, gl_version):
             del excinfo
 
 
+def test_collected_g_buffer_view_shader_storage_buffer_unit(platform, gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    g_buffer = GBuffer(1)
+    with patch("egraphics._g_buffer_view.GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS_VALUE", 1):
+        for _ in range(3):
+            with bind_g_buffer_view_shader_storage_buffer_unit(
+                GBufferView(g_buffer, ctypes.c_uint8)
+            ) as unit:
+                binding = ctypes.c_int()
+                glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, unit, ctypes.byref(binding))
+                assert binding.value == get_g_buffer_gl_buffer(g_buffer)
+
+
+def test_bind_g_buffer_view_uniform_buffer_unit(platform):
+    g_buffer_1 = GBuffer(1)
+    g_buffer_view_1 = GBufferView(g_buffer_1, ctypes.c_uint8)
+    g_buffer_2 = GBuffer(1)
+    g_buffer_view_2 = GBufferView(g_buffer_2, ctypes.c_uint8)
+    with (
+        bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_1) as unit_1,
+        bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_2) as unit_2,
+    ):
+        assert unit_1 != unit_2
+        for unit, g_buffer in ((unit_1, g_buffer_1), (unit_2, g_buffer_2)):
+            binding = ctypes.c_int()
+            glGetIntegeri_v(GL_UNIFORM_BUFFER_BINDING, unit, ctypes.byref(binding))
+            assert binding.value == get_g_buffer_gl_buffer(g_buffer)
+
+
+def test_steal_g_buffer_view_uniform_buffer_unit(platform):
+    with patch("egraphics._g_buffer_view.GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE", 2):
+        g_buffer_view_1 = GBufferView(GBuffer(1), ctypes.c_uint8)
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_1) as unit_1:
+            pass
+        assert g_buffer_view_1._uniform_buffer_unit == unit_1
+
+        g_buffer_view_2 = GBufferView(GBuffer(1), ctypes.c_uint8)
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_2) as unit_2:
+            pass
+        assert g_buffer_view_1._uniform_buffer_unit == unit_1
+        assert g_buffer_view_2._uniform_buffer_unit == unit_2
+
+        g_buffer_view_3 = GBufferView(GBuffer(1), ctypes.c_uint8)
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_3) as unit_3:
+            pass
+        assert g_buffer_view_1._uniform_buffer_unit is None
+        assert g_buffer_view_2._uniform_buffer_unit == unit_2
+        assert g_buffer_view_3._uniform_buffer_unit == unit_3
+        assert unit_1 == unit_3
+
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_2):
+            assert g_buffer_view_1._uniform_buffer_unit is None
+            assert g_buffer_view_2._uniform_buffer_unit == unit_2
+            assert g_buffer_view_3._uniform_buffer_unit == unit_3
+
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_1):
+            assert g_buffer_view_1._uniform_buffer_unit == unit_1
+            assert g_buffer_view_2._uniform_buffer_unit == unit_2
+            assert g_buffer_view_3._uniform_buffer_unit is None
+
+
+def test_out_of_g_buffer_view_uniform_buffer_units(platform):
+    with patch("egraphics._g_buffer_view.GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE", 1):
+        g_buffer_view_1 = GBufferView(GBuffer(1), ctypes.c_uint8)
+        g_buffer_view_2 = GBufferView(GBuffer(1), ctypes.c_uint8)
+        with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_1):
+            with pytest.raises(RuntimeError) as excinfo:
+                with bind_g_buffer_view_uniform_buffer_unit(g_buffer_view_2):
+                    pass
+            assert str(excinfo.value) == "no uniform buffer unit available"
+            del excinfo
+
+
+def test_collected_g_buffer_view_uniform_buffer_unit(platform):
+    g_buffer = GBuffer(1)
+    with patch("egraphics._g_buffer_view.GL_MAX_UNIFORM_BUFFER_BINDINGS_VALUE", 1):
+        for _ in range(3):
+            with bind_g_buffer_view_uniform_buffer_unit(
+                GBufferView(g_buffer, ctypes.c_uint8)
+            ) as unit:
+                binding = ctypes.c_int()
+                glGetIntegeri_v(GL_UNIFORM_BUFFER_BINDING, unit, ctypes.byref(binding))
+                assert binding.value == get_g_buffer_gl_buffer(g_buffer)
+
+
 def test_bind_g_buffer_view_shader_storage_buffer_no_size_unit_gl_state(platform, gl_version):
     if gl_version < (4, 3):
         pytest.xfail()
@@ -353,3 +657,69 @@ def test_bind_g_buffer_view_shader_storage_buffer_no_size_unit_gl_state(platform
         binding = ctypes.c_int()
         glGetIntegeri_v(GL_SHADER_STORAGE_BUFFER_BINDING, unit, ctypes.byref(binding))
         assert binding.value == 0
+
+
+def test_resize_grow(platform):
+    g_buffer = GBuffer(b"\x01\x02")
+    default_view = GBufferView(g_buffer, ctypes.c_uint8)
+    offset_view = GBufferView(g_buffer, ctypes.c_uint8, offset=1)
+    fixed_view = GBufferView(g_buffer, ctypes.c_uint8, length=2)
+
+    g_buffer.resize(4)
+    g_buffer.write(b"\x03\x04", offset=2)
+
+    assert default_view.length == 4
+    assert default_view.to_array() == emath.U8Array(1, 2, 3, 4)
+    assert list(default_view) == [1, 2, 3, 4]
+    assert offset_view.length == 3
+    assert offset_view[-1] == 4
+    assert fixed_view.length == 2
+    assert fixed_view.to_array() == emath.U8Array(1, 2)
+
+
+@pytest.mark.parametrize("resize", [lambda g: g.resize(1), lambda g: g.replace(b"\x01")])
+def test_resize_shrink(platform, resize):
+    g_buffer = GBuffer(b"\x01\x02\x03\x04")
+    default_view = GBufferView(g_buffer, ctypes.c_uint8)
+    past_end_view = GBufferView(g_buffer, ctypes.c_uint8, offset=2)
+    fixed_view = GBufferView(g_buffer, ctypes.c_uint8, length=2)
+    inside_view = GBufferView(g_buffer, ctypes.c_uint8, length=1)
+
+    resize(g_buffer)
+
+    assert default_view.length == 1
+    assert default_view.to_array() == emath.U8Array(1)
+    assert inside_view.to_array() == emath.U8Array(1)
+
+    for view in (past_end_view, fixed_view):
+        with pytest.raises(ValueError) as excinfo:
+            view.length
+        assert str(excinfo.value) == "length/offset goes beyond buffer size"
+        with pytest.raises(ValueError) as excinfo:
+            len(view)
+        assert str(excinfo.value) == "length/offset goes beyond buffer size"
+        with pytest.raises(ValueError) as excinfo:
+            view.to_array()
+        assert str(excinfo.value) == "length/offset goes beyond buffer size"
+        with pytest.raises(ValueError) as excinfo:
+            view[0]
+        assert str(excinfo.value) == "length/offset goes beyond buffer size"
+        with pytest.raises(ValueError) as excinfo:
+            list(view)
+        assert str(excinfo.value) == "length/offset goes beyond buffer size"
+
+    g_buffer.resize(4)
+    assert fixed_view.to_array() == emath.U8Array(1, 0)
+
+
+def test_resize_shrink_bind_shader_storage_buffer_unit(platform, gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    g_buffer = GBuffer(8)
+    view = GBufferView(g_buffer, ctypes.c_uint8, length=8)
+    g_buffer.resize(4)
+    with pytest.raises(ValueError) as excinfo:
+        with bind_g_buffer_view_shader_storage_buffer_unit(view):
+            pass
+    assert str(excinfo.value) == "length/offset goes beyond buffer size"
+    assert view._shader_storage_buffer_unit is None
@@ -1,10 +1,45 @@
 import ctypes
+import os
+import subprocess
+import sys
+from unittest.mock import patch
 
+import emath
 import pytest
+from emath import DVector2
+from emath import FVector2
+from emath import I8Vector2
+from emath import U16Vector2
+from emath import U32Vector2
+from OpenGL.GL import GL_ELEMENT_ARRAY_BUFFER_BINDING
+from OpenGL.GL import GL_VERTEX_ARRAY_BINDING
+from OpenGL.GL import GL_VERTEX_BINDING_BUFFER
+from OpenGL.GL import GL_VERTEX_BINDING_OFFSET
+from OpenGL.GL import GL_VERTEX_BINDING_STRIDE
+from OpenGL.GL import glGetIntegeri_v
+from OpenGL.GL import glGetIntegerv
 
 from egraphics import GBuffer
 from egraphics import GBufferView
+from egraphics import GBufferViewFormat
 from egraphics import GBufferViewMap
+from egraphics import GBufferViewMapCacheInfo
+from egraphics import Shader
+from egraphics._egraphics import GL_VERTEX_ATTRIB_BINDING_SUPPORTED
+from egraphics._g_buffer import get_g_buffer_gl_buffer
+
+
+def _create_shader(xy_type, z):
+    return Shader(
+        vertex=f"""
+        #version 140
+        in {xy_type} xy;
+        void main()
+        {{
+            gl_Position = vec4(xy.xy, {z}, 1.0);
+        }}
+        """.encode("ascii")
+    )
 
 
 @pytest.mark.parametrize("indices", [(0, 10), None])
@@ -69,3 +104,267 @@ def test_index_buffer_view_with_instancing_divisor(platform):
     assert str(excinfo.value) == (
         f"view buffer with instancing_divisor cannot be used for indexing"
     )
+
+
+@pytest.mark.parametrize("primitive_restart", [False, True])
+def test_primitive_restart(platform, primitive_restart):
+    bvm = GBufferViewMap(
+        {}, GBufferView(GBuffer(), ctypes.c_uint16), primitive_restart=primitive_restart
+    )
+    assert bvm.primitive_restart is primitive_restart
+
+    with pytest.raises(AttributeError):
+        bvm.primitive_restart = not primitive_restart  # type: ignore
+
+
+def test_primitive_restart_default(platform):
+    assert not GBufferViewMap({}, (0, 0)).primitive_restart
+
+
+def test_primitive_restart_index_range(platform):
+    with pytest.raises(ValueError) as excinfo:
+        GBufferViewMap({}, (0, 0), primitive_restart=True)
+    assert str(excinfo.value) == "primitive restart requires indices to be a view buffer"
+
+
+def test_vertex_array_shared_between_shaders(platform):
+    shader_1 = _create_shader("vec2", 0)
+    shader_2 = _create_shader("vec2", 0.5)
+    shader_3 = _create_shader("vec3", 0)
+    bvm = GBufferViewMap({"xy": GBufferView(GBuffer(), FVector2)}, (0, 0))
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(0, 0, 0)
+
+    bvm.activate_for_shader(shader_1)
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(0, 1, 1)
+
+    bvm.activate_for_shader(shader_2)
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(1, 1, 1)
+
+    bvm.activate_for_shader(shader_1)
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(2, 1, 1)
+
+    bvm.activate_for_shader(shader_3)
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(2, 2, 2)
+
+
+def test_vertex_array_ignores_unmapped_attributes(platform):
+    shader = _create_shader("vec2", 0)
+    bvm = GBufferViewMap({}, (0, 0))
+    bvm.activate_for_shader(shader)
+    bvm.activate_for_shader(_create_shader("vec3", 0))
+    assert bvm.cache_info() == GBufferViewMapCacheInfo(1, 1, 1)
+
+
+def _get_vertex_binding(index):
+    return tuple(
+        glGetIntegeri_v(name, index)[0]
+        for name in (GL_VERTEX_BINDING_BUFFER, GL_VERTEX_BINDING_OFFSET, GL_VERTEX_BINDING_STRIDE)
+    )
+
+
+def test_vertex_attrib_binding_shares_vertex_array(platform):
+    if not GL_VERTEX_ATTRIB_BINDING_SUPPORTED:
+        pytest.xfail()
+    shader = _create_shader("vec2", 0)
+    g_buffer_1 = GBuffer(b"\x00" * 32)
+    g_buffer_2 = GBuffer(b"\x00" * 64)
+    index_g_buffer = GBuffer(b"\x00" * 4)
+    bvm_1 = GBufferViewMap({"xy": GBufferView(g_buffer_1, FVector2)}, (0, 4))
+    bvm_2 = GBufferViewMap(
+        {"xy": GBufferView(g_buffer_2, FVector2, stride=16, offset=8)},
+        GBufferView(index_g_buffer, ctypes.c_uint8),
+    )
+
+    bvm_1.activate_for_shader(shader)
+    vertex_array = glGetIntegerv(GL_VERTEX_ARRAY_BINDING)
+    assert _get_vertex_binding(0) == (get_g_buffer_gl_buffer(g_buffer_1), 0, 8)
+
+    bvm_2.activate_for_shader(shader)
+    assert glGetIntegerv(GL_VERTEX_ARRAY_BINDING) == vertex_array
+    assert _get_vertex_binding(0) == (get_g_buffer_gl_buffer(g_buffer_2), 8, 16)
+    assert glGetIntegerv(GL_ELEMENT_ARRAY_BUFFER_BINDING) == get_g_buffer_gl_buffer(index_g_buffer)
+
+    bvm_1.activate_for_shader(shader)
+    assert glGetIntegerv(GL_VERTEX_ARRAY_BINDING) == vertex_array
+    assert _get_vertex_binding(0) == (get_g_buffer_gl_buffer(g_buffer_1), 0, 8)
+
+
+def test_vertex_attrib_binding_different_format(platform):
+    if not GL_VERTEX_ATTRIB_BINDING_SUPPORTED:
+        pytest.xfail()
+    shader = _create_shader("vec2", 0)
+    bvm_1 = GBufferViewMap({"xy": GBufferView(GBuffer(8), FVector2)}, (0, 1))
+    bvm_2 = GBufferViewMap({"xy": GBufferView(GBuffer(8), FVector2, instancing_divisor=1)}, (0, 1))
+    bvm_1.activate_for_shader(shader)
+    vertex_array = glGetIntegerv(GL_VERTEX_ARRAY_BINDING)
+    bvm_2.activate_for_shader(shader)
+    assert glGetIntegerv(GL_VERTEX_ARRAY_BINDING) != vertex_array
+
+
+def test_vertex_attrib_binding_not_supported():
+    process = subprocess.Popen(
+        [sys.executable, "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=os.environ | {"EGRAPHICS_GL_VERTEX_ATTRIB_BINDING": "disabled"},
+    )
+    out, err = process.communicate(
+        """
+import os
+
+if hasattr(os, "add_dll_directory"):
+    os.add_dll_directory(os.getcwd() + "/vendor/SDL")
+
+from emath import FVector2, FVector2Array
+from egraphics import GBufferView, GBufferViewMap, Shader
+from egraphics._egraphics import GL_VERTEX_ATTRIB_BINDING_SUPPORTED
+from eplatform import Platform, OpenGlWindow
+
+assert not GL_VERTEX_ATTRIB_BINDING_SUPPORTED
+
+with Platform(window_cls=OpenGlWindow):
+    shader = Shader(
+        vertex=b\"\"\"
+        #version 140
+        in vec2 xy;
+        void main()
+        {
+            gl_Position = vec4(xy, 0, 1.0);
+        }
+        \"\"\"
+    )
+    xy = GBufferView.from_array(FVector2Array(FVector2(0), FVector2(1)))
+    bvm = GBufferViewMap({"xy": xy}, (0, 2))
+    bvm.activate_for_shader(shader)
+    bvm.activate_for_shader(shader)
+    assert bvm.cache_info() == (1, 1, 1)
+    """.encode("utf8")
+    )
+    assert process.returncode == 0, (out, err)
+
+
+@pytest.mark.parametrize("shrink_indices", [False, True])
+def test_activate_for_shader_after_shrink(platform, shrink_indices):
+    shader = _create_shader("vec2", 0)
+    g_buffer = GBuffer(32)
+    index_g_buffer = GBuffer(4)
+    bvm = GBufferViewMap(
+        {"xy": GBufferView(g_buffer, FVector2, length=32)},
+        GBufferView(index_g_buffer, ctypes.c_uint8, length=4),
+    )
+    bvm.activate_for_shader(shader)
+
+    if shrink_indices:
+        index_g_buffer.resize(2)
+    else:
+        g_buffer.resize(8)
+    with pytest.raises(ValueError) as excinfo:
+        bvm.activate_for_shader(shader)
+    assert str(excinfo.value) == "length/offset goes beyond buffer size"
+
+
+def test_activate_for_shader_checks_extents_after_resize(platform):
+    shader = _create_shader("vec2", 0)
+    g_buffer = GBuffer(32)
+    other_g_buffer = GBuffer(4)
+    bvm = GBufferViewMap({"xy": GBufferView(g_buffer, FVector2, length=32)}, (0, 4))
+
+    with patch.object(GBufferView, "_check_extent", autospec=True) as check_extent_mock:
+        bvm.activate_for_shader(shader)
+        assert check_extent_mock.call_count == 1
+        bvm.activate_for_shader(shader)
+        assert check_extent_mock.call_count == 1
+
+        other_g_buffer.resize(2)
+        bvm.activate_for_shader(shader)
+        assert check_extent_mock.call_count == 2
+        bvm.activate_for_shader(shader)
+        assert check_extent_mock.call_count == 2
+
+
+def _create_attribute_shader(version, xy_type):
+    return Shader(
+        vertex=f"""
+        #version {version}
+        in {xy_type} xy;
+        void main()
+        {{
+            gl_Position = vec4(vec2(xy.xy), 0, 1.0);
+        }}
+        """.encode("ascii")
+    )
+
+
+@pytest.mark.parametrize(
+    "version, xy_type, attribute_data_type, create_view",
+    [
+        ("140", "ivec2", "I32Vector2", lambda: GBufferView(GBuffer(8), FVector2)),
+        ("140", "uvec2", "U32Vector2", lambda: GBufferView(GBuffer(8), FVector2)),
+        (
+            "140",
+            "ivec2",
+            "I32Vector2",
+            lambda: GBufferView(GBuffer(4), U16Vector2, format=GBufferViewFormat.HALF_FLOAT),
+        ),
+        (
+            "140",
+            "ivec2",
+            "I32Vector2",
+            lambda: GBufferView(GBuffer(2), I8Vector2, format=GBufferViewFormat.NORMALIZED),
+        ),
+        (
+            "140",
+            "ivec2",
+            "I32Vector2",
+            lambda: GBufferView(
+                GBuffer(4), ctypes.c_int32, format=GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV
+            ),
+        ),
+        ("410", "dvec2", "DVector2", lambda: GBufferView(GBuffer(8), FVector2)),
+        ("410", "dvec2", "DVector2", lambda: GBufferView(GBuffer(2), I8Vector2)),
+    ],
+)
+def test_incompatible_attribute(
+    platform, gl_version, version, xy_type, attribute_data_type, create_view
+):
+    if version == "410" and gl_version < (4, 1):
+        pytest.xfail()
+    shader = _create_attribute_shader(version, xy_type)
+    view = create_view()
+    bvm = GBufferViewMap({"xy": view}, (0, 1))
+    with pytest.raises(ValueError) as excinfo:
+        bvm.activate_for_shader(shader)
+    assert str(excinfo.value) == (
+        f"{view.format} view buffer with type {view.data_type!r} cannot be used for 'xy' "
+        f"attribute of type {getattr(emath, attribute_data_type)!r}"
+    )
+
+
+@pytest.mark.parametrize(
+    "version, xy_type, create_view",
+    [
+        ("140", "ivec2", lambda: GBufferView(GBuffer(2), I8Vector2)),
+        ("140", "uvec2", lambda: GBufferView(GBuffer(8), U32Vector2)),
+        (
+            "140",
+            "vec2",
+            lambda: GBufferView(GBuffer(2), I8Vector2, format=GBufferViewFormat.NORMALIZED),
+        ),
+        ("140", "vec2", lambda: GBufferView(GBuffer(2), I8Vector2)),
+        ("140", "vec2", lambda: GBufferView(GBuffer(16), DVector2)),
+        (
+            "140",
+            "vec4",
+            lambda: GBufferView(
+                GBuffer(4), ctypes.c_uint32, format=GBufferViewFormat.NORMALIZED_INT_2_10_10_10_REV
+            ),
+        ),
+        ("410", "dvec2", lambda: GBufferView(GBuffer(16), DVector2)),
+    ],
+)
+def test_compatible_attribute(platform, gl_version, version, xy_type, create_view):
+    if version == "410" and gl_version < (4, 1):
+        pytest.xfail()
+    shader = _create_attribute_shader(version, xy_type)
+    GBufferViewMap({"xy": create_view()}, (0, 1)).activate_for_shader(shader)
@@ -0,0 +1,357 @@
+import ctypes
+import random
+
+import pytest
+from emath import FVector2
+from emath import FVector2Array
+from emath import FVector3
+from emath import FVector3Array
+from emath import U8Array
+from emath import U16Array
+from emath import U32Array
+
+from egraphics import GBuffer
+from egraphics import GBufferFrequency
+from egraphics import GBufferNature
+from egraphics import GBufferView
+from egraphics import join_index_strips
+from egraphics import narrow_indices
+from egraphics import optimize_overdraw
+from egraphics import optimize_vertex_cache
+from egraphics import optimize_vertex_fetch
+
+GRID_SIZE = 16
+
+
+def _create_grid():
+    positions = FVector3Array(
+        *(FVector3(x, y, 0) for y in range(GRID_SIZE + 1) for x in range(GRID_SIZE + 1))
+    )
+    triangles = []
+    for y in range(GRID_SIZE):
+        for x in range(GRID_SIZE):
+            a = y * (GRID_SIZE + 1) + x
+            b = a + 1
+            c = a + GRID_SIZE + 1
+            d = c + 1
+            triangles.append((a, b, d))
+            triangles.append((a, d, c))
+    random.Random(0).shuffle(triangles)
+    return positions, triangles
+
+
+def _get_triangles(indices):
+    values = (indices.data_type * len(indices)).from_buffer_copy(
+        bytes(indices.g_buffer)[indices.offset : indices.offset + indices.length]
+    )
+    return list(zip(*[iter(list(values))] * 3))
+
+
+def _get_acmr(triangles, cache_size=16):
+    cache = []
+    misses = 0
+    for triangle in triangles:
+        for index in triangle:
+            if index in cache:
+                continue
+            misses += 1
+            cache.append(index)
+            if len(cache) > cache_size:
+                cache.pop(0)
+    return misses / len(triangles)
+
+
+def _create_indices(triangles, array_type=U32Array):
+    return GBufferView.from_array(array_type(*(i for t in triangles for i in t)))
+
+
+def test_optimize_vertex_cache(platform):
+    _, triangles = _create_grid()
+    indices = _create_indices(triangles)
+
+    optimized = optimize_vertex_cache(indices)
+    assert optimized.data_type is ctypes.c_uint32
+    optimized_triangles = _get_triangles(optimized)
+    assert sorted(optimized_triangles) == sorted(triangles)
+    assert _get_acmr(optimized_triangles) < _get_acmr(triangles) / 2
+
+
+@pytest.mark.parametrize(
+    "array_type, data_type",
+    [(U8Array, ctypes.c_uint8), (U16Array, ctypes.c_uint16), (U32Array, ctypes.c_uint32)],
+)
+def test_optimize_vertex_cache_data_type(platform, array_type, data_type):
+    triangles = [(0, 1, 2), (2, 1, 3)]
+    optimized = optimize_vertex_cache(_create_indices(triangles, array_type))
+    assert optimized.data_type is data_type
+    assert sorted(_get_triangles(optimized)) == sorted(triangles)
+
+
+def test_optimize_vertex_cache_g_buffer_properties(platform):
+    g_buffer = GBuffer(
+        U16Array(0, 1, 2), frequency=GBufferFrequency.DYNAMIC, nature=GBufferNature.READ
+    )
+    optimized = optimize_vertex_cache(GBufferView(g_buffer, ctypes.c_uint16))
+    assert optimized.g_buffer.frequency == GBufferFrequency.DYNAMIC
+    assert optimized.g_buffer.nature == GBufferNature.READ
+
+
+def test_optimize_vertex_cache_offset(platform):
+    g_buffer = GBuffer(U16Array(9, 0, 1, 2, 9))
+    optimized = optimize_vertex_cache(GBufferView(g_buffer, ctypes.c_uint16, offset=2, length=6))
+    assert _get_triangles(optimized) == [(0, 1, 2)]
+
+
+def test_optimize_vertex_cache_empty(platform):
+    optimized = optimize_vertex_cache(GBufferView(GBuffer(), ctypes.c_uint16))
+    assert len(optimized) == 0
+
+
+def test_optimize_vertex_cache_sparse(platform):
+    triangles = [(0, 4294967294, 1), (1, 4294967294, 2)]
+    optimized = optimize_vertex_cache(_create_indices(triangles))
+    assert sorted(_get_triangles(optimized)) == sorted(triangles)
+
+
+def test_optimize_vertex_cache_invalid_length(platform):
+    with pytest.raises(ValueError) as excinfo:
+        optimize_vertex_cache(_create_indices([(0, 1)]))
+    assert str(excinfo.value) == "indices length must be a multiple of 3"
+
+
+def test_optimize_vertex_cache_invalid_cache_size(platform):
+    with pytest.raises(ValueError) as excinfo:
+        optimize_vertex_cache(_create_indices([(0, 1, 2)]), cache_size=0)
+    assert str(excinfo.value) == "cache size must be greater than 0"
+
+
+def test_optimize_overdraw(platform):
+    positions, triangles = _create_grid()
+    indices = _create_indices(triangles)
+
+    optimized = optimize_overdraw(indices, GBufferView.from_array(positions))
+    optimized_triangles = _get_triangles(optimized)
+    assert sorted(optimized_triangles) == sorted(triangles)
+    assert _get_acmr(optimized_triangles) < _get_acmr(triangles) / 2
+
+
+def test_optimize_overdraw_orders_outside_first(platform):
+    positions = FVector3Array(
+        FVector3(0, 0, 0),
+        FVector3(1, 0, 0),
+        FVector3(0, 1, 0),
+        FVector3(0, 0, 1),
+        FVector3(0, 1, 1),
+        FVector3(1, 0, 1),
+    )
+    inner = (0, 1, 2)
+    outer = (3, 5, 4)
+    optimized = optimize_overdraw(
+        _create_indices([inner, outer]), GBufferView.from_array(positions)
+    )
+    assert _get_triangles(optimized) == [outer, inner]
+
+
+def test_optimize_overdraw_invalid_positions(platform):
+    positions = GBufferView.from_array(FVector2Array(FVector2(0), FVector2(0), FVector2(0)))
+    with pytest.raises(ValueError) as excinfo:
+        optimize_overdraw(_create_indices([(0, 1, 2)]), positions)  # type: ignore
+    assert str(excinfo.value) == "positions data type must be FVector3"
+
+
+def test_optimize_overdraw_positions_out_of_range(platform):
+    with pytest.raises(ValueError) as excinfo:
+        optimize_overdraw(
+            _create_indices([(0, 1, 2)]), GBufferView.from_array(FVector3Array(FVector3(0)))
+        )
+    assert str(excinfo.value) == "indices reference vertices beyond positions"
+
+
+def test_optimize_vertex_fetch(platform):
+    positions = FVector2Array(FVector2(0), FVector2(1), FVector2(2), FVector2(3))
+    instance_data = GBufferView.from_array(FVector2Array(FVector2(9)), instancing_divisor=1)
+    position_view = GBufferView.from_array(positions)
+    indices, attributes = optimize_vertex_fetch(
+        _create_indices([(3, 1, 3)], U8Array),
+        {"position": position_view, "array": [position_view], "instance": instance_data},
+    )
+    assert indices.data_type is ctypes.c_uint8
+    assert _get_triangles(indices) == [(0, 1, 0)]
+    assert attributes["instance"] is instance_data
+    remapped = attributes["position"]
+    assert isinstance(remapped, GBufferView)
+    assert bytes(remapped.g_buffer) == bytes(FVector2Array(FVector2(3), FVector2(1)))
+    assert attributes["array"] == (remapped,)
+
+
+def test_optimize_vertex_fetch_interleaved(platform):
+    g_buffer = GBuffer(FVector3Array(FVector3(0, 0, 10), FVector3(1, 1, 11), FVector3(2, 2, 12)))
+    xy = GBufferView(g_buffer, FVector2, stride=12)
+    z = GBufferView(g_buffer, ctypes.c_float, stride=12, offset=8)
+    indices, attributes = optimize_vertex_fetch(
+        _create_indices([(2, 0, 2)], U16Array), {"xy": xy, "z": z}
+    )
+    assert _get_triangles(indices) == [(0, 1, 0)]
+    remapped_xy = attributes["xy"]
+    remapped_z = attributes["z"]
+    assert isinstance(remapped_xy, GBufferView)
+    assert isinstance(remapped_z, GBufferView)
+    assert remapped_xy.g_buffer is remapped_z.g_buffer
+    assert remapped_xy.stride == remapped_z.stride == 12
+    assert remapped_xy.offset == 0
+    assert remapped_z.offset == 8
+    assert len(remapped_xy) == len(remapped_z) == 2
+    assert bytes(remapped_xy.g_buffer) == bytes(
+        FVector3Array(FVector3(2, 2, 12), FVector3(0, 0, 10))
+    )
+
+
+def test_optimize_vertex_fetch_out_of_range(platform):
+    with pytest.raises(ValueError) as excinfo:
+        optimize_vertex_fetch(
+            _create_indices([(0, 1, 2)]),
+            {"position": GBufferView.from_array(FVector2Array(FVector2(0)))},
+        )
+    assert str(excinfo.value) == "indices reference vertices beyond attribute data"
+
+
+@pytest.mark.parametrize(
+    "optimize",
+    [
+        optimize_vertex_cache,
+        lambda indices: optimize_overdraw(
+            indices, GBufferView.from_array(FVector3Array(FVector3(0), FVector3(0)))
+        ),
+        lambda indices: optimize_vertex_fetch(indices, {}),
+    ],
+)
+@pytest.mark.parametrize(
+    "array_type, restart_index", [(U8Array, 255), (U16Array, 65535), (U32Array, 4294967295)]
+)
+def test_optimize_restart_index(platform, optimize, array_type, restart_index):
+    with pytest.raises(ValueError) as excinfo:
+        optimize(_create_indices([(0, restart_index, 1)], array_type))
+    assert str(excinfo.value) == "indices must not contain the restart index"
+
+
+@pytest.mark.parametrize(
+    "array_type, max_index, expected_data_type",
+    [
+        (U8Array, 254, ctypes.c_uint8),
+        (U16Array, 1, ctypes.c_uint8),
+        (U16Array, 254, ctypes.c_uint8),
+        (U16Array, 255, ctypes.c_uint16),
+        (U16Array, 65534, ctypes.c_uint16),
+        (U32Array, 254, ctypes.c_uint8),
+        (U32Array, 255, ctypes.c_uint16),
+        (U32Array, 65534, ctypes.c_uint16),
+        (U32Array, 65535, ctypes.c_uint32),
+        (U32Array, 4294967294, ctypes.c_uint32),
+    ],
+)
+def test_narrow_indices(platform, array_type, max_index, expected_data_type):
+    narrowed = narrow_indices(_create_indices([(0, max_index, 1)], array_type))
+    assert narrowed.data_type is expected_data_type
+    assert _get_triangles(narrowed) == [(0, max_index, 1)]
+
+
+@pytest.mark.parametrize(
+    "array_type, restart_index", [(U8Array, 255), (U16Array, 65535), (U32Array, 4294967295)]
+)
+def test_narrow_indices_restart_index(platform, array_type, restart_index):
+    narrowed = narrow_indices(_create_indices([(0, restart_index, 1)], array_type))
+    assert narrowed.data_type is ctypes.c_uint8
+    assert _get_triangles(narrowed) == [(0, 255, 1)]
+
+
+def test_narrow_indices_joined_strips(platform):
+    narrowed = narrow_indices(
+        join_index_strips([U32Array(0, 1, 1000), U32Array(2, 3, 4)], data_type=ctypes.c_uint32)
+    )
+    assert narrowed.data_type is ctypes.c_uint16
+    assert bytes(narrowed.g_buffer) == bytes(U16Array(0, 1, 1000, 65535, 2, 3, 4))
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        optimize_vertex_cache,
+        lambda indices: optimize_overdraw(
+            indices, GBufferView.from_array(FVector3Array(FVector3(0), FVector3(0)))
+        ),
+        lambda indices: optimize_vertex_fetch(indices, {}),
+        narrow_indices,
+    ],
+)
+def test_invalid_stride(platform, function):
+    indices = GBufferView(GBuffer(U16Array(0, 9, 1, 9, 1, 9)), ctypes.c_uint16, stride=4)
+    with pytest.raises(ValueError) as excinfo:
+        function(indices)
+    assert str(excinfo.value) == (
+        "view buffer with a stride different from its type cannot be used for indexing"
+    )
+
+
+def test_narrow_indices_invalid_data_type(platform):
+    indices = GBufferView(GBuffer(4), ctypes.c_int32)
+    with pytest.raises(ValueError) as excinfo:
+        narrow_indices(indices)  # type: ignore
+    assert str(excinfo.value) == (
+        f"view buffer with type {ctypes.c_int32} cannot be used for indexing"
+    )
+
+
+@pytest.mark.parametrize(
+    "strips, expected_data_type, expected",
+    [
+        ([], ctypes.c_uint8, []),
+        ([U8Array(0, 1, 2)], ctypes.c_uint8, [0, 1, 2]),
+        ([U16Array(0, 1, 2), U32Array(3, 4)], ctypes.c_uint8, [0, 1, 2, 255, 3, 4]),
+        ([U16Array(254), U8Array(0)], ctypes.c_uint8, [254, 255, 0]),
+        ([U16Array(255), U8Array(0)], ctypes.c_uint16, [255, 65535, 0]),
+        ([U32Array(65535), U8Array(0)], ctypes.c_uint32, [65535, 4294967295, 0]),
+        ([U16Array(0, 65535, 1), U8Array(2)], ctypes.c_uint8, [0, 255, 1, 255, 2]),
+        ([U32Array(1000, 4294967295), U8Array(255)], ctypes.c_uint16, [1000, 65535, 65535, 65535]),
+    ],
+)
+def test_join_index_strips(platform, strips, expected_data_type, expected):
+    indices = join_index_strips(strips)
+    assert indices.data_type is expected_data_type
+    assert (
+        list((expected_data_type * len(indices)).from_buffer_copy(bytes(indices.g_buffer)))
+        == expected
+    )
+
+
+def test_join_index_strips_data_type(platform):
+    indices = join_index_strips([U8Array(0, 1), U8Array(2)], data_type=ctypes.c_uint32)
+    assert indices.data_type is ctypes.c_uint32
+    assert bytes(indices.g_buffer) == bytes(U32Array(0, 1, 4294967295, 2))
+
+
+def test_join_index_strips_g_buffer_properties(platform):
+    indices = join_index_strips(
+        [U8Array(0)], frequency=GBufferFrequency.DYNAMIC, nature=GBufferNature.READ
+    )
+    assert indices.g_buffer.frequency == GBufferFrequency.DYNAMIC
+    assert indices.g_buffer.nature == GBufferNature.READ
+
+
+def test_join_index_strips_restart_index_collision(platform):
+    with pytest.raises(ValueError) as excinfo:
+        join_index_strips([U16Array(255)], data_type=ctypes.c_uint8)
+    assert str(excinfo.value) == "indices do not fit below the restart index"
+
+
+def test_join_index_strips_invalid_strip(platform):
+    with pytest.raises(TypeError) as excinfo:
+        join_index_strips([FVector2Array()])  # type: ignore
+    assert str(excinfo.value) == f"{FVector2Array!r} is not an index array"
+
+
+def test_join_index_strips_invalid_data_type(platform):
+    with pytest.raises(ValueError) as excinfo:
+        join_index_strips([U8Array(0)], data_type=ctypes.c_int8)  # type: ignore
+    assert str(excinfo.value) == (
+        f"view buffer with type {ctypes.c_int8} cannot be used for indexing"
+    )
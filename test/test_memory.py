@@ -0,0 +1,145 @@
+import ctypes
+import gc
+
+import pytest
+from emath import UVector2
+
+from egraphics import GBuffer
+from egraphics import GBufferRing
+from egraphics import MemoryKind
+from egraphics import MemoryStats
+from egraphics import MemoryUsage
+from egraphics import MipmapSelection
+from egraphics import Shader
+from egraphics import Texture2d
+from egraphics import TextureComponents
+from egraphics import TextureRenderTarget
+from egraphics import memory_stats
+
+_EMPTY_USAGE = MemoryUsage(0, 0, 0, 0)
+
+
+def _get_kind_usage(kind):
+    return memory_stats().kinds.get(kind, _EMPTY_USAGE)
+
+
+def test_memory_stats(platform):
+    stats = memory_stats()
+    assert isinstance(stats, MemoryStats)
+    assert isinstance(stats.total, MemoryUsage)
+    assert stats.total.bytes == sum(u.bytes for u in stats.kinds.values())
+    assert stats.total.count == sum(u.count for u in stats.kinds.values())
+
+
+@pytest.mark.parametrize("frequency", GBuffer.Frequency)
+@pytest.mark.parametrize("nature", GBuffer.Nature)
+def test_g_buffer(platform, frequency, nature):
+    before = memory_stats()
+    before_usage = before.g_buffer_usages.get((frequency, nature), _EMPTY_USAGE)
+
+    g_buffer = GBuffer(100, frequency=frequency, nature=nature)
+    stats = memory_stats()
+    usage = stats.g_buffer_usages[(frequency, nature)]
+    assert usage.bytes == before_usage.bytes + 100
+    assert usage.count == before_usage.count + 1
+    assert usage.peak_bytes >= usage.bytes
+    assert stats.kinds[MemoryKind.G_BUFFER].bytes == (
+        before.kinds.get(MemoryKind.G_BUFFER, _EMPTY_USAGE).bytes + 100
+    )
+    assert stats.total.bytes == before.total.bytes + 100
+
+    g_buffer.replace(10)
+    usage = memory_stats().g_buffer_usages[(frequency, nature)]
+    assert usage.bytes == before_usage.bytes + 10
+    assert usage.count == before_usage.count + 1
+
+    g_buffer.resize(30)
+    usage = memory_stats().g_buffer_usages[(frequency, nature)]
+    assert usage.bytes == before_usage.bytes + 30
+
+    del g_buffer
+    gc.collect()
+    usage = memory_stats().g_buffer_usages[(frequency, nature)]
+    assert usage.bytes == before_usage.bytes
+    assert usage.count == before_usage.count
+    assert usage.peak_bytes >= before_usage.bytes + 100
+    assert usage.peak_count >= before_usage.count + 1
+
+
+def test_g_buffer_ring(platform, gl_version):
+    if gl_version < (4, 4):
+        pytest.xfail()
+    before = _get_kind_usage(MemoryKind.G_BUFFER)
+    ring = GBufferRing(16, frames=2)
+    usage = _get_kind_usage(MemoryKind.G_BUFFER)
+    assert usage.bytes == before.bytes + 32
+    assert usage.count == before.count + 1
+    del ring
+    gc.collect()
+    assert _get_kind_usage(MemoryKind.G_BUFFER).bytes == before.bytes
+
+
+@pytest.mark.parametrize(
+    "mipmap_selection, expected_size",
+    [
+        (MipmapSelection.NONE, 8 * 4 * 4),
+        (MipmapSelection.LINEAR, (8 * 4 + 4 * 2 + 2 * 1 + 1 * 1) * 4),
+    ],
+)
+def test_texture(platform, mipmap_selection, expected_size):
+    key = (TextureComponents.RGBA, ctypes.c_uint8)
+    before = memory_stats().texture_formats.get(key, _EMPTY_USAGE)
+    texture = Texture2d(
+        UVector2(8, 4),
+        TextureComponents.RGBA,
+        ctypes.c_uint8,
+        b"\x00" * 8 * 4 * 4,
+        mipmap_selection=mipmap_selection,
+    )
+    usage = memory_stats().texture_formats[key]
+    assert usage.bytes == before.bytes + expected_size
+    assert usage.count == before.count + 1
+    del texture
+    gc.collect()
+    usage = memory_stats().texture_formats[key]
+    assert usage.bytes == before.bytes
+    assert usage.count == before.count
+
+
+@pytest.mark.parametrize("depth", [False, True])
+def test_texture_render_target(platform, depth):
+    texture = Texture2d(UVector2(8, 4), TextureComponents.RGBA, ctypes.c_uint8, None)
+    before = _get_kind_usage(MemoryKind.RENDERBUFFER)
+    render_target = TextureRenderTarget([texture], depth=depth)
+    usage = _get_kind_usage(MemoryKind.RENDERBUFFER)
+    if depth:
+        assert usage.bytes == before.bytes + 8 * 4 * 4
+        assert usage.count == before.count + 1
+    else:
+        assert usage == before
+    del render_target
+    gc.collect()
+    usage = _get_kind_usage(MemoryKind.RENDERBUFFER)
+    assert usage.bytes == before.bytes
+    assert usage.count == before.count
+
+
+def test_shader(platform):
+    before = _get_kind_usage(MemoryKind.SHADER)
+    shader = Shader(
+        vertex=b"""
+#version 140
+void main()
+{
+    gl_Position = vec4(0, 0, 0, 1);
+}
+"""
+    )
+    usage = _get_kind_usage(MemoryKind.SHADER)
+    assert usage.count == before.count + 1
+    assert usage.bytes >= before.bytes
+    del shader
+    gc.collect()
+    usage = _get_kind_usage(MemoryKind.SHADER)
+    assert usage.bytes == before.bytes
+    assert usage.count == before.count
@@ -0,0 +1,100 @@
+import ctypes
+import struct
+
+import emath
+import pytest
+
+from egraphics import pack_int_2_10_10_10_rev
+from egraphics import quantize_half_float
+from egraphics import quantize_normalized
+
+
+@pytest.mark.parametrize(
+    "data_type, expected",
+    [
+        (ctypes.c_int8, emath.I8Array(-127, -127, -64, 0, 64, 127, 127)),
+        (ctypes.c_uint8, emath.U8Array(0, 0, 0, 0, 128, 255, 255)),
+        (ctypes.c_int16, emath.I16Array(-32767, -32767, -16384, 0, 16384, 32767, 32767)),
+        (ctypes.c_uint16, emath.U16Array(0, 0, 0, 0, 32768, 65535, 65535)),
+    ],
+)
+def test_quantize_normalized(data_type, expected):
+    array = emath.FArray(-2, -1, -0.5, 0, 0.5, 1, 2)
+    assert quantize_normalized(array, data_type) == expected
+
+
+@pytest.mark.parametrize(
+    "array, expected",
+    [
+        (emath.FArray(1), emath.I8Array(127)),
+        (
+            emath.FVector2Array(emath.FVector2(1, -1)),
+            emath.I8Vector2Array(emath.I8Vector2(127, -127)),
+        ),
+        (
+            emath.FVector3Array(emath.FVector3(1, -1, 0)),
+            emath.I8Vector3Array(emath.I8Vector3(127, -127, 0)),
+        ),
+        (
+            emath.FVector4Array(emath.FVector4(1, -1, 0, 1)),
+            emath.I8Vector4Array(emath.I8Vector4(127, -127, 0, 127)),
+        ),
+    ],
+)
+def test_quantize_normalized_components(array, expected):
+    assert quantize_normalized(array, ctypes.c_int8) == expected
+
+
+def test_quantize_normalized_invalid_data_type():
+    with pytest.raises(ValueError) as excinfo:
+        quantize_normalized(emath.FArray(0), ctypes.c_float)  # type: ignore
+    assert str(excinfo.value) == f"cannot quantize to {ctypes.c_float!r}"
+
+
+def test_quantize_normalized_invalid_array():
+    with pytest.raises(TypeError) as excinfo:
+        quantize_normalized(emath.DArray(0), ctypes.c_int8)  # type: ignore
+    assert str(excinfo.value) == f"{emath.DArray!r} is not a float array"
+
+
+@pytest.mark.parametrize(
+    "value", [0, -0.0, 1, -2, 0.5, 0.1, 3.14159, 65504, 6.103515625e-05, 5.960464477539063e-08]
+)
+def test_quantize_half_float(value):
+    (expected,) = struct.unpack("=H", struct.pack("=e", value))
+    assert quantize_half_float(emath.FArray(value)) == emath.U16Array(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(1e10, 0x7C00), (-1e10, 0xFC00), (float("inf"), 0x7C00), (1e-10, 0)]
+)
+def test_quantize_half_float_out_of_range(value, expected):
+    assert quantize_half_float(emath.FArray(value)) == emath.U16Array(expected)
+
+
+def test_quantize_half_float_components():
+    array = emath.FVector3Array(emath.FVector3(1, 0.5, -2))
+    assert quantize_half_float(array) == emath.U16Vector3Array(
+        emath.U16Vector3(0x3C00, 0x3800, 0xC000)
+    )
+
+
+@pytest.mark.parametrize(
+    "array, expected",
+    [
+        (emath.FVector3Array(emath.FVector3(1, -1, 0)), 0x1FF | (0x201 << 10)),
+        (
+            emath.FVector4Array(emath.FVector4(1, -1, 0.5, -1)),
+            0x1FF | (0x201 << 10) | (0x100 << 20) | (0x3 << 30),
+        ),
+        (emath.FVector4Array(emath.FVector4(2, -2, 0, 1)), 0x1FF | (0x201 << 10) | (0x1 << 30)),
+    ],
+)
+def test_pack_int_2_10_10_10_rev(array, expected):
+    assert pack_int_2_10_10_10_rev(array) == emath.I32Array.from_buffer(emath.U32Array(expected))
+
+
+def test_pack_int_2_10_10_10_rev_invalid_array():
+    with pytest.raises(TypeError) as excinfo:
+        pack_int_2_10_10_10_rev(emath.FVector2Array())  # type: ignore
+    assert str(excinfo.value) == (f"{emath.FVector2Array!r} is not a 3 or 4 component float array")
@@ -1,3 +1,4 @@
+import asyncio
 import ctypes
 import sys
 from contextlib import ExitStack
@@ -9,26 +10,34 @@ from emath import FArray
 from emath import I32Array
 from emath import U32Array
 from emath import UVector2
+from eplatform import EventLoop
 from OpenGL.GL import GL_BUFFER_BINDING
 from OpenGL.GL import GL_SHADER_STORAGE_BLOCK
 from OpenGL.GL import GL_SHADER_STORAGE_BUFFER_BINDING
+from OpenGL.GL import GL_UNIFORM_BLOCK_BINDING
+from OpenGL.GL import GL_UNIFORM_BUFFER_BINDING
+from OpenGL.GL import glGetActiveUniformBlockiv
 from OpenGL.GL import glGetIntegeri_v
 from OpenGL.GL import glGetProgramResourceiv
 from OpenGL.GL import glGetUniformfv
 from OpenGL.GL import glGetUniformiv
 from OpenGL.GL import glGetUniformLocation
 from OpenGL.GL import glIsProgram
+from OpenGL.GL import glIsShader
 
 from egraphics import ComputeShader
 from egraphics import GBuffer
 from egraphics import GBufferView
 from egraphics import Shader
 from egraphics import ShaderAttribute
+from egraphics import ShaderCompileFuture
 from egraphics import ShaderStorageBlock
 from egraphics import ShaderUniform
+from egraphics import ShaderUniformBlock
 from egraphics import Texture
 from egraphics import Texture2d
 from egraphics import TextureComponents
+from egraphics import pack_std140
 
 
 def test_empty_shader(platform):
@@ -125,6 +134,148 @@ def test_vertex_and_fragment(platform):
     )
 
 
+def test_compile_async(platform):
+    future = Shader.compile_async(
+        vertex=b"""#version 140
+    in vec2 xy;
+    void main()
+    {
+        gl_Position = vec4(xy, 0, 1);
+    }
+    """,
+        fragment=b"""#version 140
+    uniform vec4 color;
+    out vec4 FragColor;
+    void main()
+    {
+        FragColor = color;
+    }
+    """,
+    )
+    assert isinstance(future, ShaderCompileFuture)
+
+    shader = future.result()
+    assert future.done()
+    assert isinstance(shader, Shader)
+    assert glIsProgram(shader._gl_program)
+    assert [a.name for a in shader.attributes] == ["xy"]
+    assert [u.name for u in shader.uniforms] == ["color"]
+    assert future.result() is shader
+
+
+def test_compile_async_poll(platform):
+    future = Shader.compile_async(
+        vertex=b"""#version 140
+    void main()
+    {
+        gl_Position = vec4(0, 0, 0, 1);
+    }
+    """
+    )
+    while not future.done():
+        pass
+    assert isinstance(future.result(), Shader)
+
+
+def test_compile_async_await(platform):
+    future = Shader.compile_async(
+        vertex=b"""#version 140
+    void main()
+    {
+        gl_Position = vec4(0, 0, 0, 1);
+    }
+    """
+    )
+    result = None
+
+    async def test():
+        nonlocal result
+        result = await future
+
+    loop = EventLoop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(test())
+    assert result is future.result()
+
+
+def test_compile_async_compute(platform, gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    future = ComputeShader.compile_async(
+        b"""#version 430
+    layout(local_size_x=1) in;
+    uniform float value;
+    void main()
+    {
+    }
+    """
+    )
+    assert isinstance(future.result(), ComputeShader)
+
+
+@pytest.mark.parametrize("stage", ["vertex", "fragment"])
+def test_compile_async_compile_error(platform, stage):
+    future = Shader.compile_async(
+        **{
+            stage: b"""#version 140
+        void main()
+        {
+            what--what
+        }
+        """
+        }
+    )
+    for _ in range(2):
+        with pytest.raises(RuntimeError) as excinfo:
+            future.result()
+        assert str(excinfo.value).startswith(f"{stage} stage failed to compile:\n")
+    assert future.done()
+
+
+def test_compile_async_link_error(platform):
+    future = Shader.compile_async(
+        vertex=b"""#version 140
+        vec4 some_function_that_doesnt_exist();
+        void main()
+        {
+            gl_Position = some_function_that_doesnt_exist();
+        }
+        """
+    )
+    with pytest.raises(RuntimeError) as excinfo:
+        future.result()
+    assert str(excinfo.value).startswith("failed to link:\n")
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "vertex, geometry or fragment must be provided"),
+        ({"geometry": b""}, "geometry shader requires vertex shader"),
+    ],
+)
+def test_compile_async_invalid_stages(platform, kwargs, message):
+    with pytest.raises(TypeError) as excinfo:
+        Shader.compile_async(**kwargs)
+    assert str(excinfo.value) == message
+
+
+def test_compile_async_abandoned(platform):
+    future = Shader.compile_async(
+        vertex=b"""#version 140
+    void main()
+    {
+        gl_Position = vec4(0, 0, 0, 1);
+    }
+    """
+    )
+    gl_program = future._gl_program
+    gl_shaders = [s for s in future._gl_shaders if s]
+    del future
+    assert not glIsProgram(gl_program)
+    assert not any(glIsShader(s) for s in gl_shaders)
+
+
 def test_delete(platform):
     shader = Shader(
         vertex=b"""#version 140
@@ -1702,3 +1853,72 @@ def test_storage_block(platform, gl_version, binding, shader_cls, shader_kwargs)
             ctypes.byref(storage_block_binding),
         )
         assert storage_block_binding.value == g_buffer_view._shader_storage_buffer_unit
+
+
+UNIFORM_BLOCK_VERTEX_SHADER = b"""#version 140
+layout(std140) uniform BlockName
+{
+    vec4 color;
+    float scale;
+};
+uniform float loose;
+void main()
+{
+    gl_Position = color * scale * loose;
+}
+"""
+
+
+@pytest.mark.parametrize("use_view", [False, True])
+def test_uniform_block(platform, use_view):
+    shader = Shader(vertex=UNIFORM_BLOCK_VERTEX_SHADER)
+
+    assert [u.name for u in shader.uniforms] == ["loose"]
+    assert len(shader.uniform_blocks) == 1
+    uniform_block = shader.uniform_blocks[0]
+    assert isinstance(uniform_block, ShaderUniformBlock)
+    assert uniform_block.name == "BlockName"
+    assert uniform_block.size in (20, 32)
+
+    g_buffer = GBuffer(pack_std140([emath.FVector4(1), ctypes.c_float(2)]))
+    value = GBufferView(g_buffer, ctypes.c_uint8) if use_view else g_buffer
+    with ExitStack() as exit_stack:
+        shader._set_uniform_block(uniform_block, value, exit_stack)
+
+        assert uniform_block._binding is not None
+        binding_value = ctypes.c_int()
+        glGetIntegeri_v(
+            GL_UNIFORM_BUFFER_BINDING, uniform_block._binding, ctypes.byref(binding_value)
+        )
+        assert binding_value.value == g_buffer._gl_buffer
+
+        uniform_block_binding = ctypes.c_int()
+        glGetActiveUniformBlockiv(
+            shader._gl_program,
+            uniform_block._index,
+            GL_UNIFORM_BLOCK_BINDING,
+            ctypes.byref(uniform_block_binding),
+        )
+        assert uniform_block_binding.value == uniform_block._binding
+
+
+def test_uniform_block_too_small(platform):
+    shader = Shader(vertex=UNIFORM_BLOCK_VERTEX_SHADER)
+    (uniform_block,) = shader.uniform_blocks
+    with ExitStack() as exit_stack:
+        with pytest.raises(ValueError) as excinfo:
+            shader._set_uniform_block(uniform_block, GBuffer(16), exit_stack)
+    assert str(excinfo.value) == (
+        f"expected at least {uniform_block.size} bytes for BlockName (got 16)"
+    )
+
+
+def test_uniform_block_invalid_value(platform):
+    shader = Shader(vertex=UNIFORM_BLOCK_VERTEX_SHADER)
+    (uniform_block,) = shader.uniform_blocks
+    with ExitStack() as exit_stack:
+        with pytest.raises(ValueError) as excinfo:
+            shader._set_uniform_block(uniform_block, None, exit_stack)  # type: ignore
+    assert str(excinfo.value) == (
+        f"expected {GBuffer} or {GBufferView} for BlockName (got {type(None)})"
+    )
@@ -0,0 +1,156 @@
+from unittest.mock import patch
+
+import pytest
+
+from egraphics import ComputeShader
+from egraphics import Shader
+from egraphics import ShaderBinaryCache
+from egraphics._shader_binary_cache import GlProgramReflection
+
+VERTEX_SHADER = b"""
+#version 140
+in vec2 xy;
+uniform float depth;
+void main()
+{
+    gl_Position = vec4(xy, depth, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = b"""
+#version 140
+uniform vec4 color;
+out vec4 FragColor;
+void main()
+{
+    FragColor = color;
+}
+"""
+
+COMPUTE_SHADER = b"""
+#version 430
+layout(local_size_x=1) in;
+layout(std430) buffer output_data
+{
+    float data[];
+};
+uniform float value;
+void main()
+{
+    data[gl_GlobalInvocationID.x] = value;
+}
+"""
+
+
+def _describe(shader):
+    return (
+        tuple((u.name, u.data_type, u.size, u.location) for u in shader.uniforms),
+        tuple(
+            (a.name, a.data_type, a.size, a.location) for a in getattr(shader, "attributes", ())
+        ),
+        tuple(b.name for b in shader.storage_blocks),
+    )
+
+
+def test_directory(tmp_path):
+    assert ShaderBinaryCache(tmp_path).directory == tmp_path
+    assert ShaderBinaryCache(str(tmp_path)).directory == tmp_path
+
+
+def test_shader(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path / "cache")
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    cached_shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert _describe(cached_shader) == _describe(shader)
+    assert cached_shader["color"] is not shader["color"]
+
+
+def test_compute_shader(platform, gl_version, tmp_path):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path)
+
+    shader = ComputeShader(COMPUTE_SHADER, binary_cache=cache)
+    cached_shader = ComputeShader(COMPUTE_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert _describe(cached_shader) == _describe(shader)
+
+
+def test_different_sources(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path)
+
+    Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    Shader(vertex=VERTEX_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.parametrize("data", [b"", b"EGPB", b"EGPB\x01\x00\x00\x00\xff\x00\x00\x00{"])
+def test_corrupt_file(platform, gl_version, tmp_path, data):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path)
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(data)
+
+    recompiled_shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert _describe(recompiled_shader) == _describe(shader)
+    assert path.read_bytes() != data
+
+
+def test_invalid_binary(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path)
+
+    Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    (path,) = tmp_path.iterdir()
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+
+    Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert cache.misses == 2
+
+
+def test_unwritable_directory(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_bytes(b"")
+    cache = ShaderBinaryCache(not_a_directory)
+
+    shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert shader["color"].name == "color"
+
+
+def test_failed_replace(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    cache = ShaderBinaryCache(tmp_path)
+
+    with (
+        patch("egraphics._shader_binary_cache.os.replace", side_effect=OSError("replace")),
+        patch("egraphics._shader_binary_cache.os.unlink", side_effect=OSError("unlink")),
+    ):
+        shader = Shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, binary_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert shader["color"].name == "color"
+
+    with patch("egraphics._shader_binary_cache.os.replace", side_effect=OSError("replace")):
+        with pytest.raises(OSError) as excinfo:
+            cache._store("key", 0, b"", GlProgramReflection((), (), (), ()))
+    assert str(excinfo.value) == "replace"
+    assert not list(tmp_path.glob("*.bin"))
@@ -0,0 +1,234 @@
+import re
+
+import pytest
+
+from egraphics import ComputeShader
+from egraphics import Shader
+from egraphics import ShaderBinaryCache
+from egraphics import ShaderLibrary
+from egraphics import ShaderLibraryCacheInfo
+from egraphics._shader_library import _hash_sources
+
+VERTEX_SHADER = b"""#version 140
+#include "common.glsl"
+void main()
+{
+    gl_Position = vec4(0, 0, 0, SCALE);
+}
+"""
+
+FRAGMENT_SHADER = b"""#version 140
+out vec4 FragColor;
+void main()
+{
+#ifdef RED
+    FragColor = vec4(1, 0, 0, 1);
+#else
+    FragColor = vec4(1);
+#endif
+}
+"""
+
+COMPUTE_SHADER = b"""#version 430
+layout(local_size_x=1) in;
+void main()
+{
+}
+"""
+
+INCLUDES = {"common.glsl": b"#ifndef SCALE\n#define SCALE 1.0\n#endif\n"}
+
+
+def test_preprocess():
+    library = ShaderLibrary(
+        includes={"a.glsl": b"#include <b.glsl>\nfloat a;  \n", "b.glsl": b"float b;\n\n"}
+    )
+    assert library.preprocess(
+        b'#version 140\r\n#include "a.glsl"\nvoid main(){}\n',
+        defines={"Y": True, "X": None, "Z": 1.5, "W": "vec2(0)"},
+    ) == (
+        b"#version 140\n"
+        b"#define W vec2(0)\n"
+        b"#define X\n"
+        b"#define Y 1\n"
+        b"#define Z 1.5\n"
+        b"#line 1 0\n"
+        b"#line 0 1\n"
+        b"#line 0 2\n"
+        b"float b;\n"
+        b"\n"
+        b"#line 1 1\n"
+        b"float a;  \n"
+        b"#line 2 0\n"
+        b"void main(){}\n"
+    )
+
+
+def test_preprocess_line_numbers():
+    library = ShaderLibrary(includes={"a.glsl": b"float a;\n", "b.glsl": b"float b;"})
+    assert library.preprocess(
+        b'#version 330\n\n#include "a.glsl"\n#include "b.glsl"\n#include "a.glsl"\nfloat c; \\  \n',
+        defines={"X": None},
+    ) == (
+        b"#version 330\n"
+        b"#define X\n"
+        b"#line 2 0\n"
+        b"\n"
+        b"#line 1 1\n"
+        b"float a;\n"
+        b"#line 4 0\n"
+        b"#line 1 2\n"
+        b"float b;\n"
+        b"#line 5 0\n"
+        b"#line 1 1\n"
+        b"float a;\n"
+        b"#line 6 0\n"
+        b"float c; \\  \n"
+    )
+
+
+def test_preprocess_no_version():
+    library = ShaderLibrary()
+    assert library.preprocess(b"void main(){}", defines={"A": False}) == (
+        b"#define A 0\n#line 0 0\nvoid main(){}\n"
+    )
+
+
+def test_preprocess_include_directories(tmp_path):
+    (tmp_path / "common.glsl").write_bytes(b"float x;")
+    library = ShaderLibrary(include_directories=[str(tmp_path / "missing"), tmp_path])
+    assert library.preprocess(b'#include "common.glsl"') == (b"#line 0 1\nfloat x;\n#line 1 0\n")
+
+
+def test_preprocess_include_not_found():
+    library = ShaderLibrary()
+    with pytest.raises(ValueError) as excinfo:
+        library.preprocess(b'#include "missing.glsl"')
+    assert str(excinfo.value) == "include 'missing.glsl' not found"
+
+
+def test_preprocess_circular_include():
+    library = ShaderLibrary(
+        includes={"a.glsl": b'#include "b.glsl"', "b.glsl": b"#include <a.glsl>"}
+    )
+    with pytest.raises(ValueError) as excinfo:
+        library.preprocess(b'#include "a.glsl"')
+    assert str(excinfo.value) == "circular include of 'a.glsl'"
+
+
+@pytest.mark.parametrize("name", ["", "1A", "A B", "A-B"])
+def test_preprocess_invalid_define_name(name):
+    library = ShaderLibrary()
+    with pytest.raises(ValueError) as excinfo:
+        library.preprocess(b"", defines={name: None})
+    assert str(excinfo.value) == f"invalid define name {name!r}"
+
+
+@pytest.mark.parametrize("max_size", [0, -1])
+def test_invalid_max_size(max_size):
+    with pytest.raises(ValueError) as excinfo:
+        ShaderLibrary(max_size=max_size)
+    assert str(excinfo.value) == "max size must be greater than 0"
+
+
+def test_get_shader(platform):
+    library = ShaderLibrary(includes=INCLUDES)
+    assert library.cache_info() == ShaderLibraryCacheInfo(0, 0, 0, 128)
+
+    shader = library.get_shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    assert isinstance(shader, Shader)
+    assert library.cache_info() == ShaderLibraryCacheInfo(0, 1, 1, 128)
+
+    assert library.get_shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER) is shader
+    assert library.cache_info() == ShaderLibraryCacheInfo(1, 1, 1, 128)
+
+    red_shader = library.get_shader(
+        vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER, defines={"RED": None}
+    )
+    assert red_shader is not shader
+    assert library.cache_info() == ShaderLibraryCacheInfo(1, 2, 2, 128)
+    assert len(library) == 2
+
+
+def test_get_shader_canonical(platform):
+    library = ShaderLibrary(includes=INCLUDES)
+    shader = library.get_shader(vertex=VERTEX_SHADER, fragment=FRAGMENT_SHADER)
+    assert (
+        library.get_shader(
+            vertex=VERTEX_SHADER.replace(b"\n", b"   \r\n"), fragment=bytearray(FRAGMENT_SHADER)
+        )
+        is shader
+    )
+    assert library.cache_info() == ShaderLibraryCacheInfo(1, 1, 1, 128)
+
+
+def test_hash_sources_canonical():
+    assert _hash_sources((b"a  \r\nb",)) == _hash_sources((b"a\nb\t",))
+    assert _hash_sources((b"a \\  \nb",)) != _hash_sources((b"a \\\nb",))
+
+
+def test_get_shader_compile_error_line(platform):
+    library = ShaderLibrary(includes={"error.glsl": b"\nwhat--what\n"})
+    with pytest.raises(RuntimeError) as excinfo:
+        library.get_shader(
+            vertex=b'#version 140\n#include "error.glsl"\nvoid main(){}\n', defines={"X": None}
+        )
+    assert re.search(r"\b1[:(]2\b", str(excinfo.value))
+
+
+def test_get_shader_define_order(platform):
+    library = ShaderLibrary(includes=INCLUDES)
+    shader = library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 2, "RED": None})
+    assert library.get_shader(vertex=VERTEX_SHADER, defines={"RED": None, "SCALE": 2}) is shader
+    float_shader = library.get_shader(vertex=VERTEX_SHADER, defines={"RED": None, "SCALE": 2.0})
+    assert float_shader is not shader
+
+
+def test_get_shader_lru(platform):
+    library = ShaderLibrary(includes=INCLUDES, max_size=2)
+    a = library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 1})
+    b = library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 2})
+    assert library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 1}) is a
+    c = library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 3})
+    assert library.cache_info() == ShaderLibraryCacheInfo(1, 3, 2, 2)
+
+    assert library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 1}) is a
+    assert library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 3}) is c
+    assert library.get_shader(vertex=VERTEX_SHADER, defines={"SCALE": 2}) is not b
+    assert library.cache_info() == ShaderLibraryCacheInfo(3, 4, 2, 2)
+
+
+def test_get_shader_compile_error(platform):
+    library = ShaderLibrary()
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            library.get_shader(vertex=b"#version 140\nwhat--what")
+    assert library.cache_info() == ShaderLibraryCacheInfo(0, 2, 0, 128)
+
+
+def test_get_compute_shader(platform, gl_version):
+    if gl_version < (4, 3):
+        pytest.xfail()
+    library = ShaderLibrary()
+    shader = library.get_compute_shader(COMPUTE_SHADER)
+    assert isinstance(shader, ComputeShader)
+    assert library.get_compute_shader(COMPUTE_SHADER) is shader
+    assert library.cache_info() == ShaderLibraryCacheInfo(1, 1, 1, 128)
+
+
+def test_clear(platform):
+    library = ShaderLibrary(includes=INCLUDES)
+    shader = library.get_shader(vertex=VERTEX_SHADER)
+    library.clear()
+    assert len(library) == 0
+    assert library.get_shader(vertex=VERTEX_SHADER) is not shader
+    assert library.cache_info() == ShaderLibraryCacheInfo(0, 2, 1, 128)
+
+
+def test_binary_cache(platform, gl_version, tmp_path):
+    if gl_version < (4, 1):
+        pytest.xfail()
+    binary_cache = ShaderBinaryCache(tmp_path)
+    ShaderLibrary(includes=INCLUDES, binary_cache=binary_cache).get_shader(vertex=VERTEX_SHADER)
+    ShaderLibrary(includes=INCLUDES, binary_cache=binary_cache).get_shader(vertex=VERTEX_SHADER)
+    assert (binary_cache.hits, binary_cache.misses) == (1, 1)
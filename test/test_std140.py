@@ -0,0 +1,56 @@
+import ctypes
+import struct
+
+import emath
+import pytest
+
+from egraphics import pack_std140
+
+
+def test_empty():
+    assert pack_std140([]) == b""
+
+
+def test_layout():
+    data = pack_std140(
+        [
+            ctypes.c_float(1),
+            emath.FVector3(2, 3, 4),
+            ctypes.c_float(5),
+            emath.FVector2(6, 7),
+            emath.FArray(8, 9),
+            emath.FMatrix3x3(10, 11, 12, 13, 14, 15, 16, 17, 18),
+            ctypes.c_bool(True),
+            emath.DVector3(19, 20, 21),
+        ]
+    )
+    assert len(data) == 192
+    assert struct.unpack_from("<f", data, 0) == (1,)
+    assert struct.unpack_from("<3f", data, 16) == (2, 3, 4)
+    assert struct.unpack_from("<f", data, 28) == (5,)
+    assert struct.unpack_from("<2f", data, 32) == (6, 7)
+    assert struct.unpack_from("<f", data, 48) == (8,)
+    assert struct.unpack_from("<f", data, 64) == (9,)
+    assert struct.unpack_from("<3f", data, 80) == (10, 11, 12)
+    assert struct.unpack_from("<3f", data, 96) == (13, 14, 15)
+    assert struct.unpack_from("<3f", data, 112) == (16, 17, 18)
+    assert struct.unpack_from("<I", data, 128) == (1,)
+    assert struct.unpack_from("<3d", data, 160) == (19, 20, 21)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        emath.FVector4Array(emath.FVector4(1), emath.FVector4(2)),
+        emath.FMatrix4x4Array(emath.FMatrix4x4(1), emath.FMatrix4x4(2)),
+    ],
+)
+def test_tightly_packed_array(value):
+    assert pack_std140([value]) == bytes(value)
+
+
+@pytest.mark.parametrize("value", [1, 1.0, None, ctypes.c_int8(0), ctypes.c_int16(0)])
+def test_invalid_value(value):
+    with pytest.raises(TypeError) as excinfo:
+        pack_std140([value])
+    assert str(excinfo.value) == f"{type(value)!r} cannot be packed with std140 layout"
@@ -14,10 +14,14 @@ from emath import UVector2
 from OpenGL.GL import GL_ACTIVE_TEXTURE
 from OpenGL.GL import GL_IMAGE_BINDING_NAME
 from OpenGL.GL import GL_TEXTURE0
+from OpenGL.GL import GL_TEXTURE_2D
 from OpenGL.GL import GL_TEXTURE_BINDING_2D
+from OpenGL.GL import GL_TEXTURE_IMMUTABLE_FORMAT
+from OpenGL.GL import GL_TEXTURE_IMMUTABLE_LEVELS
 from OpenGL.GL import glActiveTexture
 from OpenGL.GL import glGetIntegeri_v
 from OpenGL.GL import glGetIntegerv
+from OpenGL.GL import glGetTexParameteriv
 from OpenGL.GL import glIsTexture
 
 from egraphics import MipmapSelection
@@ -26,6 +30,7 @@ from egraphics import TextureComponents
 from egraphics import TextureFilter
 from egraphics import TextureType
 from egraphics import TextureWrap
+from egraphics._egraphics import GL_DIRECT_STATE_ACCESS_SUPPORTED
 from egraphics._texture import _FIRST_BINDABLE_TEXTURE_UNIT
 from egraphics._texture import _TextureTarget
 from egraphics._texture import bind_texture
@@ -582,3 +587,29 @@ class TestTexture2d(TextureTestType):
     texture_type = TextureType.TWO_DIMENSIONS
     size_length = 2
     wrap_length = 2
+
+
+@pytest.mark.parametrize(
+    "components, mipmap_selection, immutable, levels",
+    [
+        (TextureComponents.XYZW, MipmapSelection.NONE, True, 1),
+        (TextureComponents.XYZW, MipmapSelection.LINEAR, True, 4),
+        (TextureComponents.X, MipmapSelection.NEAREST, True, 4),
+        (TextureComponents.RGBA, MipmapSelection.LINEAR, False, 0),
+    ],
+)
+def test_direct_state_access_storage(platform, components, mipmap_selection, immutable, levels):
+    if not GL_DIRECT_STATE_ACCESS_SUPPORTED:
+        pytest.xfail()
+    component_count = TEXTURE_COMPONENTS_COUNT[components]
+    texture = Texture(
+        TextureType.TWO_DIMENSIONS,
+        size=UVector2(8, 5),
+        components=components,
+        data_type=ctypes.c_uint8,
+        buffer=b"\x00" * 8 * 5 * component_count,
+        mipmap_selection=mipmap_selection,
+    )
+    with bind_texture(texture):
+        assert bool(glGetTexParameteriv(GL_TEXTURE_2D, GL_TEXTURE_IMMUTABLE_FORMAT)) == immutable
+        assert glGetTexParameteriv(GL_TEXTURE_2D, GL_TEXTURE_IMMUTABLE_LEVELS) == levels